@@ -10,8 +10,18 @@ Targets (Design 6.128): 1k < 5m, 5k < 15m, 10k < 30m.
 
 Design 6.19, 6.20: Profiling - use cProfile, capture hot paths, top 20 slowest.
 
+Offline replay (real search/parse/scoring, no live site):
+    --record STORE   run against Beatport and store every response in STORE
+    --replay STORE   serve STORE through a local HTTP stand-in; with
+                     --synthesize, missing responses come from a synthetic
+                     catalog (benchmark_*.xml titles are not on Beatport)
+    Reports throughput, p95 per-track latency, peak RSS and match accuracy
+    against a golden file (STORE/golden.json unless --golden is given).
+
 Usage:
     python scripts/bench.py [--dataset 1k|5k|10k|all] [--output-dir path] [--mock] [--profile]
+    python scripts/bench.py --dataset 1k --replay bench_store --synthesize [--latency-ms 30]
+    python scripts/bench.py --xml my.xml --playlist "Set" --record bench_store --write-golden
 """
 
 import argparse
@@ -154,6 +164,175 @@ def run_benchmark(
     }
 
 
+# Settings that keep URL discovery on the Beatport host during record/replay
+# (DuckDuckGo and browser automation bypass the shared HTTP session).
+REPLAY_SETTINGS = {
+    "PREFER_DIRECT_SEARCH": True,
+    "DDG_ENABLED": False,
+    "USE_BROWSER_AUTOMATION": False,
+}
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS reports bytes
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        try:
+            import psutil
+
+            info = psutil.Process().memory_info()
+            return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+        except Exception:
+            return 0.0
+
+
+def load_golden(path: Path) -> dict:
+    """Load golden matches: {playlist_index: beatport_url or ""}."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {int(k): v or "" for k, v in data.get("tracks", {}).items()}
+
+
+def save_golden(path: Path, golden: dict) -> None:
+    """Write golden matches as {"tracks": {playlist_index: url}}."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"tracks": {str(k): v for k, v in sorted(golden.items())}}, f, indent=2)
+
+
+def match_accuracy(results, golden: dict) -> float:
+    """Fraction of golden tracks whose match URL equals the golden URL."""
+    if not golden:
+        return 0.0
+    by_index = {r.playlist_index: r.beatport_url or "" for r in results}
+    hits = sum(1 for idx, url in golden.items() if by_index.get(idx, "") == url)
+    return hits / len(golden)
+
+
+def run_replay_benchmark(
+    xml_path: Path,
+    store_dir: Path,
+    playlist_name: str = None,
+    mode: str = "replay",
+    golden_path: Path = None,
+    write_golden: bool = False,
+    synthesize: bool = False,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    seed: int = 0,
+    output_dir: Path = None,
+) -> dict:
+    """Run the real pipeline against recorded (or recording) responses.
+
+    Args:
+        xml_path: Rekordbox XML to process.
+        store_dir: Fixture store directory.
+        playlist_name: Playlist to process (default: first playlist).
+        mode: "replay" (local stand-in) or "record" (live site, store responses).
+        golden_path: Golden file (default: store_dir / "golden.json").
+        write_golden: Save this run's matches as the golden file.
+        synthesize: In replay mode, synthesize missing responses from a
+            SyntheticCatalog of the playlist and use its golden matches.
+        latency_ms, jitter_ms, error_rate, seed: ReplayServer options.
+        output_dir: Where CSV outputs go (default: temporary directory).
+
+    Returns:
+        Metrics dict (throughput, p95 per-track latency, peak RSS, accuracy).
+    """
+    from unittest import mock
+
+    from cuepoint.data.rekordbox import parse_rekordbox
+    from cuepoint.models.run_settings import RunSettings
+    from cuepoint.services.bootstrap import bootstrap_services
+    from cuepoint.services.interfaces import IConfigService, IProcessorService
+    from cuepoint.utils.di_container import get_container
+    from cuepoint.utils.http_replay import (
+        FixtureStore,
+        SyntheticCatalog,
+        percentile,
+        recording,
+        replaying,
+    )
+
+    playlists = parse_rekordbox(str(xml_path))
+    if not playlists:
+        raise ValueError(f"No playlists in {xml_path}")
+    playlist_name = playlist_name or list(playlists.keys())[0]
+    tracks = playlists[playlist_name].tracks
+
+    store = FixtureStore(store_dir)
+    golden_path = Path(golden_path or Path(store_dir) / "golden.json")
+    golden = load_golden(golden_path) if golden_path.exists() else {}
+
+    fallback = None
+    if mode == "replay" and synthesize:
+        catalog = SyntheticCatalog(
+            (i, t.title, t.artist or "") for i, t in enumerate(tracks, 1)
+        )
+        fallback = catalog.respond
+        if not golden:
+            golden = dict(catalog.golden)
+            save_golden(golden_path, golden)
+
+    bootstrap_services()
+    container = get_container()
+    config_service = container.resolve(IConfigService)
+    config_service.set("product.preflight_network_check", False)
+    processor = container.resolve(IProcessorService)
+
+    if mode == "record":
+        transport = recording(store)
+    else:
+        transport = replaying(
+            store,
+            latency_ms=latency_ms,
+            jitter_ms=jitter_ms,
+            error_rate=error_rate,
+            seed=seed,
+            fallback=fallback,
+        )
+
+    # The run's own snapshot: the global SETTINGS are left untouched
+    run_settings = RunSettings.resolve(config_service=config_service).replace(
+        **REPLAY_SETTINGS
+    )
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        out_dir = tmpdir if output_dir is None else str(output_dir)
+        with transport as server, mock.patch(
+            "cuepoint.services.processor_service.NetworkState"
+        ) as mock_net:
+            mock_net.is_online.return_value = True
+            results = processor.process_playlist_from_xml(
+                str(xml_path), playlist_name, output_dir=out_dir, settings=run_settings
+            )
+    duration_sec = time.perf_counter() - start
+
+    if write_golden:
+        golden = {r.playlist_index: r.beatport_url or "" for r in results}
+        save_golden(golden_path, golden)
+
+    per_track = [r.processing_time for r in results if r.processing_time is not None]
+    return {
+        "playlist": playlist_name,
+        "mode": mode,
+        "tracks": len(results),
+        "duration_sec": round(duration_sec, 2),
+        "throughput_tracks_per_sec": round(len(results) / duration_sec, 3) if duration_sec else 0.0,
+        "p50_track_sec": round(percentile(per_track, 50), 3),
+        "p95_track_sec": round(percentile(per_track, 95), 3),
+        "rss_mb_peak": round(_peak_rss_mb(), 1),
+        "accuracy": round(match_accuracy(results, golden), 4) if golden else None,
+        "http": server.stats() if hasattr(server, "stats") else {"fixtures": len(store)},
+    }
+
+
 def compare_with_baseline(
     current: dict, baseline: dict, runtime_regression_pct: float = 20, memory_regression_pct: float = 30
 ) -> tuple[bool, list[str]]:
@@ -196,6 +375,29 @@ def main() -> int:
                         help="Compare against scripts/benchmarks/baseline.json, fail if regression > 20% (Design 6.115)")
     parser.add_argument("--update-baseline", action="store_true",
                         help="Update baseline.json with current results (Design 6.54)")
+    parser.add_argument("--xml", type=Path, default=None,
+                        help="Rekordbox XML to use instead of the benchmark_<dataset>.xml fixture")
+    parser.add_argument("--playlist", default=None,
+                        help="Playlist name in --xml (default: first playlist)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", type=Path, default=None, metavar="STORE",
+                      help="Run against the live site and record responses into STORE")
+    mode.add_argument("--replay", type=Path, default=None, metavar="STORE",
+                      help="Replay responses from STORE through a local HTTP stand-in")
+    parser.add_argument("--synthesize", action="store_true",
+                        help="With --replay: synthesize missing responses from a synthetic catalog")
+    parser.add_argument("--golden", type=Path, default=None,
+                        help="Golden matches file (default: STORE/golden.json)")
+    parser.add_argument("--write-golden", action="store_true",
+                        help="Save this run's matches as the golden file")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Replay: added latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0,
+                        help="Replay: random extra latency per request (0..N ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Replay: probability of an injected 503 per request")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Replay: seed for jitter and error injection")
     args = parser.parse_args()
 
     output_dir = args.output_dir or (SCRIPT_DIR / "benchmarks")
@@ -208,13 +410,48 @@ def main() -> int:
     print("CuePoint Performance Benchmarks (Design 6)")
     print("=" * 60)
 
+    store_dir = args.record or args.replay
+    if args.xml:
+        datasets = [args.xml.stem]
+
     for dataset in datasets:
-        fixture = get_fixture_path(dataset)
+        fixture = args.xml or get_fixture_path(dataset)
         if not fixture.exists():
             print(f"\n[SKIP] {dataset}: Fixture not found. Run: python scripts/generate_test_xml.py --benchmark")
             continue
 
         print(f"\n[Benchmark] {dataset} tracks ({fixture.name})...")
+        if store_dir:
+            try:
+                metrics = run_replay_benchmark(
+                    fixture,
+                    store_dir / dataset if len(datasets) > 1 else store_dir,
+                    playlist_name=args.playlist,
+                    mode="record" if args.record else "replay",
+                    golden_path=args.golden,
+                    write_golden=args.write_golden,
+                    synthesize=args.synthesize,
+                    latency_ms=args.latency_ms,
+                    jitter_ms=args.jitter_ms,
+                    error_rate=args.error_rate,
+                    seed=args.seed,
+                )
+                metrics["dataset"] = dataset
+                metrics["target_sec"] = TARGETS.get(dataset, 0)
+                metrics["passed"] = metrics["duration_sec"] < TARGETS.get(dataset, float("inf"))
+                results.append(metrics)
+                print(f"  Duration: {metrics['duration_sec']}s "
+                      f"({metrics['throughput_tracks_per_sec']} tracks/s)")
+                print(f"  Per-track: p50 {metrics['p50_track_sec']}s, p95 {metrics['p95_track_sec']}s")
+                print(f"  Peak RSS: {metrics['rss_mb_peak']} MB")
+                if metrics["accuracy"] is not None:
+                    print(f"  Accuracy vs golden: {metrics['accuracy'] * 100:.1f}%")
+                print(f"  HTTP: {metrics['http']}")
+                print(f"  [{'PASS' if metrics['passed'] else 'FAIL'}]")
+            except Exception as e:
+                print(f"  [ERROR] {e}")
+                results.append({"dataset": dataset, "error": str(e), "passed": False})
+            continue
         try:
             metrics = run_benchmark(
                 dataset,
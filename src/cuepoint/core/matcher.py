@@ -21,11 +21,12 @@ Key components:
 
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 from concurrent.futures import as_completed
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from cuepoint.core.mix_parser import (
     _any_phrase_token_set_in_title,
@@ -35,22 +36,38 @@ from cuepoint.core.mix_parser import (
     _parse_mix_flags,
 )
 from cuepoint.core.query_generator import _artist_tokens
+from cuepoint.core.slug_prescore import CandidateSkipped, SlugPrescorer
 from cuepoint.core.text_processing import (
     _artist_token_overlap,
     normalize_text,
     sanitize_title_for_search,
     score_components,
 )
+from cuepoint.data.async_fetch import get_fetch_engine
 from cuepoint.data.beatport import (
-    get_last_cache_hit,
+    cached_track_fields,
+    is_known_bad_page,
     parse_track_page,
+    parse_track_response,
     track_urls,
 )
+from cuepoint.data.negative_cache import SearchOutcome
 from cuepoint.models.beatport_candidate import BeatportCandidate
-from cuepoint.models.config import NEAR_KEYS, SETTINGS
-from cuepoint.utils.performance import performance_collector
+from cuepoint.models.config import NEAR_KEYS
+from cuepoint.models.run_settings import settings_or_global
+from cuepoint.utils.logger import LogSampler
+from cuepoint.utils.performance import (
+    STAGE_SCORE,
+    STAGE_SEARCH,
+    performance_collector,
+    stage_metrics,
+)
+from cuepoint.utils.tracing import traced, tracer
 from cuepoint.utils.utils import tlog, vlog
 
+# Thins the per-candidate "[scored]" TRACE lines (LOG_CANDIDATE_SAMPLE_EVERY)
+_candidate_log_sampler = LogSampler()
+
 
 def _norm_key(k: Optional[str]) -> Optional[str]:
     """
@@ -335,16 +352,18 @@ def _classify_query_type(query: str, query_index: int) -> str:
         return "n_gram"
 
 
+@traced("best_beatport_match")
 def best_beatport_match(
     idx: int,
     track_title: str,
     track_artists_for_scoring: str,
     title_only_mode: bool,
-    queries: List[str],
+    queries: Iterable[str],
     input_year: Optional[int] = None,
     input_key: Optional[str] = None,
     input_mix: Optional[Dict[str, object]] = None,
     input_generic_phrases: Optional[List[str]] = None,
+    settings: Optional[Mapping[str, Any]] = None,
 ) -> Tuple[
     Optional[BeatportCandidate],
     List[BeatportCandidate],
@@ -367,11 +386,13 @@ def best_beatport_match(
         track_title: Clean track title (already sanitized)
         track_artists_for_scoring: Artist string for scoring
         title_only_mode: True if no artists available (title-only search)
-        queries: List of search queries to execute
+        queries: Search queries to execute, in order (may be a lazy iterator)
         input_year: Optional year from Rekordbox (currently unused)
         input_key: Optional key from Rekordbox (currently unused)
         input_mix: Mix type flags (is_remix, is_extended, etc.)
         input_generic_phrases: Special parenthetical phrases (e.g., "Ivory Re-fire")
+        settings: Run settings snapshot (defaults to the global SETTINGS); also
+            passed to scoring and track_urls()
 
     Returns:
         Tuple of:
@@ -380,6 +401,8 @@ def best_beatport_match(
         - queries_audit: List of (query_index, query_text, candidate_count, elapsed_ms)
         - last_query_index: Last query index processed
     """
+    cfg = settings_or_global(settings)
+
     # Start track metrics
     track_id = f"track_{idx}"
     track_metrics = performance_collector.record_track_start(track_id, track_title)
@@ -483,8 +506,8 @@ def best_beatport_match(
         Returns:
             Maximum number of results to fetch for this query type.
         """
-        if not SETTINGS.get("ADAPTIVE_MAX_RESULTS", True):
-            return int(SETTINGS.get("MAX_SEARCH_RESULTS", 50))
+        if not cfg.get("ADAPTIVE_MAX_RESULTS", True):
+            return int(cfg.get("MAX_SEARCH_RESULTS", 50))
         ql = (q or "").lower()
         has_phrase = "(" in ql and ")" in ql
         has_mix = any(
@@ -503,14 +526,12 @@ def best_beatport_match(
         scarcity = len(visited_urls) < 6
 
         if "original mix" in ql:
-            return int(SETTINGS.get("MR_MED", 40))
+            return int(cfg.get("MR_MED", 40))
         if has_mix or has_phrase or family_full_plus_one:
             return (
-                int(SETTINGS.get("MR_HIGH", 100))
-                if scarcity
-                else int(SETTINGS.get("MR_MED", 40))
+                int(cfg.get("MR_HIGH", 100)) if scarcity else int(cfg.get("MR_MED", 40))
             )
-        return int(SETTINGS.get("MR_LOW", 10))
+        return int(cfg.get("MR_LOW", 10))
 
     effective_input_mix = dict(input_mix or {})
     if input_generic_phrases:
@@ -540,6 +561,7 @@ def best_beatport_match(
                 return True
         return False
 
+    @traced("score_candidate")
     def consider(
         u: str,
         title: Optional[str],
@@ -583,6 +605,7 @@ def best_beatport_match(
             elapsed_ms: Time spent parsing this candidate (milliseconds).
         """
         nonlocal best, seen_generic_match, best_is_family_shape
+        score_start = time.perf_counter()
         ok = True  # Whether candidate passes guards (not rejected)
         reject_reason = ""  # Reason for rejection (if rejected)
 
@@ -591,7 +614,7 @@ def best_beatport_match(
         # a_sim: Artist similarity (0-100)
         # comp: Combined base score (weighted: TITLE_WEIGHT * t_sim + ARTIST_WEIGHT * a_sim)
         t_sim, a_sim, comp = score_components(
-            track_title, track_artists_for_scoring, title, artists or ""
+            track_title, track_artists_for_scoring, title, artists or "", settings=cfg
         )
 
         # ========================================================================
@@ -677,11 +700,11 @@ def best_beatport_match(
                     input_generic_phrases, title or ""
                 )
                 if matched_generic:
-                    gen_bonus += SETTINGS.get("GENERIC_PHRASE_MATCH_BONUS", 24)
+                    gen_bonus += cfg.get("GENERIC_PHRASE_MATCH_BONUS", 24)
                 else:
                     # Penalty when searching for special phrase but only found generic mix
                     if cand_mix.get("is_original") or cand_mix.get("is_extended"):
-                        gen_bonus -= SETTINGS.get("GENERIC_PHRASE_PLAIN_PENALTY", 14)
+                        gen_bonus -= cfg.get("GENERIC_PHRASE_PLAIN_PENALTY", 14)
             except Exception:
                 pass
 
@@ -859,8 +882,26 @@ def best_beatport_match(
         if input_generic_phrases and matched_generic:
             seen_generic_match = True
 
-        if SETTINGS["TRACE"]:
+        if cfg["TRACE"] and _candidate_log_sampler.sample(
+            cfg.get("LOG_CANDIDATE_SAMPLE_EVERY", 1)
+        ):
             tlog(idx, f"[scored] {u} score={final:.1f} ok={ok}")
+        stage_metrics.observe(STAGE_SCORE, time.perf_counter() - score_start)
+
+    # Fetch candidate pages best-slug-first and skip those whose best possible
+    # score (judged from the URL slug) cannot beat the current best match
+    prescorer = (
+        SlugPrescorer(
+            track_title,
+            effective_input_mix,
+            title_only_mode,
+            input_generic_phrases,
+            special_intent,
+            settings=cfg,
+        )
+        if cfg.get("SLUG_PRESCORE", True)
+        else None
+    )
 
     # ========================================================================
     # MAIN QUERY EXECUTION LOOP
@@ -869,21 +910,22 @@ def best_beatport_match(
 
     for i, q in enumerate(queries, 1):
         last_q_processed = i
+        tracer.tag(query=i)
 
         # Check query cap (hard limit on number of queries)
-        cap = SETTINGS.get("MAX_QUERIES_PER_TRACK")
+        cap = cfg.get("MAX_QUERIES_PER_TRACK")
         if cap and i > int(cap):
             vlog(idx, f"[cap] stopping at {cap} queries")
             break
 
         # Check time budget (max time to spend on this track)
-        budget = SETTINGS.get("PER_TRACK_TIME_BUDGET_SEC")
+        budget = cfg.get("PER_TRACK_TIME_BUDGET_SEC")
         elapsed = time.perf_counter() - start
         # Always allow at least the first 5 priority queries to complete
         # Priority queries are the most important (full title + artist)
         min_priority_queries = 5
         if (
-            not SETTINGS.get("RUN_ALL_QUERIES")
+            not cfg.get("RUN_ALL_QUERIES")
             and budget
             and elapsed > budget
             and i > min_priority_queries
@@ -895,11 +937,11 @@ def best_beatport_match(
             (input_mix and input_mix.get("is_remix")) or (input_generic_phrases)
         )
         if remix_like_intent:
-            min_q_for_exit = SETTINGS.get("EARLY_EXIT_MIN_QUERIES_REMIX", 6)
+            min_q_for_exit = cfg.get("EARLY_EXIT_MIN_QUERIES_REMIX", 6)
         elif input_mix and input_mix.get("is_original"):
-            min_q_for_exit = SETTINGS.get("EARLY_EXIT_MIN_QUERIES_ORIGINAL", 8)
+            min_q_for_exit = cfg.get("EARLY_EXIT_MIN_QUERIES_ORIGINAL", 8)
         else:
-            min_q_for_exit = SETTINGS.get("EARLY_EXIT_MIN_QUERIES", 12)
+            min_q_for_exit = cfg.get("EARLY_EXIT_MIN_QUERIES", 12)
 
         # Execute query to find candidate URLs
         query_start_time = time.perf_counter()
@@ -913,17 +955,19 @@ def best_beatport_match(
 
         # Fetch candidate URLs using unified search (DuckDuckGo or direct Beatport)
         # track_urls() automatically chooses the best search method based on query type
-        urls_all = track_urls(idx, q, max_results=mr)
+        query_outcome = SearchOutcome()
+        urls_all = track_urls(idx, q, max_results=mr, settings=cfg, outcome=query_outcome)
 
-        # Check cache hit status (from the last HTTP request made by track_urls)
-        # Note: This tracks the last request, which may not represent all requests in track_urls
-        # but gives a reasonable approximation for performance metrics
-        cache_hit = get_last_cache_hit()
+        # Cache hit status for metrics: every backend answer of this query's
+        # search came from cache (reported with the result, so hedged and
+        # coalesced searches count correctly)
+        cache_hit = query_outcome.from_cache
 
         query_execution_time = time.perf_counter() - query_start_time
         q_elapsed = int(query_execution_time * 1000)
+        stage_metrics.observe(STAGE_SEARCH, query_execution_time)
 
-        cap = SETTINGS.get("PER_QUERY_CANDIDATE_CAP")
+        cap = cfg.get("PER_QUERY_CANDIDATE_CAP")
         cap_i = (
             int(cap)
             if (isinstance(cap, (int, str)) and str(cap).isdigit())
@@ -955,7 +999,7 @@ def best_beatport_match(
             f"[{idx}]   q{i} -> {len(urls)} candidates (raw={len(urls_all)}, MR={mr})",
             flush=True,
         )
-        if SETTINGS.get("TRACE") or SETTINGS.get("VERBOSE"):
+        if cfg.get("TRACE") or cfg.get("VERBOSE"):
             try:
                 # Shorten for readability in console; full query is stored in queries_audit/queries_data.
                 q_disp = q if len(q) <= 200 else (q[:197] + "...")
@@ -966,7 +1010,7 @@ def best_beatport_match(
 
         # If we ended up with 0 candidates but had raw results, it usually means
         # downstream filtering/deduplication/capping removed them. Print a hint in TRACE mode.
-        if SETTINGS.get("TRACE") and len(urls) == 0 and len(urls_all) > 0:
+        if cfg.get("TRACE") and len(urls) == 0 and len(urls_all) > 0:
             try:
                 print(
                     f"[{idx}]     note: raw results existed but 0 remained after cap/filter/dedupe",
@@ -1003,6 +1047,10 @@ def best_beatport_match(
             if u in visited_urls:
                 continue
 
+            # Skip pages that recently answered 404/410 or could not be parsed
+            if is_known_bad_page(u, cfg):
+                continue
+
             # Extract track ID and check if we've already parsed this track
             track_id = extract_track_id_from_url(u)
             if track_id and track_id in visited_track_ids:
@@ -1021,6 +1069,9 @@ def best_beatport_match(
             if track_id:
                 visited_track_ids.add(track_id)
 
+        if prescorer is not None:
+            to_fetch = prescorer.order(to_fetch)
+
         # ========================================================================
         # PARALLEL CANDIDATE FETCHING
         # ========================================================================
@@ -1072,11 +1123,21 @@ def best_beatport_match(
                     0,
                 )
 
+            # Pages run most promising first, so by now a better match may be known
+            if prescorer is not None and prescorer.cannot_win(
+                u, best.score if best else None
+            ):
+                raise CandidateSkipped(u)
+
             # Parse the Beatport track page
             t0 = time.perf_counter()
-            title, artists, key, year, bpm, label, genres, rel_name, rel_date = (
-                parse_track_page(u)
-            )
+            return remember(u, parse_track_page(u, settings=cfg), t0)
+
+        def remember(
+            u: str, fields: Tuple[Any, ...], t0: float
+        ) -> Tuple[Any, ...]:
+            """Cache parsed fields by URL and track ID; return fetch()'s tuple."""
+            title, artists, key, year, bpm, label, genres, rel_name, rel_date = fields
 
             # Cache by URL
             parsed_cache[u] = (
@@ -1121,14 +1182,58 @@ def best_beatport_match(
                 elapsed_ms,
             )
 
-        with ThreadPoolExecutor(max_workers=SETTINGS["CANDIDATE_WORKERS"]) as ex:
+        def fetch_async(u: str) -> "Future[Tuple[Any, ...]]":
+            """fetch() on the shared event loop (FETCH_ENGINE="asyncio").
+
+            The page is downloaded on the engine's loop and parsed on its
+            small executor (or the parse process pool), so no thread is held
+            per in-flight request.
+            """
+            done: "Future[Tuple[Any, ...]]" = Future()
+            if u in parsed_cache:
+                done.set_result(fetch(u))
+                return done
+            if prescorer is not None and prescorer.cannot_win(
+                u, best.score if best else None
+            ):
+                done.set_exception(CandidateSkipped(u))
+                return done
+            assert fetch_engine is not None
+            t0 = time.perf_counter()
+            cached = cached_track_fields(u, cfg)
+            if cached is not None:
+                done.set_result(remember(u, cached, t0))
+                return done
+            return fetch_engine.submit(
+                u, lambda html: remember(u, parse_track_response(u, html, cfg), t0)
+            )
+
+        # Candidate pages go to the shared asyncio engine when enabled,
+        # otherwise to a per-query thread pool
+        fetch_engine = (
+            get_fetch_engine(cfg) if cfg.get("FETCH_ENGINE") == "asyncio" else None
+        )
+        candidate_pool = (
+            nullcontext(None)
+            if fetch_engine is not None
+            else ThreadPoolExecutor(max_workers=cfg["CANDIDATE_WORKERS"])
+        )
+
+        with candidate_pool as ex:
             try:
-                futures = [ex.submit(fetch, u) for u in to_fetch]
+                futures = (
+                    [fetch_async(u) for u in to_fetch]
+                    if fetch_engine is not None
+                    else [
+                        tracer.submit(ex, fetch, u, name="fetch_candidate")
+                        for u in to_fetch
+                    ]
+                )
             except RuntimeError:
                 # Interpreter shutting down (e.g. "cannot schedule new futures after interpreter shutdown")
                 return (None, [], queries_audit, last_q_processed)
 
-            if SETTINGS.get("RUN_ALL_QUERIES"):
+            if cfg.get("RUN_ALL_QUERIES"):
                 for fut in as_completed(futures) if futures else []:
                     try:
                         (
@@ -1144,6 +1249,8 @@ def best_beatport_match(
                             rel_date,
                             ems,
                         ) = fut.result()
+                    except CandidateSkipped:
+                        continue
                     except Exception as e:
                         vlog(idx, f"[fetch-error] {u}: {e}")
                         continue
@@ -1238,6 +1345,8 @@ def best_beatport_match(
                                 rel_date,
                                 ems,
                             ) = fut.result()
+                        except CandidateSkipped:
+                            continue
                         except Exception as e:
                             vlog(idx, f"[fetch-error] {u}: {e}")
                             continue
@@ -1314,6 +1423,10 @@ def best_beatport_match(
                             )
                 except FuturesTimeoutError:
                     vlog(idx, "[warn] candidate fetch join timed out")
+                    if fetch_engine is not None:
+                        # Abandoned requests would otherwise keep running on the loop
+                        for fut in futures:
+                            fut.cancel()
                     for fut in futures:
                         if fut.done():
                             try:
@@ -1375,7 +1488,7 @@ def best_beatport_match(
         # Stop searching if we found an excellent match (saves time)
         # Only applies if RUN_ALL_QUERIES is False and we have a guard-passing candidate
 
-        if (not SETTINGS.get("RUN_ALL_QUERIES")) and best and best.guard_ok:
+        if (not cfg.get("RUN_ALL_QUERIES")) and best and best.guard_ok:
             # Check if special phrase requirement is met
             generic_ok = True
             if input_generic_phrases:
@@ -1384,15 +1497,12 @@ def best_beatport_match(
                 )
 
             # Check if score meets early exit threshold
-            if (
-                SETTINGS.get("EARLY_EXIT_SCORE")
-                and best.score >= SETTINGS["EARLY_EXIT_SCORE"]
-            ):
+            if cfg.get("EARLY_EXIT_SCORE") and best.score >= cfg["EARLY_EXIT_SCORE"]:
                 # Ensure minimum queries have been executed (avoid premature exit)
                 if i >= int(min_q_for_exit or 0):
                     # Check mix type compatibility (unless disabled)
                     mix_ok = (
-                        not SETTINGS.get("EARLY_EXIT_REQUIRE_MIX_OK", True)
+                        not cfg.get("EARLY_EXIT_REQUIRE_MIX_OK", True)
                     ) or _mix_ok_for_early_exit(
                         effective_input_mix, _parse_mix_flags(best.title), best.artists
                     )
@@ -1425,6 +1535,7 @@ def best_beatport_match(
         early_exit=track_metrics.early_exit,
         early_exit_query_index=track_metrics.early_exit_query_index,
         candidates_evaluated=len(candidates_log),
+        candidates_skipped=prescorer.skipped if prescorer else 0,
     )
 
     return best, candidates_log, queries_audit, last_q_processed
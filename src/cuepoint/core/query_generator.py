@@ -17,12 +17,13 @@ Query generation strategy:
 
 Key functions:
 - make_search_queries(): Main function that generates all query variants
+- iter_search_queries(): Lazy, budgeted generator behind make_search_queries()
 - Helper functions for N-grams, artist tokens, prefixes, etc.
 """
 
 import re
-from itertools import combinations
-from typing import List, Optional, Tuple
+from itertools import combinations, islice
+from typing import Any, Iterator, List, Mapping, Optional, Tuple
 
 from cuepoint.core.mix_parser import (
     _extract_bracket_artist_hints,
@@ -35,7 +36,7 @@ from cuepoint.core.mix_parser import (
 )
 from cuepoint.core.text_processing import normalize_text, sanitize_title_for_search
 from cuepoint.data.rekordbox import extract_artists_from_title
-from cuepoint.models.config import SETTINGS
+from cuepoint.models.run_settings import settings_or_global
 
 
 def _ordered_unique(seq: List[str]) -> List[str]:
@@ -153,7 +154,11 @@ def _title_prefixes(
 
 
 def make_search_queries(
-    title: str, artists: str, original_title: Optional[str] = None
+    title: str,
+    artists: str,
+    original_title: Optional[str] = None,
+    max_queries: Optional[int] = None,
+    settings: Optional[Mapping[str, Any]] = None,
 ) -> List[str]:
     """
     Build robust search queries from track title and artist information
@@ -171,15 +176,62 @@ def make_search_queries(
     7. (Optional) Exhaustive title combinations (if enabled)
 
     Queries are de-duplicated and ordered by priority (most specific first).
+    Generation stops as soon as the cap is reached; see iter_search_queries().
 
     Args:
         title: Clean track title (already sanitized)
         artists: Artist string (may be empty for title-only search)
         original_title: Original title from Rekordbox (for mix/remix detection)
+        max_queries: Cap on the number of queries; defaults to
+            MAX_QUERIES_PER_TRACK, 0 returns every generated query
+        settings: Run settings snapshot (defaults to the global SETTINGS)
 
     Returns:
         List of search query strings (ordered by priority)
     """
+    cfg = settings_or_global(settings)
+    cap: Any = (
+        cfg.get("MAX_QUERIES_PER_TRACK", 200) if max_queries is None else max_queries
+    )
+    queries = iter_search_queries(
+        title, artists, original_title=original_title, settings=cfg
+    )
+    return list(islice(queries, cap) if cap else queries)
+
+
+def iter_search_queries(
+    title: str,
+    artists: str,
+    original_title: Optional[str] = None,
+    stage_budget: Optional[int] = None,
+    settings: Optional[Mapping[str, Any]] = None,
+) -> Iterator[str]:
+    """
+    Lazily yield the queries of make_search_queries(), in the same order
+
+    Title bases and artist variants are prepared up front (cheap); the query
+    stages themselves run only as far as the consumer pulls, so a matcher
+    that early-exits after a few queries never pays for the combinatorial
+    tail (artist pairs, title bases × artist variants, title grams × artist
+    variants).
+
+    Each combinatorial stage additionally stops after ``stage_budget`` raw
+    candidates (duplicates included), which bounds the cost of exhausting
+    the generator for tracks with many credited artists.
+
+    Args:
+        title: Clean track title (already sanitized)
+        artists: Artist string (may be empty for title-only search)
+        original_title: Original title from Rekordbox (for mix/remix detection)
+        stage_budget: Raw candidates per combinatorial stage; defaults to
+            QUERY_STAGE_BUDGET, 0 disables the budget
+        settings: Run settings snapshot (defaults to the global SETTINGS)
+
+    Yields:
+        De-duplicated search query strings (ordered by priority)
+    """
+    cfg = settings_or_global(settings)
+    budget = cfg.get("QUERY_STAGE_BUDGET", 0) if stage_budget is None else stage_budget
 
     def _Q(s: str) -> str:
         return (s or "").strip().strip('"').strip()
@@ -213,17 +265,6 @@ def make_search_queries(
         s = normalize_text(s)
         return [t for t in re.split(r"\s+", s) if t]
 
-    def _subset_space_join(tokens: List[str], max_r: Optional[int] = None) -> List[str]:
-        if not tokens:
-            return []
-        out = []
-        n = len(tokens)
-        upper = n if max_r is None else min(max_r, n)
-        for r in range(1, upper + 1):
-            for comb in combinations(tokens, r):
-                out.append(" ".join(comb))
-        return _ordered_unique_local(out)
-
     # If artists are missing, try to extract them from the original_title
     if (not artists or not artists.strip()) and (original_title or "").strip():
         try:
@@ -342,40 +383,40 @@ def make_search_queries(
 
     # Title grams (linear prefixes only if configured)
     words_all = _word_tokens_local(t_clean)
-    if SETTINGS.get("LINEAR_PREFIX_ONLY", False):
+    if cfg.get("LINEAR_PREFIX_ONLY", False):
         uni = (
             [words_all[0]]
             if (
                 words_all
-                and SETTINGS.get("TITLE_GRAM_MAX", 3) >= 1
+                and cfg.get("TITLE_GRAM_MAX", 3) >= 1
                 and words_all[0] not in STOP
             )
             else []
         )
         bi = (
             _title_prefixes(words_all, k_min=2, k_max=2)
-            if SETTINGS.get("TITLE_GRAM_MAX", 3) >= 2
+            if cfg.get("TITLE_GRAM_MAX", 3) >= 2
             else []
         )
         tri = (
             _title_prefixes(words_all, k_min=3, k_max=3)
-            if SETTINGS.get("TITLE_GRAM_MAX", 3) >= 3
+            if cfg.get("TITLE_GRAM_MAX", 3) >= 3
             else []
         )
     else:
         uni = (
             [w for w in words_all if w not in STOP]
-            if SETTINGS.get("TITLE_GRAM_MAX", 3) >= 1
+            if cfg.get("TITLE_GRAM_MAX", 3) >= 1
             else []
         )
         bi = (
             [" ".join(words_all[i : i + 2]) for i in range(len(words_all) - 1)]
-            if SETTINGS.get("TITLE_GRAM_MAX", 3) >= 2
+            if cfg.get("TITLE_GRAM_MAX", 3) >= 2
             else []
         )
         tri = (
             [" ".join(words_all[i : i + 3]) for i in range(len(words_all) - 2)]
-            if SETTINGS.get("TITLE_GRAM_MAX", 3) >= 3
+            if cfg.get("TITLE_GRAM_MAX", 3) >= 3
             else []
         )
 
@@ -431,7 +472,7 @@ def make_search_queries(
                 remixer_variants.append(f"{rn} remix")
         a_variants = _ordered_unique_local(remixer_variants + a_variants)
 
-        if SETTINGS.get("ALLOW_GENERIC_ARTIST_REMIX_HINTS", False) and _parse_mix_flags(
+        if cfg.get("ALLOW_GENERIC_ARTIST_REMIX_HINTS", False) and _parse_mix_flags(
             original_title or ""
         ).get("is_remix"):
             for tok in toks:
@@ -444,14 +485,20 @@ def make_search_queries(
         a_variants = [""]
 
     # ---------- assemble queries ----------
-    queries: List[str] = []
     seenq = set()
 
-    def _add(q: str):
+    def _add(q: str) -> Iterator[str]:
         k = q.lower().strip()
         if k and k not in seenq:
             seenq.add(k)
-            queries.append(q.strip())
+            yield q.strip()
+
+    def _budgeted(candidates: Iterator[str]) -> Iterator[str]:
+        # Combinatorial stages stop after stage_budget raw candidates
+        for n, q in enumerate(candidates, 1):
+            if budget and n > budget:
+                return
+            yield from _add(q)
 
     # Extract remixers and base title
     remixers_from_title = (
@@ -476,15 +523,15 @@ def make_search_queries(
 
         if exact_title and len(exact_title.split()) >= 2:
             # Try exact format as Beatport would search it (preserving remix)
-            _add(f'"{exact_title}"')
+            yield from _add(f'"{exact_title}"')
             # Also try without quotes (broader)
-            _add(exact_title)
+            yield from _add(exact_title)
             # Try with original artist if available
             if toks:
                 for a in toks[:1]:  # First artist
                     if a and a.strip():
-                        _add(f'"{exact_title}" {a}')
-                        _add(f'{a} "{exact_title}"')
+                        yield from _add(f'"{exact_title}" {a}')
+                        yield from _add(f'{a} "{exact_title}"')
 
     # Extract base title (without remix/extended/etc. suffixes) for better matching
     # Beatport often lists remixes as "Base Title - Original Artist (Remixer Remix)"
@@ -578,33 +625,33 @@ def make_search_queries(
                         else " ".join(toks[:2])
                     )
                     if all_artists:  # Only add if we have artists
-                        _add(f"{base_title_no_remix} {all_artists} {r}")
-                        _add(f"{base_title_no_remix} {all_artists} {r} remix")
+                        yield from _add(f"{base_title_no_remix} {all_artists} {r}")
+                        yield from _add(f"{base_title_no_remix} {all_artists} {r} remix")
                         # Try extended remix variants (common on Beatport)
-                        _add(f"{base_title_no_remix} {all_artists} {r} extended remix")
-                        _add(f"{base_title_no_remix} {all_artists} {r} extended mix")
-                        _add(f"{all_artists} {base_title_no_remix} {r}")
-                        _add(f"{all_artists} {r} {base_title_no_remix}")
+                        yield from _add(f"{base_title_no_remix} {all_artists} {r} extended remix")
+                        yield from _add(f"{base_title_no_remix} {all_artists} {r} extended mix")
+                        yield from _add(f"{all_artists} {base_title_no_remix} {r}")
+                        yield from _add(f"{all_artists} {r} {base_title_no_remix}")
                         if len(base_title_no_remix.split()) >= 1:
-                            _add(f'"{base_title_no_remix}" {all_artists} {r}')
-                            _add(f'{all_artists} "{base_title_no_remix}" {r}')
-                            _add(
+                            yield from _add(f'"{base_title_no_remix}" {all_artists} {r}')
+                            yield from _add(f'{all_artists} "{base_title_no_remix}" {r}')
+                            yield from _add(
                                 f'"{base_title_no_remix}" {all_artists} {r} extended remix'
                             )
-                            _add(
+                            yield from _add(
                                 f'"{base_title_no_remix}" {all_artists} {r} extended mix'
                             )
                     # Also try with just the remixer (no artists) if artists were filtered
-                    _add(f"{base_title_no_remix} {r}")
-                    _add(f"{base_title_no_remix} {r} remix")
+                    yield from _add(f"{base_title_no_remix} {r}")
+                    yield from _add(f"{base_title_no_remix} {r} remix")
                     # Try extended remix variants (common on Beatport)
-                    _add(f"{base_title_no_remix} {r} extended remix")
-                    _add(f"{base_title_no_remix} {r} extended mix")
+                    yield from _add(f"{base_title_no_remix} {r} extended remix")
+                    yield from _add(f"{base_title_no_remix} {r} extended mix")
                     if len(base_title_no_remix.split()) >= 1:
-                        _add(f'"{base_title_no_remix}" {r}')
-                        _add(f'"{base_title_no_remix}" {r} remix')
-                        _add(f'"{base_title_no_remix}" {r} extended remix')
-                        _add(f'"{base_title_no_remix}" {r} extended mix')
+                        yield from _add(f'"{base_title_no_remix}" {r}')
+                        yield from _add(f'"{base_title_no_remix}" {r} remix')
+                        yield from _add(f'"{base_title_no_remix}" {r} extended remix')
+                        yield from _add(f'"{base_title_no_remix}" {r} extended mix')
 
         if has_extended_intent and len(toks) >= 2:
             # Extended mix queries: combine ALL artists together for better matching
@@ -613,25 +660,25 @@ def make_search_queries(
                 " ".join(toks[:3]) if len(toks) >= 3 else " ".join(toks[:2])
             )
             # Try with all artists first (most specific)
-            _add(f"{base_title_no_remix} {all_artists_full}")
-            _add(f"{all_artists_full} {base_title_no_remix}")
+            yield from _add(f"{base_title_no_remix} {all_artists_full}")
+            yield from _add(f"{all_artists_full} {base_title_no_remix}")
             # Try with extended mix suffix
-            _add(f"{base_title_no_remix} {all_artists_full} Extended Mix")
-            _add(f"{base_title_no_remix} {all_artists_full} Extended")
-            _add(f"{all_artists_full} {base_title_no_remix} Extended Mix")
+            yield from _add(f"{base_title_no_remix} {all_artists_full} Extended Mix")
+            yield from _add(f"{base_title_no_remix} {all_artists_full} Extended")
+            yield from _add(f"{all_artists_full} {base_title_no_remix} Extended Mix")
             if len(base_title_no_remix.split()) >= 1:
-                _add(f'"{base_title_no_remix}" {all_artists_full}')
-                _add(f'{all_artists_full} "{base_title_no_remix}"')
-                _add(f'"{base_title_no_remix}" {all_artists_full} Extended Mix')
+                yield from _add(f'"{base_title_no_remix}" {all_artists_full}')
+                yield from _add(f'{all_artists_full} "{base_title_no_remix}"')
+                yield from _add(f'"{base_title_no_remix}" {all_artists_full} Extended Mix')
 
             # Also try with just first 2 artists (for compatibility)
             all_artists_pair = " ".join(toks[:2])
-            _add(f"{base_title_no_remix} {all_artists_pair}")
-            _add(f"{all_artists_pair} {base_title_no_remix}")
-            _add(f"{base_title_no_remix} {all_artists_pair} Extended Mix")
+            yield from _add(f"{base_title_no_remix} {all_artists_pair}")
+            yield from _add(f"{all_artists_pair} {base_title_no_remix}")
+            yield from _add(f"{base_title_no_remix} {all_artists_pair} Extended Mix")
             if len(base_title_no_remix.split()) >= 1:
-                _add(f'"{base_title_no_remix}" {all_artists_pair}')
-                _add(f'{all_artists_pair} "{base_title_no_remix}" Extended Mix')
+                yield from _add(f'"{base_title_no_remix}" {all_artists_pair}')
+                yield from _add(f'{all_artists_pair} "{base_title_no_remix}" Extended Mix')
 
     # PRIORITY STAGE 0: Base title (without remix) + ORIGINAL ARTIST first
     # This is MORE reliable than quoted queries for DuckDuckGo
@@ -656,15 +703,18 @@ def make_search_queries(
         # Try each original artist with base title first
         for a in toks_for_stage0:
             if a and a.strip():
-                _add(f"{base_title_no_remix} {a}")
-                _add(f"{a} {base_title_no_remix}")
+                yield from _add(f"{base_title_no_remix} {a}")
+                yield from _add(f"{a} {base_title_no_remix}")
 
         # Try two-artist combinations with base title
-        if len(toks_for_stage0) >= 2:
-            for a1, a2 in combinations(toks_for_stage0, 2):
-                _add(f"{base_title_no_remix} {a1} {a2}")
-                _add(f"{base_title_no_remix} {a1} & {a2}")
-                _add(f"{a1} {a2} {base_title_no_remix}")
+        def _stage0_pairs() -> Iterator[str]:
+            if len(toks_for_stage0) >= 2:
+                for a1, a2 in combinations(toks_for_stage0, 2):
+                    yield f"{base_title_no_remix} {a1} {a2}"
+                    yield f"{base_title_no_remix} {a1} & {a2}"
+                    yield f"{a1} {a2} {base_title_no_remix}"
+
+        yield from _budgeted(_stage0_pairs())
 
     # PRIORITY STAGE 0.25: Base title + original artist + "Original Mix" if present in title
     # This ensures queries like "Bass Bousa Original Mix" are generated for direct search
@@ -673,12 +723,12 @@ def make_search_queries(
         if input_mix_flags.get("is_original") and toks:
             for a in toks[:2]:  # First 2 artists
                 if a and a.strip():
-                    _add(f"{base_title_no_remix} {a} Original Mix")
-                    _add(f"{base_title_no_remix} Original Mix {a}")
-                    _add(f"{a} {base_title_no_remix} Original Mix")
+                    yield from _add(f"{base_title_no_remix} {a} Original Mix")
+                    yield from _add(f"{base_title_no_remix} Original Mix {a}")
+                    yield from _add(f"{a} {base_title_no_remix} Original Mix")
                     if len(base_title_no_remix.split()) >= 1:
-                        _add(f'"{base_title_no_remix}" {a} Original Mix')
-                        _add(f'{a} "{base_title_no_remix}" Original Mix')
+                        yield from _add(f'"{base_title_no_remix}" {a} Original Mix')
+                        yield from _add(f'{a} "{base_title_no_remix}" Original Mix')
 
     # PRIORITY STAGE 0.3: Base title + original artist + remixer (all together)
     # Beatport sometimes lists as "Title OriginalArtist (Remixer Remix)"
@@ -692,14 +742,14 @@ def make_search_queries(
                     if r and r.strip():
                         # Quoted title for precision
                         if len(base_title_no_remix.split()) >= 1:
-                            _add(f'"{base_title_no_remix}" {a} {r} remix')
-                            _add(f'"{base_title_no_remix}" {a} {r}')
-                            _add(f'{a} "{base_title_no_remix}" {r} remix')
+                            yield from _add(f'"{base_title_no_remix}" {a} {r} remix')
+                            yield from _add(f'"{base_title_no_remix}" {a} {r}')
+                            yield from _add(f'{a} "{base_title_no_remix}" {r} remix')
                         # Unquoted variants (broader)
-                        _add(f"{base_title_no_remix} {a} {r}")
-                        _add(f"{base_title_no_remix} {a} {r} remix")
-                        _add(f"{a} {base_title_no_remix} {r}")
-                        _add(f"{r} {base_title_no_remix} {a}")
+                        yield from _add(f"{base_title_no_remix} {a} {r}")
+                        yield from _add(f"{base_title_no_remix} {a} {r} remix")
+                        yield from _add(f"{a} {base_title_no_remix} {r}")
+                        yield from _add(f"{r} {base_title_no_remix} {a}")
 
     # PRIORITY STAGE 0.5: Base title + remixer (but after original artist)
     # Use quoted queries for better precision when searching for specific remixes
@@ -707,18 +757,18 @@ def make_search_queries(
         for r in remixers_from_title:
             if r and r.strip():
                 # Unquoted variants (broader search)
-                _add(f"{base_title_no_remix} {r}")
-                _add(f"{r} {base_title_no_remix}")
+                yield from _add(f"{base_title_no_remix} {r}")
+                yield from _add(f"{r} {base_title_no_remix}")
                 # Quoted variants for better precision (remix-specific)
                 if len(base_title_no_remix.split()) >= 1:  # Quote if at least one word
-                    _add(f'"{base_title_no_remix}" {r} remix')
-                    _add(f'"{base_title_no_remix}" {r}')
+                    yield from _add(f'"{base_title_no_remix}" {r} remix')
+                    yield from _add(f'"{base_title_no_remix}" {r}')
                 # Also try with "remix" suffix (unquoted)
-                _add(f"{base_title_no_remix} {r} remix")
-                if SETTINGS.get("REVERSE_REMIX_HINTS", True):
-                    _add(f"{r} remix {base_title_no_remix}")
+                yield from _add(f"{base_title_no_remix} {r} remix")
+                if cfg.get("REVERSE_REMIX_HINTS", True):
+                    yield from _add(f"{r} remix {base_title_no_remix}")
                     if len(base_title_no_remix.split()) >= 1:
-                        _add(f'{r} remix "{base_title_no_remix}"')
+                        yield from _add(f'{r} remix "{base_title_no_remix}"')
 
     # PRIORITY STAGE 0.75: Full title with remix + "<remixer> remix" variants
     if remixers_from_title:
@@ -732,11 +782,11 @@ def make_search_queries(
                 ]
                 for rr in rr_variants:
                     if rr.strip():
-                        _add(f"{tb} {rr}")
-                        if SETTINGS.get("PRIORITY_REVERSE_STAGE", True) or SETTINGS.get(
+                        yield from _add(f"{tb} {rr}")
+                        if cfg.get("PRIORITY_REVERSE_STAGE", True) or cfg.get(
                             "REVERSE_REMIX_HINTS", True
                         ):
-                            _add(f"{rr} {tb}")
+                            yield from _add(f"{rr} {tb}")
 
     # PRIORITY STAGE 0.8: Quoted full title variations
     # (lower priority - often returns wrong results)
@@ -746,13 +796,13 @@ def make_search_queries(
             title_words = len(tb.split())
             if title_words >= 2:  # Only quote multi-word titles
                 # Quoted exact title (but lower priority - base title + artist is more reliable)
-                _add(f'"{tb}"')
+                yield from _add(f'"{tb}"')
                 # Quoted title + artist
                 if toks:
                     for a in toks[:1]:  # First artist
                         if a and a.strip():
-                            _add(f'"{tb}" {a}')
-                            _add(f'{a} "{tb}"')
+                            yield from _add(f'"{tb}" {a}')
+                            yield from _add(f'{a} "{tb}"')
 
     # PRIORITY STAGE 1: Full title + ONE artist, then + TWO-artist subsets
     single_artists = toks[:] + (remixers_from_title[:] if remixers_from_title else [])
@@ -771,129 +821,131 @@ def make_search_queries(
             seen_pairs.add(key)
             two_artist_subsets.append((a1, a2))
 
-    for tb in title_bases:
-        tb_tokens = _word_tokens_local(tb)
-        has_parens = ("(" in tb) or (")" in tb)
-        single_word_title = len(tb_tokens) == 1
-        tb_q = (
-            f'"{tb}"'
-            if (
-                SETTINGS.get("QUOTED_TITLE_VARIANT", False)
-                and (has_parens or single_word_title)
+    def _stage1_title_artists() -> Iterator[str]:
+        for tb in title_bases:
+            tb_tokens = _word_tokens_local(tb)
+            has_parens = ("(" in tb) or (")" in tb)
+            single_word_title = len(tb_tokens) == 1
+            tb_q = (
+                f'"{tb}"'
+                if (
+                    cfg.get("QUOTED_TITLE_VARIANT", False)
+                    and (has_parens or single_word_title)
+                )
+                else None
             )
-            else None
-        )
-
-        for a in single_artists:
-            _add(f"{tb} {a}")
-            _add(f"{_Q(tb)} {a}")
-            if tb_q:
-                _add(f"{tb_q} {a}")
-            if SETTINGS.get("PRIORITY_REVERSE_STAGE", True) or SETTINGS.get(
-                "REVERSE_ORDER_QUERIES", False
-            ):
-                _add(f"{a} {tb}")
-                _add(f"{a} {_Q(tb)}")
-                if tb_q:
-                    _add(f"{a} {tb_q}")
 
-        for a1, a2 in two_artist_subsets:
-            for a in (f"{a1} {a2}", f"{a1} & {a2}"):
-                _add(f"{tb} {a}")
-                _add(f"{_Q(tb)} {a}")
+            for a in single_artists:
+                yield f"{tb} {a}"
+                yield f"{_Q(tb)} {a}"
                 if tb_q:
-                    _add(f"{tb_q} {a}")
-                if SETTINGS.get("PRIORITY_REVERSE_STAGE", True) or SETTINGS.get(
+                    yield f"{tb_q} {a}"
+                if cfg.get("PRIORITY_REVERSE_STAGE", True) or cfg.get(
                     "REVERSE_ORDER_QUERIES", False
                 ):
-                    _add(f"{a} {tb}")
-                    _add(f"{a} {_Q(tb)}")
+                    yield f"{a} {tb}"
+                    yield f"{a} {_Q(tb)}"
                     if tb_q:
-                        _add(f"{a} {tb_q}")
+                        yield f"{a} {tb_q}"
 
-    # (1) Full title bases × artist variants
-    for tb in title_bases:
-        for av in a_variants:
-            if av:
-                for q in (
-                    f"{tb} {av}",
-                    f"{tb} {_Q(av)}",
-                    f"{_Q(tb)} {av}",
-                    f"{_Q(tb)} {_Q(av)}",
-                ):
-                    _add(q)
-                allow_rev = SETTINGS.get("REVERSE_ORDER_QUERIES", False)
-                if (not allow_rev) and SETTINGS.get("REVERSE_REMIX_HINTS", True):
-                    av_key = av.lower().strip()
-                    if av_key in (
-                        set(v.lower().strip() for v in remixers_from_title or [])
-                    ) or re.search(r"\bremix\b", av_key, flags=re.I):
-                        allow_rev = True
-                if allow_rev:
-                    for q in (
-                        f"{av} {tb}",
-                        f"{_Q(av)} {tb}",
-                        f"{av} {_Q(tb)}",
-                        f"{_Q(av)} {_Q(tb)}",
+            for a1, a2 in two_artist_subsets:
+                for a in (f"{a1} {a2}", f"{a1} & {a2}"):
+                    yield f"{tb} {a}"
+                    yield f"{_Q(tb)} {a}"
+                    if tb_q:
+                        yield f"{tb_q} {a}"
+                    if cfg.get("PRIORITY_REVERSE_STAGE", True) or cfg.get(
+                        "REVERSE_ORDER_QUERIES", False
                     ):
-                        _add(q)
-            else:
-                if (not a_in) or (
-                    not SETTINGS.get("FULL_TITLE_WITH_ARTIST_ONLY", False)
-                ):
-                    for q in (tb, _Q(tb)):
-                        _add(q)
+                        yield f"{a} {tb}"
+                        yield f"{a} {_Q(tb)}"
+                        if tb_q:
+                            yield f"{a} {tb_q}"
 
-    # (2) Grams only when FULL_TITLE_WITH_ARTIST_ONLY is False
-    if not SETTINGS.get("FULL_TITLE_WITH_ARTIST_ONLY", False):
-        for g in grams_all:
-            for q in (g, _Q(g)):
-                _add(q)
+    yield from _budgeted(_stage1_title_artists())
 
-        if SETTINGS.get("CROSS_TITLE_GRAMS_WITH_ARTISTS", True):
-            if SETTINGS.get("CROSS_SMALL_ONLY", True):
-                uni_small = [w for w in words_all if w not in STOP]
-                bi_small = [
-                    " ".join(words_all[i : i + 2]) for i in range(len(words_all) - 1)
-                ]
-                cross_grams = _dedup(uni_small + bi_small)
-            else:
-                cross_grams = grams_all
-
-            for g in cross_grams:
-                for av in a_variants:
-                    if not av:
-                        continue
+    # (1) Full title bases × artist variants
+    def _stage_title_variants() -> Iterator[str]:
+        for tb in title_bases:
+            for av in a_variants:
+                if av:
                     for q in (
-                        f"{g} {av}",
-                        f"{_Q(g)} {av}",
-                        f"{g} {_Q(av)}",
-                        f"{_Q(g)} {_Q(av)}",
+                        f"{tb} {av}",
+                        f"{tb} {_Q(av)}",
+                        f"{_Q(tb)} {av}",
+                        f"{_Q(tb)} {_Q(av)}",
                     ):
-                        _add(q)
-                    if SETTINGS.get("REVERSE_ORDER_QUERIES", False):
+                        yield q
+                    allow_rev = cfg.get("REVERSE_ORDER_QUERIES", False)
+                    if (not allow_rev) and cfg.get("REVERSE_REMIX_HINTS", True):
+                        av_key = av.lower().strip()
+                        if av_key in (
+                            set(v.lower().strip() for v in remixers_from_title or [])
+                        ) or re.search(r"\bremix\b", av_key, flags=re.I):
+                            allow_rev = True
+                    if allow_rev:
                         for q in (
-                            f"{av} {g}",
-                            f"{_Q(av)} {g}",
-                            f"{av} {_Q(g)}",
-                            f"{_Q(av)} {_Q(g)}",
+                            f"{av} {tb}",
+                            f"{_Q(av)} {tb}",
+                            f"{av} {_Q(tb)}",
+                            f"{_Q(av)} {_Q(tb)}",
                         ):
-                            _add(q)
-
-            sw_tokens = _ordered_unique([t for t in single_word_artist_tokens if t])
-            for g in cross_grams:
-                for sw in sw_tokens:
-                    for q in (
-                        f"{g} {sw}",
-                        f"{_Q(g)} {sw}",
-                        f"{sw} {g}",
-                        f"{sw} {_Q(g)}",
+                            yield q
+                else:
+                    if (not a_in) or (
+                        not cfg.get("FULL_TITLE_WITH_ARTIST_ONLY", False)
                     ):
-                        _add(q)
+                        for q in (tb, _Q(tb)):
+                            yield q
+
+    yield from _budgeted(_stage_title_variants())
 
-    # Apply cap if configured
-    max_queries = SETTINGS.get("MAX_QUERIES_PER_TRACK", 200)
-    if max_queries and len(queries) > max_queries:
-        queries = queries[:max_queries]
+    # (2) Grams only when FULL_TITLE_WITH_ARTIST_ONLY is False
+    if not cfg.get("FULL_TITLE_WITH_ARTIST_ONLY", False):
+        for g in grams_all:
+            for q in (g, _Q(g)):
+                yield from _add(q)
+
+        def _stage_cross_grams() -> Iterator[str]:
+            if cfg.get("CROSS_TITLE_GRAMS_WITH_ARTISTS", True):
+                if cfg.get("CROSS_SMALL_ONLY", True):
+                    uni_small = [w for w in words_all if w not in STOP]
+                    bi_small = [
+                        " ".join(words_all[i : i + 2]) for i in range(len(words_all) - 1)
+                    ]
+                    cross_grams = _dedup(uni_small + bi_small)
+                else:
+                    cross_grams = grams_all
+
+                for g in cross_grams:
+                    for av in a_variants:
+                        if not av:
+                            continue
+                        for q in (
+                            f"{g} {av}",
+                            f"{_Q(g)} {av}",
+                            f"{g} {_Q(av)}",
+                            f"{_Q(g)} {_Q(av)}",
+                        ):
+                            yield q
+                        if cfg.get("REVERSE_ORDER_QUERIES", False):
+                            for q in (
+                                f"{av} {g}",
+                                f"{_Q(av)} {g}",
+                                f"{av} {_Q(g)}",
+                                f"{_Q(av)} {_Q(g)}",
+                            ):
+                                yield q
+
+                sw_tokens = _ordered_unique([t for t in single_word_artist_tokens if t])
+                for g in cross_grams:
+                    for sw in sw_tokens:
+                        for q in (
+                            f"{g} {sw}",
+                            f"{_Q(g)} {sw}",
+                            f"{sw} {g}",
+                            f"{sw} {_Q(g)}",
+                        ):
+                            yield q
 
-    return queries
+        yield from _budgeted(_stage_cross_grams())
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cached per-track query plans
+
+Everything process_track derives from a track before it touches the network
+(search title, artists for scoring, title-only mode, search queries, mix
+flags and generic phrases) is a pure function of the track's title, artist
+and the query-generation settings. A QueryPlan holds that derivation and
+QueryPlanCache memoizes it, so re-runs and the auto-research pass reuse the
+same plan instead of rebuilding it.
+
+Plans generate queries lazily and keep what they generated; callers take a
+prefix with queries_for(cap) or iter_queries(start, cap), so raising
+MAX_QUERIES_PER_TRACK (as auto-research does) extends a plan instead of
+invalidating it.
+
+Key functions:
+- build_query_plan(): Derive a plan from (title, artist)
+- settings_fingerprint(): Hash of the settings that shape query generation
+- QueryPlanCache: Thread-safe, bounded plan cache with JSON persistence
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
+
+from cuepoint.core.mix_parser import (
+    _extract_generic_parenthetical_phrases,
+    _parse_mix_flags,
+)
+from cuepoint.core.query_generator import iter_search_queries
+from cuepoint.core.text_processing import sanitize_title_for_search
+from cuepoint.data.rekordbox import extract_artists_from_title
+from cuepoint.models.config import SETTINGS
+
+logger = logging.getLogger(__name__)
+
+# Bump when query generation changes so persisted plans are not reused
+QUERY_PLAN_VERSION = 1
+
+# File name used when plans are saved next to run outputs
+QUERY_PLAN_FILENAME = "query_plans.json"
+
+# Settings read by iter_search_queries (MAX_QUERIES_PER_TRACK excluded:
+# plans are generated lazily and sliced per call)
+QUERY_PLAN_SETTINGS = (
+    "ALLOW_GENERIC_ARTIST_REMIX_HINTS",
+    "CROSS_SMALL_ONLY",
+    "CROSS_TITLE_GRAMS_WITH_ARTISTS",
+    "FULL_TITLE_WITH_ARTIST_ONLY",
+    "LINEAR_PREFIX_ONLY",
+    "PRIORITY_REVERSE_STAGE",
+    "QUERY_STAGE_BUDGET",
+    "QUOTED_TITLE_VARIANT",
+    "REVERSE_ORDER_QUERIES",
+    "REVERSE_REMIX_HINTS",
+    "TITLE_GRAM_MAX",
+)
+
+
+def settings_fingerprint(settings: Optional[Mapping[str, Any]] = None) -> str:
+    """Short hash of the query-generation settings (defaults to SETTINGS)."""
+    source = SETTINGS if settings is None else settings
+    payload: Dict[str, Any] = {"v": QUERY_PLAN_VERSION}
+    payload.update({key: source.get(key) for key in QUERY_PLAN_SETTINGS})
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def _normalize(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+def plan_key(title: str, artist: str, fingerprint: str) -> str:
+    """Cache key for (title, artist) under a settings fingerprint."""
+    blob = "\x00".join((fingerprint, _normalize(title), _normalize(artist)))
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class QueryPlan:
+    """Network-free inputs for matching one track.
+
+    Queries are pulled lazily from iter_search_queries() and memoized, so a
+    plan only ever generates as many queries as some caller has asked for.
+
+    Attributes:
+        title: Original track title.
+        artist: Original artist string (may be empty).
+        title_for_search: Sanitized title used for queries and scoring.
+        artists_for_scoring: Artists used for scoring (inferred from the
+            title when the artist field is empty).
+        title_only_search: True when queries carry no artist.
+        extracted: True when artists were inferred from the title.
+        queries: Queries generated so far, in priority order.
+        complete: True once the generator is exhausted.
+        input_mix_flags: Mix flags parsed from the original title.
+        input_generic_phrases: Generic parenthetical phrases from the title.
+        settings: Run settings queries are generated with (global SETTINGS
+            when None); not persisted.
+    """
+
+    title: str
+    artist: str
+    title_for_search: str
+    artists_for_scoring: str
+    title_only_search: bool
+    extracted: bool
+    queries: List[str] = field(default_factory=list)
+    complete: bool = False
+    input_mix_flags: Dict[str, object] = field(default_factory=dict)
+    input_generic_phrases: List[str] = field(default_factory=list)
+    settings: Optional[Mapping[str, Any]] = field(
+        default=None, repr=False, compare=False
+    )
+    _source: Optional[Iterator[str]] = field(default=None, repr=False, compare=False)
+    _lock: Any = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def _fill(self, n: Optional[int]) -> None:
+        """Generate queries until ``n`` exist (all of them when n is None)."""
+        with self._lock:
+            have = len(self.queries)
+            if self.complete or (n is not None and have >= n):
+                return
+            if self._source is None:
+                # Fresh or loaded plan: resume the deterministic generator
+                self._source = islice(
+                    iter_search_queries(
+                        self.title_for_search,
+                        "" if self.title_only_search else self.artists_for_scoring,
+                        original_title=self.title,
+                        settings=self.settings,
+                    ),
+                    have,
+                    None,
+                )
+            wanted = None if n is None else n - have
+            self.queries.extend(islice(self._source, wanted))
+            if n is None or len(self.queries) < n:
+                self.complete = True
+                self._source = None
+
+    def queries_for(self, cap: Any = None) -> List[str]:
+        """Queries limited to ``cap`` (falsy cap returns all of them)."""
+        limit = _as_limit(cap)
+        self._fill(limit or None)
+        return list(self.queries[:limit] if limit else self.queries)
+
+    def has_query(self, index: int) -> bool:
+        """True if a query exists at 0-based ``index``."""
+        self._fill(index + 1)
+        return index < len(self.queries)
+
+    def iter_queries(self, start: int = 0, cap: Any = None) -> Iterator[str]:
+        """Lazily yield queries ``start`` up to ``cap``, generating on demand."""
+        limit = _as_limit(cap)
+        i = start
+        while not limit or i < limit:
+            if not self.has_query(i):
+                return
+            yield self.queries[i]
+            i += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe form; mix flags and phrases are re-derived on load."""
+        with self._lock:
+            queries = list(self.queries)
+            complete = self.complete
+        return {
+            "title": self.title,
+            "artist": self.artist,
+            "title_for_search": self.title_for_search,
+            "artists_for_scoring": self.artists_for_scoring,
+            "title_only_search": self.title_only_search,
+            "extracted": self.extracted,
+            "queries": queries,
+            "complete": complete,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "QueryPlan":
+        title = str(data["title"])
+        return cls(
+            title=title,
+            artist=str(data.get("artist") or ""),
+            title_for_search=str(data["title_for_search"]),
+            artists_for_scoring=str(data.get("artists_for_scoring") or ""),
+            title_only_search=bool(data.get("title_only_search")),
+            extracted=bool(data.get("extracted")),
+            queries=[str(q) for q in data.get("queries") or []],
+            complete=bool(data.get("complete")),
+            input_mix_flags=_parse_mix_flags(title),
+            input_generic_phrases=_extract_generic_parenthetical_phrases(title),
+        )
+
+
+def _as_limit(cap: Any) -> int:
+    try:
+        return max(0, int(cap or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def build_query_plan(
+    title: str, artist: str, settings: Optional[Mapping[str, Any]] = None
+) -> QueryPlan:
+    """Derive the query plan for one track (uncached).
+
+    Mirrors what process_track used to do inline: sanitize the title, infer
+    artists from the title when the artist field is empty (search is then
+    title-only) and parse the mix intent. Queries are generated on demand.
+    """
+    original_artists = artist or ""
+    title_for_search = sanitize_title_for_search(title)
+    artists_for_scoring = original_artists
+    title_only_search = False
+    extracted = False
+
+    if not original_artists.strip():
+        ex = extract_artists_from_title(title)
+        if ex:
+            artists_for_scoring, extracted_title = ex
+            title_for_search = sanitize_title_for_search(extracted_title)
+            extracted = True
+        title_only_search = True
+
+    return QueryPlan(
+        title=title,
+        artist=original_artists,
+        title_for_search=title_for_search,
+        artists_for_scoring=artists_for_scoring,
+        title_only_search=title_only_search,
+        extracted=extracted,
+        input_mix_flags=_parse_mix_flags(title),
+        input_generic_phrases=_extract_generic_parenthetical_phrases(title),
+        settings=settings,
+    )
+
+
+class QueryPlanCache:
+    """Thread-safe LRU cache of QueryPlans keyed by input and settings.
+
+    Args:
+        max_entries: Plans kept in memory (least recently used are evicted).
+    """
+
+    def __init__(self, max_entries: int = 20000):
+        self.max_entries = max(1, int(max_entries))
+        self._plans: "OrderedDict[str, QueryPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._plans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+            self.hits = self.misses = 0
+
+    def get_or_build(
+        self,
+        title: str,
+        artist: str,
+        fingerprint: Optional[str] = None,
+        settings: Optional[Mapping[str, Any]] = None,
+    ) -> QueryPlan:
+        """Return the cached plan for (title, artist), building it on a miss.
+
+        Plans are keyed by the fingerprint of ``settings`` (global SETTINGS
+        when None), so runs with different query settings never share one.
+        """
+        key = plan_key(title, artist, fingerprint or settings_fingerprint(settings))
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                if plan.settings is None and settings is not None:
+                    # Loaded from disk: extend it with equivalent settings
+                    plan.settings = settings
+                return plan
+            self.misses += 1
+        # Build outside the lock; a concurrent duplicate build is harmless
+        plan = build_query_plan(title, artist, settings=settings)
+        self._put(key, plan)
+        return plan
+
+    def _put(self, key: str, plan: QueryPlan) -> None:
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+
+    def load(self, path: Union[str, Path]) -> int:
+        """Merge plans saved by save(); returns the number loaded.
+
+        Missing, unreadable or version-mismatched files are ignored.
+        """
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable query plan file %s: %s", path, e)
+            return 0
+        if not isinstance(data, dict) or data.get("version") != QUERY_PLAN_VERSION:
+            return 0
+        loaded = 0
+        for key, raw in (data.get("plans") or {}).items():
+            try:
+                self._put(str(key), QueryPlan.from_dict(raw))
+                loaded += 1
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+        return loaded
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write all cached plans to ``path`` atomically."""
+        from cuepoint.utils.file_safety import SafeFileWriter
+
+        with self._lock:
+            plans = {key: plan.to_dict() for key, plan in self._plans.items()}
+        payload = {"version": QUERY_PLAN_VERSION, "plans": plans}
+        SafeFileWriter.write_text_atomic(
+            Path(path), json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        )
+
+
+# Process-wide cache shared by ProcessorService runs
+query_plan_cache = QueryPlanCache()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+URL-slug pre-scoring of Beatport candidates
+
+Beatport track URLs look like ``/track/<title-slug>/<id>`` and the slug
+already spells out the title and mix name. best_beatport_match() used to
+fetch and parse every new candidate before scoring any of them. A
+SlugPrescorer fuzzy-matches each slug against the input title and mix intent
+so pages are fetched most-promising first, and works out the highest final
+score a candidate could still reach. Once that bound cannot beat the current
+best match, the page is not fetched at all.
+
+The bound is deliberately loose: artist similarity is taken as 100, every
+bonus at its maximum, and the title similarity read off the slug is raised by
+SLUG_PRESCORE_MARGIN because slugs drop punctuation and non-ASCII characters.
+Titles a slug cannot represent (no ASCII letters or digits) are never pruned.
+
+Key functions:
+- slug_text(): Title words encoded in a track URL
+- SlugPrescorer: Per-track ordering and "cannot win" test
+- CandidateSkipped: Raised by the matcher's fetch() for pruned pages
+"""
+
+import re
+import threading
+from typing import Any, Dict, List, Mapping, Optional
+
+from rapidfuzz import fuzz
+
+from cuepoint.core.mix_parser import _mix_bonus, _parse_mix_flags
+from cuepoint.core.text_processing import normalize_text
+from cuepoint.models.run_settings import settings_or_global
+
+_SLUG_RE = re.compile(r"/track/([^/?#]+)/\d+")
+
+# Largest bonuses consider() can add on top of the weighted base score
+MAX_YEAR_BONUS = 2
+MAX_KEY_BONUS = 2
+MAX_MIX_BONUS = 12
+MAX_ARTIST_BOOSTS = 40  # +25 (remix with exact remixer) and +15 (exact artist)
+REFIRE_BONUS = 12
+REWORK_BONUS = 8
+
+# Lowest title similarity guard 5 in consider() lets through
+TITLE_ONLY_FLOOR = 88
+REMIX_TITLE_FLOOR = 35
+TITLE_FLOOR = 50
+
+
+class CandidateSkipped(Exception):
+    """A candidate page was not fetched because it cannot beat the best match."""
+
+
+def slug_text(url: str) -> str:
+    """Title words in a track URL (``/track/never-sleep-again/1`` -> ``never sleep again``)."""
+    match = _SLUG_RE.search(url or "")
+    if not match:
+        return ""
+    return match.group(1).replace("-", " ").strip()
+
+
+class SlugPrescorer:
+    """Rank a track's candidate URLs by slug and prune those that cannot win.
+
+    Args:
+        track_title: Input title (as scored by consider()).
+        input_mix: Mix intent used for scoring (effective_input_mix).
+        title_only_mode: True when scoring without artists.
+        generic_phrases: Special parenthetical phrases of the input title.
+        special_intent: Refire/rework intent (want_refire, want_rework).
+        settings: Run settings snapshot (defaults to the global SETTINGS).
+    """
+
+    def __init__(
+        self,
+        track_title: str,
+        input_mix: Optional[Mapping[str, Any]] = None,
+        title_only_mode: bool = False,
+        generic_phrases: Optional[List[str]] = None,
+        special_intent: Optional[Mapping[str, Any]] = None,
+        settings: Optional[Mapping[str, Any]] = None,
+    ):
+        cfg = settings_or_global(settings)
+        self.input_mix = dict(input_mix or {})
+        self.title_norm = normalize_text(track_title)
+        self.margin = float(cfg.get("SLUG_PRESCORE_MARGIN", 10))
+        self.title_weight = float(cfg["TITLE_WEIGHT"])
+        self.artist_weight = float(cfg["ARTIST_WEIGHT"])
+        intent = special_intent or {}
+        self.max_bonus = (
+            MAX_YEAR_BONUS
+            + MAX_KEY_BONUS
+            + MAX_MIX_BONUS
+            + MAX_ARTIST_BOOSTS
+            + (int(cfg.get("GENERIC_PHRASE_MATCH_BONUS", 24)) if generic_phrases else 0)
+            + (REFIRE_BONUS if intent.get("want_refire") else 0)
+            + (REWORK_BONUS if intent.get("want_rework") else 0)
+        )
+        if title_only_mode:
+            self.title_floor = TITLE_ONLY_FLOOR
+        elif self.input_mix.get("is_remix"):
+            self.title_floor = REMIX_TITLE_FLOOR
+        else:
+            self.title_floor = TITLE_FLOOR
+        # A slug only keeps ASCII letters and digits; other titles are not pruned
+        self.can_prune = self.title_norm.isascii() and bool(self.title_norm.strip())
+        self._lock = threading.Lock()
+        self._sims: Dict[str, Optional[int]] = {}
+        self.skipped = 0
+
+    def title_similarity(self, url: str) -> Optional[int]:
+        """Title similarity read off the slug, or None if it cannot be judged."""
+        if url not in self._sims:
+            slug = normalize_text(slug_text(url))
+            sim = None
+            if slug and self.title_norm:
+                sim = int(fuzz.token_set_ratio(self.title_norm, slug))
+            self._sims[url] = sim
+        return self._sims[url]
+
+    def prescore(self, url: str) -> float:
+        """Ordering score: slug title similarity plus the mix bonus the slug implies."""
+        sim = self.title_similarity(url)
+        if sim is None:
+            return 100.0
+        mix, _reason = _mix_bonus(self.input_mix, _parse_mix_flags(slug_text(url)))
+        words = set(normalize_text(slug_text(url)).split())
+        remixers = self.input_mix.get("remixer_tokens") or set()
+        if remixers and set(remixers) <= words:
+            mix += MAX_MIX_BONUS
+        return float(sim + mix)
+
+    def order(self, urls: List[str]) -> List[str]:
+        """``urls`` most promising first (ties keep search order)."""
+        return sorted(urls, key=self.prescore, reverse=True)
+
+    def upper_bound(self, url: str) -> Optional[float]:
+        """Highest final score the candidate could reach.
+
+        Returns None when the slug cannot be judged and float("-inf") when the
+        title similarity could never clear guard 5's floor.
+        """
+        sim = self.title_similarity(url)
+        if sim is None or not self.can_prune:
+            return None
+        t_max = min(100.0, sim + self.margin)
+        if t_max < self.title_floor:
+            return float("-inf")
+        return self.title_weight * t_max + self.artist_weight * 100 + self.max_bonus
+
+    def cannot_win(self, url: str, best_score: Optional[float]) -> bool:
+        """True if fetching ``url`` cannot produce a new best match."""
+        bound = self.upper_bound(url)
+        if bound is None:
+            return False
+        if bound != float("-inf") and (best_score is None or bound > best_score):
+            return False
+        with self._lock:
+            self.skipped += 1
+        return True
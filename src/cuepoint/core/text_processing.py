@@ -20,11 +20,11 @@ Key functions:
 import html
 import re
 import unicodedata
-from typing import List, Tuple
+from typing import Any, List, Mapping, Optional, Tuple
 
 from rapidfuzz import fuzz, process
 
-from cuepoint.models.config import SETTINGS
+from cuepoint.models.run_settings import settings_or_global
 
 
 def _strip_accents(s: str) -> str:
@@ -253,7 +253,11 @@ def artists_similarity(a: str, b: str) -> int:
 
 
 def score_components(
-    title_a: str, artists_a: str, title_b: str, artists_b: str
+    title_a: str,
+    artists_a: str,
+    title_b: str,
+    artists_b: str,
+    settings: Optional[Mapping[str, Any]] = None,
 ) -> Tuple[int, int, float]:
     """
     Calculate similarity scores for title and artists
@@ -271,6 +275,7 @@ def score_components(
         artists_a: First artist string
         title_b: Second title (candidate)
         artists_b: Second artist string (candidate)
+        settings: Run settings snapshot (defaults to the global SETTINGS)
 
     Returns:
         Tuple of (title_sim, artist_sim, combined_score)
@@ -285,7 +290,8 @@ def score_components(
     title_sim = fuzz.token_set_ratio(t1, t2)
     artist_sim = artists_similarity(artists_a, artists_b)
     # Weighted combination (typically 55% title, 45% artist)
-    comp = SETTINGS["TITLE_WEIGHT"] * title_sim + SETTINGS["ARTIST_WEIGHT"] * artist_sim
+    cfg = settings_or_global(settings)
+    comp = cfg["TITLE_WEIGHT"] * title_sim + cfg["ARTIST_WEIGHT"] * artist_sim
     return title_sim, artist_sim, comp
 
 
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Asyncio fetch engine for Beatport candidate pages
+
+Opt-in alternative (``FETCH_ENGINE = "asyncio"``) to the ThreadPoolExecutor
+that best_beatport_match() opens per query for candidate pages. With nested
+pools a run keeps up to TRACK_WORKERS x CANDIDATE_WORKERS OS threads alive
+(180 with the defaults), each blocked on one request. Here the candidate
+fetches of every track run on a single event-loop thread through one aiohttp
+session, capped by ASYNC_MAX_IN_FLIGHT, while page parsing runs on a
+small executor (ASYNC_PARSE_WORKERS) so the loop never blocks on CPU work.
+
+submit() is called from ordinary track threads and returns a
+concurrent.futures.Future, so callers keep their as_completed() loops.
+
+Key functions:
+- AsyncFetchEngine: Event loop thread, aiohttp session and parse executor
+- get_fetch_engine(): Process-wide engine, created on first use
+- shutdown_fetch_engine(): Close the session and stop the loop (atexit)
+"""
+
+import asyncio
+import atexit
+import logging
+import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Mapping, Optional, TypeVar
+
+from cuepoint.models.config import HEADERS
+from cuepoint.utils.performance import STAGE_FETCH, stage_metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncFetchEngine:
+    """Fetch pages on one event loop and parse them on a small executor.
+
+    Args:
+        max_in_flight: Requests allowed in flight at once (all tracks).
+        parse_workers: Threads for the ``parse`` callables passed to submit().
+        connect_timeout: Seconds to establish a connection.
+        read_timeout: Seconds to wait for response data.
+        dns_cache_ttl: Seconds aiohttp reuses a resolved address (0 = off).
+        headers: Default request headers (browser headers from config).
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 64,
+        parse_workers: int = 2,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 8.0,
+        dns_cache_ttl: float = 300.0,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        self.max_in_flight = max(int(max_in_flight), 1)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.headers = dict(headers if headers is not None else HEADERS)
+        self._parse_pool = ThreadPoolExecutor(
+            max_workers=max(int(parse_workers), 1),
+            thread_name_prefix="cuepoint-parse",
+        )
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Any = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._aiohttp: Any = None
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    @classmethod
+    def from_settings(cls, settings: Mapping[str, Any]) -> "AsyncFetchEngine":
+        return cls(
+            max_in_flight=int(settings.get("ASYNC_MAX_IN_FLIGHT") or 64),
+            parse_workers=int(settings.get("ASYNC_PARSE_WORKERS") or 2),
+            connect_timeout=float(settings.get("CONNECT_TIMEOUT") or 3),
+            read_timeout=float(settings.get("READ_TIMEOUT") or 8),
+            dns_cache_ttl=float(settings.get("HTTP_DNS_CACHE_TTL") or 0),
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def submit(self, url: str, parse: Callable[[Optional[str]], T]) -> "Future[T]":
+        """Fetch ``url`` on the loop, then run ``parse(html)`` on the executor.
+
+        ``parse`` receives None when the page could not be fetched. Cancelling
+        the returned future cancels the request.
+        """
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._fetch_and_parse(url, parse), loop)
+
+    async def fetch_text(self, url: str) -> Optional[str]:
+        """GET ``url`` and return its body, or None after the retries fail.
+
+        Mirrors request_html_ex(): one retry on an error or non-200 status and
+        one retry with identity encoding when the body comes back empty.
+        """
+        session = await self._get_session()
+        assert self._semaphore is not None
+        async with self._semaphore:
+            self._track_in_flight(1)
+            try:
+                with stage_metrics.time(STAGE_FETCH):
+                    text = await self._get(session, url)
+                    if text is None:
+                        await asyncio.sleep(0.1)
+                        text = await self._get(session, url)
+                    if text == "":
+                        await asyncio.sleep(0.15 + random.random() * 0.2)
+                        text = await self._get(
+                            session,
+                            url,
+                            {
+                                "Accept-Encoding": "identity",
+                                "Cache-Control": "no-cache",
+                                "Pragma": "no-cache",
+                            },
+                        )
+                return text or None
+            finally:
+                self._track_in_flight(-1)
+
+    def close(self) -> None:
+        """Close the session, stop the loop thread and the parse executor."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._close_session(), loop).result(timeout=5)
+            except Exception as e:
+                logger.debug("Async fetch session close failed: %s", e)
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=5)
+            if not loop.is_running():
+                loop.close()
+        self._parse_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                thread = threading.Thread(target=run, name="cuepoint-fetch-loop", daemon=True)
+                thread.start()
+                ready.wait()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    async def _get_session(self) -> Any:
+        # Only the loop thread gets here, and there is no await before the
+        # assignment, so the session is created once
+        if self._session is None:
+            import aiohttp
+
+            self._aiohttp = aiohttp
+            connector = aiohttp.TCPConnector(
+                limit=self.max_in_flight,
+                use_dns_cache=self.dns_cache_ttl > 0,
+                ttl_dns_cache=int(self.dns_cache_ttl) or None,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.connect_timeout, sock_read=self.read_timeout
+                ),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._session
+
+    async def _get(
+        self, session: Any, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[str]:
+        try:
+            async with session.get(url, headers=headers, allow_redirects=True) as resp:
+                if resp.status != 200:
+                    return None
+                return str(await resp.text(errors="replace"))
+        except (self._aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            logger.debug("Async fetch failed for %s: %s", url, e)
+            return None
+
+    async def _fetch_and_parse(self, url: str, parse: Callable[[Optional[str]], T]) -> T:
+        html = await self.fetch_text(url)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_pool, parse, html)
+
+    async def _close_session(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _track_in_flight(self, delta: int) -> None:
+        # Loop thread only
+        self.in_flight += delta
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+
+_engine: Optional[AsyncFetchEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_fetch_engine(settings: Mapping[str, Any]) -> AsyncFetchEngine:
+    """Process-wide engine; limits come from the settings of its first caller."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = AsyncFetchEngine.from_settings(settings)
+        return _engine
+
+
+def shutdown_fetch_engine() -> None:
+    """Close the process-wide engine (a later get_fetch_engine() starts anew)."""
+    global _engine
+    with _engine_lock:
+        engine, _engine = _engine, None
+    if engine is not None:
+        engine.close()
+
+
+atexit.register(shutdown_fetch_engine)
@@ -13,6 +13,11 @@ Key Functions:
     track_urls(): Finds Beatport track URLs using multiple search strategies
     parse_track_page(): Parses a single Beatport track page and extracts metadata
     request_html(): Robust HTTP fetching with retry logic and cache detection
+    request_text(): Same fetch, returning the page text without building a soup
+    parse_track_json(): Track metadata from the page's JSON payloads only
+    track_fields_from_payloads(): The same, from payloads already extracted
+    parse_track_response(): Parse a fetched page and fill the payload cache
+    is_known_bad_page(): Whether a page recently 404'd or failed to parse
     ddg_track_urls(): Enhanced DuckDuckGo search with multiple query strategies
 
 Data Classes:
@@ -34,57 +39,98 @@ import socket
 import ssl
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as dateparser
-
-# Import DDGS with better error handling for packaged apps
-try:
-    from duckduckgo_search import DDGS
-except ImportError:
-    # Try direct import from ddgs package
-    try:
-        from ddgs import DDGS
-    except ImportError as import_err:
-        # Log the error for debugging
-        import logging
 
-        logger = logging.getLogger(__name__)
-        logger.error(
-            f"DuckDuckGo search (ddgs) not available: {import_err!r}", exc_info=True
-        )
-        # Create a stub that will raise on use
-        _import_err = import_err
-
-        class DDGS:  # type: ignore
-            def __init__(self, *args, **kwargs):
-                raise ImportError(
-                    "DuckDuckGo search (ddgs package) is required but not available. "
-                    "Please ensure ddgs>=9.0.0 is installed."
-                ) from _import_err
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
+from cuepoint.utils.lazy_import import LazyCallable, lazy_callable, lazy_module
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    from dateutil import parser as dateparser
+else:
+    # Deferred: bs4 and dateutil are imported when the first page is parsed
+    BeautifulSoup = lazy_callable("bs4", "BeautifulSoup")
+    dateparser = lazy_module("dateutil.parser")
 
 from cuepoint.core.mix_parser import (
     _extract_remixer_names_from_title,
     _merge_name_lists,
     _split_display_names,
 )
+from cuepoint.data.negative_cache import (
+    KIND_DEAD,
+    KIND_EMPTY_SEARCH,
+    KIND_UNPARSEABLE,
+    SearchOutcome,
+    current_search_outcome,
+    get_negative_cache,
+    note_search_answered,
+    note_search_failed,
+    search_outcome,
+)
+from cuepoint.data.page_json import extract_payloads
+from cuepoint.data.parse_pool import parse_page, parse_page_payloads
+from cuepoint.data.payload_cache import (
+    KIND_TRACK,
+    canonical_key,
+    get_payload_cache,
+    payload_ttl,
+)
 from cuepoint.models.config import BASE_URL, SESSION, SETTINGS
+from cuepoint.models.run_settings import settings_or_global
 from cuepoint.utils.http_cache import CacheInvalidation
+from cuepoint.utils.performance import STAGE_FETCH, STAGE_PARSE, stage_metrics
+from cuepoint.utils.single_flight import coalesce, normalize_url
+from cuepoint.utils.tracing import traced, tracer
 from cuepoint.utils.utils import retry_with_backoff, vlog
 
 logger = logging.getLogger(__name__)
 
 
-def beatport_search_direct(idx: int, query: str, max_results: int) -> List[str]:
+def _load_ddgs() -> Any:
+    """Import DDGS, with better error handling for packaged apps."""
+    try:
+        from duckduckgo_search import DDGS
+    except ImportError:
+        # Try direct import from ddgs package
+        try:
+            from ddgs import DDGS
+        except ImportError as import_err:
+            # Log the error for debugging
+            import logging
+
+            logger = logging.getLogger(__name__)
+            logger.error(
+                f"DuckDuckGo search (ddgs) not available: {import_err!r}",
+                exc_info=True,
+            )
+            # Create a stub that will raise on use
+            _import_err = import_err
+
+            class DDGS:  # type: ignore
+                def __init__(self, *args, **kwargs):
+                    raise ImportError(
+                        "DuckDuckGo search (ddgs package) is required but not available. "
+                        "Please ensure ddgs>=9.0.0 is installed."
+                    ) from _import_err
+
+                def __enter__(self):
+                    return self
+
+                def __exit__(self, *args):
+                    pass
+
+    return DDGS
+
+
+# Deferred until the first DuckDuckGo search
+DDGS = LazyCallable(_load_ddgs, "ddgs.DDGS")
+
+
+def beatport_search_direct(
+    idx: int, query: str, max_results: int, use_api: bool = True
+) -> List[str]:
     """Proxy to `cuepoint.data.beatport_search.beatport_search_direct`.
 
     This indirection keeps the symbol patchable in tests while still allowing
@@ -96,6 +142,8 @@ def beatport_search_direct(idx: int, query: str, max_results: int) -> List[str]:
     # direct search can fail due to network blocks/captchas/HTML changes; treat that
     # as a soft failure so other strategies (browser/DDG) can proceed.
     try:
+        if not use_api:
+            return _impl(idx, query, max_results, use_api=False)
         return _impl(idx, query, max_results)
     except Exception as e:
         import logging
@@ -106,6 +154,7 @@ def beatport_search_direct(idx: int, query: str, max_results: int) -> List[str]:
             exc_info=True,
         )
         vlog(idx, f"[search] direct search exception: {e!r}")
+        note_search_failed()
         return []
 
 
@@ -132,13 +181,10 @@ def beatport_search_browser(idx: int, query: str, max_results: int) -> List[str]
             exc_info=True,
         )
         vlog(idx, f"[search] browser automation exception: {e!r}")
+        note_search_failed()
         return []
 
 
-# Cache hit tracking for performance metrics
-_last_cache_hit = False
-
-
 @dataclass
 class BeatportCandidate:
     """
@@ -195,14 +241,16 @@ def is_track_url(u: str) -> bool:
     return bool(re.search(r"beatport\.com/track/[^/]+/\d+", u))
 
 
-def get_last_cache_hit() -> bool:
-    """Get the cache hit status from the last request_html() call.
-
-    Returns:
-        True if the last HTTP request was served from cache, False otherwise.
-        This is useful for performance monitoring and metrics.
-    """
-    return _last_cache_hit
+def _response_from_cache(resp: Optional[requests.Response]) -> bool:
+    """Return True if a response was served by requests_cache."""
+    if not resp:
+        return False
+    # requests_cache adds this attribute
+    if hasattr(resp, "from_cache"):
+        return bool(resp.from_cache)
+    if hasattr(resp, "_from_cache"):
+        return bool(resp._from_cache)
+    return False
 
 
 def request_html(url: str) -> Optional[BeautifulSoup]:
@@ -222,10 +270,82 @@ def request_html(url: str) -> Optional[BeautifulSoup]:
         after all retries.
 
     Note:
-        The cache hit status is tracked globally and can be retrieved using
-        get_last_cache_hit() after calling this function.
+        Use request_html_ex() to also get whether the response came from
+        cache.
     """
+    soup, _from_cache = request_html_ex(url)
+    return soup
+
+
+def _coalescing_enabled() -> bool:
+    return bool(SETTINGS.get("SINGLE_FLIGHT", True))
+
+
+@traced("request_html")
+def request_html_ex(url: str) -> Tuple[Optional[BeautifulSoup], bool]:
+    """Fetch and parse a URL, returning the cache-hit flag alongside the soup.
+
+    Same fetching strategy as request_html(). Network time is recorded under
+    the "fetch" stage and HTML parsing under the "parse" stage. Concurrent
+    calls for the same URL (other track workers) share one request and one
+    parse (single-flight group "html").
+
+    Args:
+        url: The URL to fetch.
+
+    Returns:
+        Tuple of (soup or None, from_cache).
+    """
+    return coalesce(
+        "html", normalize_url(url), lambda: _fetch_html(url), enabled=_coalescing_enabled()
+    )
+
+
+def request_text(url: str) -> Optional[str]:
+    """request_html() without the BeautifulSoup tree: the page text, or None.
+
+    Track pages are parsed from their JSON payloads (parse_track_html()), so
+    building a soup up front would be wasted work when those are present.
+    """
+    text, _from_cache = request_text_ex(url)
+    return text
+
+
+@traced("request_text")
+def request_text_ex(url: str) -> Tuple[Optional[str], bool]:
+    """Fetch a URL like request_html_ex() and return (text or None, from_cache).
+
+    Concurrent calls for the same URL share one request (single-flight group
+    "page_text").
+    """
+    return coalesce(
+        "page_text", normalize_url(url), lambda: _fetch_text(url), enabled=_coalescing_enabled()
+    )
+
+
+def _fetch_html(url: str) -> Tuple[Optional[BeautifulSoup], bool]:
+    """request_html_ex() without coalescing."""
+    text, from_cache = _fetch_text(url)
+    if text is None:
+        return None, from_cache
+    try:
+        with stage_metrics.time(STAGE_PARSE), tracer.span("parse_html"):
+            return BeautifulSoup(text, "lxml"), from_cache
+    except Exception:
+        return None, from_cache
+
+
+def _fetch_text(url: str) -> Tuple[Optional[str], bool]:
+    """request_text_ex() without coalescing."""
     to = (SETTINGS["CONNECT_TIMEOUT"], SETTINGS["READ_TIMEOUT"])
+    from_cache = False
+
+    # Pages that recently answered 404/410 are not requested again until
+    # their negative cache entry expires
+    negative = get_negative_cache()
+    page_key = canonical_key(url)
+    if negative is not None and negative.is_negative(KIND_DEAD, page_key):
+        return None, False
 
     def _is_empty_body(resp: requests.Response) -> bool:
         if resp is None:
@@ -251,66 +371,55 @@ def request_html(url: str) -> Optional[BeautifulSoup]:
     def _get(
         u: str, headers: Optional[Dict[str, str]] = None
     ) -> Optional[requests.Response]:
-        global _last_cache_hit
+        nonlocal from_cache
         try:
             resp = SESSION.get(u, timeout=to, allow_redirects=True, headers=headers)
-            # Track cache hit status for performance metrics
-            if resp:
-                # Check if response came from cache
-                # (requests_cache adds this attribute)
-                if hasattr(resp, "from_cache"):
-                    _last_cache_hit = resp.from_cache
-                elif hasattr(resp, "_from_cache"):
-                    _last_cache_hit = resp._from_cache
-                else:
-                    _last_cache_hit = False
-            else:
-                _last_cache_hit = False
-            return resp
         except requests.RequestException:
-            _last_cache_hit = False
-            return None
+            resp = None
+        from_cache = _response_from_cache(resp)
+        return resp
 
-    resp = _get(url)
-    if not resp or resp.status_code != 200:
-        time.sleep(0.1)
+    with stage_metrics.time(STAGE_FETCH):
         resp = _get(url)
         if not resp or resp.status_code != 200:
-            return None
-
-    if _is_empty_body(resp):
-        enc = resp.headers.get("Content-Encoding", "-")
-        cl = resp.headers.get("Content-Length", "-")
-        vlog(
-            "fetch",
-            f"[http] empty body (enc={enc}, cl={cl}); retry identity",
-        )
-        h2 = dict(SESSION.headers)
-        h2["Accept-Encoding"] = "identity"
-        h2["Cache-Control"] = "no-cache"
-        h2["Pragma"] = "no-cache"
-        time.sleep(0.15 + random.random() * 0.2)
-        resp = _get(url, headers=h2)
-
-    if resp and _is_empty_body(resp):
-        vlog("fetch", "[http] still empty; retry with cache-buster + identity")
-        bust = f"_r={int(time.time() * 1000)}"
-        sep = "&" if ("?" in url) else "?"
-        busted_url = f"{url}{sep}{bust}"
-        h3 = dict(SESSION.headers)
-        h3["Accept-Encoding"] = "identity"
-        h3["Cache-Control"] = "no-cache"
-        h3["Pragma"] = "no-cache"
-        time.sleep(0.15 + random.random() * 0.2)
-        resp = _get(busted_url, headers=h3)
+            time.sleep(0.1)
+            resp = _get(url)
+            if not resp or resp.status_code != 200:
+                if negative is not None and resp is not None and resp.status_code in (404, 410):
+                    negative.record(KIND_DEAD, page_key, f"HTTP {resp.status_code}")
+                return None, from_cache
+
+        if _is_empty_body(resp):
+            enc = resp.headers.get("Content-Encoding", "-")
+            cl = resp.headers.get("Content-Length", "-")
+            vlog(
+                "fetch",
+                f"[http] empty body (enc={enc}, cl={cl}); retry identity",
+            )
+            h2 = dict(SESSION.headers)
+            h2["Accept-Encoding"] = "identity"
+            h2["Cache-Control"] = "no-cache"
+            h2["Pragma"] = "no-cache"
+            time.sleep(0.15 + random.random() * 0.2)
+            resp = _get(url, headers=h2)
+
+        if resp and _is_empty_body(resp):
+            vlog("fetch", "[http] still empty; retry with cache-buster + identity")
+            bust = f"_r={int(time.time() * 1000)}"
+            sep = "&" if ("?" in url) else "?"
+            busted_url = f"{url}{sep}{bust}"
+            h3 = dict(SESSION.headers)
+            h3["Accept-Encoding"] = "identity"
+            h3["Cache-Control"] = "no-cache"
+            h3["Pragma"] = "no-cache"
+            time.sleep(0.15 + random.random() * 0.2)
+            resp = _get(busted_url, headers=h3)
 
     if not resp or resp.status_code != 200 or _is_empty_body(resp):
-        return None
-
-    try:
-        return BeautifulSoup(resp.text, "lxml")
-    except Exception:
-        return None
+        return None, from_cache
+    if negative is not None:
+        negative.forget(KIND_DEAD, page_key)
+    return resp.text, from_cache
 
 
 def _parse_structured_json_ld(soup: BeautifulSoup) -> Dict[str, str]:
@@ -330,10 +439,17 @@ def _parse_structured_json_ld(soup: BeautifulSoup) -> Dict[str, str]:
         - release_name: Release/album name
         - release_date: Release date string
     """
+    return _json_ld_info(
+        tag.string or "" for tag in soup.find_all("script", {"type": "application/ld+json"})
+    )
+
+
+def _json_ld_info(texts: Iterable[str]) -> Dict[str, str]:
+    """_parse_structured_json_ld() for JSON-LD script texts sliced out of the page."""
     out: Dict[str, Any] = {}
-    for tag in soup.find_all("script", {"type": "application/ld+json"}):
+    for text in texts:
         try:
-            data = json.loads(tag.string or "")
+            data = json.loads(text)
 
             def grab(d):
                 if not isinstance(d, dict):
@@ -401,12 +517,17 @@ def _parse_next_data(soup: BeautifulSoup) -> Dict[str, str]:
         - release_name: Release/album name
         - release_date: Release date string
     """
+    tag = soup.find("script", id="__NEXT_DATA__")
+    if not tag or not tag.string:
+        return {}
+    return _next_data_info(tag.string)
+
+
+def _next_data_info(text: str) -> Dict[str, str]:
+    """_parse_next_data() for the __NEXT_DATA__ script text sliced out of the page."""
     out: Dict[str, str] = {}
     try:
-        tag = soup.find("script", id="__NEXT_DATA__")
-        if not tag or not tag.string:
-            return out
-        data = json.loads(tag.string)
+        data = json.loads(text)
 
         def dig(node):
             if isinstance(node, dict):
@@ -480,9 +601,294 @@ def _parse_next_data(soup: BeautifulSoup) -> Dict[str, str]:
     return out
 
 
-@retry_with_backoff(max_retries=2, backoff_base=0.5, backoff_max=10.0, jitter=True)
+TrackFields = Tuple[
+    str,
+    str,
+    Optional[str],
+    Optional[int],
+    Optional[str],
+    Optional[str],
+    Optional[str],
+    Optional[str],
+    Optional[str],
+]
+
+EMPTY_TRACK_FIELDS: TrackFields = ("", "", None, None, None, None, None, None, None)
+
+# Fields the JSON payloads must supply for parse_track_json() to skip the soup
+_JSON_REQUIRED_FIELDS = (
+    "title",
+    "artists",
+    "key",
+    "bpm",
+    "label",
+    "genres",
+    "release_name",
+    "release_date",
+)
+
+
+def _merge_remixers(title: str, artists: str, remixers: str) -> str:
+    """Artists with the remixers (credited or named in the title) merged in."""
+    title_remixers = _extract_remixer_names_from_title(title)
+    if title_remixers:
+        remixers = ", ".join([remixers, ", ".join(title_remixers)]).strip(", ")
+
+    if remixers:
+        a_list = _split_display_names(artists)
+        r_list = _split_display_names(remixers)
+        artists = (
+            _merge_name_lists(a_list, r_list)
+            if a_list or r_list
+            else (artists or remixers)
+        )
+    return artists
+
+
+def _parse_release_date(date_str: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
+    """(ISO date, year) of a release date string; (None, None) if unparseable."""
+    if not date_str:
+        return None, None
+    # Resolved outside the try: a broken dateutil install must fail loudly,
+    # not read as an unparseable date
+    parse_date = dateparser.parse
+    try:
+        dt = parse_date(date_str, fuzzy=True)
+    except Exception:
+        return None, None
+    if not dt:
+        return None, None
+    return dt.date().isoformat(), dt.year
+
+
+def parse_track_json(html: str) -> Optional[TrackFields]:
+    """Track metadata from the page's JSON-LD and __NEXT_DATA__ payloads alone.
+
+    The payloads are sliced out of the raw text (page_json) instead of a
+    BeautifulSoup tree.
+
+    Returns:
+        The parse_track_page() tuple, or None when the payloads do not supply
+        every field, in which case the caller falls back to HTML scraping.
+    """
+    return track_fields_from_payloads(extract_payloads(html))
+
+
+def track_fields_from_payloads(payloads: Mapping[str, Any]) -> Optional[TrackFields]:
+    """parse_track_json() over an extract_payloads() dict (e.g. from the payload cache).
+
+    Sources are combined as in parse_track_soup(): JSON-LD first, Next.js
+    data for whatever it lacks. Returns None unless every field is supplied.
+    """
+    info = _json_ld_info(payloads.get("json_ld") or [])
+    next_data = payloads.get("next_data")
+    if next_data:
+        nd_info = _next_data_info(next_data)
+        if not info.get("title") or not info.get("artists"):
+            info.update(nd_info)
+        else:
+            for k, v in nd_info.items():
+                info.setdefault(k, v)
+    if not all(info.get(k) for k in _JSON_REQUIRED_FIELDS):
+        return None
+
+    rel_date_iso, year = _parse_release_date(info["release_date"])
+    if year is None:
+        return None
+    title = info["title"]
+    artists = _merge_remixers(title, info["artists"], info.get("remixers") or "")
+    bpm = re.sub(r"[^\d.]+", "", info["bpm"]) or info["bpm"]
+    return (
+        title,
+        artists,
+        info["key"],
+        year,
+        bpm,
+        info["label"],
+        info["genres"],
+        info["release_name"],
+        rel_date_iso,
+    )
+
+
+def parse_track_soup(soup: BeautifulSoup) -> TrackFields:
+    """Extract track metadata from an already fetched track page.
+
+    The parsing half of parse_track_page(): JSON-LD first, then Next.js data,
+    then HTML scraping. Returns the same tuple as parse_track_page().
+    """
+    info = {}
+    info.update(_parse_structured_json_ld(soup))
+    if not info.get("title") or not info.get("artists"):
+        info.update(_parse_next_data(soup))
+
+    title = info.get("title") or ""
+    if not title:
+        title_el = soup.select_one("h1, h2")
+        if title_el:
+            txt = title_el.get_text(" ", strip=True)
+            if txt and len(txt) > 2 and txt.lower() not in {"track", "title"}:
+                title = txt
+
+    artists = info.get("artists") or ""
+    if not artists:
+        header = soup.select_one("h1, h2")
+        header = header.parent if header else None
+        for _ in range(3):
+            if header and header.find("a", href=re.compile(r"^/artist/")):
+                break
+            header = header.parent if header else None
+        if header:
+            chips = header.select('a[href^="/artist/"]')[:8]
+            names = [
+                c.get_text(strip=True) for c in chips if c.get_text(strip=True)
+            ]
+            if names:
+                artists = ", ".join(dict.fromkeys(names))
+        if not artists:
+            byline = soup.find(string=re.compile(r"^\s*Artists?\s*:\s*$", re.I))
+            if byline and byline.parent:
+                artists = re.sub(
+                    r"Artists?:\s*",
+                    "",
+                    byline.parent.get_text(" ", strip=True),
+                    flags=re.I,
+                )
+
+    def val_after_label(label_regex: str) -> Optional[str]:
+        lbls = soup.find_all(string=re.compile(label_regex, re.I))
+        for lab in lbls:
+            try:
+                parent = lab.find_parent()
+                val = parent.find_next_sibling() if parent else None
+                if val:
+                    text = val.get_text(" ", strip=True)
+                    if text:
+                        return text
+            except Exception:
+                continue
+        return None
+
+    remixers = info.get("remixers") or ""
+    if not remixers:
+        remixers = val_after_label(r"^\s*Remixers?\s*$") or ""
+
+    artists = _merge_remixers(title, artists, remixers)
+
+    key = info.get("key") or val_after_label(r"^\s*Key\s*$")
+    bpm = info.get("bpm") or val_after_label(r"^\s*BPM\s*$")
+    if bpm:
+        bpm = re.sub(r"[^\d.]+", "", bpm) or bpm
+
+    label = info.get("label")
+    if label is None:
+        for labx in soup.select('a[href^="/label/"]'):
+            label = labx.get_text(strip=True)
+            if label:
+                break
+        if label is None:
+            label = val_after_label(r"^\s*Label\s*$")
+
+    genres = info.get("genres")
+    if genres is None:
+        genre_links = soup.select('a[href^="/genre/"]')
+        if genre_links:
+            genres = ", ".join(
+                dict.fromkeys(
+                    [
+                        g.get_text(strip=True)
+                        for g in genre_links
+                        if g.get_text(strip=True)
+                    ]
+                )
+            )
+        else:
+            genres = val_after_label(r"^\s*Genres?\s*$")
+
+    rel_name = info.get("release_name")
+    if rel_name is None:
+        rel_link = soup.select_one('a[href^="/release/"]')
+        if rel_link:
+            rel_name = rel_link.get_text(strip=True)
+        if not rel_name:
+            rel_name = val_after_label(r"^\s*Release\s*$")
+
+    date_str = info.get("release_date") or val_after_label(
+        r"(Release Date|Released)"
+    )
+    rel_date_iso, year = _parse_release_date(date_str)
+    if year is None:
+        meta = soup.find("meta", {"property": "music:release_date"})
+        if meta and meta.get("content"):
+            parse_date = dateparser.parse
+            try:
+                ydt = parse_date(meta["content"])
+                year = ydt.year
+                if not rel_date_iso:
+                    rel_date_iso = ydt.date().isoformat()
+            except Exception:
+                pass
+
+    return (
+        title or "",
+        artists or "",
+        key,
+        year,
+        bpm,
+        label,
+        genres,
+        rel_name,
+        rel_date_iso,
+    )
+
+
+def parse_track_html(html: Optional[str], json_fast_path: Optional[bool] = None) -> TrackFields:
+    """Parse a raw track page: parse_track_json() first, else parse_track_soup().
+
+    The BeautifulSoup tree is only built when the JSON payloads are missing or
+    incomplete, or when ``json_fast_path`` is False (default: the
+    PARSE_JSON_FAST_PATH setting).
+    """
+    if not html:
+        return EMPTY_TRACK_FIELDS
+    if json_fast_path is None:
+        json_fast_path = bool(SETTINGS.get("PARSE_JSON_FAST_PATH", True))
+    if json_fast_path:
+        with stage_metrics.time(STAGE_PARSE), tracer.span("parse_json"):
+            fields = parse_track_json(html)
+        if fields is not None:
+            return fields
+    try:
+        with stage_metrics.time(STAGE_PARSE), tracer.span("parse_html"):
+            soup = BeautifulSoup(html, "lxml")
+    except Exception:
+        return EMPTY_TRACK_FIELDS
+    return parse_track_soup(soup)
+
+
+def parse_track_html_payloads(
+    html: Optional[str],
+) -> Tuple[Optional[Dict[str, Any]], TrackFields]:
+    """parse_track_html() with the JSON fast path, plus the payloads it used.
+
+    The payloads are returned only when they supply every field (what the
+    payload cache stores); otherwise they are None and the fields come from
+    parse_track_soup().
+    """
+    if not html:
+        return None, EMPTY_TRACK_FIELDS
+    with stage_metrics.time(STAGE_PARSE), tracer.span("parse_json"):
+        payloads = extract_payloads(html)
+        fields = track_fields_from_payloads(payloads)
+    if fields is not None:
+        return payloads, fields
+    return None, parse_track_html(html, json_fast_path=False)
+
+
+@traced("parse_track_page")
 def parse_track_page(
     url: str,
+    settings: Optional[Mapping[str, Any]] = None,
 ) -> Tuple[
     str,
     str,
@@ -498,9 +904,15 @@ def parse_track_page(
 
     Fetches and parses a Beatport track page, extracting all available metadata
     using multiple parsing strategies (JSON-LD, Next.js data, HTML scraping).
+    The JSON payloads are read straight from the page text; the page is only
+    parsed into a BeautifulSoup tree when they leave a field empty. Complete
+    payloads are kept in the payload cache, so a later call for the same
+    track ID neither fetches nor slices the page.
 
     Args:
         url: Beatport track URL to parse.
+        settings: Run settings snapshot (defaults to the global SETTINGS);
+            decides the JSON fast path, the process pool and the caches.
 
     Returns:
         Tuple containing (in order):
@@ -518,172 +930,87 @@ def parse_track_page(
         This function uses retry logic with exponential backoff. If parsing fails
         after all retries, returns empty/default values rather than raising exceptions.
         Design 5.11: Self-healing for stale cache - if empty result from cache, invalidate and retry once.
+        Concurrent calls for the same URL share one fetch and parse (single-flight
+        group "track_page").
     """
-    for _stale_retry in range(2):
-        soup = request_html(url)
-        if soup is None:
-            return "", "", None, None, None, None, None, None, None
+    return coalesce(
+        "track_page",
+        normalize_url(url),
+        lambda: _parse_track_page(url, settings),
+        enabled=_coalescing_enabled(),
+    )
 
-        info = {}
-        info.update(_parse_structured_json_ld(soup))
-        if not info.get("title") or not info.get("artists"):
-            info.update(_parse_next_data(soup))
 
-        title = info.get("title") or ""
-        if not title:
-            title_el = soup.select_one("h1, h2")
-            if title_el:
-                txt = title_el.get_text(" ", strip=True)
-                if txt and len(txt) > 2 and txt.lower() not in {"track", "title"}:
-                    title = txt
+def cached_track_fields(
+    url: str, settings: Optional[Mapping[str, Any]] = None
+) -> Optional[TrackFields]:
+    """Track fields rebuilt from the payload cache, or None on a miss (or when disabled)."""
+    cache = get_payload_cache(settings)
+    if cache is None:
+        return None
+    payloads = cache.get(KIND_TRACK, canonical_key(url))
+    if payloads is None:
+        return None
+    with stage_metrics.time(STAGE_PARSE), tracer.span("parse_payloads"):
+        return track_fields_from_payloads(payloads)
 
-        artists = info.get("artists") or ""
-        if not artists:
-            header = soup.select_one("h1, h2")
-            header = header.parent if header else None
-            for _ in range(3):
-                if header and header.find("a", href=re.compile(r"^/artist/")):
-                    break
-                header = header.parent if header else None
-            if header:
-                chips = header.select('a[href^="/artist/"]')[:8]
-                names = [
-                    c.get_text(strip=True) for c in chips if c.get_text(strip=True)
-                ]
-                if names:
-                    artists = ", ".join(dict.fromkeys(names))
-            if not artists:
-                byline = soup.find(string=re.compile(r"^\s*Artists?\s*:\s*$", re.I))
-                if byline and byline.parent:
-                    artists = re.sub(
-                        r"Artists?:\s*",
-                        "",
-                        byline.parent.get_text(" ", strip=True),
-                        flags=re.I,
-                    )
 
-        remixers = info.get("remixers") or ""
-        if not remixers:
+def parse_track_response(
+    url: str, html: Optional[str], settings: Optional[Mapping[str, Any]] = None
+) -> TrackFields:
+    """Parse a fetched track page, keeping its JSON payloads in the payload cache.
 
-            def val_after_label(label_regex: str) -> Optional[str]:
-                lbls = soup.find_all(string=re.compile(label_regex, re.I))
-                for lab in lbls:
-                    try:
-                        parent = lab.find_parent()
-                        val = parent.find_next_sibling() if parent else None
-                        if val:
-                            text = val.get_text(" ", strip=True)
-                            if text:
-                                return text
-                    except Exception:
-                        continue
-                return None
+    Pages are parsed by parse_page(), on the process pool when enabled; with
+    the payload cache on, parse_page_payloads() also returns the payloads,
+    and only pages whose payloads supply every field are cached. A fetched
+    page that yields neither title nor artists is recorded in the negative
+    cache (KIND_UNPARSEABLE).
+    """
+    cache = get_payload_cache(settings)
+    if cache is not None and html:
+        payloads, fields = parse_page_payloads(html, settings)
+        if payloads is not None:
+            cache.put(KIND_TRACK, canonical_key(url), payloads, payload_ttl(KIND_TRACK, settings))
+    else:
+        fields = parse_page(html, settings)
 
-            remixers = val_after_label(r"^\s*Remixers?\s*$") or ""
+    negative = get_negative_cache(settings) if html else None
+    if negative is not None:
+        if fields[0] or fields[1]:
+            negative.forget(KIND_UNPARSEABLE, canonical_key(url))
+        else:
+            negative.record(KIND_UNPARSEABLE, canonical_key(url), "no title or artists")
+    return fields
 
-        title_remixers = _extract_remixer_names_from_title(title)
-        if title_remixers:
-            remixers = ", ".join([remixers, ", ".join(title_remixers)]).strip(", ")
 
-        if remixers:
-            a_list = _split_display_names(artists)
-            r_list = _split_display_names(remixers)
-            artists = (
-                _merge_name_lists(a_list, r_list)
-                if a_list or r_list
-                else (artists or remixers)
-            )
+def is_known_bad_page(url: str, settings: Optional[Mapping[str, Any]] = None) -> bool:
+    """True if the negative cache holds a recent 404/410 or failed parse of the page."""
+    negative = get_negative_cache(settings)
+    if negative is None:
+        return False
+    key = canonical_key(url)
+    return negative.is_negative(KIND_DEAD, key) or negative.is_negative(KIND_UNPARSEABLE, key)
 
-        def val_after_label(label_regex: str) -> Optional[str]:
-            lbls = soup.find_all(string=re.compile(label_regex, re.I))
-            for lab in lbls:
-                try:
-                    parent = lab.find_parent()
-                    val = parent.find_next_sibling() if parent else None
-                    if val:
-                        text = val.get_text(" ", strip=True)
-                        if text:
-                            return text
-                except Exception:
-                    continue
-            return None
 
-        key = info.get("key") or val_after_label(r"^\s*Key\s*$")
-        bpm = info.get("bpm") or val_after_label(r"^\s*BPM\s*$")
-        if bpm:
-            bpm = re.sub(r"[^\d.]+", "", bpm) or bpm
+@retry_with_backoff(max_retries=2, backoff_base=0.5, backoff_max=10.0, jitter=True)
+def _parse_track_page(url: str, settings: Optional[Mapping[str, Any]] = None) -> TrackFields:
+    """parse_track_page() without coalescing."""
+    if is_known_bad_page(url, settings):
+        return EMPTY_TRACK_FIELDS
+    cached = cached_track_fields(url, settings)
+    if cached is not None:
+        return cached
 
-        label = info.get("label")
-        if label is None:
-            for labx in soup.select('a[href^="/label/"]'):
-                label = labx.get_text(strip=True)
-                if label:
-                    break
-            if label is None:
-                label = val_after_label(r"^\s*Label\s*$")
-
-        genres = info.get("genres")
-        if genres is None:
-            genre_links = soup.select('a[href^="/genre/"]')
-            if genre_links:
-                genres = ", ".join(
-                    dict.fromkeys(
-                        [
-                            g.get_text(strip=True)
-                            for g in genre_links
-                            if g.get_text(strip=True)
-                        ]
-                    )
-                )
-            else:
-                genres = val_after_label(r"^\s*Genres?\s*$")
-
-        rel_name = info.get("release_name")
-        if rel_name is None:
-            rel_link = soup.select_one('a[href^="/release/"]')
-            if rel_link:
-                rel_name = rel_link.get_text(strip=True)
-            if not rel_name:
-                rel_name = val_after_label(r"^\s*Release\s*$")
-
-        date_str = info.get("release_date") or val_after_label(
-            r"(Release Date|Released)"
-        )
-        rel_date_iso = None
-        year = None
-        if date_str:
-            try:
-                dt = dateparser.parse(date_str, fuzzy=True)
-                rel_date_iso = dt.date().isoformat() if dt else None
-                year = dt.year if dt else None
-            except Exception:
-                year = None
-        if year is None:
-            meta = soup.find("meta", {"property": "music:release_date"})
-            if meta and meta.get("content"):
-                try:
-                    ydt = dateparser.parse(meta["content"])
-                    year = ydt.year
-                    if not rel_date_iso:
-                        rel_date_iso = ydt.date().isoformat()
-                except Exception:
-                    pass
+    for _stale_retry in range(2):
+        html, from_cache = request_text_ex(url)
+        if html is None:
+            return "", "", None, None, None, None, None, None, None
 
-        result = (
-            title or "",
-            artists or "",
-            key,
-            year,
-            bpm,
-            label,
-            genres,
-            rel_name,
-            rel_date_iso,
-        )
+        result = parse_track_response(url, html, settings)
         # Design 5.11: Self-healing for stale cache - empty result from cache may indicate Beatport HTML change
         if (
             (not result[0] and not result[1])
-            and get_last_cache_hit()
+            and from_cache
             and _stale_retry == 0
         ):
             if CacheInvalidation.invalidate_url(url):
@@ -693,12 +1020,15 @@ def parse_track_page(
     return "", "", None, None, None, None, None, None, None
 
 
+@traced("track_urls")
 def track_urls(
     idx: int,
     query: str,
     max_results: int,
     use_direct_search: Optional[bool] = None,
     fallback_to_browser: bool = False,
+    settings: Optional[Mapping[str, Any]] = None,
+    outcome: Optional[SearchOutcome] = None,
 ) -> List[str]:
     """
     Unified search function that can use direct Beatport search, DuckDuckGo, or both.
@@ -714,14 +1044,142 @@ def track_urls(
                           if None, use SETTINGS to decide (hybrid mode for remixes)
         fallback_to_browser: If True and other methods find many results but might miss the track,
                            try browser automation as fallback
+        settings: Run settings snapshot (defaults to the global SETTINGS)
+        outcome: Receives the search's backend reports, including whether
+                 its answers came from cache (SearchOutcome.from_cache)
 
     Returns:
         List of Beatport track URLs
+
+    Note:
+        Concurrent calls with the same normalised query, options and settings
+        snapshot (neighbouring tracks by the same artist) share one search
+        (single-flight group "search"). A search that backends answered with
+        no results (no backend failing) is not repeated until its negative
+        cache entry (KIND_EMPTY_SEARCH) expires. The search's backend
+        reports are merged into outcome and, inside search_outcome(), into
+        the caller's outcome; coalesced waiters get the leader's.
     """
     if os.environ.get("CUEPOINT_SKIP_BEATPORT", "").lower() in ("1", "true", "yes"):
         return []
 
-    diag_enabled = bool(SETTINGS.get("TRACE") or SETTINGS.get("VERBOSE"))
+    cfg = settings_or_global(settings)
+    normalized_query = " ".join(query.lower().split())
+    key = (
+        normalized_query,
+        max_results,
+        use_direct_search,
+        fallback_to_browser,
+        id(cfg),
+    )
+    negative = get_negative_cache(cfg)
+    empty_key = f"{use_direct_search}|{fallback_to_browser}|{normalized_query}"
+    if negative is not None and negative.is_negative(KIND_EMPTY_SEARCH, empty_key):
+        vlog(idx, "[search] no results last time; skipped until the negative cache expires")
+        skipped = SearchOutcome()
+        skipped.note_answered(from_cache=True)
+        _report_search_outcome(skipped, outcome)
+        return []
+
+    def search() -> Tuple[List[str], SearchOutcome]:
+        with search_outcome() as outcome:
+            found = _track_urls(
+                idx, query, max_results, use_direct_search, fallback_to_browser, cfg
+            )
+        # Recorded by the leader only, so coalesced waiters do not grow the
+        # backoff; and only when a backend answered and none failed
+        if negative is not None:
+            if found:
+                negative.forget(KIND_EMPTY_SEARCH, empty_key)
+            elif outcome.confirmed_empty:
+                negative.record(KIND_EMPTY_SEARCH, empty_key, query)
+        return found, outcome
+
+    urls, found_outcome = coalesce(
+        "search", key, search, enabled=bool(cfg.get("SINGLE_FLIGHT", True))
+    )
+    # Waiters get the leader's outcome with its result
+    _report_search_outcome(found_outcome, outcome)
+    # Callers may extend the list; waiters must not share the leader's
+    return list(urls)
+
+
+def _report_search_outcome(found: SearchOutcome, outcome: Optional[SearchOutcome]) -> None:
+    """Merge a search's outcome into track_urls()'s outcome and the thread's."""
+    if outcome is not None:
+        outcome.merge(found)
+    caller_outcome = current_search_outcome()
+    if caller_outcome is not None and caller_outcome is not outcome:
+        caller_outcome.merge(found)
+
+
+def _direct_search_query(query: str) -> str:
+    """Search terms for Beatport's own search: no "site:beatport.com/track" prefix or quotes."""
+    search_query = query
+    if "site:beatport.com" in query.lower():
+        parts = query.split("site:beatport.com", 1)
+        if len(parts) > 1:
+            search_query = parts[1].strip()
+            if search_query.startswith("/track"):
+                search_query = search_query[6:].strip()
+            search_query = search_query.strip().strip('"').strip("'").strip()
+            search_query = search_query.replace('"""', "").replace('"', "").replace("'", "")
+    return search_query
+
+
+def _hedged_track_urls(
+    idx: int,
+    query: str,
+    max_results: int,
+    prefer_direct: bool,
+    cfg: Mapping[str, Any],
+) -> List[str]:
+    """track_urls() for SEARCH_MODE="hedged": API, search page and DDG raced.
+
+    The preferred source (direct search for remix/original-mix queries,
+    DuckDuckGo otherwise) starts first; the others follow after the stagger.
+    """
+    from cuepoint.data.beatport_search import beatport_search_via_api
+    from cuepoint.data.hedged_search import hedged_search
+
+    search_query = _direct_search_query(query)
+    direct = [
+        ("api", lambda: beatport_search_via_api(idx, search_query, max_results)),
+        (
+            "direct",
+            lambda: beatport_search_direct(idx, search_query, max_results, use_api=False),
+        ),
+    ]
+    ddg = []
+    if cfg.get("DDG_ENABLED", True):
+        ddg = [("ddg", lambda: ddg_track_urls(idx, query, max_results, settings=cfg))]
+    backends = direct + ddg if prefer_direct else ddg + direct
+    # Backends run on pool threads; they report into this search's outcome
+    outcome = current_search_outcome()
+
+    def reporting(fn: Callable[[], List[str]]) -> Callable[[], List[str]]:
+        def run() -> List[str]:
+            with search_outcome(outcome):
+                return fn()
+
+        return run
+
+    backends = [(name, reporting(fn)) for name, fn in backends]
+    ratio = float(cfg.get("HEDGED_SUFFICIENT_RATIO", 0.7) or 0.7)
+    sufficient = max(1, int(max_results * ratio + 0.999))
+    return hedged_search(idx, backends, max_results, sufficient, settings=cfg)
+
+
+def _track_urls(
+    idx: int,
+    query: str,
+    max_results: int,
+    use_direct_search: Optional[bool],
+    fallback_to_browser: bool,
+    cfg: Mapping[str, Any],
+) -> List[str]:
+    """track_urls() without coalescing."""
+    diag_enabled = bool(cfg.get("TRACE") or cfg.get("VERBOSE"))
     diag_steps: list[str] = []
 
     def _diag(msg: str) -> None:
@@ -761,22 +1219,29 @@ def track_urls(
             or (ql.count("(") > 0 and ql.count(")") > 0)
         )
         has_original_mix = "original mix" in ql
-        use_direct_search = SETTINGS.get("USE_DIRECT_SEARCH_FOR_REMIXES", True) and (
+        use_direct_search = cfg.get("USE_DIRECT_SEARCH_FOR_REMIXES", True) and (
             has_remix_keywords or has_original_mix
         )
 
     # Global override: prefer direct Beatport search for ALL queries (not just remixes).
     # This is the most reliable mode on networks where DuckDuckGo is blocked/slow.
-    if SETTINGS.get("PREFER_DIRECT_SEARCH", False):
+    if cfg.get("PREFER_DIRECT_SEARCH", False):
         _diag("[search] PREFER_DIRECT_SEARCH=true -> using direct search")
         use_direct_search = True
 
     # If DuckDuckGo is disabled (manually or automatically), force direct search so we
     # still have a viable URL discovery path.
-    if not SETTINGS.get("DDG_ENABLED", True):
+    if not cfg.get("DDG_ENABLED", True):
         _diag("[search] DDG_ENABLED=false -> forcing direct search")
         use_direct_search = True
 
+    if cfg.get("SEARCH_MODE") == "hedged":
+        hedged_urls = _hedged_track_urls(idx, query, max_results, bool(use_direct_search), cfg)
+        _diag(f"[search] hedged search -> {len(hedged_urls)} urls (max_results={max_results})")
+        if hedged_urls or not cfg.get("USE_BROWSER_AUTOMATION", False):
+            return hedged_urls
+        return beatport_search_browser(idx, _direct_search_query(query), max_results)
+
     if use_direct_search:
         # Try direct Beatport search with multiple methods
         try:
@@ -827,7 +1292,7 @@ def track_urls(
                 if (
                     is_remix_query
                     and len(direct_urls) < 5
-                    and SETTINGS.get("USE_BROWSER_AUTOMATION", False)
+                    and cfg.get("USE_BROWSER_AUTOMATION", False)
                 ):
                     vlog(
                         idx,
@@ -876,7 +1341,7 @@ def track_urls(
             # query, try browser automation
             # This fixes cases like "Tighter (CamelPhat Remix) HOSH" where direct
             # search might miss the track
-            if SETTINGS.get("USE_BROWSER_AUTOMATION", False):
+            if cfg.get("USE_BROWSER_AUTOMATION", False):
                 # If direct search found nothing, or if it's a remix query and
                 # found very few results, try browser
                 should_try_browser = False
@@ -938,13 +1403,14 @@ def track_urls(
             _diag("[search] direct search ImportError -> falling back to DDG")
             pass
         except Exception as e:
+            note_search_failed()
             _diag(f"[search] direct search failed: {e!r} -> falling back to DDG")
             vlog(
                 idx, f"[search] direct search failed: {e!r}, falling back to DuckDuckGo"
             )
 
     # Fall back to DuckDuckGo
-    ddg_urls = ddg_track_urls(idx, query, max_results)
+    ddg_urls = ddg_track_urls(idx, query, max_results, settings=cfg)
     _diag(
         f"[search] ddg_track_urls -> {len(ddg_urls)} urls (max_results={max_results})"
     )
@@ -974,7 +1440,7 @@ def track_urls(
             )
             if direct_fallback:
                 return direct_fallback[:max_results]
-            if SETTINGS.get("USE_BROWSER_AUTOMATION", False):
+            if cfg.get("USE_BROWSER_AUTOMATION", False):
                 browser_fallback = beatport_search_browser(
                     idx, fallback_query, max_results
                 )
@@ -984,6 +1450,7 @@ def track_urls(
                 if browser_fallback:
                     return browser_fallback[:max_results]
         except Exception as e:
+            note_search_failed()
             _diag(f"[search] ddg empty -> fallback failed: {e!r}")
 
     # CRITICAL: If DuckDuckGo finds many results (50+) but we're looking for a specific track,
@@ -996,7 +1463,7 @@ def track_urls(
     should_try_browser = False
     if fallback_to_browser:
         should_try_browser = True
-    elif len(ddg_urls) >= 50 and SETTINGS.get("USE_BROWSER_AUTOMATION", False):
+    elif len(ddg_urls) >= 50 and cfg.get("USE_BROWSER_AUTOMATION", False):
         # Auto-detect artist+title queries: if query has spaces and looks like it might be
         # a specific track search (not just a title), try browser automation
         ql = (query or "").strip()
@@ -1007,7 +1474,7 @@ def track_urls(
             if not ((" remix" in ql.lower()) or ("extended mix" in ql.lower())):
                 should_try_browser = True
 
-    if should_try_browser and SETTINGS.get("USE_BROWSER_AUTOMATION", False):
+    if should_try_browser and cfg.get("USE_BROWSER_AUTOMATION", False):
         vlog(
             idx,
             f"[search] DDG found {len(ddg_urls)} results, trying browser automation "
@@ -1056,15 +1523,20 @@ def track_urls(
             idx,
             "[search] 0 candidates summary: "
             f"use_direct_search={use_direct_search}, "
-            f"DDG_ENABLED={SETTINGS.get('DDG_ENABLED', True)}, "
-            f"PREFER_DIRECT_SEARCH={SETTINGS.get('PREFER_DIRECT_SEARCH', False)}, "
-            f"USE_BROWSER_AUTOMATION={SETTINGS.get('USE_BROWSER_AUTOMATION', False)}",
+            f"DDG_ENABLED={cfg.get('DDG_ENABLED', True)}, "
+            f"PREFER_DIRECT_SEARCH={cfg.get('PREFER_DIRECT_SEARCH', False)}, "
+            f"USE_BROWSER_AUTOMATION={cfg.get('USE_BROWSER_AUTOMATION', False)}",
         )
 
     return ddg_urls
 
 
-def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
+def ddg_track_urls(
+    idx: int,
+    query: str,
+    max_results: int,
+    settings: Optional[Mapping[str, Any]] = None,
+) -> List[str]:
     """Enhanced search with multiple query strategies and better fallback.
 
     Searches for Beatport track URLs using DuckDuckGo with multiple query
@@ -1075,6 +1547,7 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
         idx: Track index for logging purposes.
         query: Search query string (may include quotes for exact matches).
         max_results: Maximum number of URLs to return.
+        settings: Run settings snapshot (defaults to the global SETTINGS).
 
     Returns:
         List of unique Beatport track URLs found. May return fewer than
@@ -1091,17 +1564,18 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
           the app falls back to other search methods (direct Beatport search,
           browser automation).
     """
+    cfg = settings_or_global(settings)
     # Allow users to disable DDG entirely.
-    if not SETTINGS.get("DDG_ENABLED", True):
+    if not cfg.get("DDG_ENABLED", True):
         vlog(idx, "[search] DuckDuckGo disabled - skipping DDG and using fallbacks")
         return []
 
     # Fast preflight: if we can't even establish a quick TCP connection to DuckDuckGo,
     # don't wait for ddgs/httpx timeouts. This avoids long stalls on networks where DDG
     # is blocked by VPN/firewall/DNS.
-    if SETTINGS.get("DDG_PREFLIGHT_ENABLED", True):
+    if cfg.get("DDG_PREFLIGHT_ENABLED", True):
         try:
-            preflight_timeout = float(SETTINGS.get("DDG_PREFLIGHT_TIMEOUT_SEC", 1.5))
+            preflight_timeout = float(cfg.get("DDG_PREFLIGHT_TIMEOUT_SEC", 1.5))
         except Exception:
             preflight_timeout = 1.5
         try:
@@ -1130,11 +1604,12 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
             # Don't auto-disable DDG globally; just skip DDG for this call.
             # This keeps behavior stable across runs and avoids noisy warnings.
             # If user wants to disable DDG entirely, they can set DDG_ENABLED=false.
-            if SETTINGS.get("TRACE") or SETTINGS.get("VERBOSE"):
+            if cfg.get("TRACE") or cfg.get("VERBOSE"):
                 logger.debug(
                     "DuckDuckGo preflight failed (network/DNS/TCP/TLS). Skipping DDG for this query. "
                     f"Reason: {e!r}"
                 )
+            note_search_failed()
             return []
 
     urls: List[str] = []
@@ -1180,10 +1655,10 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
             f"site:beatport.com {query}",  # Broader search last
         ]
 
-    ddg_timeout = SETTINGS.get("DDG_TIMEOUT_SEC", 12)
-    ddg_region = SETTINGS.get("DDG_REGION", "us-en")
-    ddg_proxy = SETTINGS.get("DDG_PROXY", None)
-    ddg_verify = SETTINGS.get("DDG_VERIFY_SSL", True)
+    ddg_timeout = cfg.get("DDG_TIMEOUT_SEC", 12)
+    ddg_region = cfg.get("DDG_REGION", "us-en")
+    ddg_proxy = cfg.get("DDG_PROXY", None)
+    ddg_verify = cfg.get("DDG_VERIFY_SSL", True)
     timed_out = False
 
     try:
@@ -1204,6 +1679,7 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
                         href = r.get("href") or r.get("url") or ""
                         if "beatport.com/track/" in href:
                             urls.append(href)
+                    note_search_answered()
                     # For remix queries, don't break early - we need to find specific tracks
                     # Only break early for non-remix queries with many results
                     if len(urls) >= 20 and (
@@ -1211,6 +1687,7 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
                     ):
                         break
                 except Exception as e:
+                    note_search_failed()
                     # Handle DDGSException specifically (known issue with ddgs package parsing)
 
                     # Try to import DDGSException and TimeoutException to check type directly
@@ -1282,6 +1759,7 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
         # Other errors (network, SSL, etc.)
         logger.error(f"[{idx}] DuckDuckGo search failed: {e!r}", exc_info=True)
         vlog(idx, f"[search] ddgs error: {e!r}")
+        note_search_failed()
         return []
 
     # Process and deduplicate URLs
@@ -1311,7 +1789,7 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
             needs_fallback
             and (" " in ql)
             and (not timed_out)
-            and SETTINGS.get("DDG_ENABLED", True)
+            and cfg.get("DDG_ENABLED", True)
         ):
             extra_pages: list[str] = []
 
@@ -1335,6 +1813,7 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
                                 if href and "beatport.com" in href:
                                     extra_pages.append(href)
                         except Exception as e:
+                            note_search_failed()
                             logger.debug(
                                 f"[{idx}] Fallback search error for '{fallback_q}': {e!r}"
                             )
@@ -1344,6 +1823,7 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
                             )
                             continue
             except Exception as e:
+                note_search_failed()
                 logger.warning(f"[{idx}] Fallback DuckDuckGo search failed: {e!r}")
                 vlog(idx, f"[fallback-search] ddgs error: {e!r}")
 
@@ -1363,7 +1843,7 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
                 # Look for track links
                 for a in soup.select('a[href^="/track/"]'):
                     try:
-                        href = a.get("href") or ""
+                        href = str(a.get("href") or "")
                         if not href:
                             continue
                         full = BASE_URL + href if href.startswith("/track/") else href
@@ -1408,12 +1888,14 @@ def ddg_track_urls(idx: int, query: str, max_results: int) -> List[str]:
                                     seen.add(href)
                                     out.append(href)
                         except Exception as e:
+                            note_search_failed()
                             vlog(idx, f"[broader-search] error for '{broad_q}': {e!r}")
                             continue
         except Exception as e:
+            note_search_failed()
             vlog(idx, f"[url-construction] error: {e!r}")
 
-    if SETTINGS["TRACE"]:
+    if cfg["TRACE"]:
         from cuepoint.utils.utils import tlog
 
         for i, u in enumerate(out, 1):
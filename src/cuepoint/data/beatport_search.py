@@ -31,11 +31,29 @@ import json
 import random
 import re
 import time
-from typing import Any, List
+from typing import Any, List, Mapping, Optional
 from urllib.parse import quote_plus
 
-from cuepoint.data.beatport import is_track_url, request_html
+from cuepoint.data.beatport import is_track_url, request_html_ex
+from cuepoint.data.browser_pool import (
+    BACKEND_PLAYWRIGHT,
+    BACKEND_SELENIUM,
+    collect_track_links,
+)
+from cuepoint.data.negative_cache import (
+    KIND_EMPTY_SEARCH,
+    get_negative_cache,
+    note_search_answered,
+    note_search_failed,
+)
+from cuepoint.data.payload_cache import (
+    KIND_SEARCH,
+    canonical_key,
+    get_payload_cache,
+    payload_ttl,
+)
 from cuepoint.models.config import BASE_URL, SESSION, SETTINGS
+from cuepoint.models.run_settings import settings_or_global
 from cuepoint.utils.utils import vlog
 
 _PLAYWRIGHT_USABLE = True
@@ -261,8 +279,11 @@ def beatport_search_via_api(idx: int, query: str, max_results: int = 50) -> List
 
     Note:
         Tries multiple common API endpoint patterns. Returns empty list
-        if all attempts fail.
+        if all attempts fail. Endpoints that keep failing (non-200 or not
+        JSON) are skipped for a while (see hedged_search.BACKEND_HEALTH).
     """
+    from cuepoint.data.hedged_search import BACKEND_HEALTH
+
     urls: List[str] = []
 
     # Common API endpoint patterns to try
@@ -274,11 +295,20 @@ def beatport_search_via_api(idx: int, query: str, max_results: int = 50) -> List
     ]
 
     for endpoint in api_endpoints:
+        backend = "api:" + endpoint[len(BASE_URL) :].split("?", 1)[0]
+        if BACKEND_HEALTH.is_dead(backend):
+            continue
+        t0 = time.perf_counter()
+        ok = False
         try:
             resp = SESSION.get(endpoint, timeout=SETTINGS["READ_TIMEOUT"])
+            if resp.status_code == 429 or resp.status_code >= 500:
+                note_search_failed()
             if resp.status_code == 200:
                 try:
                     data = resp.json()
+                    ok = True
+                    note_search_answered(from_cache=bool(getattr(resp, "from_cache", False)))
                     seen = set()
                     _extract_track_ids_from_next_data(data, seen, urls, max_results)
                     if urls:
@@ -291,12 +321,17 @@ def beatport_search_via_api(idx: int, query: str, max_results: int = 50) -> List
                     continue
         except Exception as e:
             vlog(idx, f"[beatport-api] Error trying {endpoint}: {e!r}")
+            note_search_failed()
             continue
+        finally:
+            BACKEND_HEALTH.record(backend, ok, time.perf_counter() - t0, len(urls))
 
     return []
 
 
-def beatport_search_direct(idx: int, query: str, max_results: int = 50) -> List[str]:
+def beatport_search_direct(
+    idx: int, query: str, max_results: int = 50, use_api: bool = True
+) -> List[str]:
     """
     Search Beatport directly by scraping their search results page.
     This bypasses DuckDuckGo entirely and gets results directly from Beatport.
@@ -305,16 +340,24 @@ def beatport_search_direct(idx: int, query: str, max_results: int = 50) -> List[
         idx: Track index for logging
         query: Search query (e.g., "Never Sleep Again (Keinemusik Remix)")
         max_results: Maximum number of results to return
+        use_api: Try the API endpoints before the search page (hedged search
+            runs them as a separate backend)
 
     Returns:
         List of Beatport track URLs
+
+    Note:
+        Non-empty result lists of the search page are kept in the payload
+        cache (PAYLOAD_CACHE_SEARCH_TTL_HOURS); a hit skips the fetch. A page
+        with no results is recorded in the negative cache and not fetched
+        again until that entry expires.
     """
     urls: List[str] = []
     seen = set()
 
     try:
         # First, try API endpoints
-        api_urls = beatport_search_via_api(idx, query, max_results)
+        api_urls = beatport_search_via_api(idx, query, max_results) if use_api else []
         if api_urls:
             return api_urls
 
@@ -326,12 +369,28 @@ def beatport_search_direct(idx: int, query: str, max_results: int = 50) -> List[
         encoded_query = quote_plus(clean_query)
         search_url = f"{BASE_URL}/search?q={encoded_query}"
 
+        # Result lists of recent searches are kept in the payload cache
+        payload_cache = get_payload_cache()
+        cache_key = f"{canonical_key(search_url)}#{max_results}"
+        if payload_cache is not None:
+            cached_urls = payload_cache.get(KIND_SEARCH, cache_key)
+            if cached_urls is not None:
+                vlog(idx, f"[beatport-direct] {len(cached_urls)} track URLs from payload cache")
+                note_search_answered(from_cache=True)
+                return list(cached_urls)
+        negative = get_negative_cache()
+        if negative is not None and negative.is_negative(KIND_EMPTY_SEARCH, cache_key):
+            vlog(idx, "[beatport-direct] No results last time (negative cache)")
+            note_search_answered(from_cache=True)
+            return []
+
         vlog(idx, f"[beatport-direct] Searching: {search_url}")  # noqa: F541
 
         # Fetch the search page
-        soup = request_html(search_url)
+        soup, from_cache = request_html_ex(search_url)
         if not soup:
             vlog(idx, "[beatport-direct] Failed to fetch search page")
+            note_search_failed()
             return []
 
         # Method 1: Look for track links directly in HTML
@@ -409,9 +468,23 @@ def beatport_search_direct(idx: int, query: str, max_results: int = 50) -> List[
         time.sleep(random.uniform(0.1, 0.3))
 
         vlog(idx, f"[beatport-direct] Found {len(urls)} track URLs")
+        note_search_answered(from_cache=from_cache)
+        if negative is not None:
+            if urls:
+                negative.forget(KIND_EMPTY_SEARCH, cache_key)
+            else:
+                negative.record(KIND_EMPTY_SEARCH, cache_key, query)
+        if payload_cache is not None and urls:
+            payload_cache.put(
+                KIND_SEARCH,
+                cache_key,
+                urls[:max_results] if max_results else urls,
+                payload_ttl(KIND_SEARCH),
+            )
 
     except Exception as e:
         vlog(idx, f"[beatport-direct] Error: {e!r}")
+        note_search_failed()
 
     return urls[:max_results] if max_results else urls
 
@@ -442,62 +515,42 @@ def beatport_search_browser(idx: int, query: str, max_results: int = 50) -> List
         - Selenium: `pip install selenium` (requires ChromeDriver)
 
         Browser runs in headless mode. Waits for track links to appear
-        before extracting URLs.
+        before extracting URLs. Inside browser_pool_scope() (processing
+        runs) browsers stay warm across queries; otherwise each call
+        launches and closes its own browser.
     """
     global _PLAYWRIGHT_ERROR_LOGGED, _PLAYWRIGHT_USABLE
     urls: List[str] = []
 
-    # Try Playwright first (faster, more modern)
+    # Remove all quote marks (single, double, triple) from query for URL encoding
+    clean_query = query.strip('"').strip("'").strip()
+    # Remove any remaining quote marks in the middle
+    clean_query = clean_query.replace('"""', "").replace('"', "").replace("'", "")
+    search_url = f"{BASE_URL}/search?q={quote_plus(clean_query)}"
+
+    def _collect(hrefs: List[str]) -> None:
+        seen = set(urls)
+        for href in hrefs:
+            full_url = href if href.startswith("http") else f"{BASE_URL}{href}"
+            if is_track_url(full_url) and full_url not in seen:
+                seen.add(full_url)
+                urls.append(full_url)
+                if len(urls) >= max_results:
+                    break
+
+    # Try Playwright first (faster, more modern). Browsers come from the
+    # run-scoped pool when one is active (see browser_pool_scope()).
     if _PLAYWRIGHT_USABLE:
         try:
-            from playwright.sync_api import sync_playwright
-
             vlog(idx, f"[beatport-browser] Using Playwright to search: {query}")
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                # Navigate to search page
-                # Remove all quote marks (single, double, triple) from query for URL encoding
-                clean_query = query.strip('"').strip("'").strip()
-                # Remove any remaining quote marks in the middle
-                clean_query = (
-                    clean_query.replace('"""', "").replace('"', "").replace("'", "")
+            _collect(collect_track_links(BACKEND_PLAYWRIGHT, search_url))
+            note_search_answered()
+            if urls:
+                vlog(
+                    idx,
+                    f"[beatport-browser] Found {len(urls)} tracks via Playwright",
                 )
-                encoded_query = quote_plus(clean_query)
-                search_url = f"{BASE_URL}/search?q={encoded_query}"
-
-                page.goto(search_url, wait_until="networkidle", timeout=30000)
-
-                # Wait for track links to appear
-                try:
-                    page.wait_for_selector('a[href^="/track/"]', timeout=10000)
-                except Exception:
-                    pass  # Links might already be there
-
-                # Extract all track links
-                seen = set()
-                for link in page.query_selector_all('a[href^="/track/"]'):
-                    href = link.get_attribute("href")
-                    if href:
-                        full_url = (
-                            f"{BASE_URL}{href}" if href.startswith("/track/") else href
-                        )
-                        if is_track_url(full_url) and full_url not in seen:
-                            seen.add(full_url)
-                            urls.append(full_url)
-                            if len(urls) >= max_results:
-                                break
-
-                browser.close()
-
-                if urls:
-                    vlog(
-                        idx,
-                        f"[beatport-browser] Found {len(urls)} tracks via Playwright",
-                    )
-                    return urls[:max_results]
+                return urls[:max_results]
 
         except ImportError:
             # Playwright not available, try Selenium
@@ -515,75 +568,16 @@ def beatport_search_browser(idx: int, query: str, max_results: int = 50) -> List
                         "run `playwright install chromium` (or `playwright install`) "
                         "to enable Playwright.",
                     )
+            note_search_failed()
             vlog(idx, f"[beatport-browser] Playwright error: {e!r}, trying Selenium")
 
     # Fallback to Selenium
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.support.ui import WebDriverWait
-
         vlog(idx, f"[beatport-browser] Using Selenium to search: {query}")
-
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--use-gl=swiftshader")
-        options.add_argument("--disable-software-rasterizer")
-        options.add_argument("--disable-gpu-compositing")
-        options.add_argument("--disable-features=VizDisplayCompositor,UseSkiaRenderer")
-        options.add_argument("--in-process-gpu")
-        options.add_argument("--log-level=3")
-        options.add_experimental_option("excludeSwitches", ["enable-logging"])
-        options.add_argument(f"user-agent={SETTINGS.get('USER_AGENT', 'Mozilla/5.0')}")
-
-        driver = webdriver.Chrome(options=options)
-
-        try:
-            # Remove all quote marks (single, double, triple) from query for URL encoding
-            clean_query = query.strip('"').strip("'").strip()
-            # Remove any remaining quote marks in the middle
-            clean_query = (
-                clean_query.replace('"""', "").replace('"', "").replace("'", "")
-            )
-            encoded_query = quote_plus(clean_query)
-            search_url = f"{BASE_URL}/search?q={encoded_query}"
-
-            driver.get(search_url)
-
-            # Wait for track links
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, 'a[href^="/track/"]')
-                    )
-                )
-            except Exception:
-                pass
-
-            # Extract track links
-            seen = set()
-            links = driver.find_elements(By.CSS_SELECTOR, 'a[href^="/track/"]')
-            for link in links:
-                href = link.get_attribute("href")
-                if href:
-                    full_url = href if href.startswith("http") else f"{BASE_URL}{href}"
-                    if is_track_url(full_url) and full_url not in seen:
-                        seen.add(full_url)
-                        urls.append(full_url)
-                        if len(urls) >= max_results:
-                            break
-
-            if urls:
-                vlog(idx, f"[beatport-browser] Found {len(urls)} tracks via Selenium")
-
-        finally:
-            driver.quit()
+        _collect(collect_track_links(BACKEND_SELENIUM, search_url))
+        note_search_answered()
+        if urls:
+            vlog(idx, f"[beatport-browser] Found {len(urls)} tracks via Selenium")
 
     except ImportError:
         vlog(
@@ -592,12 +586,17 @@ def beatport_search_browser(idx: int, query: str, max_results: int = 50) -> List
         )
     except Exception as e:
         vlog(idx, f"[beatport-browser] Selenium error: {e!r}")
+        note_search_failed()
 
     return urls[:max_results]
 
 
 def beatport_search_hybrid(
-    idx: int, query: str, max_results: int = 50, prefer_direct: bool = True
+    idx: int,
+    query: str,
+    max_results: int = 50,
+    prefer_direct: bool = True,
+    settings: Optional[Mapping[str, Any]] = None,
 ) -> List[str]:
     """Hybrid search: Try direct Beatport search first, fall back to DuckDuckGo if needed.
 
@@ -610,6 +609,8 @@ def beatport_search_hybrid(
         max_results: Maximum number of URLs to return. Defaults to 50.
         prefer_direct: If True, use direct Beatport search first and supplement
             with DuckDuckGo if needed. If False, try DuckDuckGo first.
+        settings: Run settings snapshot (defaults to the global SETTINGS);
+            decides SEARCH_MODE and is passed to the hedged search and DuckDuckGo.
 
     Returns:
         List of unique Beatport track URLs, combining results from both
@@ -617,10 +618,19 @@ def beatport_search_hybrid(
         results (70% of max_results for direct, 50% for DuckDuckGo).
 
     Note:
-        Removes duplicates when merging results from both methods.
+        Removes duplicates when merging results from both methods. With
+        SEARCH_MODE="hedged" the API, search page and DuckDuckGo (unless
+        DDG_ENABLED is off) run concurrently (staggered) instead of one after
+        another, exactly as in track_urls().
     """
     from cuepoint.data.beatport import ddg_track_urls
 
+    cfg = settings_or_global(settings)
+    if cfg.get("SEARCH_MODE") == "hedged":
+        from cuepoint.data.beatport import _hedged_track_urls
+
+        return _hedged_track_urls(idx, query, max_results, prefer_direct, cfg)
+
     seen = set()
     urls = []
 
@@ -640,7 +650,9 @@ def beatport_search_hybrid(
         # CRITICAL: In packaged apps, DuckDuckGo may timeout. If it does, we'll get an empty list
         # and continue with just the direct search results. This is fine - direct search is more reliable.
         try:
-            ddg_urls = ddg_track_urls(idx, query, max(max_results - len(urls), 20))
+            ddg_urls = ddg_track_urls(
+                idx, query, max(max_results - len(urls), 20), settings=cfg
+            )
             for url in ddg_urls:
                 if url not in seen:
                     seen.add(url)
@@ -658,7 +670,7 @@ def beatport_search_hybrid(
         # Try DuckDuckGo first, then supplement with direct search
         # CRITICAL: In packaged apps, DuckDuckGo may timeout. If it does, fall back to direct search immediately.
         try:
-            ddg_urls = ddg_track_urls(idx, query, max_results)
+            ddg_urls = ddg_track_urls(idx, query, max_results, settings=cfg)
             for url in ddg_urls:
                 if url not in seen:
                     seen.add(url)
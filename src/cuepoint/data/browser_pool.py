@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Pooled, persistent headless browsers for the browser search fallback.
+
+Launching Chromium costs 1-3 s, which used to be paid on every browser
+search. A BrowserPool keeps a few warm browsers (each with one context and
+page) alive for the duration of a run and hands search URLs to them:
+
+- Each pooled browser lives on its own worker thread, because Playwright's
+  sync API and WebDriver sessions must be driven from the thread that
+  created them. Callers on any track worker thread submit a URL and wait.
+- Browsers are recycled after ``max_pages`` page loads, and immediately
+  after any error (crash, disconnect, timeout).
+- Images, fonts, media and common analytics hosts are blocked to cut page
+  load time; only the DOM's track links are needed.
+- The pool is run-scoped: ``browser_pool_scope()`` activates one for a
+  processing run and shuts every browser down when the run ends. Outside
+  a scope, ``collect_track_links`` launches a one-shot browser as before.
+
+Example:
+    >>> from cuepoint.data.browser_pool import browser_pool_scope, collect_track_links
+    >>> with browser_pool_scope():
+    ...     hrefs = collect_track_links("playwright", "https://www.beatport.com/search?q=x")
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from cuepoint.models.config import SETTINGS
+
+logger = logging.getLogger(__name__)
+
+BACKEND_PLAYWRIGHT = "playwright"
+BACKEND_SELENIUM = "selenium"
+
+# Resource types that never carry track links
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Third-party hosts that only slow down "networkidle"
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "sentry.io",
+    "onetrust.com",
+    "cookielaw.org",
+)
+
+# Selenium/CDP URL patterns equivalent to the two lists above
+_CDP_BLOCKED_URLS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.mp3",
+    "*.mp4",
+] + [f"*{host}*" for host in BLOCKED_HOSTS]
+
+TRACK_LINK_SELECTOR = 'a[href^="/track/"]'
+
+
+def is_blocked_url(url: str) -> bool:
+    """True if ``url`` belongs to a blocked analytics/tracking host."""
+    host = (urlsplit(url).hostname or "").lower()
+    return any(host == h or host.endswith("." + h) for h in BLOCKED_HOSTS)
+
+
+class _PlaywrightBrowser:
+    """One Chromium browser, context and page driven via Playwright."""
+
+    def __init__(self, timeout_sec: float, block_resources: bool):
+        self.timeout_ms = int(timeout_sec * 1000)
+        self.block_resources = block_resources
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._page: Any = None
+
+    def start(self) -> None:
+        from playwright.sync_api import sync_playwright
+
+        self._playwright = sync_playwright().start()
+        try:
+            self._browser = self._playwright.chromium.launch(headless=True)
+            context = self._browser.new_context(
+                user_agent=SETTINGS.get("USER_AGENT") or None
+            )
+            if self.block_resources:
+                context.route("**/*", self._route)
+            self._page = context.new_page()
+        except Exception:
+            self.close()
+            raise
+
+    @staticmethod
+    def _route(route: Any) -> None:
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or is_blocked_url(request.url):
+            route.abort()
+        else:
+            route.continue_()
+
+    def collect_links(self, url: str) -> List[str]:
+        page = self._page
+        page.goto(url, wait_until="networkidle", timeout=self.timeout_ms)
+        try:
+            page.wait_for_selector(TRACK_LINK_SELECTOR, timeout=10000)
+        except Exception:
+            pass  # Links might already be there
+        hrefs = []
+        for link in page.query_selector_all(TRACK_LINK_SELECTOR):
+            href = link.get_attribute("href")
+            if href:
+                hrefs.append(href)
+        return hrefs
+
+    def close(self) -> None:
+        for closer in (
+            lambda: self._browser.close() if self._browser else None,
+            lambda: self._playwright.stop() if self._playwright else None,
+        ):
+            try:
+                closer()
+            except Exception:
+                pass
+        self._browser = self._playwright = self._page = None
+
+
+class _SeleniumBrowser:
+    """One headless Chrome WebDriver session."""
+
+    def __init__(self, timeout_sec: float, block_resources: bool):
+        self.timeout_sec = timeout_sec
+        self.block_resources = block_resources
+        self._driver: Any = None
+
+    def start(self) -> None:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        options = Options()
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--use-gl=swiftshader")
+        options.add_argument("--disable-software-rasterizer")
+        options.add_argument("--disable-gpu-compositing")
+        options.add_argument("--disable-features=VizDisplayCompositor,UseSkiaRenderer")
+        options.add_argument("--in-process-gpu")
+        options.add_argument("--log-level=3")
+        options.add_experimental_option("excludeSwitches", ["enable-logging"])
+        options.add_argument(f"user-agent={SETTINGS.get('USER_AGENT', 'Mozilla/5.0')}")
+        if self.block_resources:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+
+        self._driver = webdriver.Chrome(options=options)
+        self._driver.set_page_load_timeout(self.timeout_sec)
+        if self.block_resources:
+            try:
+                self._driver.execute_cdp_cmd("Network.enable", {})
+                self._driver.execute_cdp_cmd(
+                    "Network.setBlockedURLs", {"urls": _CDP_BLOCKED_URLS}
+                )
+            except Exception:
+                pass  # CDP not available (non-Chromium driver)
+
+    def collect_links(self, url: str) -> List[str]:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        driver = self._driver
+        driver.get(url)
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, TRACK_LINK_SELECTOR))
+            )
+        except Exception:
+            pass
+        hrefs = []
+        for link in driver.find_elements(By.CSS_SELECTOR, TRACK_LINK_SELECTOR):
+            href = link.get_attribute("href")
+            if href:
+                hrefs.append(href)
+        return hrefs
+
+    def close(self) -> None:
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+
+
+_BACKENDS = {
+    BACKEND_PLAYWRIGHT: _PlaywrightBrowser,
+    BACKEND_SELENIUM: _SeleniumBrowser,
+}
+
+
+def _setting(key: str, default: Any) -> Any:
+    value: Any = SETTINGS.get(key, default)
+    return default if value is None else value
+
+
+def _new_browser(backend: str) -> Any:
+    return _BACKENDS[backend](
+        timeout_sec=float(_setting("BROWSER_TIMEOUT_SEC", 30)),
+        block_resources=bool(SETTINGS.get("BROWSER_BLOCK_RESOURCES", True)),
+    )
+
+
+_STOP = object()
+
+
+class BrowserPool:
+    """Fixed set of worker threads, each owning at most one warm browser.
+
+    Args:
+        size: Number of browsers (worker threads).
+        max_pages: Page loads before a browser is recycled.
+    """
+
+    def __init__(self, size: int = 2, max_pages: int = 50):
+        self.size = max(1, int(size))
+        self.max_pages = max(1, int(max_pages))
+        self._jobs: "queue.Queue[Any]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {"pages": 0, "launches": 0, "recycles": 0, "crashes": 0}
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: pages loaded, browser launches, recycles, crashes."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def collect_links(self, backend: str, url: str) -> List[str]:
+        """Load ``url`` in a pooled ``backend`` browser and return track hrefs.
+
+        Raises whatever the browser raised (ImportError when the backend
+        is not installed), after recycling that browser, and RuntimeError
+        when the pool is shut down before the job ran.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BrowserPool is shut down")
+            if len(self._threads) < self.size:
+                worker = threading.Thread(
+                    target=self._worker,
+                    name=f"BrowserPool-{len(self._threads) + 1}",
+                    daemon=True,
+                )
+                self._threads.append(worker)
+                worker.start()
+            # Enqueued under the lock so shutdown() sees (and fails) every job
+            self._jobs.put((backend, url, future))
+        return list(future.result())
+
+    def _worker(self) -> None:
+        browsers: Dict[str, Tuple[Any, int]] = {}
+        while True:
+            job = self._jobs.get()
+            if job is _STOP:
+                break
+            backend, url, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            browser, pages = browsers.pop(backend, (None, 0))
+            try:
+                if browser is None:
+                    fresh = _new_browser(backend)
+                    fresh.start()
+                    browser = fresh
+                    self._count("launches")
+                hrefs = browser.collect_links(url)
+                self._count("pages")
+                pages += 1
+            except Exception as e:
+                if browser is not None:
+                    self._count("crashes")
+                    browser.close()
+                future.set_exception(e)
+                continue
+            if pages >= self.max_pages:
+                self._count("recycles")
+                browser.close()
+            else:
+                browsers[backend] = (browser, pages)
+            future.set_result(hrefs)
+        for browser, _ in browsers.values():
+            browser.close()
+
+    def shutdown(self) -> None:
+        """Close all browsers and stop the worker threads.
+
+        Jobs still queued are failed with RuntimeError; jobs already running
+        finish first.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads = list(self._threads)
+        while True:
+            try:
+                _backend, _url, future = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError("BrowserPool is shut down"))
+        for _ in threads:
+            self._jobs.put(_STOP)
+        for t in threads:
+            t.join(timeout=30)
+
+
+_active_pool: Optional[BrowserPool] = None
+_scope_depth = 0
+_scope_lock = threading.Lock()
+
+
+def get_active_pool() -> Optional[BrowserPool]:
+    """The run-scoped pool, or None outside ``browser_pool_scope()``."""
+    return _active_pool
+
+
+@contextmanager
+def browser_pool_scope() -> Iterator[Optional[BrowserPool]]:
+    """Keep browsers warm for the enclosed run; shut them down on exit.
+
+    Re-entrant: nested scopes share the outermost pool. Browsers are only
+    launched on first use, so runs that never hit the browser fallback
+    pay nothing. Also usable as a decorator.
+    """
+    global _active_pool, _scope_depth
+    with _scope_lock:
+        _scope_depth += 1
+        size = int(_setting("BROWSER_POOL_SIZE", 2))
+        if _active_pool is None and size > 0:
+            _active_pool = BrowserPool(
+                size=size,
+                max_pages=int(_setting("BROWSER_POOL_MAX_PAGES", 50)),
+            )
+        pool = _active_pool
+    try:
+        yield pool
+    finally:
+        with _scope_lock:
+            _scope_depth -= 1
+            closing = _active_pool if _scope_depth == 0 else None
+            if closing is not None:
+                _active_pool = None
+        if closing is not None:
+            stats = closing.stats()
+            closing.shutdown()
+            if stats["launches"]:
+                logger.info("[browser-pool] shut down: %s", stats)
+
+
+def collect_track_links(backend: str, url: str) -> List[str]:
+    """Return track hrefs from ``url`` rendered by ``backend``.
+
+    Uses the run-scoped pool when one is active, otherwise launches a
+    one-shot browser on the calling thread and closes it afterwards.
+    """
+    pool = _active_pool
+    if pool is not None:
+        return pool.collect_links(backend, url)
+    browser = _new_browser(backend)
+    browser.start()
+    try:
+        return list(browser.collect_links(url))
+    finally:
+        browser.close()
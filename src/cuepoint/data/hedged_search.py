@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Hedged search across Beatport search backends
+
+The sequential search path tries one backend (direct Beatport search, the
+API endpoints, DuckDuckGo) and only moves on when it comes back short, so a
+query's tail latency is the sum of every slow backend. With
+``SEARCH_MODE = "hedged"`` the backends are started in priority order, each
+HEDGED_STAGGER_SEC after the previous one (or at once when it finishes
+short). The merged result is returned as soon as it is large enough, and
+the losing backends are abandoned: ones still queued on the search pool are
+cancelled (and skip their search if a worker picks them up regardless), and
+the results of ones already running are ignored.
+
+BACKEND_HEALTH learns latency and failures per backend (and per API
+endpoint). A backend that fails SEARCH_BACKEND_DEAD_AFTER times in a row is
+skipped for SEARCH_BACKEND_RETRY_SEC, so dead endpoints stop costing a
+round-trip on every query.
+
+Key functions:
+- BackendHealth / BACKEND_HEALTH: Per-backend latency and failure tracking
+- hedged_search(): Run backends with a stagger and merge their results
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from cuepoint.data.negative_cache import note_search_failed
+from cuepoint.models.run_settings import settings_or_global
+from cuepoint.utils.utils import vlog
+
+logger = logging.getLogger(__name__)
+
+SearchBackend = Tuple[str, Callable[[], List[str]]]
+
+
+@dataclass
+class BackendStats:
+    """Running totals for one search backend."""
+
+    calls: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    results: int = 0
+    ewma_ms: Optional[float] = None
+    dead_until: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "results": self.results,
+            "avg_ms": round(self.ewma_ms, 1) if self.ewma_ms is not None else None,
+            "dead": self.dead_until > time.monotonic(),
+        }
+
+
+class BackendHealth:
+    """Thread-safe latency/success record of search backends.
+
+    Thresholds come from SEARCH_BACKEND_DEAD_AFTER and SEARCH_BACKEND_RETRY_SEC
+    in the global SETTINGS at the time of each call.
+    """
+
+    EWMA_ALPHA = 0.3
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[str, BackendStats] = {}
+
+    def record(self, name: str, ok: bool, elapsed_sec: float, results: int = 0) -> None:
+        """Record one call; enough consecutive failures mark ``name`` dead."""
+        ms = elapsed_sec * 1000.0
+        with self._lock:
+            st = self._stats.setdefault(name, BackendStats())
+            st.calls += 1
+            st.results += results
+            st.ewma_ms = (
+                ms if st.ewma_ms is None else st.ewma_ms + self.EWMA_ALPHA * (ms - st.ewma_ms)
+            )
+            if ok:
+                st.consecutive_failures = 0
+                st.dead_until = 0.0
+                return
+            st.failures += 1
+            st.consecutive_failures += 1
+            dead_after = int(settings_or_global(None).get("SEARCH_BACKEND_DEAD_AFTER", 3) or 0)
+            if dead_after and st.consecutive_failures >= dead_after:
+                retry_sec = float(settings_or_global(None).get("SEARCH_BACKEND_RETRY_SEC", 900))
+                if st.dead_until <= time.monotonic():
+                    logger.info(
+                        "Search backend %s failed %d times in a row; skipping it for %.0fs",
+                        name,
+                        st.consecutive_failures,
+                        retry_sec,
+                    )
+                st.dead_until = time.monotonic() + retry_sec
+
+    def is_dead(self, name: str) -> bool:
+        """True while ``name`` is being skipped after repeated failures."""
+        with self._lock:
+            st = self._stats.get(name)
+            return st is not None and st.dead_until > time.monotonic()
+
+    def avg_ms(self, name: str) -> Optional[float]:
+        with self._lock:
+            st = self._stats.get(name)
+            return st.ewma_ms if st else None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: st.to_dict() for name, st in sorted(self._stats.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+BACKEND_HEALTH = BackendHealth()
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _search_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = int(settings_or_global(None).get("HEDGED_MAX_WORKERS", 32) or 32)
+            _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cuepoint-search")
+        return _pool
+
+
+def _run_backend(name: str, fn: Callable[[], List[str]], over: threading.Event) -> List[str]:
+    if over.is_set():
+        # The search finished while this backend was queued
+        return []
+    t0 = time.perf_counter()
+    try:
+        urls = list(fn() or [])
+    except Exception:
+        BACKEND_HEALTH.record(name, False, time.perf_counter() - t0)
+        raise
+    BACKEND_HEALTH.record(name, True, time.perf_counter() - t0, len(urls))
+    return urls
+
+
+def _merge(order: Sequence[str], results: Mapping[str, List[str]], limit: int) -> List[str]:
+    merged: List[str] = []
+    seen = set()
+    for name in order:
+        for url in results.get(name, []):
+            if url not in seen:
+                seen.add(url)
+                merged.append(url)
+    return merged[:limit] if limit else merged
+
+
+def hedged_search(
+    idx: int,
+    backends: Sequence[SearchBackend],
+    max_results: int,
+    sufficient: Optional[int] = None,
+    settings: Optional[Mapping[str, Any]] = None,
+) -> List[str]:
+    """Run ``backends`` with a stagger and return their merged URLs.
+
+    Args:
+        idx: Track index for logging.
+        backends: (name, zero-argument search) pairs in priority order; the
+            merged list keeps this order. Backends marked dead are skipped
+            unless every backend is dead.
+        max_results: Maximum URLs to return.
+        sufficient: Return once this many merged URLs are available
+            (defaults to max_results).
+        settings: Run settings snapshot (HEDGED_STAGGER_SEC, HEDGED_TIMEOUT_SEC).
+
+    Returns:
+        Merged, de-duplicated URLs (possibly fewer than ``sufficient`` when
+        every backend came back short or the timeout passed).
+    """
+    cfg = settings_or_global(settings)
+    stagger = max(float(cfg.get("HEDGED_STAGGER_SEC", 0.25) or 0), 0.0)
+    deadline = time.monotonic() + float(cfg.get("HEDGED_TIMEOUT_SEC", 20) or 20)
+    need = max(int(sufficient or max_results), 1)
+
+    live = [b for b in backends if not BACKEND_HEALTH.is_dead(b[0])] or list(backends)
+    order = [name for name, _fn in live]
+    pool = _search_pool()
+    pending: Dict["Future[List[str]]", str] = {}
+    results: Dict[str, List[str]] = {}
+    merged: List[str] = []
+    next_i = 0
+    over = threading.Event()
+
+    def launch() -> None:
+        nonlocal next_i
+        name, fn = live[next_i]
+        next_i += 1
+        pending[pool.submit(_run_backend, name, fn, over)] = name
+
+    try:
+        if live:
+            launch()
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                waiting = sorted(pending.values())
+                vlog(idx, f"[search] hedged search timed out waiting for {waiting}")
+                note_search_failed()
+                break
+            wait_for = min(stagger, remaining) if next_i < len(live) else remaining
+            done, _ = wait(list(pending), timeout=wait_for, return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = pending.pop(fut)
+                try:
+                    results[name] = fut.result()
+                except Exception as e:
+                    vlog(idx, f"[search] hedged backend {name} failed: {e!r}")
+                    note_search_failed()
+                    results[name] = []
+            merged = _merge(order, results, max_results)
+            if len(merged) >= need:
+                break
+            # Next backend: the stagger passed, or everything started so far came back short
+            if next_i < len(live) and (not done or not pending):
+                launch()
+    finally:
+        over.set()
+        cancelled = sorted(name for fut, name in pending.items() if fut.cancel())
+        running = sorted(name for fut, name in pending.items() if not fut.cancelled())
+        if cancelled:
+            vlog(idx, f"[search] hedged search cancelled queued backends {cancelled}")
+        if running:
+            vlog(idx, f"[search] hedged search abandoned running backends {running}")
+    return merged
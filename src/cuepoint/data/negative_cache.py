@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Negative-result cache for dead pages, empty searches and failed parses
+
+Failures used to be forgotten as soon as they happened: a removed track page
+(404/410) went through every fetch retry again for each track whose search
+returned it, and a query with no results was searched again by every run.
+This cache remembers such failures for a while, so track_urls(),
+beatport_search_direct() and the candidate loop of best_beatport_match()
+skip them.
+
+TTLs are short and grow with each repeat (doubling from a per-kind base up to
+NEGATIVE_CACHE_MAX_TTL_HOURS), so a transient failure costs little and a
+permanent one is retried rarely. A success forgets the entry. Entries persist
+in SQLite and are mirrored in memory, so lookups on the hot path touch no
+database.
+
+Search backends return [] on errors as well as on "no results", so an empty
+search is only recorded when a backend reported an answer and none reported
+a failure (search_outcome() / note_search_answered() / note_search_failed()):
+a rate limit, timeout or outage is never remembered as "no results".
+track_urls() also merges each search's outcome into the caller's, so a
+caller can tell a track that found nothing from one whose searches failed,
+and whether the answers came from cache (SearchOutcome.from_cache).
+
+Key functions:
+- NegativeCache: is_negative() / record() / forget() / stats()
+- search_outcome(): Collect what the backends of one search reported
+- note_search_answered() / note_search_failed(): Report from a backend
+- get_negative_cache(): Process-wide cache, or None when disabled
+- shutdown_negative_cache(): Close the process-wide cache (atexit)
+"""
+
+import atexit
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Union
+
+from cuepoint.models.run_settings import settings_or_global
+
+_logger = logging.getLogger(__name__)
+
+KIND_DEAD = "dead"  # 404/410 pages
+KIND_EMPTY_SEARCH = "empty_search"  # Searches that found no track URLs
+KIND_UNPARSEABLE = "unparseable"  # Fetched track pages without title or artists
+
+# TTL of a first failure; each repeat doubles it
+BASE_TTL_SEC = {
+    KIND_DEAD: 6 * 3600,
+    KIND_EMPTY_SEARCH: 15 * 60,
+    KIND_UNPARSEABLE: 3600,
+}
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS negative (
+  kind TEXT NOT NULL,
+  key TEXT NOT NULL,
+  failures INTEGER NOT NULL,
+  expires REAL NOT NULL,
+  reason TEXT,
+  PRIMARY KEY (kind, key)
+);
+"""
+
+_PUT_SQL = (
+    "INSERT OR REPLACE INTO negative (kind, key, failures, expires, reason) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+
+class NegativeCache:
+    """Remembered failures with backoff-growing TTLs.
+
+    Safe to share between threads.
+
+    Args:
+        path: Database file.
+        max_ttl_sec: Upper bound of a TTL. Entries expired for longer than
+            this are dropped on open, which resets their backoff.
+    """
+
+    def __init__(self, path: Union[str, Path], max_ttl_sec: float = 7 * 86400):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_ttl_sec = float(max_ttl_sec)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA_SQL)
+        self._conn.execute(
+            "DELETE FROM negative WHERE expires < ?", (time.time() - self.max_ttl_sec,)
+        )
+        self._conn.commit()
+        # (kind, key) -> (failures, expires)
+        self._entries: Dict[Tuple[str, str], Tuple[int, float]] = {
+            (kind, key): (failures, expires)
+            for kind, key, failures, expires in self._conn.execute(
+                "SELECT kind, key, failures, expires FROM negative"
+            )
+        }
+        self.hits = 0
+
+    def is_negative(self, kind: str, key: str) -> bool:
+        """True while a recorded failure of (kind, key) has not expired."""
+        entry = self._entries.get((kind, key))
+        if entry is None or entry[1] <= time.time():
+            return False
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def record(self, kind: str, key: str, reason: str = "") -> float:
+        """Remember a failure; returns its TTL in seconds.
+
+        The TTL doubles with each failure recorded since the entry was last
+        forgotten, from BASE_TTL_SEC[kind] up to max_ttl_sec.
+        """
+        with self._lock:
+            failures = self._entries.get((kind, key), (0, 0.0))[0] + 1
+            base = BASE_TTL_SEC.get(kind, 3600)
+            ttl = float(min(base << min(failures - 1, 32), self.max_ttl_sec))
+            expires = time.time() + ttl
+            self._entries[(kind, key)] = (failures, expires)
+            try:
+                self._conn.execute(_PUT_SQL, (kind, key, failures, expires, reason))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                _logger.debug("Negative cache write failed: %s", e)
+        return ttl
+
+    def forget(self, kind: str, key: str) -> None:
+        """Drop the entry after a success (no-op, and no write, if there is none)."""
+        if (kind, key) not in self._entries:
+            return
+        with self._lock:
+            if self._entries.pop((kind, key), None) is None:
+                return
+            try:
+                self._conn.execute("DELETE FROM negative WHERE kind = ? AND key = ?", (kind, key))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                _logger.debug("Negative cache write failed: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Unexpired entries per kind and the number of lookups they answered."""
+        now = time.time()
+        with self._lock:
+            active: Dict[str, int] = {}
+            for (kind, _key), (_failures, expires) in self._entries.items():
+                if expires > now:
+                    active[kind] = active.get(kind, 0) + 1
+            return {"active": active, "hits": self.hits}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._conn.execute("DELETE FROM negative")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SearchOutcome:
+    """What the backends of one search reported.
+
+    Attributes:
+        answered: Some backend got a valid response (possibly without results).
+        failed: Some backend errored, timed out or was refused.
+        answers: Number of valid backend responses.
+        cached_answers: How many of those came from a cache.
+    """
+
+    def __init__(self) -> None:
+        self.answered = False
+        self.failed = False
+        self.answers = 0
+        self.cached_answers = 0
+
+    def note_answered(self, from_cache: bool = False) -> None:
+        """Record a valid backend response."""
+        self.answered = True
+        self.answers += 1
+        if from_cache:
+            self.cached_answers += 1
+
+    def note_failed(self) -> None:
+        """Record a backend failure."""
+        self.failed = True
+
+    @property
+    def confirmed_empty(self) -> bool:
+        """True if an empty result may be recorded as KIND_EMPTY_SEARCH."""
+        return self.answered and not self.failed
+
+    @property
+    def from_cache(self) -> bool:
+        """True if every backend answer came from a cache (none from the network)."""
+        return self.answers > 0 and self.cached_answers == self.answers
+
+    def merge(self, other: "SearchOutcome") -> None:
+        """Add the reports of another search (one of several this outcome covers)."""
+        self.answered = self.answered or other.answered
+        self.failed = self.failed or other.failed
+        self.answers += other.answers
+        self.cached_answers += other.cached_answers
+
+
+_search_state = threading.local()
+
+
+@contextmanager
+def search_outcome(outcome: Optional[SearchOutcome] = None) -> Iterator[SearchOutcome]:
+    """Collect the reports of backends run on this thread.
+
+    Args:
+        outcome: Outcome to report into, so that backends on other threads
+            (hedged search) share the caller's; a new one by default.
+    """
+    outcome = outcome if outcome is not None else SearchOutcome()
+    previous = getattr(_search_state, "outcome", None)
+    _search_state.outcome = outcome
+    try:
+        yield outcome
+    finally:
+        _search_state.outcome = previous
+
+
+def current_search_outcome() -> Optional[SearchOutcome]:
+    """The outcome collected on this thread, or None outside search_outcome()."""
+    return getattr(_search_state, "outcome", None)
+
+
+def note_search_answered(from_cache: bool = False) -> None:
+    """Report that a search backend got a valid response.
+
+    Args:
+        from_cache: The response came from the HTTP or payload cache.
+    """
+    outcome = current_search_outcome()
+    if outcome is not None:
+        outcome.note_answered(from_cache)
+
+
+def note_search_failed() -> None:
+    """Report that a search backend failed (its [] means nothing)."""
+    outcome = current_search_outcome()
+    if outcome is not None:
+        outcome.note_failed()
+
+
+_cache: Optional[NegativeCache] = None
+_cache_failed = False
+_cache_lock = threading.Lock()
+
+
+def get_negative_cache(settings: Optional[Mapping[str, Any]] = None) -> Optional[NegativeCache]:
+    """Process-wide cache in the app cache directory, or None when disabled.
+
+    Disabled unless NEGATIVE_CACHE and ENABLE_CACHE are on, or when the
+    database cannot be opened.
+    """
+    global _cache, _cache_failed
+    cfg = settings_or_global(settings)
+    if not (cfg.get("NEGATIVE_CACHE", True) and cfg.get("ENABLE_CACHE", True)):
+        return None
+    with _cache_lock:
+        if _cache is None and not _cache_failed:
+            from cuepoint.utils.paths import AppPaths
+
+            max_ttl = float(cfg.get("NEGATIVE_CACHE_MAX_TTL_HOURS", 168) or 168) * 3600
+            try:
+                _cache = NegativeCache(AppPaths.cache_dir() / "negative_cache.sqlite", max_ttl)
+            except (OSError, sqlite3.Error) as e:
+                _logger.warning("Negative cache unavailable: %s", e)
+                _cache_failed = True
+        return _cache
+
+
+def shutdown_negative_cache() -> None:
+    """Close the process-wide cache (a later get_negative_cache() reopens it)."""
+    global _cache
+    with _cache_lock:
+        cache, _cache = _cache, None
+    if cache is not None:
+        cache.close()
+
+
+atexit.register(shutdown_negative_cache)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+JSON payloads sliced out of raw Beatport HTML
+
+Beatport track pages carry everything parse_track_page() needs in two
+``<script>`` payloads: the Next.js ``__NEXT_DATA__`` blob and JSON-LD
+``MusicRecording`` records. Building a BeautifulSoup tree of a ~500 KB page
+only to find those tags costs far more than the json parsing itself, so these
+helpers locate the script bodies with a regex over the response text. Script
+bodies are raw text in HTML (no entities to decode), so the slices can go
+straight to json.loads().
+
+Key functions:
+- extract_next_data(): Body of the __NEXT_DATA__ script, or None
+- extract_json_ld(): Bodies of every application/ld+json script
+- extract_payloads(): Both, as the dict the payload cache stores
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+_NEXT_DATA_RE = re.compile(
+    r"<script\b[^>]*\bid\s*=\s*[\"']?__NEXT_DATA__[\"']?[^>]*>(.*?)</script\s*>",
+    re.I | re.S,
+)
+_JSON_LD_RE = re.compile(
+    r"<script\b[^>]*\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.I | re.S,
+)
+
+
+def extract_next_data(html: str) -> Optional[str]:
+    """Text of the ``<script id="__NEXT_DATA__">`` tag, or None if absent or empty."""
+    if not html or "__NEXT_DATA__" not in html:
+        return None
+    match = _NEXT_DATA_RE.search(html)
+    if not match:
+        return None
+    body = match.group(1).strip()
+    return body or None
+
+
+def extract_json_ld(html: str) -> List[str]:
+    """Texts of the ``<script type="application/ld+json">`` tags, in page order."""
+    if not html:
+        return []
+    return [m.group(1) for m in _JSON_LD_RE.finditer(html)]
+
+
+def extract_payloads(html: str) -> Dict[str, Any]:
+    """``{"json_ld": [...], "next_data": str or None}`` of a page.
+
+    Everything the JSON fast path reads from a track page, small enough to
+    keep in the payload cache instead of the page.
+    """
+    return {"json_ld": extract_json_ld(html), "next_data": extract_next_data(html)}
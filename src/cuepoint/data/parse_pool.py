@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Process pool for track page parsing
+
+Candidate pages are parsed on the thread that fetched them (a track or
+candidate worker, or the asyncio engine's parse executor). BeautifulSoup and
+the __NEXT_DATA__ walk are pure Python, so with the GIL every parse in the
+process runs on one core however many workers there are. With
+``PARSE_PROCESSES = N`` the fetching thread hands the page text to one of N
+worker processes and blocks, without holding the GIL, until the compact
+9-field tuple comes back; the network threads stay I/O-only and parsing
+scales across cores.
+
+Workers are started with the "spawn" method (forking a process that runs
+dozens of network threads is unsafe) and import cuepoint.data.beatport once.
+Settings the parse depends on are passed with each page because workers do
+not see runtime changes to the parent's SETTINGS.
+
+Key functions:
+- parse_page(): parse_track_html() inline, or on the pool when enabled
+- parse_page_payloads(): parse_page() plus the JSON payloads, for the payload cache
+- ParsePool: ProcessPoolExecutor wrapper with task/failure counters
+- get_parse_pool() / shutdown_parse_pool(): Process-wide pool (atexit)
+"""
+
+import atexit
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Tuple, TypeVar
+
+from cuepoint.models.run_settings import settings_or_global
+from cuepoint.utils.performance import STAGE_PARSE, stage_metrics
+
+if TYPE_CHECKING:
+    from cuepoint.data.beatport import TrackFields
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def _parse_worker(html: Optional[str], json_fast_path: bool) -> "TrackFields":
+    """Parse one page (runs in a worker process, or inline)."""
+    from cuepoint.data.beatport import parse_track_html
+
+    return parse_track_html(html, json_fast_path=json_fast_path)
+
+
+def _parse_payloads_worker(html: Optional[str]) -> Tuple[Optional[Dict[str, Any]], "TrackFields"]:
+    """Parse one page and keep its complete JSON payloads (worker process, or inline)."""
+    from cuepoint.data.beatport import parse_track_html_payloads
+
+    return parse_track_html_payloads(html)
+
+
+def _warm_up() -> bool:
+    """Import the parser in a worker so the first real page does not pay for it."""
+    import cuepoint.data.beatport  # noqa: F401
+
+    return True
+
+
+class ParsePool:
+    """Parse track pages on a pool of worker processes.
+
+    Args:
+        processes: Number of worker processes.
+    """
+
+    def __init__(self, processes: int):
+        self.processes = max(int(processes), 1)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._lock = threading.Lock()
+        self.tasks = 0
+        self.failures = 0
+
+    def parse(self, html: str, json_fast_path: bool = True) -> "TrackFields":
+        """parse_track_html(html) in a worker process; blocks until it returns.
+
+        Raises:
+            BrokenProcessPool: If a worker died (the pool is then unusable).
+        """
+        return self._run(_parse_worker, html, json_fast_path)
+
+    def parse_payloads(self, html: str) -> Tuple[Optional[Dict[str, Any]], "TrackFields"]:
+        """parse_track_html_payloads(html) in a worker process; blocks until it returns."""
+        return self._run(_parse_payloads_worker, html)
+
+    def _run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        with self._lock:
+            self.tasks += 1
+        try:
+            return self._executor.submit(fn, *args).result()
+        except Exception:
+            with self._lock:
+                self.failures += 1
+            raise
+
+    def warm_up(self) -> None:
+        """Start every worker process and import the parser in it."""
+        for fut in [self._executor.submit(_warm_up) for _ in range(self.processes)]:
+            fut.result()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"processes": self.processes, "tasks": self.tasks, "failures": self.failures}
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool: Optional[ParsePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool(processes: int) -> ParsePool:
+    """Process-wide pool; its size comes from the first caller."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ParsePool(processes)
+        return _pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the process-wide pool (a later get_parse_pool() starts anew)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+def parse_page(html: Optional[str], settings: Optional[Mapping[str, Any]] = None) -> "TrackFields":
+    """Parse a fetched track page, on the process pool when PARSE_PROCESSES > 0.
+
+    Falls back to parsing in the calling thread if the pool breaks (a worker
+    was killed); the next call starts a fresh pool.
+    """
+    cfg = settings_or_global(settings)
+    json_fast_path = bool(cfg.get("PARSE_JSON_FAST_PATH", True))
+    return _run_parse(
+        html,
+        cfg,
+        lambda page: _parse_worker(page, json_fast_path),
+        lambda pool, page: pool.parse(page, json_fast_path),
+    )
+
+
+def parse_page_payloads(
+    html: Optional[str], settings: Optional[Mapping[str, Any]] = None
+) -> Tuple[Optional[Dict[str, Any]], "TrackFields"]:
+    """parse_page() with the JSON fast path, plus the payloads for the payload cache.
+
+    The payloads come back only when they supply every field (see
+    parse_track_html_payloads()). One round trip to the pool either way.
+    """
+    return _run_parse(
+        html,
+        settings_or_global(settings),
+        _parse_payloads_worker,
+        ParsePool.parse_payloads,
+    )
+
+
+def _run_parse(
+    html: Optional[str],
+    cfg: Mapping[str, Any],
+    inline: Callable[[Optional[str]], _T],
+    on_pool: Callable[[ParsePool, str], _T],
+) -> _T:
+    """``inline(html)``, or ``on_pool(pool, html)`` when PARSE_PROCESSES > 0."""
+    processes = int(cfg.get("PARSE_PROCESSES", 0) or 0)
+    if not html or processes <= 0:
+        return inline(html)
+
+    try:
+        pool = get_parse_pool(processes)
+        # Time in the worker is not visible here, so the round trip is the parse stage
+        with stage_metrics.time(STAGE_PARSE):
+            return on_pool(pool, html)
+    except BrokenProcessPool as e:
+        logger.warning("Parse process pool broke (%s); parsing in-process", e)
+        shutdown_parse_pool()
+        return inline(html)
+
+
+atexit.register(shutdown_parse_pool)
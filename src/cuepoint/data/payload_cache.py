@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Persistent cache of extracted page payloads
+
+A Beatport track page is ~500 KB of HTML, of which parse_track_page() needs
+the few KB in its JSON-LD and ``__NEXT_DATA__`` scripts; a search page boils
+down to a list of track URLs. This cache stores just those extracted
+payloads, zlib-compressed JSON in SQLite, keyed by kind ("track", "search")
+and a canonical key (track pages by Beatport track ID, so slug variants share
+an entry). A hit rebuilds the result with json.loads() alone: no HTML is
+fetched, sliced or parsed.
+
+Entries expire after a per-kind TTL; when the database grows past its size
+budget the least recently used entries are dropped. Access times of hits are
+buffered and written in batches, so a hit costs no write or commit.
+
+Key functions:
+- PayloadCache: get() / put() / stats() / clear() over one SQLite file
+- canonical_key(): Cache key of a page URL
+- get_payload_cache(): Process-wide cache, or None when disabled
+- payload_ttl(): TTL in seconds for a kind from settings
+- shutdown_payload_cache(): Close the process-wide cache (atexit)
+"""
+
+import atexit
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+from cuepoint.models.run_settings import settings_or_global
+from cuepoint.utils.single_flight import normalize_url
+
+_logger = logging.getLogger(__name__)
+
+KIND_TRACK = "track"
+KIND_SEARCH = "search"
+
+_TRACK_ID_RE = re.compile(r"/track/[^/?#]+/(\d+)")
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS payloads (
+  kind TEXT NOT NULL,
+  key TEXT NOT NULL,
+  data BLOB NOT NULL,
+  created REAL NOT NULL,
+  expires REAL NOT NULL,
+  last_access REAL NOT NULL,
+  PRIMARY KEY (kind, key)
+);
+CREATE INDEX IF NOT EXISTS payloads_last_access ON payloads (last_access);
+"""
+
+_PUT_SQL = (
+    "INSERT OR REPLACE INTO payloads (kind, key, data, created, expires, last_access) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+_LRU_SQL = "SELECT kind, key, length(data) FROM payloads ORDER BY last_access, rowid"
+
+
+def canonical_key(url: str) -> str:
+    """Cache key of a page URL: ``track/<id>`` for track pages, else the normalised URL."""
+    match = _TRACK_ID_RE.search(url)
+    if match:
+        return f"track/{match.group(1)}"
+    return normalize_url(url)
+
+
+class PayloadCache:
+    """SQLite store of compressed JSON payloads.
+
+    Safe to share between threads (one connection behind a lock). Hits are
+    buffered and their access times written every FLUSH_EVERY hits, before
+    pruning and on flush() / close().
+
+    Args:
+        path: Database file.
+        max_bytes: Size budget of the stored (compressed) payloads; 0 for none.
+    """
+
+    FLUSH_EVERY = 64
+
+    def __init__(self, path: Union[str, Path], max_bytes: int = 0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(int(max_bytes), 0)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA_SQL)
+        self._conn.commit()
+        self._size = self._stored_bytes()
+        self._pending: Dict[Tuple[str, str], float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _stored_bytes(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(SUM(length(data)), 0) FROM payloads").fetchone()
+        return int(row[0])
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """The payload stored for (kind, key), or None if absent or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, expires FROM payloads WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            self._pending[(kind, key)] = now
+            if len(self._pending) >= self.FLUSH_EVERY:
+                self._flush_locked()
+            self.hits += 1
+            data = row[0]
+        try:
+            return json.loads(zlib.decompress(data))
+        except (zlib.error, ValueError) as e:
+            _logger.warning("Dropping unreadable payload cache entry %s/%s: %s", kind, key, e)
+            self.delete(kind, key)
+            return None
+
+    def put(self, kind: str, key: str, value: Any, ttl_sec: float) -> None:
+        """Store ``value`` (anything json can encode) for ``ttl_sec`` seconds."""
+        data = zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT length(data) FROM payloads WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+            self._conn.execute(_PUT_SQL, (kind, key, data, now, now + ttl_sec, now))
+            self._size += len(data) - (old[0] if old else 0)
+            if self.max_bytes and self._size > self.max_bytes:
+                self._prune_locked()
+            self._conn.commit()
+
+    def delete(self, kind: str, key: str) -> None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT length(data) FROM payloads WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+            if row is None:
+                return
+            self._conn.execute("DELETE FROM payloads WHERE kind = ? AND key = ?", (kind, key))
+            self._conn.commit()
+            self._size -= row[0]
+
+    def flush(self) -> None:
+        """Write buffered access times."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            self._conn.executemany(
+                "UPDATE payloads SET last_access = ? WHERE kind = ? AND key = ?",
+                [(ts, kind, key) for (kind, key), ts in pending.items()],
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            _logger.debug("Payload cache access time flush failed: %s", e)
+
+    def _prune_locked(self) -> None:
+        """Drop expired entries, then LRU entries, until 90% of the budget is left."""
+        self._flush_locked()
+        self._conn.execute("DELETE FROM payloads WHERE expires <= ?", (time.time(),))
+        self._size = self._stored_bytes()
+        target = self.max_bytes * 0.9
+        if self._size <= target:
+            return
+        victims = []
+        for kind, key, size in self._conn.execute(_LRU_SQL):
+            if self._size <= target:
+                break
+            victims.append((kind, key))
+            self._size -= size
+        self._conn.executemany("DELETE FROM payloads WHERE kind = ? AND key = ?", victims)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry counts per kind, stored bytes and hit/miss counters."""
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, COUNT(*) FROM payloads GROUP BY kind")
+            entries = {kind: count for kind, count in rows}
+            return {
+                "entries": entries,
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._conn.execute("DELETE FROM payloads")
+            self._conn.commit()
+            self._size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+
+_cache: Optional[PayloadCache] = None
+_cache_failed = False
+_cache_lock = threading.Lock()
+
+
+def payload_ttl(kind: str, settings: Optional[Mapping[str, Any]] = None) -> float:
+    """TTL in seconds of a payload kind (PAYLOAD_CACHE_<KIND>_TTL_HOURS)."""
+    cfg = settings_or_global(settings)
+    default = 168 if kind == KIND_TRACK else 24
+    return float(cfg.get(f"PAYLOAD_CACHE_{kind.upper()}_TTL_HOURS", default)) * 3600
+
+
+def get_payload_cache(settings: Optional[Mapping[str, Any]] = None) -> Optional[PayloadCache]:
+    """Process-wide cache in the app cache directory, or None when disabled.
+
+    Disabled unless PAYLOAD_CACHE, ENABLE_CACHE and PARSE_JSON_FAST_PATH are
+    all on (the stored payloads are what the JSON fast path parses), or when
+    the database cannot be opened.
+    """
+    global _cache, _cache_failed
+    cfg = settings_or_global(settings)
+    if not (
+        cfg.get("PAYLOAD_CACHE", True)
+        and cfg.get("ENABLE_CACHE", True)
+        and cfg.get("PARSE_JSON_FAST_PATH", True)
+    ):
+        return None
+    with _cache_lock:
+        if _cache is None and not _cache_failed:
+            from cuepoint.utils.paths import AppPaths
+
+            max_bytes = int(float(cfg.get("PAYLOAD_CACHE_MAX_MB", 64) or 0) * 1024 * 1024)
+            try:
+                _cache = PayloadCache(AppPaths.cache_dir() / "payload_cache.sqlite", max_bytes)
+            except (OSError, sqlite3.Error) as e:
+                _logger.warning("Payload cache unavailable: %s", e)
+                _cache_failed = True
+        return _cache
+
+
+def shutdown_payload_cache() -> None:
+    """Close the process-wide cache (a later get_payload_cache() reopens it)."""
+    global _cache
+    with _cache_lock:
+        cache, _cache = _cache, None
+    if cache is not None:
+        cache.close()
+
+
+atexit.register(shutdown_payload_cache)
@@ -24,10 +24,20 @@ Example:
 
 import logging
 import re
+import threading
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 from urllib.parse import unquote
 
 import os
@@ -48,6 +58,9 @@ MAX_XML_SIZE_BYTES = 100 * 1024 * 1024  # 100 MiB
 # Report progress every N tracks during streaming parse (and on first track)
 _PARSE_PROGRESS_INTERVAL = 100
 
+# Elements between progress reports / cancellation checks in stream_playlist_tree
+_TREE_PROGRESS_INTERVAL = 2000
+
 
 def playlist_path_for_display(path: str) -> str:
     """Return path with ROOT/ or ROOT prefix stripped for display and filenames.
@@ -311,6 +324,182 @@ def parse_rekordbox(xml_path: str) -> Dict[str, Playlist]:
     return playlists
 
 
+class PlaylistIndex(Mapping[str, Playlist]):
+    """Path-keyed playlists whose Track objects are built on first access.
+
+    Filled by stream_playlist_tree(): it keeps lightweight RBTrack entries for
+    the collection and the track IDs of each playlist, and only converts a
+    playlist to Track objects when it is looked up (e.g. when selected).
+    Lookups are thread-safe so the index can be read while a worker fills it.
+    """
+
+    def __init__(self) -> None:
+        self._tracks_by_id: Dict[str, RBTrack] = {}
+        self._track_ids: Dict[str, Tuple[str, List[str]]] = {}
+        self._built: Dict[str, Playlist] = {}
+        self._lock = threading.Lock()
+
+    def add_track(self, track: RBTrack) -> None:
+        with self._lock:
+            self._tracks_by_id[track.track_id] = track
+
+    def add_playlist(self, path: str, name: str, track_ids: List[str]) -> None:
+        with self._lock:
+            self._track_ids[path] = (name, track_ids)
+            self._built.pop(path, None)
+
+    def track_count(self, path: str) -> int:
+        """Number of track references in the playlist (no Track objects built)."""
+        with self._lock:
+            entry = self._track_ids.get(path)
+        return len(entry[1]) if entry else 0
+
+    def __getitem__(self, path: str) -> Playlist:
+        with self._lock:
+            playlist = self._built.get(path)
+            if playlist is not None:
+                return playlist
+            name, track_ids = self._track_ids[path]
+            tracks: List[Track] = []
+            for idx, track_id in enumerate(track_ids, start=1):
+                rbtrack = self._tracks_by_id.get(track_id)
+                if rbtrack:
+                    track = track_from_rbtrack(rbtrack)
+                    track.position = idx
+                    tracks.append(track)
+            playlist = Playlist(name=name, tracks=tracks)
+            self._built[path] = playlist
+            return playlist
+
+    def __contains__(self, path: object) -> bool:
+        with self._lock:
+            return path in self._track_ids
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._track_ids))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._track_ids)
+
+
+def stream_playlist_tree(
+    xml_path: str,
+    index: PlaylistIndex,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    should_cancel: Optional[Callable[[], bool]] = None,
+) -> Iterator[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]]:
+    """Stream the folder/playlist hierarchy of a Rekordbox XML as it is parsed.
+
+    Uses iterparse and clears elements once read, so memory stays flat and the
+    first nodes are available long before the file is fully read. Yields
+    (parent, node) pairs in document order: parent is the folder node the node
+    belongs to (None at top level). Folders are yielded when they open (with
+    an empty "children" list the caller fills), playlists when they close
+    (with "track_count"). This function never mutates a node after yielding it.
+
+    COLLECTION tracks and playlist track IDs are recorded in ``index``, which
+    builds Track objects lazily.
+
+    Args:
+        xml_path: Path to Rekordbox XML export file.
+        index: PlaylistIndex to fill.
+        progress_callback: Optional callback(bytes_read, total_bytes).
+        should_cancel: Optional callable; parsing stops quietly once it returns True.
+
+    Raises:
+        FileNotFoundError: If XML file does not exist.
+        ValueError: If XML file exceeds MAX_XML_SIZE_BYTES.
+        ET.ParseError: If XML parsing fails.
+    """
+    if not os.path.exists(xml_path):
+        raise FileNotFoundError(f"XML file not found: {xml_path}")
+    size = os.path.getsize(xml_path)
+    if size > MAX_XML_SIZE_BYTES:
+        raise ValueError(
+            f"XML file too large: {size} bytes (max {MAX_XML_SIZE_BYTES}). "
+            "Refusing to parse to prevent resource exhaustion."
+        )
+
+    collection_seen = playlists_seen = False
+    in_collection = in_playlists = False
+    # Open NODE elements: (node dict, track IDs for playlists / None for folders)
+    stack: List[Tuple[Dict[str, Any], Optional[List[str]]]] = []
+    elements = 0
+
+    with open(xml_path, "rb") as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            elements += 1
+            if elements % _TREE_PROGRESS_INTERVAL == 0:
+                if should_cancel is not None and should_cancel():
+                    return
+                if progress_callback is not None:
+                    progress_callback(f.tell(), size)
+            tag = elem.tag
+            if event == "start":
+                if tag == "COLLECTION" and not collection_seen:
+                    collection_seen = in_collection = True
+                elif tag == "PLAYLISTS" and not playlists_seen:
+                    playlists_seen = in_playlists = True
+                elif tag == "NODE" and in_playlists:
+                    name = (elem.get("Name") or elem.get("name") or "Unnamed").strip()
+                    typ = (elem.get("Type") or elem.get("type") or "0").strip()
+                    parent = stack[-1][0] if stack else None
+                    prefix = parent["path"] if parent else ""
+                    path = f"{prefix}/{name}".lstrip("/") if prefix else name
+                    node: Dict[str, Any]
+                    if typ == "1":
+                        node = {"type": "playlist", "name": name, "path": path}
+                        stack.append((node, []))
+                    else:
+                        node = {
+                            "type": "folder",
+                            "name": name,
+                            "path": path,
+                            "children": [],
+                        }
+                        stack.append((node, None))
+                        yield parent, node
+                continue
+
+            if tag == "TRACK":
+                if in_collection:
+                    tid = (
+                        elem.get("TrackID") or elem.get("ID") or elem.get("Key") or ""
+                    ).strip()
+                    title = (elem.get("Name") or elem.get("Title") or "").strip()
+                    artists = (elem.get("Artist") or elem.get("Artists") or "").strip()
+                    if tid and title:
+                        index.add_track(
+                            RBTrack(track_id=tid, title=title, artists=artists)
+                        )
+                elif stack:
+                    track_ids = stack[-1][1]
+                    ref = (
+                        elem.get("Key") or elem.get("TrackID") or elem.get("ID") or ""
+                    ).strip()
+                    if track_ids is not None and ref:
+                        track_ids.append(ref)
+                elem.clear()
+            elif tag == "NODE" and in_playlists and stack:
+                node, track_ids = stack.pop()
+                if track_ids is not None:
+                    index.add_playlist(node["path"], node["name"], track_ids)
+                    playlist_node = dict(node, track_count=len(track_ids))
+                    yield (stack[-1][0] if stack else None), playlist_node
+                elem.clear()
+            elif tag == "COLLECTION" and in_collection:
+                in_collection = False
+                elem.clear()
+            elif tag == "PLAYLISTS" and in_playlists:
+                in_playlists = False
+                elem.clear()
+
+    if progress_callback is not None:
+        progress_callback(size, size)
+
+
 # Tree node: dict with "type" ("folder"|"playlist"), "name", "path"; folder has "children", playlist has "track_count"
 def parse_playlist_tree(
     xml_path: str,
@@ -320,6 +509,9 @@ def parse_playlist_tree(
     NODE Type="0" = folder, Type="1" = playlist. Folders contain NODE children;
     playlists contain TRACK references. Returns tree roots and path-keyed playlists.
 
+    Builds every Playlist eagerly; the UI uses stream_playlist_tree() with a
+    PlaylistIndex instead so tracks are only built for the selected playlist.
+
     Args:
         xml_path: Path to Rekordbox XML export file.
 
@@ -330,75 +522,20 @@ def parse_playlist_tree(
         (e.g. "Folder/SubFolder/Playlist Name") to Playlist. Root-level playlists
         have path = name (no slash).
     """
-    if not os.path.exists(xml_path):
-        raise FileNotFoundError(f"XML file not found: {xml_path}")
-    size = os.path.getsize(xml_path)
-    if size > MAX_XML_SIZE_BYTES:
-        raise ValueError(
-            f"XML file too large: {size} bytes (max {MAX_XML_SIZE_BYTES}). "
-            "Refusing to parse to prevent resource exhaustion."
-        )
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-    tracks_by_id: Dict[str, RBTrack] = {}
-    collection = root.find(".//COLLECTION")
-    if collection is not None:
-        for t in collection.findall("TRACK"):
-            tid = (t.get("TrackID") or t.get("ID") or t.get("Key") or "").strip()
-            title = (t.get("Name") or t.get("Title") or "").strip()
-            artists = (t.get("Artist") or t.get("Artists") or "").strip()
-            if not tid or not title:
-                continue
-            tracks_by_id[tid] = RBTrack(track_id=tid, title=title, artists=artists)
-
-    playlists_by_path: Dict[str, Playlist] = {}
-
-    def _parse_nodes(parent_elem: ET.Element, path_prefix: str) -> List[Dict[str, Any]]:
-        nodes: List[Dict[str, Any]] = []
-        for node_elem in parent_elem.findall("NODE"):
-            name = (node_elem.get("Name") or node_elem.get("name") or "Unnamed").strip()
-            typ = (node_elem.get("Type") or node_elem.get("type") or "0").strip()
-            full_path = f"{path_prefix}/{name}".lstrip("/") if path_prefix else name
-            if typ == "1":
-                track_refs = [
-                    (tr.get("Key") or tr.get("TrackID") or tr.get("ID") or "").strip()
-                    for tr in node_elem.findall("TRACK")
-                ]
-                track_ids = [r for r in track_refs if r]
-                tracks = []
-                for idx, track_id in enumerate(track_ids, start=1):
-                    rbtrack = tracks_by_id.get(track_id)
-                    if rbtrack:
-                        track = track_from_rbtrack(rbtrack)
-                        track.position = idx
-                        tracks.append(track)
-                pl = Playlist(name=name, tracks=tracks)
-                playlists_by_path[full_path] = pl
-                nodes.append(
-                    {
-                        "type": "playlist",
-                        "name": name,
-                        "path": full_path,
-                        "track_count": len(track_ids),
-                    }
-                )
-            else:
-                children = _parse_nodes(node_elem, full_path)
-                nodes.append(
-                    {
-                        "type": "folder",
-                        "name": name,
-                        "path": full_path,
-                        "children": children,
-                    }
-                )
-        return nodes
-
-    playlists_root = root.find(".//PLAYLISTS")
-    tree_roots: List[Dict[str, Any]] = []
-    if playlists_root is not None:
-        tree_roots = _parse_nodes(playlists_root, "")
-    return (tree_roots, playlists_by_path)
+    index = PlaylistIndex()
+    tree_roots = build_playlist_tree(stream_playlist_tree(xml_path, index))
+    return (tree_roots, dict(index))
+
+
+def build_playlist_tree(
+    pairs: Iterator[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]],
+    tree_roots: Optional[List[Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """Attach (parent, node) pairs from stream_playlist_tree() to a tree; returns the roots."""
+    roots: List[Dict[str, Any]] = [] if tree_roots is None else tree_roots
+    for parent, node in pairs:
+        (parent["children"] if parent is not None else roots).append(node)
+    return roots
 
 
 def resolve_playlist_key(
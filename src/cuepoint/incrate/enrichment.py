@@ -3,6 +3,11 @@
 Uses the full inKey pipeline: IProcessorService.process_track() with the same
 query generation, matcher, scoring, and parallel workers (ThreadPoolExecutor)
 as inKey.
+
+Results are written by a single inventory_db.EnrichmentWriter thread in
+batched transactions, and every row tried is recorded so a later run resumes
+with the rows not yet attempted. A row left unmatched while a search backend
+failed (timeout, rate limit, outage) is not recorded, so it is tried again.
 """
 
 import logging
@@ -12,6 +17,7 @@ import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from cuepoint.data.negative_cache import SearchOutcome, search_outcome
 from cuepoint.incrate import inventory_db
 from cuepoint.models.track import Track
 
@@ -43,6 +49,7 @@ def enrich_labels_for_empty(
     delay_seconds: float = DEFAULT_ENRICHMENT_DELAY_SECONDS,
     processor_service: Optional[Any] = None,
     config_service: Optional[Any] = None,
+    retry_attempted: bool = False,
 ) -> int:
     """Enrich inventory rows with empty label using the full inKey pipeline.
 
@@ -54,13 +61,20 @@ def enrich_labels_for_empty(
     When processor_service is None, falls back to single-threaded make_search_queries
     + best_beatport_match (no parallelism).
 
+    Rows already attempted by an earlier run (with unchanged artist/title) are
+    skipped, so an interrupted enrichment picks up where it stopped. Rows that
+    raised, or stayed unmatched while a search backend failed, are not marked
+    and are retried next time.
+
     Args:
         db_path: Path to SQLite inventory database.
         beatport_service: Used only when processor_service is None (fallback).
         progress_callback: Optional callback(current_index, total_count) after each row.
         delay_seconds: Sleep between tracks in fallback path.
         processor_service: Optional IProcessorService for full inKey pipeline + workers.
-        config_service: Optional IConfigService for TRACK_WORKERS / max_workers.
+        config_service: Optional IConfigService for TRACK_WORKERS / max_workers
+            and the incrate.enrichment_write_* writer settings.
+        retry_attempted: If True, also retry rows earlier runs could not match.
 
     Returns:
         Number of rows updated.
@@ -71,33 +85,92 @@ def enrich_labels_for_empty(
             processor_service=processor_service,
             config_service=config_service,
             progress_callback=progress_callback,
+            retry_attempted=retry_attempted,
         )
     return _enrich_fallback(
         db_path=db_path,
         beatport_service=beatport_service,
         progress_callback=progress_callback,
         delay_seconds=delay_seconds,
+        retry_attempted=retry_attempted,
+    )
+
+
+def _load_rows(db_path: str, retry_attempted: bool) -> List[Tuple[Any, ...]]:
+    """Rows with an empty label still to enrich."""
+    conn = inventory_db.get_connection(db_path)
+    try:
+        return inventory_db.get_unlabeled_rows(conn.cursor(), include_attempted=retry_attempted)
+    finally:
+        conn.close()
+
+
+def _make_writer(
+    db_path: str, config_service: Optional[Any] = None
+) -> inventory_db.EnrichmentWriter:
+    batch_size = inventory_db.DEFAULT_WRITE_BATCH_SIZE
+    flush_seconds = inventory_db.DEFAULT_WRITE_FLUSH_SECONDS
+    if config_service is not None:
+        batch_size = _safe_int(
+            config_service.get("incrate.enrichment_write_batch_size", batch_size),
+            batch_size,
+        )
+        try:
+            flush_seconds = float(
+                config_service.get("incrate.enrichment_write_flush_seconds", flush_seconds)
+            )
+        except (TypeError, ValueError):
+            pass
+    return inventory_db.EnrichmentWriter(
+        db_path, batch_size=batch_size, flush_interval=flush_seconds
     )
 
 
+def _process_track(processor_service: Any, idx: int, track: Track) -> Tuple[Any, SearchOutcome]:
+    """process_track() plus what the backends of its searches reported."""
+    with search_outcome() as outcome:
+        return processor_service.process_track(idx, track), outcome
+
+
+def _record_result(
+    writer: inventory_db.EnrichmentWriter,
+    row_id: int,
+    result: Any,
+    outcome: SearchOutcome,
+) -> None:
+    """Queue a processor result: label update when matched, else an attempt marker.
+
+    No marker when a search failed: the row was not really tried.
+    """
+    if result.matched and result.best_match and result.best_match.label and result.best_match.url:
+        label = (result.best_match.label or "").strip() or None
+        if label:
+            bid = _extract_track_id_from_url(result.best_match.url)
+            writer.record(row_id, label, bid, result.best_match.url)
+            return
+    _record_unmatched(writer, row_id, outcome)
+
+
+def _record_unmatched(
+    writer: inventory_db.EnrichmentWriter, row_id: int, outcome: SearchOutcome
+) -> None:
+    if outcome.failed:
+        _logger.debug("Enrichment search failed for row id=%s; retried next run", row_id)
+        return
+    writer.record(row_id)
+
+
 def _enrich_with_processor(
     db_path: str,
     processor_service: Any,
     config_service: Any,
     progress_callback: Optional[Callable[[int, int], None]] = None,
+    retry_attempted: bool = False,
 ) -> int:
     """Use IProcessorService.process_track with parallel workers (same as inKey)."""
     from cuepoint.models.config import SETTINGS
 
-    conn = inventory_db.get_connection(db_path)
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT id, track_key, artist, title FROM inventory WHERE label IS NULL OR TRIM(label) = ''"
-        )
-        rows = cur.fetchall()
-    finally:
-        conn.close()
+    rows = _load_rows(db_path, retry_attempted)
 
     # Build (row_id, idx, track) for rows with non-empty title; Track requires non-empty title and artist
     inputs: List[Tuple[int, int, Track]] = []
@@ -130,138 +203,84 @@ def _enrich_with_processor(
 
     # Index -> row_id for updating DB from results
     idx_to_row_id: Dict[int, int] = {idx: row_id for row_id, idx, _ in inputs}
-    updated = 0
     progress_lock = threading.Lock()
 
     if progress_callback:
         progress_callback(0, total_inputs)
 
-    def _update_row(
-        row_id: int, label: str, beatport_track_id: Optional[str], url: str
-    ) -> None:
-        nonlocal updated
-        updated_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        conn = inventory_db.get_connection(db_path)
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                "UPDATE inventory SET label = ?, beatport_track_id = ?, beatport_url = ?, updated_at = ? WHERE id = ?",
-                (label, beatport_track_id, url, updated_at, row_id),
+    with _make_writer(db_path, config_service) as writer:
+        if track_workers > 1:
+            _logger.info(
+                "inCrate enrichment: parallel processing with %s workers for %s tracks",
+                track_workers,
+                len(inputs),
             )
-            conn.commit()
-            updated += 1
-        finally:
-            conn.close()
-
-    if track_workers > 1:
-        _logger.info(
-            "inCrate enrichment: parallel processing with %s workers for %s tracks",
-            track_workers,
-            len(inputs),
-        )
-        try:
-            with ThreadPoolExecutor(max_workers=track_workers) as ex:
-                future_to_idx = {
-                    ex.submit(processor_service.process_track, idx, track): idx
-                    for _row_id, idx, track in inputs
-                }
-                completed = 0
-                for future in as_completed(future_to_idx):
-                    idx = future_to_idx[future]
-                    row_id = idx_to_row_id.get(idx)
-                    if row_id is None:
-                        continue
-                    try:
-                        result = future.result()
-                        if (
-                            result.matched
-                            and result.best_match
-                            and result.best_match.label
-                            and result.best_match.url
-                        ):
-                            label = (result.best_match.label or "").strip() or None
-                            if label:
-                                bid = _extract_track_id_from_url(result.best_match.url)
-                                _update_row(row_id, label, bid, result.best_match.url)
-                    except Exception as e:
-                        _logger.warning(
-                            "Enrichment failed for row id=%s: %s",
-                            row_id,
-                            e,
-                            exc_info=True,
-                        )
-                    with progress_lock:
-                        completed += 1
-                        if progress_callback:
-                            progress_callback(completed, total_inputs)
-        except Exception as e:
-            _logger.warning(
-                "Enrichment parallel run failed, falling back to sequential: %s", e
-            )
-            updated = _run_sequential(
+            try:
+                with ThreadPoolExecutor(max_workers=track_workers) as ex:
+                    future_to_idx = {
+                        ex.submit(_process_track, processor_service, idx, track): idx
+                        for _row_id, idx, track in inputs
+                    }
+                    completed = 0
+                    for future in as_completed(future_to_idx):
+                        idx = future_to_idx[future]
+                        row_id = idx_to_row_id.get(idx)
+                        if row_id is None:
+                            continue
+                        try:
+                            _record_result(writer, row_id, *future.result())
+                        except Exception as e:
+                            _logger.warning(
+                                "Enrichment failed for row id=%s: %s",
+                                row_id,
+                                e,
+                                exc_info=True,
+                            )
+                        with progress_lock:
+                            completed += 1
+                            if progress_callback:
+                                progress_callback(completed, total_inputs)
+            except Exception as e:
+                _logger.warning("Enrichment parallel run failed, falling back to sequential: %s", e)
+                _run_sequential(
+                    inputs,
+                    processor_service,
+                    writer,
+                    progress_callback,
+                    total_inputs,
+                )
+        else:
+            _logger.info("inCrate enrichment: sequential processing for %s tracks", len(inputs))
+            _run_sequential(
                 inputs,
-                idx_to_row_id,
                 processor_service,
-                db_path,
+                writer,
                 progress_callback,
                 total_inputs,
             )
-    else:
-        _logger.info(
-            "inCrate enrichment: sequential processing for %s tracks", len(inputs)
-        )
-        updated = _run_sequential(
-            inputs,
-            idx_to_row_id,
-            processor_service,
-            db_path,
-            progress_callback,
-            total_inputs,
-        )
-
-    return updated
+    _logger.info(
+        "inCrate enrichment: %s of %s rows updated in %s transactions",
+        writer.updated,
+        writer.attempted,
+        writer.batches,
+    )
+    return writer.updated
 
 
 def _run_sequential(
     inputs: List[Tuple[int, int, Track]],
-    idx_to_row_id: Dict[int, int],
     processor_service: Any,
-    db_path: str,
+    writer: inventory_db.EnrichmentWriter,
     progress_callback: Optional[Callable[[int, int], None]],
     total_inputs: int,
-) -> int:
-    updated = 0
+) -> None:
     for completed, (row_id, idx, track) in enumerate(inputs, 1):
         try:
-            result = processor_service.process_track(idx, track)
-            if (
-                result.matched
-                and result.best_match
-                and result.best_match.label
-                and result.best_match.url
-            ):
-                label = (result.best_match.label or "").strip() or None
-                if label:
-                    bid = _extract_track_id_from_url(result.best_match.url)
-                    updated_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-                    conn = inventory_db.get_connection(db_path)
-                    try:
-                        cur = conn.cursor()
-                        cur.execute(
-                            "UPDATE inventory SET label = ?, beatport_track_id = ?, beatport_url = ?, updated_at = ? WHERE id = ?",
-                            (label, bid, result.best_match.url, updated_at, row_id),
-                        )
-                        conn.commit()
-                        updated += 1
-                    finally:
-                        conn.close()
+            _record_result(writer, row_id, *_process_track(processor_service, idx, track))
         except Exception as e:
-            _logger.warning(
-                "Enrichment failed for row id=%s: %s", row_id, e, exc_info=True
-            )
+            _logger.warning("Enrichment failed for row id=%s: %s", row_id, e, exc_info=True)
         if progress_callback:
             progress_callback(completed, total_inputs)
-    return updated
 
 
 def _enrich_fallback(
@@ -269,6 +288,7 @@ def _enrich_fallback(
     beatport_service: Any,
     progress_callback: Optional[Callable[[int, int], None]] = None,
     delay_seconds: float = DEFAULT_ENRICHMENT_DELAY_SECONDS,
+    retry_attempted: bool = False,
 ) -> int:
     """Single-threaded fallback: make_search_queries + best_beatport_match (no processor)."""
     from cuepoint.core.matcher import best_beatport_match
@@ -281,84 +301,66 @@ def _enrich_fallback(
 
     MIN_ACCEPT_SCORE = 70
 
-    conn = inventory_db.get_connection(db_path)
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT id, track_key, artist, title FROM inventory WHERE label IS NULL OR TRIM(label) = ''"
-        )
-        rows = cur.fetchall()
-    finally:
-        conn.close()
+    rows = _load_rows(db_path, retry_attempted)
 
     total = len(rows)
-    updated = 0
     if progress_callback:
         progress_callback(0, total)
 
-    for i, (row_id, _track_key, artist, title) in enumerate(rows):
-        try:
-            title_str = (title or "").strip()
-            artist_str = (artist or "").strip()
-            if not title_str:
-                if progress_callback:
-                    progress_callback(i + 1, total)
-                continue
-
-            title_for_search = sanitize_title_for_search(title_str).strip()
-            queries = make_search_queries(
-                title_for_search,
-                artist_str,
-                original_title=title_str,
-            )
-            if not queries:
-                if progress_callback:
-                    progress_callback(i + 1, total)
-                continue
-
-            input_mix = _parse_mix_flags(title_str)
-            input_generic_phrases = _extract_generic_parenthetical_phrases(title_str)
-            title_only_mode = not bool(artist_str)
-
-            best, _candidates, _audit, _last_q = best_beatport_match(
-                idx=i + 1,
-                track_title=title_for_search,
-                track_artists_for_scoring=artist_str,
-                title_only_mode=title_only_mode,
-                queries=queries,
-                input_mix=input_mix,
-                input_generic_phrases=input_generic_phrases,
-            )
-
-            if best and best.score >= MIN_ACCEPT_SCORE and best.label and best.url:
-                best_label = (best.label or "").strip() or None
-                if best_label:
-                    beatport_track_id = _extract_track_id_from_url(best.url)
-                    updated_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-                    conn = inventory_db.get_connection(db_path)
-                    try:
-                        cur = conn.cursor()
-                        cur.execute(
-                            "UPDATE inventory SET label = ?, beatport_track_id = ?, beatport_url = ?, updated_at = ? WHERE id = ?",
-                            (
-                                best_label,
-                                beatport_track_id,
-                                best.url,
-                                updated_at,
-                                row_id,
-                            ),
-                        )
-                        conn.commit()
-                        updated += 1
-                    finally:
-                        conn.close()
-        except Exception as e:
-            _logger.warning(
-                "Enrichment failed for row id=%s: %s", row_id, e, exc_info=True
-            )
-
-        if progress_callback:
-            progress_callback(i + 1, total)
-        time.sleep(delay_seconds)
-
-    return updated
+    with _make_writer(db_path) as writer:
+        for i, (row_id, _track_key, artist, title) in enumerate(rows):
+            try:
+                title_str = (title or "").strip()
+                artist_str = (artist or "").strip()
+                if not title_str:
+                    if progress_callback:
+                        progress_callback(i + 1, total)
+                    continue
+
+                title_for_search = sanitize_title_for_search(title_str).strip()
+                queries = make_search_queries(
+                    title_for_search,
+                    artist_str,
+                    original_title=title_str,
+                )
+                if not queries:
+                    if progress_callback:
+                        progress_callback(i + 1, total)
+                    continue
+
+                input_mix = _parse_mix_flags(title_str)
+                input_generic_phrases = _extract_generic_parenthetical_phrases(title_str)
+                title_only_mode = not bool(artist_str)
+
+                with search_outcome() as outcome:
+                    best, _candidates, _audit, _last_q = best_beatport_match(
+                        idx=i + 1,
+                        track_title=title_for_search,
+                        track_artists_for_scoring=artist_str,
+                        title_only_mode=title_only_mode,
+                        queries=queries,
+                        input_mix=input_mix,
+                        input_generic_phrases=input_generic_phrases,
+                    )
+
+                best_label = best_url = None
+                if best and best.score >= MIN_ACCEPT_SCORE and best.label and best.url:
+                    best_label = (best.label or "").strip() or None
+                    best_url = best.url
+                if best_label and best_url:
+                    writer.record(
+                        row_id,
+                        best_label,
+                        _extract_track_id_from_url(best_url),
+                        best_url,
+                    )
+                else:
+                    _record_unmatched(writer, row_id, outcome)
+            except Exception as e:
+                _logger.warning("Enrichment failed for row id=%s: %s", row_id, e, exc_info=True)
+
+            if progress_callback:
+                progress_callback(i + 1, total)
+            time.sleep(delay_seconds)
+
+    return writer.updated
@@ -1,11 +1,21 @@
 """SQLite persistence for inCrate inventory."""
 
+import logging
+import queue
 import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from cuepoint.incrate.models import InventoryRecord
 
+_logger = logging.getLogger(__name__)
+
+# Enrichment writer defaults: rows per transaction and max seconds a row waits
+DEFAULT_WRITE_BATCH_SIZE = 200
+DEFAULT_WRITE_FLUSH_SECONDS = 1.0
+
 _SCHEMA_PATH = Path(__file__).resolve().parent / "schema.sql"
 
 _UPSERT_SQL = """
@@ -21,6 +31,24 @@ ON CONFLICT(track_key) DO UPDATE SET
   updated_at = excluded.updated_at;
 """
 
+_UNLABELED_SQL = """
+SELECT i.id, i.track_key, i.artist, i.title
+FROM inventory i
+LEFT JOIN enrichment_attempts a
+  ON a.inventory_id = i.id AND a.artist = i.artist AND a.title = i.title
+WHERE (i.label IS NULL OR TRIM(i.label) = '')
+"""
+
+_ENRICH_UPDATE_SQL = (
+    "UPDATE inventory SET label = ?, beatport_track_id = ?, beatport_url = ?, "
+    "updated_at = ? WHERE id = ?"
+)
+
+_ATTEMPT_SQL = """
+INSERT OR REPLACE INTO enrichment_attempts (inventory_id, artist, title, attempted_at)
+SELECT id, artist, title, ? FROM inventory WHERE id = ?
+"""
+
 
 def _load_schema() -> str:
     return _SCHEMA_PATH.read_text(encoding="utf-8")
@@ -41,6 +69,7 @@ def reset_db(db_path: str) -> None:
     conn = sqlite3.connect(db_path)
     try:
         conn.execute("DELETE FROM inventory")
+        conn.execute("DELETE FROM enrichment_attempts")
         conn.commit()
         conn.execute("VACUUM")
     finally:
@@ -52,6 +81,12 @@ def get_connection(db_path: str) -> sqlite3.Connection:
     return sqlite3.connect(db_path)
 
 
+def configure_for_writes(conn: sqlite3.Connection) -> None:
+    """Use WAL with synchronous=NORMAL so readers are not blocked by batch commits."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+
 def upsert(cursor: sqlite3.Cursor, record: InventoryRecord) -> None:
     """Insert or update one inventory row by track_key."""
     cursor.execute(
@@ -79,9 +114,7 @@ def upsert_batch(cursor: sqlite3.Cursor, records: List[InventoryRecord]) -> None
 
 def get_library_artists(cursor: sqlite3.Cursor) -> List[str]:
     """Return distinct artist names, excluding empty, sorted."""
-    cursor.execute(
-        "SELECT DISTINCT artist FROM inventory WHERE TRIM(artist) != '' ORDER BY artist"
-    )
+    cursor.execute("SELECT DISTINCT artist FROM inventory WHERE TRIM(artist) != '' ORDER BY artist")
     return [row[0] for row in cursor.fetchall()]
 
 
@@ -156,3 +189,164 @@ def get_all_inventory(
         "updated_at",
     ]
     return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def get_unlabeled_rows(
+    cursor: sqlite3.Cursor, include_attempted: bool = False
+) -> List[Tuple[int, str, str, str]]:
+    """Return (id, track_key, artist, title) for rows with an empty label.
+
+    Rows enrichment already attempted with the same artist/title are skipped
+    unless include_attempted is True.
+    """
+    sql = _UNLABELED_SQL
+    if not include_attempted:
+        sql += " AND a.inventory_id IS NULL"
+    cursor.execute(sql + " ORDER BY i.id")
+    return list(cursor.fetchall())
+
+
+def clear_enrichment_attempts(cursor: sqlite3.Cursor) -> None:
+    """Forget attempted rows so the next enrichment retries every empty label."""
+    cursor.execute("DELETE FROM enrichment_attempts")
+
+
+class EnrichmentWriter:
+    """Single writer thread that batches enrichment results into transactions.
+
+    Worker threads call record() and never touch the database; the writer
+    applies queued label updates and attempt markers in one transaction per
+    batch_size rows or flush_interval seconds, whichever comes first.
+
+    Use as a context manager; leaving it flushes everything still queued.
+
+    Args:
+        db_path: Path to SQLite inventory database.
+        batch_size: Maximum rows per transaction.
+        flush_interval: Maximum seconds a recorded row waits before commit.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        flush_interval: float = DEFAULT_WRITE_FLUSH_SECONDS,
+    ):
+        self._db_path = db_path
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0.0, float(flush_interval))
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self.updated = 0
+        self.attempted = 0
+        self.batches = 0
+
+    def __enter__(self) -> "EnrichmentWriter":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="incrate-enrichment-writer", daemon=True
+            )
+            self._thread.start()
+
+    def record(
+        self,
+        row_id: int,
+        label: Optional[str] = None,
+        beatport_track_id: Optional[str] = None,
+        beatport_url: Optional[str] = None,
+    ) -> None:
+        """Queue the outcome for one row; without a label it is only marked attempted."""
+        self._queue.put((row_id, label, beatport_track_id, beatport_url))
+
+    def close(self) -> None:
+        """Flush queued rows and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        conn = sqlite3.connect(self._db_path)
+        try:
+            configure_for_writes(conn)
+            pending: List[Tuple[int, Optional[str], Optional[str], Optional[str]]] = []
+            deadline = 0.0
+            stop = False
+            while not stop:
+                timeout = max(0.0, deadline - time.monotonic()) if pending else None
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+                if item is self._STOP:
+                    stop = True
+                elif item is not None:
+                    if not pending:
+                        deadline = time.monotonic() + self.flush_interval
+                    pending.append(item)
+                if pending and (
+                    stop or len(pending) >= self.batch_size or time.monotonic() >= deadline
+                ):
+                    self._flush(conn, pending)
+                    pending = []
+        finally:
+            conn.close()
+
+    def _flush(
+        self,
+        conn: sqlite3.Connection,
+        pending: List[Tuple[int, Optional[str], Optional[str], Optional[str]]],
+    ) -> None:
+        """Write a batch in one transaction; if it fails, write its rows one by one.
+
+        A row that still fails is dropped (and logged) without losing the rest
+        of the batch.
+        """
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        try:
+            updated = self._write(conn, pending, now)
+            attempted = len(pending)
+        except sqlite3.Error as e:
+            _logger.warning(
+                "inCrate enrichment: batch of %s rows failed (%s); writing rows one by one",
+                len(pending),
+                e,
+            )
+            updated = attempted = 0
+            for item in pending:
+                try:
+                    updated += self._write(conn, [item], now)
+                    attempted += 1
+                except sqlite3.Error as row_error:
+                    _logger.warning("inCrate enrichment: dropped row %s: %s", item[0], row_error)
+        self.updated += updated
+        self.attempted += attempted
+        self.batches += 1
+
+    @staticmethod
+    def _write(
+        conn: sqlite3.Connection,
+        rows: List[Tuple[int, Optional[str], Optional[str], Optional[str]]],
+        now: str,
+    ) -> int:
+        """Apply label updates and attempt markers in one transaction; returns rows updated."""
+        updated = 0
+        with conn:
+            for row_id, label, beatport_track_id, beatport_url in rows:
+                if label:
+                    cur = conn.execute(
+                        _ENRICH_UPDATE_SQL,
+                        (label, beatport_track_id, beatport_url, now, row_id),
+                    )
+                    updated += cur.rowcount
+                conn.execute(_ATTEMPT_SQL, (now, row_id))
+        return updated
@@ -1,14 +1,22 @@
 """Create Beatport playlist and add discovered tracks (Phase 4). API path first; browser fallback."""
 
 import logging
-from dataclasses import dataclass
-from typing import Any, Callable, List, Optional
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List, Optional, Set
 
 from cuepoint.exceptions.cuepoint_exceptions import BeatportAPIError
 from cuepoint.incrate.beatport_api_models import DiscoveredTrack
 
 _logger = logging.getLogger(__name__)
 
+# Extra attempts for a failed add before the track counts as failed
+DEFAULT_ADD_RETRIES = 2
+DEFAULT_RETRY_DELAY = 0.5
+
+# Token problems: retrying or continuing cannot succeed
+_FATAL_STATUS = (401, 403)
+
 
 @dataclass
 class PlaylistResult:
@@ -19,12 +27,122 @@ class PlaylistResult:
     playlist_id: Optional[str]
     added_count: int
     error: Optional[str]
+    failed_track_ids: List[int] = field(default_factory=list)
+
+
+@dataclass
+class AddTracksResult:
+    """Result of add_tracks_with_retry."""
+
+    added: int
+    failed_track_ids: List[int]
+
+
+def _status_of(e: BaseException) -> Optional[int]:
+    status = getattr(e, "status_code", None)
+    if status is None:
+        status = getattr(getattr(e, "response", None), "status_code", None)
+    return status
+
+
+def _add_with_retry(
+    add: Callable[[int], Any],
+    track_id: int,
+    present_ids: Optional[Callable[[], Set[int]]],
+    max_retries: int,
+    retry_delay: float,
+) -> bool:
+    """Add one track, retrying failures; returns False if it was not added.
+
+    Before each retry the playlist is re-read (when the client can) and the
+    retry is skipped if a failed-but-applied request already added the track,
+    so retries never add a track twice. Auth errors are re-raised.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            add(track_id)
+            return True
+        except Exception as e:
+            if _status_of(e) in _FATAL_STATUS:
+                raise
+            if attempt == max_retries:
+                _logger.warning(
+                    "Adding track %s to playlist failed after %d attempts: %s",
+                    track_id,
+                    attempt + 1,
+                    e,
+                )
+                return False
+            _logger.debug("Add track %s failed (attempt %d): %s", track_id, attempt + 1, e)
+        time.sleep(retry_delay * (2**attempt))
+        if present_ids is not None:
+            try:
+                present = present_ids()
+            except Exception as e:
+                _logger.debug("Could not re-read playlist before retry: %s", e)
+            else:
+                if track_id in present:
+                    return True
+    return False
+
+
+def add_tracks_with_retry(
+    api_client: Any,
+    playlist_id: str,
+    track_ids: Iterable[int],
+    max_retries: int = DEFAULT_ADD_RETRIES,
+    retry_delay: float = DEFAULT_RETRY_DELAY,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> AddTracksResult:
+    """Add tracks to a playlist one request at a time, in playlist order.
+
+    Failed adds are retried idempotently (see _add_with_retry); tracks that
+    still fail are reported instead of aborting the run. A 401/403 stops
+    the run.
+
+    Args:
+        progress_callback: Called with (processed, total) after every track.
+
+    Raises:
+        BeatportAPIError: Auth failure (401/403) before any track was added.
+    """
+    ids = list(dict.fromkeys(int(t) for t in track_ids))
+    total = len(ids)
+    add: Any = getattr(api_client, "add_track_to_playlist", None)
+    if ids and not callable(add):
+        raise RuntimeError("API client cannot add tracks to playlists")
+    get_present = getattr(api_client, "get_playlist_track_ids", None)
+    present_ids = (lambda: get_present(playlist_id)) if callable(get_present) else None
+
+    added = 0
+    failed: List[int] = []
+    for processed, track_id in enumerate(ids, start=1):
+        try:
+            ok = _add_with_retry(
+                lambda t: add(playlist_id, t), track_id, present_ids, max_retries, retry_delay
+            )
+        except Exception as e:
+            if added == 0:
+                raise
+            _logger.warning("Stopped adding tracks to playlist: %s", e)
+            failed.extend(ids[processed - 1 :])
+            if progress_callback:
+                progress_callback(total, total)
+            break
+        if ok:
+            added += 1
+        else:
+            failed.append(track_id)
+        if progress_callback:
+            progress_callback(processed, total)
+    return AddTracksResult(added, failed)
 
 
 def _try_api_path(
     name: str,
     tracks: List[DiscoveredTrack],
     api_client: Any,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
 ) -> Optional[PlaylistResult]:
     """Try create_playlist and add_tracks via API. Returns None if API doesn't support or fails."""
     create_playlist = getattr(api_client, "create_playlist", None)
@@ -41,23 +159,21 @@ def _try_api_path(
                 added_count=0,
                 error="Could not create playlist. Your Beatport token may not have playlist write access, or the API may not support playlist creation.",
             )
-        added = 0
-        for t in tracks:
-            try:
-                add_track(playlist_id, t.beatport_track_id)
-                added += 1
-            except Exception as e:
-                _logger.warning(
-                    "Add track %s to playlist failed: %s", t.beatport_track_id, e
-                )
+        batch = add_tracks_with_retry(
+            api_client,
+            str(playlist_id),
+            [t.beatport_track_id for t in tracks],
+            progress_callback=progress_callback,
+        )
         playlist_url = getattr(api_client, "playlist_url", None)
         url = playlist_url(playlist_id) if callable(playlist_url) else None
         return PlaylistResult(
             success=True,
             playlist_url=url,
             playlist_id=str(playlist_id) if playlist_id is not None else None,
-            added_count=added,
+            added_count=batch.added,
             error=None,
+            failed_track_ids=batch.failed_track_ids,
         )
     except BeatportAPIError as e:
         err_msg = getattr(e, "message", str(e)) or "Beatport API error"
@@ -122,6 +238,7 @@ def create_playlist_and_add_tracks(
     ] = None,
     beatport_username: Optional[str] = None,
     beatport_password: Optional[str] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
 ) -> PlaylistResult:
     """Create a playlist with the given name and add tracks. Tries API then browser fallback.
 
@@ -132,6 +249,7 @@ def create_playlist_and_add_tracks(
         browser_add_to_playlist: Optional callable(name, tracks, username, password) -> PlaylistResult.
         beatport_username: For browser path.
         beatport_password: For browser path (never logged).
+        progress_callback: Optional callable(processed, total) for the API path.
 
     Returns:
         PlaylistResult with success, playlist_url/id, added_count, and error if failed.
@@ -146,7 +264,12 @@ def create_playlist_and_add_tracks(
         )
     result = None
     if api_client is not None:
-        result = _try_api_path(name, tracks, api_client)
+        result = _try_api_path(
+            name,
+            tracks,
+            api_client,
+            progress_callback=progress_callback,
+        )
     if result is not None and result.success:
         return result
     # When API failed or was skipped, try browser (you log in manually in the window)
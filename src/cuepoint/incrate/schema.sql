@@ -16,3 +16,13 @@ CREATE TABLE IF NOT EXISTS inventory (
 CREATE INDEX IF NOT EXISTS idx_inventory_artist ON inventory(artist);
 CREATE INDEX IF NOT EXISTS idx_inventory_label ON inventory(label);
 CREATE UNIQUE INDEX IF NOT EXISTS idx_inventory_track_key ON inventory(track_key);
+
+-- Rows label enrichment already tried (matched or not), so an interrupted or
+-- repeated enrichment resumes instead of starting over. artist/title snapshot
+-- the row at attempt time: a re-import that changes them makes it eligible again.
+CREATE TABLE IF NOT EXISTS enrichment_attempts (
+    inventory_id INTEGER PRIMARY KEY,
+    artist TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    attempted_at TEXT NOT NULL
+);
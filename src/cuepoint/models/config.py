@@ -41,6 +41,9 @@ import os
 
 import requests  # type: ignore[import-untyped]
 
+from cuepoint.utils.http_pool import PoolConfig, mount_shared_adapter
+from cuepoint.utils.lazy_import import module_available
+
 # -----------------------------
 # Main Configuration Dictionary
 # -----------------------------
@@ -64,6 +67,48 @@ SETTINGS = {
     # Each thread processes one track's queries and matching
     # Higher = faster overall but more memory usage
     # Optimized for parallel track processing (was 1)
+    "FETCH_ENGINE": "threads",  # How candidate pages are fetched: "threads"
+    # (a CANDIDATE_WORKERS pool per track) or "asyncio" (one event loop for all
+    # tracks via aiohttp; far fewer threads, so TRACK_WORKERS can go higher)
+    "ASYNC_MAX_IN_FLIGHT": 64,  # asyncio engine: requests in flight across all tracks
+    "ASYNC_PARSE_WORKERS": 2,  # asyncio engine: threads parsing fetched pages
+    "PARSE_JSON_FAST_PATH": True,  # Read track pages from their __NEXT_DATA__ and
+    # JSON-LD payloads sliced out of the raw HTML; the page is only parsed into
+    # a BeautifulSoup tree when those payloads lack a field
+    "PARSE_PROCESSES": 0,  # Worker processes that parse fetched track pages
+    # (0 = parse on the fetching thread). Spreads parsing across cores, which
+    # the GIL otherwise confines to one however many workers run
+    "PAYLOAD_CACHE": True,  # Keep the JSON payloads extracted from track pages
+    # (and search result URL lists) in payload_cache.sqlite instead of re-fetching
+    # and re-slicing the HTML; needs ENABLE_CACHE and PARSE_JSON_FAST_PATH
+    "PAYLOAD_CACHE_TRACK_TTL_HOURS": 168,  # Track page payloads change rarely
+    "PAYLOAD_CACHE_SEARCH_TTL_HOURS": 24,  # Search results change as tracks are released
+    "PAYLOAD_CACHE_MAX_MB": 64,  # Size budget; least recently used entries go first
+    "NEGATIVE_CACHE": True,  # Remember 404/410 pages, searches without results and
+    # unparseable pages (negative_cache.sqlite) so tracks and runs skip them; the
+    # TTL starts short (15 min to 6 h by kind) and doubles on each repeat
+    "NEGATIVE_CACHE_MAX_TTL_HOURS": 168,  # Cap of the growing TTL
+    "SEARCH_MODE": "sequential",  # "sequential": try search backends one after
+    # another; "hedged": start API, Beatport search page and DuckDuckGo with a
+    # short stagger and return once enough merged results are in
+    "HEDGED_STAGGER_SEC": 0.25,  # Delay before starting the next backend
+    "HEDGED_SUFFICIENT_RATIO": 0.7,  # Return once this share of max_results is in
+    "HEDGED_TIMEOUT_SEC": 20,  # Give up waiting on slow backends after this
+    "HEDGED_MAX_WORKERS": 32,  # Threads shared by hedged searches of all tracks
+    "SEARCH_BACKEND_DEAD_AFTER": 3,  # Consecutive failures before a backend or
+    # API endpoint is skipped (0 = never skip)
+    "SEARCH_BACKEND_RETRY_SEC": 900,  # How long a failing backend is skipped
+    "SLUG_PRESCORE": True,  # Rank candidate URLs by their /track/<slug>/ title
+    # before fetching, fetch the most promising first and skip pages whose best
+    # possible score cannot beat the current best match
+    "SLUG_PRESCORE_MARGIN": 10,  # Points added to the slug title similarity
+    # when bounding a candidate (slugs drop punctuation and accents)
+    "SINGLE_FLIGHT": True,  # Coalesce identical in-flight searches and page
+    # fetches across track workers: concurrent callers for the same query/URL
+    # wait for the first one and share its result (counters in the run report)
+    "AUTO_RESEARCH_OVERLAP": True,  # With auto-research and TRACK_WORKERS > 1,
+    # queue a track's enhanced re-search as soon as it finishes unmatched,
+    # behind the main-pass tracks still waiting, instead of after the whole pass
     "PER_TRACK_TIME_BUDGET_SEC": 45,  # Maximum time (in seconds) to spend
     # searching for matches per track
     # After this time, the best match found so far is accepted
@@ -85,6 +130,8 @@ SETTINGS = {
     # ========================================================================
     "VERBOSE": True,  # Enable verbose logging (detailed progress information)
     "TRACE": True,  # Enable trace-level logging (shows every candidate evaluated)
+    "LOG_CANDIDATE_SAMPLE_EVERY": 1,  # Print 1 in N per-candidate TRACE lines
+    # (1 = all; higher values cut console time on large playlists)
     # ========================================================================
     # NETWORK & CACHING SETTINGS
     # ========================================================================
@@ -97,6 +144,15 @@ SETTINGS = {
     "ENABLE_CACHE": True,  # Enable HTTP response caching (requires requests-cache package)
     # Speeds up repeated runs by caching Beatport page responses
     # Enabled by default for better performance (was False)
+    "HTTP_POOL_MAXSIZE": None,  # Connections kept open per host (None = derive)
+    # Derived as TRACK_WORKERS x CANDIDATE_WORKERS, clamped to [10, HTTP_POOL_MAXSIZE_CAP],
+    # so concurrent fetches reuse connections instead of redoing TLS handshakes
+    "HTTP_POOL_MAXSIZE_CAP": 64,  # Upper bound for the derived pool size
+    "HTTP_POOL_HOSTS": 10,  # Number of per-host pools kept (Beatport, API, DDG, ...)
+    "HTTP_POOL_BLOCK": False,  # Wait for a free connection instead of opening a throwaway one
+    "HTTP_KEEPALIVE": True,  # TCP keep-alive on pooled sockets (drops are detected sooner)
+    "HTTP_DNS_CACHE_TTL": 300,  # Seconds to reuse a resolved address (0 = no DNS cache)
+    "HTTP_TRANSPORT": "urllib3",  # "urllib3" or "http2" (needs httpx[http2]; falls back)
     # ========================================================================
     # SEARCH STRATEGY SETTINGS
     # ========================================================================
@@ -112,6 +168,9 @@ SETTINGS = {
     # Enabled by default for maximum reliability (was False)
     "BROWSER_TIMEOUT_SEC": 30,  # Timeout for browser automation operations in seconds
     # How long to wait for page to load in browser
+    "BROWSER_POOL_SIZE": 2,  # Warm headless browsers kept per run (0 = launch per query)
+    "BROWSER_POOL_MAX_PAGES": 50,  # Page loads before a pooled browser is recycled
+    "BROWSER_BLOCK_RESOURCES": True,  # Block images/fonts/media/analytics in browser search
     # ========================================================================
     # DUCKDUCKGO (DDGS) SETTINGS
     # ========================================================================
@@ -290,6 +349,12 @@ SETTINGS = {
     "MAX_QUERIES_PER_TRACK": 40,  # Hard cap on total queries generated per track
     # Prevents runaway query generation
     # Optimized to allow remix queries while maintaining speed (was 200)
+    "QUERY_STAGE_BUDGET": 400,  # Raw candidates per combinatorial query stage
+    # (artist pairs, title bases × artist variants, grams × artists); 0 = unlimited.
+    # Queries are generated lazily, so this only matters past the first stages
+    "QUERY_PLAN_CACHE": True,  # Reuse generated query plans across runs and auto-research
+    # Plans are keyed by (title, artist, query-generation settings) and saved
+    # as query_plans.json next to the run outputs when an output dir is known
     # ========================================================================
     # GENERIC PARENTHETICAL PHRASE SCORING (e.g., "Ivory Re-fire", "Club Mix")
     # ========================================================================
@@ -340,15 +405,14 @@ BASE_URL = "https://www.beatport.com"
 # Persistent HTTP session (reuses connections for better performance)
 SESSION = requests.Session()
 SESSION.headers.update(HEADERS)
+# Shared connection pool (also used by BeatportApiClient); sized for the
+# default worker counts and grown per run by http_pool.ensure_capacity()
+mount_shared_adapter(SESSION, PoolConfig.from_settings(SETTINGS))
 
 # Check if requests-cache is available for HTTP response caching
 # If available, responses are cached to speed up repeated runs
-try:
-    import requests_cache  # noqa: F401
-
-    HAVE_CACHE = True
-except Exception:
-    HAVE_CACHE = False
+# (checked without importing it; the cache module imports it when installed)
+HAVE_CACHE = module_available("requests_cache")
 
 # ========================================================================
 # MUSICAL KEY EQUIVALENTS
@@ -432,11 +496,16 @@ def _map_yaml_keys_to_settings(yaml_dict: dict) -> dict:
         "QUERY_GENERATION_TITLE_GRAM_MAX": "TITLE_GRAM_MAX",
         "QUERY_GENERATION_MAX_QUERIES_PER_TRACK": "MAX_QUERIES_PER_TRACK",
         "QUERY_GENERATION_CROSS_TITLE_GRAMS_WITH_ARTISTS": "CROSS_TITLE_GRAMS_WITH_ARTISTS",
+        "QUERY_GENERATION_PLAN_CACHE": "QUERY_PLAN_CACHE",
+        "QUERY_GENERATION_STAGE_BUDGET": "QUERY_STAGE_BUDGET",
         "NETWORK_CONNECT_TIMEOUT": "CONNECT_TIMEOUT",
         "NETWORK_READ_TIMEOUT": "READ_TIMEOUT",
         "NETWORK_ENABLE_CACHE": "ENABLE_CACHE",
         "SEARCH_USE_BROWSER_AUTOMATION": "USE_BROWSER_AUTOMATION",
         "SEARCH_BROWSER_TIMEOUT_SEC": "BROWSER_TIMEOUT_SEC",
+        "SEARCH_BROWSER_POOL_SIZE": "BROWSER_POOL_SIZE",
+        "SEARCH_BROWSER_POOL_MAX_PAGES": "BROWSER_POOL_MAX_PAGES",
+        "SEARCH_BROWSER_BLOCK_RESOURCES": "BROWSER_BLOCK_RESOURCES",
         "LOGGING_VERBOSE": "VERBOSE",
         "LOGGING_TRACE": "TRACE",
         "DETERMINISM_SEED": "SEED",
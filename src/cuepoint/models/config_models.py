@@ -172,6 +172,8 @@ class IncrateConfig:
     inventory_db_path: Optional[str] = None  # None = use platform default
     enrich_on_first_import: bool = True
     enrichment_delay_seconds: float = 0.5
+    enrichment_write_batch_size: int = 200  # Rows per enrichment DB transaction
+    enrichment_write_flush_seconds: float = 1.0  # Max wait before a batch commits
     # Phase 2: Beatport API client
     beatport_api_base_url: str = "https://api.beatport.com/v4"
     beatport_access_token: str = ""
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Immutable per-run settings snapshot.
+
+SETTINGS in models/config.py is a process-global, mutable dict. A processing
+run resolves it once into a RunSettings (its own overrides on top of
+SETTINGS, or the config service's values when it has none) and passes that snapshot down through
+ProcessorService, MatcherService, best_beatport_match, the query generator
+and track_urls. Two runs in one process can therefore use different settings
+(e.g. auto-research with enhanced limits next to a normal run), and nothing
+re-resolves settings per track.
+
+Functions that take ``settings=None`` fall back to the live SETTINGS dict via
+settings_or_global(), so callers outside a run behave as before.
+"""
+
+from typing import Any, Iterator, Mapping, Optional
+
+from cuepoint.models.config import SETTINGS
+
+
+class RunSettings(Mapping[str, Any]):
+    """Read-only mapping of setting name to value, fixed for one run.
+
+    The values are copied on construction, so later changes to SETTINGS
+    (or to the dict a snapshot was built from) do not leak into a run.
+    Use replace() to derive a modified snapshot.
+    """
+
+    def __init__(self, values: Optional[Mapping[str, Any]] = None):
+        self._values = dict(values or {})
+
+    @classmethod
+    def resolve(
+        cls,
+        overrides: Optional[Mapping[str, Any]] = None,
+        config_service: Optional[Any] = None,
+    ) -> "RunSettings":
+        """Snapshot every SETTINGS key plus the run's overrides.
+
+        Args:
+            overrides: Run-specific values (e.g. from the GUI), applied on top
+                of SETTINGS. An existing RunSettings is returned unchanged.
+            config_service: Used only without overrides: its get(key, default)
+                supplies each value, with SETTINGS as the default.
+        """
+        if isinstance(overrides, RunSettings):
+            return overrides
+        if overrides is None and config_service is not None:
+            values = {
+                key: config_service.get(key, SETTINGS.get(key)) for key in SETTINGS
+            }
+        else:
+            values = dict(SETTINGS)
+        values.update(overrides or {})
+        return cls(values)
+
+    def replace(self, **changes: Any) -> "RunSettings":
+        """Copy of this snapshot with ``changes`` applied."""
+        values = dict(self._values)
+        values.update(changes)
+        return RunSettings(values)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"RunSettings({len(self._values)} keys)"
+
+
+def settings_or_global(settings: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """The run's settings, or the live global SETTINGS when none were passed."""
+    return SETTINGS if settings is None else settings
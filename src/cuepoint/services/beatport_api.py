@@ -4,7 +4,7 @@ import json
 import logging
 import re
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from cuepoint.exceptions.cuepoint_exceptions import BeatportAPIError
 from cuepoint.incrate.beatport_api_models import (
@@ -964,6 +964,33 @@ class BeatportApi:
             raise RuntimeError("API client does not support POST")
         post(f"my/playlists/{playlist_id}/tracks", json={"track_id": int(track_id)})
 
+    def get_playlist_track_ids(self, playlist_id: str) -> Set[int]:
+        """Track IDs currently in a playlist (all pages, uncached)."""
+        ids: Set[int] = set()
+        page = 1
+        per_page = 100
+        while True:
+            data = self._client.get(
+                f"my/playlists/{playlist_id}/tracks",
+                params={"page": page, "per_page": per_page},
+            )
+            if not isinstance(data, dict):
+                break
+            results = data.get("results")
+            if not results:
+                break
+            for item in results:
+                if not isinstance(item, dict):
+                    continue
+                track = item.get("track")
+                tid = (track if isinstance(track, dict) else item).get("id")
+                if tid is not None:
+                    ids.add(int(tid))
+            if len(results) < per_page or not data.get("next"):
+                break
+            page += 1
+        return ids
+
     def playlist_url(self, playlist_id: str) -> Optional[str]:
         """Return the Beatport URL for a playlist (if known)."""
         base = "https://www.beatport.com"
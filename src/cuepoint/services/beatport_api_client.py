@@ -7,6 +7,7 @@ import requests
 
 from cuepoint.exceptions.cuepoint_exceptions import BeatportAPIError
 from cuepoint.services.reliability_retry import run_with_retry
+from cuepoint.utils.http_pool import pooled_session
 
 _logger = logging.getLogger(__name__)
 
@@ -24,7 +25,8 @@ class BeatportApiClient:
         self.base_url = base_url.rstrip("/")
         self.access_token = access_token or ""
         self.timeout = timeout
-        self._session = session if session is not None else requests.Session()
+        # Own headers, but connections come from the shared Beatport pool
+        self._session = session if session is not None else pooled_session()
 
     def _headers(self) -> Dict[str, str]:
         return {
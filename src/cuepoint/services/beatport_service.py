@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional
 
 from cuepoint.data.providers import get_active_provider
 from cuepoint.exceptions.cuepoint_exceptions import BeatportAPIError
+from cuepoint.models.config import SETTINGS
 from cuepoint.services.circuit_breaker import (
     CircuitOpenError,
     get_network_circuit_breaker,
@@ -28,6 +29,7 @@ from cuepoint.services.interfaces import (
     ILoggingService,
 )
 from cuepoint.services.reliability_retry import run_with_retry
+from cuepoint.utils.single_flight import coalesce
 
 
 class BeatportService(IBeatportService):
@@ -62,7 +64,8 @@ class BeatportService(IBeatportService):
         """Search for tracks on Beatport and return URLs.
 
         Searches Beatport using a hybrid search strategy (DuckDuckGo + direct)
-        and returns a list of track URLs. Results are cached for 1 hour.
+        and returns a list of track URLs. Results are cached for 1 hour, and
+        concurrent searches for the same normalised query share one request.
 
         Args:
             query: Search query string.
@@ -125,7 +128,12 @@ class BeatportService(IBeatportService):
                     config_service=self.config_service,
                 )
 
-            urls = get_network_circuit_breaker().call(_search)
+            urls = coalesce(
+                "service_search",
+                (" ".join(query.lower().split()), max_results),
+                lambda: get_network_circuit_breaker().call(_search),
+                enabled=bool(SETTINGS.get("SINGLE_FLIGHT", True)),
+            )
 
             self.logging_service.info(
                 f"Found {len(urls)} track URLs for query: {query}"
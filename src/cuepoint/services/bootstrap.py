@@ -43,7 +43,7 @@ def bootstrap_services() -> None:
     container = get_container()
 
     # Register logging service first (needed by others)
-    logging_service = LoggingService()
+    logging_service = LoggingService(queue_logging=True)
     container.register_singleton(ILoggingService, logging_service)
 
     # Register config service
@@ -9,7 +9,7 @@ These interfaces enable dependency injection and testability.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from cuepoint.models.preflight import PreflightResult
 from cuepoint.models.result import TrackResult
@@ -191,11 +191,12 @@ class IMatcherService(ABC):
         track_title: str,
         track_artists_for_scoring: str,
         title_only_mode: bool,
-        queries: List[str],
+        queries: Iterable[str],
         input_year: Optional[int] = None,
         input_key: Optional[str] = None,
         input_mix: Optional[Dict[str, object]] = None,
         input_generic_phrases: Optional[List[str]] = None,
+        settings: Optional[Mapping[str, Any]] = None,
     ) -> Tuple[Any, List[Any], List[Any], int]:
         """Find best Beatport match for a track.
 
@@ -207,11 +208,13 @@ class IMatcherService(ABC):
             track_title: Track title to match.
             track_artists_for_scoring: Artist string for scoring (may differ from title).
             title_only_mode: If True, only match on title (ignore artist).
-            queries: List of search queries to execute.
+            queries: Search queries to execute, in order (may be a lazy iterator).
             input_year: Optional input year for bonus scoring.
             input_key: Optional input key for bonus scoring.
             input_mix: Optional mix flags dictionary.
             input_generic_phrases: Optional list of generic phrases from title.
+            settings: Optional run settings snapshot (see RunSettings); the
+                global SETTINGS are used when omitted.
 
         Returns:
             Tuple containing:
@@ -74,11 +74,21 @@ class InventoryService:
             "inCrate: inventory database reset (user can re-import another collection)"
         )
 
+    def clear_enrichment_attempts(self) -> None:
+        """Forget which rows enrichment tried, so the next import retries every empty label."""
+        conn = inventory_db.get_connection(self._db_path)
+        try:
+            inventory_db.clear_enrichment_attempts(conn.cursor())
+            conn.commit()
+        finally:
+            conn.close()
+
     def import_from_xml(
         self,
         xml_path: str,
         enrich: bool = True,
         progress_callback: Optional[Any] = None,
+        retry_attempted: bool = False,
     ) -> Dict[str, Any]:
         """Import COLLECTION from Rekordbox XML and optionally enrich empty labels.
 
@@ -86,6 +96,8 @@ class InventoryService:
             xml_path: Path to Rekordbox XML export.
             enrich: If True, run label enrichment for rows with empty label (when beatport_service set).
             progress_callback: Optional (current, total) for enrichment progress.
+            retry_attempted: If True, enrichment also retries rows earlier runs
+                tried and could not match (see clear_enrichment_attempts()).
 
         Returns:
             Dict with imported (int), enriched (int), errors (list).
@@ -147,6 +159,7 @@ class InventoryService:
                 delay_seconds=delay,
                 processor_service=self._processor,
                 config_service=self._config,
+                retry_attempted=retry_attempted,
             )
             _logger.info(
                 "inCrate import: enrichment complete, enriched=%s", result["enriched"]
@@ -6,6 +6,10 @@ Logging Service Implementation
 
 Structured logging service with file rotation and console output.
 Design 7.1, 7.15: 5MB max, 5 backup files.
+
+With queue_logging the handlers are served by a listener thread, so callers
+(processing workers) only enqueue records; sanitising, formatting and file
+I/O happen off their threads.
 """
 
 import logging
@@ -15,7 +19,14 @@ from pathlib import Path
 from typing import Any, Optional
 
 from cuepoint.services.interfaces import ILoggingService
-from cuepoint.utils.logger import LogSanitizer, RunContextFilter
+from cuepoint.utils.logger import (
+    LogSanitizer,
+    NonBlockingQueueHandler,
+    RunContextFilter,
+    SensitiveDataFilter,
+    start_queue_logging,
+    stop_queue_logging,
+)
 
 # Disable error output from the logging system itself at module level
 # This prevents "--- Logging error ---" messages from appearing
@@ -67,6 +78,7 @@ class LoggingService(ILoggingService):
     - Console logging with simplified format
     - Configurable log levels
     - Structured logging with extra context
+    - Optional queue-based, non-blocking handlers
     """
 
     def __init__(
@@ -76,6 +88,7 @@ class LoggingService(ILoggingService):
         enable_file_logging: bool = True,
         enable_console_logging: bool = True,
         logger_name: str = "cuepoint",
+        queue_logging: bool = False,
     ):
         """Initialize logging service.
 
@@ -85,11 +98,15 @@ class LoggingService(ILoggingService):
             enable_file_logging: Whether to log to file.
             enable_console_logging: Whether to log to console.
             logger_name: Name for the logger (default: "cuepoint").
+            queue_logging: Serve the handlers from a listener thread so log
+                calls never block on disk or console I/O.
         """
         self.logger = logging.getLogger(logger_name)
         self.logger.setLevel(getattr(logging, log_level.upper()))
 
-        # Remove existing handlers to avoid duplicates
+        # Remove existing handlers to avoid duplicates (stopping the listener
+        # of a previous queued setup first, so its records are flushed)
+        stop_queue_logging(self.logger)
         self.logger.handlers.clear()
 
         # Prevent propagation to root logger to avoid duplicate handlers
@@ -115,6 +132,10 @@ class LoggingService(ILoggingService):
             "run_id=%(run_id)s version=%(version)s os=%(os)s - %(pathname)s:%(lineno)d"
         )
         console_formatter = logging.Formatter("%(levelname)s - %(message)s")
+        # Step 8.2: sanitize logs by default; on the handlers, so that behind
+        # the queue the regexes run on the listener thread
+        sanitizer = SensitiveDataFilter()
+        run_context = RunContextFilter()
 
         # File handler with rotation
         if enable_file_logging:
@@ -130,7 +151,9 @@ class LoggingService(ILoggingService):
             )
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(file_formatter)
-            file_handler.addFilter(RunContextFilter())
+            file_handler.addFilter(sanitizer)
+            if not queue_logging:
+                file_handler.addFilter(run_context)
             self.logger.addHandler(file_handler)
 
         # Console handler with UTF-8 encoding support
@@ -140,8 +163,13 @@ class LoggingService(ILoggingService):
             console_handler = logging.StreamHandler(safe_stdout)
             console_handler.setLevel(logging.INFO)
             console_handler.setFormatter(console_formatter)
+            console_handler.addFilter(sanitizer)
             self.logger.addHandler(console_handler)
 
+        if queue_logging and self.logger.handlers:
+            # run_id must be read on the calling thread, at call time
+            start_queue_logging(self.logger, caller_filters=[run_context])
+
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log debug message.
 
@@ -202,16 +230,17 @@ class LoggingService(ILoggingService):
             *args: Format args for message interpolation.
             **kwargs: extra, exc_info, etc.
         """
-        extra = kwargs.pop("extra", {})
+        # Below the level: no sanitising, formatting or record creation
+        if not self.logger.isEnabledFor(level):
+            return
+        extra = kwargs.pop("extra", None)
         exc_info = kwargs.pop("exc_info", None)
 
-        # Step 8.2: sanitize logs by default (message + structured extra)
-        safe_message = LogSanitizer.sanitize_message(str(message))
-        safe_extra = LogSanitizer.sanitize_dict(extra)
+        # Step 8.2: structured extra is sanitized here; the message (with its
+        # args) is sanitized by SensitiveDataFilter when a handler emits it
+        safe_extra = LogSanitizer.sanitize_dict(extra) if extra else None
 
-        self.logger.log(
-            level, safe_message, *args, extra=safe_extra, exc_info=exc_info, **kwargs
-        )
+        self.logger.log(level, message, *args, extra=safe_extra, exc_info=exc_info, **kwargs)
 
     def get_log_path(self) -> Optional[Path]:
         """Get path to current log file (Design 7.53).
@@ -219,7 +248,13 @@ class LoggingService(ILoggingService):
         Returns:
             Path to cuepoint.log, or None if file logging disabled.
         """
+        handlers = []
         for handler in self.logger.handlers:
+            if isinstance(handler, NonBlockingQueueHandler):
+                handlers.extend(handler.target_handlers)
+            else:
+                handlers.append(handler)
+        for handler in handlers:
             if isinstance(handler, logging.handlers.RotatingFileHandler):
                 return Path(handler.baseFilename)
         return None
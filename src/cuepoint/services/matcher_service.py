@@ -7,7 +7,7 @@ Matcher Service Implementation
 Service for finding best Beatport matches for tracks.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from cuepoint.core.matcher import best_beatport_match
 from cuepoint.models.beatport_candidate import BeatportCandidate
@@ -30,11 +30,12 @@ class MatcherService(IMatcherService):
         track_title: str,
         track_artists_for_scoring: str,
         title_only_mode: bool,
-        queries: List[str],
+        queries: Iterable[str],
         input_year: Optional[int] = None,
         input_key: Optional[str] = None,
         input_mix: Optional[Dict[str, object]] = None,
         input_generic_phrases: Optional[List[str]] = None,
+        settings: Optional[Mapping[str, Any]] = None,
     ) -> Tuple[
         Optional[BeatportCandidate],
         List[BeatportCandidate],
@@ -51,11 +52,13 @@ class MatcherService(IMatcherService):
             track_title: Track title to match.
             track_artists_for_scoring: Artist string for scoring (may differ from title).
             title_only_mode: If True, only match on title (ignore artist).
-            queries: List of search queries to execute.
+            queries: Search queries to execute, in order (may be a lazy iterator).
             input_year: Optional input year for bonus scoring.
             input_key: Optional input key for bonus scoring.
             input_mix: Optional mix flags dictionary.
             input_generic_phrases: Optional list of generic phrases from title.
+            settings: Optional run settings snapshot (see RunSettings); the
+                global SETTINGS are used when omitted.
 
         Returns:
             Tuple containing:
@@ -86,4 +89,5 @@ class MatcherService(IMatcherService):
             input_key=input_key,
             input_mix=input_mix,
             input_generic_phrases=input_generic_phrases,
+            settings=settings,
         )
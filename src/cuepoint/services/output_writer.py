@@ -32,6 +32,8 @@ from cuepoint.services.integrity_service import (
     write_checksum_file,
     write_summary_report,
 )
+from cuepoint.utils.lazy_import import module_available
+from cuepoint.utils.tracing import traced
 from cuepoint.utils.utils import with_timestamp
 
 # Design 6.30: Buffer size for large outputs (1MB)
@@ -80,17 +82,11 @@ def load_processed_track_keys(csv_path: str) -> Set[tuple]:
     return keys
 
 
-# Try to import openpyxl for Excel export
-try:
-    import openpyxl
-    from openpyxl.styles import Alignment, Font, PatternFill
-    from openpyxl.utils import get_column_letter
-
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
+# openpyxl is only needed for Excel export; write_excel_file() imports it
+OPENPYXL_AVAILABLE = module_available("openpyxl")
 
 
+@traced("write_csv_files")
 def write_csv_files(
     results: List[TrackResult],
     base_filename: str,
@@ -310,6 +306,7 @@ def preview_csv_output_paths(
     return paths
 
 
+@traced("write_main_csv")
 def write_main_csv(
     results: List[TrackResult],
     base_filename: str,
@@ -474,6 +471,7 @@ def _main_csv_fieldnames(include_metadata: bool) -> List[str]:
     return fieldnames
 
 
+@traced("append_rows_to_main_csv")
 def append_rows_to_main_csv(
     results: List[TrackResult],
     filepath: str,
@@ -511,6 +509,7 @@ def append_rows_to_main_csv(
         return None
 
 
+@traced("write_candidates_csv")
 def write_candidates_csv(
     results: List[TrackResult],
     base_filename: str,
@@ -561,6 +560,7 @@ def write_candidates_csv(
     return filepath
 
 
+@traced("write_queries_csv")
 def write_queries_csv(
     results: List[TrackResult],
     base_filename: str,
@@ -609,6 +609,7 @@ def write_queries_csv(
     return filepath
 
 
+@traced("write_review_csv")
 def write_review_csv(
     results: List[TrackResult],
     review_indices: Set[int],
@@ -793,6 +794,7 @@ def _get_review_indices(results: List[TrackResult]) -> Set[int]:
     return review_indices
 
 
+@traced("write_json_file")
 def write_json_file(
     results: List[TrackResult],
     file_path: str,
@@ -994,6 +996,7 @@ def write_json_file(
         raise RuntimeError(f"JSON export failed: {e}") from e
 
 
+@traced("write_excel_file")
 def write_excel_file(
     results: List[TrackResult], file_path: str, playlist_name: str = ""
 ) -> str:
@@ -1021,6 +1024,10 @@ def write_excel_file(
         os.path.dirname(file_path) if os.path.dirname(file_path) else ".", exist_ok=True
     )
 
+    import openpyxl
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
     # Create workbook
     wb = openpyxl.Workbook()
     ws = wb.active
@@ -1138,6 +1145,7 @@ def write_excel_file(
     return file_path
 
 
+@traced("write_performance_report")
 def write_performance_report(
     stats, base_filename: str, output_dir: str = "output"
 ) -> str:
@@ -1154,6 +1162,8 @@ def write_performance_report(
     """
     from collections import defaultdict
 
+    from cuepoint.utils.performance import PerformanceStats
+
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
 
@@ -1182,10 +1192,18 @@ def write_performance_report(
 
     # Query Statistics
     report_lines.append("Query Performance:")
-    report_lines.append(f"  Total queries executed: {len(stats.query_metrics)}")
+    query_count = (
+        stats.query_count()
+        if isinstance(stats, PerformanceStats)
+        else len(stats.query_metrics)
+    )
+    report_lines.append(f"  Total queries executed: {query_count}")
     report_lines.append(
         f"  Average time per query: {_format_time_for_report(stats.average_time_per_query())}"
     )
+    skipped = getattr(stats, "candidates_skipped", 0)
+    if skipped:
+        report_lines.append(f"  Candidate pages skipped (slug pre-score): {skipped}")
     report_lines.append("")
 
     # Query Type Breakdown
@@ -1217,8 +1235,72 @@ def write_performance_report(
     report_lines.append(f"  Hit rate: {stats.cache_hit_rate():.1f}%")
     report_lines.append("")
 
+    # HTTP connection pool utilisation (whole session)
+    from cuepoint.utils.http_pool import POOL_METRICS
+
+    pool = POOL_METRICS.snapshot()
+    if pool["requests"]:
+        report_lines.append("HTTP Connection Pool:")
+        report_lines.append(f"  Requests: {pool['requests']:.0f}")
+        report_lines.append(f"  New connections: {pool['new_connections']:.0f}")
+        report_lines.append(f"  Reused connections: {pool['reused_connections']:.0f}")
+        if pool["reuse_ratio"] is not None:
+            report_lines.append(f"  Reuse ratio: {pool['reuse_ratio'] * 100:.1f}%")
+        report_lines.append(
+            f"  Pool waits: {pool['pool_waits']:.0f} ({pool['wait_ms']:.0f} ms total)"
+        )
+        report_lines.append(f"  Discarded (pool full): {pool['discarded']:.0f}")
+        report_lines.append("")
+
+    # In-flight request coalescing (whole session)
+    from cuepoint.utils.single_flight import single_flight_stats
+
+    flights = {k: v for k, v in single_flight_stats().items() if v["calls"]}
+    if flights:
+        report_lines.append("Request Coalescing (single-flight):")
+        for name, counts in sorted(flights.items()):
+            report_lines.append(
+                f"  {name}: {counts['coalesced']} of {counts['calls']} calls coalesced "
+                f"({counts['executions']} executed)"
+            )
+        report_lines.append("")
+
+    # Search backend latency and failures (whole session)
+    from cuepoint.data.hedged_search import BACKEND_HEALTH
+
+    backends = BACKEND_HEALTH.stats()
+    if backends:
+        report_lines.append("Search Backends:")
+        for name, data in backends.items():
+            avg = f"{data['avg_ms']:.0f} ms" if data["avg_ms"] is not None else "-"
+            line = (
+                f"  {name}: {data['calls']} calls, {data['failures']} failed, "
+                f"avg {avg}, {data['results']} results"
+            )
+            report_lines.append(line + (" (skipped: failing)" if data["dead"] else ""))
+        report_lines.append("")
+
+    # Stage Latency (bounded histograms, whole session)
+    from cuepoint.utils.performance import performance_collector
+
+    stage_stats = performance_collector.get_stage_stats()
+    if stage_stats:
+        report_lines.append("Stage Latency (p50 / p95 / p99):")
+        for stage, data in stage_stats.items():
+            report_lines.append(
+                f"  {stage.title()}: "
+                f"{_format_time_for_report(data['p50'])} / "
+                f"{_format_time_for_report(data['p95'])} / "
+                f"{_format_time_for_report(data['p99'])} "
+                f"({data['count']} samples)"
+            )
+        report_lines.append("")
+
     # Slowest Tracks
-    slowest = sorted(stats.track_metrics, key=lambda t: t.total_time, reverse=True)[:10]
+    if isinstance(stats, PerformanceStats):
+        slowest = stats.slowest_tracks(10)
+    else:
+        slowest = sorted(stats.track_metrics, key=lambda t: t.total_time, reverse=True)[:10]
     report_lines.append("Slowest Tracks (Top 10):")
     for track in slowest:
         title_preview = track.track_title[:60]
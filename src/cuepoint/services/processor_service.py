@@ -12,20 +12,20 @@ import shutil
 import threading
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from cuepoint.core.mix_parser import (
-    _extract_generic_parenthetical_phrases,
-    _parse_mix_flags,
+from cuepoint.core.query_plan import (
+    QUERY_PLAN_FILENAME,
+    build_query_plan,
+    query_plan_cache,
 )
-from cuepoint.core.query_generator import make_search_queries
-from cuepoint.core.text_processing import sanitize_title_for_search
+from cuepoint.data.browser_pool import browser_pool_scope
 from cuepoint.data.playlist_file import parse_m3u, read_title_artist_from_file
 from cuepoint.data.rekordbox import (
-    extract_artists_from_title,
     get_track_locations,
     inspect_rekordbox_xml,
     is_readable,
@@ -34,7 +34,9 @@ from cuepoint.data.rekordbox import (
     read_playlist_index,
     resolve_playlist_key,
 )
+from cuepoint.models.beatport_candidate import BeatportCandidate
 from cuepoint.models.config import SETTINGS
+from cuepoint.models.run_settings import RunSettings
 from cuepoint.models.preflight import PreflightIssue, PreflightResult
 from cuepoint.models.result import FILE_NOT_FOUND_ERROR, TrackResult
 from cuepoint.models.track import Track
@@ -63,6 +65,7 @@ from cuepoint.ui.gui_interface import (
     ProgressInfo,
     ReliabilityState,
 )
+from cuepoint.utils import http_pool
 from cuepoint.utils.network import NetworkState
 from cuepoint.utils.paths import AppPaths, StorageInvariants
 from cuepoint.utils.run_context import set_run_id
@@ -71,6 +74,89 @@ from cuepoint.utils.run_performance_collector import (
     STAGE_SEARCH_CANDIDATES,
     RunPerformanceCollector,
 )
+from cuepoint.utils.tracing import tracer
+
+
+def _executed_query_count(result: TrackResult) -> int:
+    """Number of leading plan queries ``result``'s search actually executed."""
+    indices = []
+    for q in result.queries_data or []:
+        try:
+            indices.append(int(q.get("index", 0)))
+        except (TypeError, ValueError, AttributeError):
+            continue
+    return max(indices, default=0)
+
+
+def _previous_match(
+    previous: TrackResult,
+) -> Tuple[
+    Optional[BeatportCandidate],
+    List[BeatportCandidate],
+    List[Tuple[int, str, int, int]],
+    int,
+]:
+    """Rebuild a find_best_match() tuple from a previous TrackResult."""
+    candidates = list(previous.candidates or [])
+    best = next((c for c in candidates if c.is_winner), None)
+    audit = [
+        (
+            int(q.get("index", 0)),
+            str(q.get("query", "")),
+            int(q.get("candidates", 0)),
+            int(q.get("elapsed_ms", 0)),
+        )
+        for q in previous.queries_data or []
+    ]
+    try:
+        last_qidx = int(previous.search_stop_query_index or 0)
+    except (TypeError, ValueError):
+        last_qidx = max((a[0] for a in audit), default=0)
+    return best, candidates, audit, last_qidx
+
+
+def _merge_resumed_match(
+    previous: TrackResult,
+    offset: int,
+    best: Optional[BeatportCandidate],
+    candidates: List[BeatportCandidate],
+    audit: List[Tuple[int, str, int, int]],
+    last_qidx: int,
+) -> Tuple[
+    Optional[BeatportCandidate],
+    List[BeatportCandidate],
+    List[Tuple[int, str, int, int]],
+    int,
+]:
+    """Combine a resumed search over ``queries[offset:]`` with ``previous``.
+
+    Query indices of the resumed search are shifted by ``offset`` so they
+    refer to positions in the full plan, and the better of the two winners
+    is kept.
+    """
+    prev_best, prev_candidates, prev_audit, _ = _previous_match(previous)
+    for cand in candidates:
+        cand.query_index += offset
+    audit = [(q_idx + offset, q, n, ms) for q_idx, q, n, ms in audit]
+    if prev_best is not None and (best is None or prev_best.score >= best.score):
+        for cand in candidates:
+            cand.is_winner = False
+        best = prev_best
+    elif prev_best is not None:
+        prev_candidates = [
+            replace(c, is_winner=False) if c.is_winner else c for c in prev_candidates
+        ]
+    return best, prev_candidates + candidates, prev_audit + audit, last_qidx + offset
+
+
+def _enhanced_research_settings(settings: RunSettings) -> RunSettings:
+    """Settings for the auto-research pass: more time, results and queries."""
+    return settings.replace(
+        PER_TRACK_TIME_BUDGET_SEC=max(settings.get("PER_TRACK_TIME_BUDGET_SEC", 45), 90),
+        MAX_SEARCH_RESULTS=max(settings.get("MAX_SEARCH_RESULTS", 50), 100),
+        MAX_QUERIES_PER_TRACK=max(settings.get("MAX_QUERIES_PER_TRACK", 40), 60),
+        MIN_ACCEPT_SCORE=max(settings.get("MIN_ACCEPT_SCORE", 70), 60),
+    )
 
 
 def _throttled_progress_callback(
@@ -176,7 +262,7 @@ class ProcessorService(IProcessorService):
         self.config_service = config_service
 
     def process_track(
-        self, idx: int, track: Track, settings: Optional[Dict[str, Any]] = None
+        self, idx: int, track: Track, settings: Optional[Mapping[str, Any]] = None
     ) -> TrackResult:
         """Process a single track and return match result.
 
@@ -204,70 +290,101 @@ class ProcessorService(IProcessorService):
             >>> print(result.matched)
             True
         """
-        # Use provided settings or fall back to config service
-        effective_settings = (
-            settings
-            if settings is not None
-            else {
-                key: self.config_service.get(key, SETTINGS.get(key))
-                for key in SETTINGS.keys()
-            }
-        )
+        with tracer.context(track=idx), tracer.span("process_track"):
+            return self._process_track(idx, track, settings)
 
-        t0 = time.perf_counter()
+    def _research_track(
+        self,
+        idx: int,
+        track: Track,
+        settings: Optional[Mapping[str, Any]],
+        previous: TrackResult,
+    ) -> TrackResult:
+        """Re-search an unmatched track, continuing after its executed queries.
 
-        # Extract artists, clean title
-        # Note: Track uses 'artist' (singular), RBTrack used 'artists' (plural)
-        original_artists = track.artist or ""
-        title_for_search = sanitize_title_for_search(track.title)
-        artists_for_scoring = original_artists
+        Candidates from ``previous`` are kept and re-scored against the new
+        acceptance threshold; only queries past the last one executed are run.
+        """
+        with tracer.context(track=idx), tracer.span("process_track"):
+            return self._process_track(idx, track, settings, previous=previous)
 
-        title_only_search = False
-        extracted = False
+    def _process_track(
+        self,
+        idx: int,
+        track: Track,
+        settings: Optional[Mapping[str, Any]],
+        previous: Optional[TrackResult] = None,
+    ) -> TrackResult:
+        """Body of process_track(), run inside the per-track trace context."""
+        # Runs pass their snapshot; a bare process_track() call resolves one
+        effective_settings = RunSettings.resolve(settings, self.config_service)
+
+        t0 = time.perf_counter()
 
-        if not original_artists.strip():
-            ex = extract_artists_from_title(track.title)
-            if ex:
-                artists_for_scoring, extracted_title = ex
-                title_for_search = sanitize_title_for_search(extracted_title)
-                extracted = True
-            title_only_search = True
+        # Title/artist derivation and query generation are cached per
+        # (title, artist, query settings); see cuepoint.core.query_plan
+        with tracer.span("make_search_queries"):
+            if effective_settings.get("QUERY_PLAN_CACHE", True):
+                plan = query_plan_cache.get_or_build(
+                    track.title, track.artist or "", settings=effective_settings
+                )
+            else:
+                plan = build_query_plan(
+                    track.title, track.artist or "", settings=effective_settings
+                )
+        original_artists = plan.artist
+        title_for_search = plan.title_for_search
+        artists_for_scoring = plan.artists_for_scoring
+        title_only_search = plan.title_only_search
 
+        # Lazy %-style args: nothing is formatted for records below the level
         self.logging_service.info(
-            f"[{idx}] Processing: {title_for_search} - {original_artists or artists_for_scoring}"
+            "[%s] Processing: %s - %s",
+            idx,
+            title_for_search,
+            original_artists or artists_for_scoring,
         )
 
-        if extracted and title_only_search:
+        if plan.extracted and title_only_search:
             self.logging_service.debug(
-                f"[{idx}] Artists inferred from title for scoring; search is title-only"
+                "[%s] Artists inferred from title for scoring; search is title-only", idx
             )
 
-        # Generate queries
-        queries = make_search_queries(
-            title_for_search,
-            ("" if title_only_search else artists_for_scoring),
-            original_title=track.title,
+        query_cap = effective_settings.get(
+            "MAX_QUERIES_PER_TRACK", SETTINGS.get("MAX_QUERIES_PER_TRACK")
         )
 
-        self.logging_service.debug(f"[{idx}] Generated {len(queries)} queries")
-
-        # Extract mix flags
-        input_mix_flags = _parse_mix_flags(track.title)
-        input_generic_phrases = _extract_generic_parenthetical_phrases(track.title)
-
         # Execute matching
         min_accept_score = effective_settings.get("MIN_ACCEPT_SCORE", 70)
 
-        best, all_candidates, queries_audit, last_qidx = (
-            self.matcher_service.find_best_match(
-                idx=idx,
-                track_title=title_for_search,
-                track_artists_for_scoring=artists_for_scoring,
-                title_only_mode=title_only_search,
-                queries=queries,
-                input_mix=input_mix_flags,
-                input_generic_phrases=input_generic_phrases,
+        # Resuming (auto-research): only run queries beyond those already executed
+        start = _executed_query_count(previous) if previous is not None else 0
+        if previous is not None and next(plan.iter_queries(start, query_cap), None) is None:
+            self.logging_service.debug(
+                "[%s] No queries beyond q%s; re-scoring previous candidates", idx, start
+            )
+            best, all_candidates, queries_audit, last_qidx = _previous_match(previous)
+        else:
+            best, all_candidates, queries_audit, last_qidx = (
+                self.matcher_service.find_best_match(
+                    idx=idx,
+                    track_title=title_for_search,
+                    track_artists_for_scoring=artists_for_scoring,
+                    title_only_mode=title_only_search,
+                    # Lazy: the matcher pulls (and the plan generates) only
+                    # the queries it gets to before exiting
+                    queries=plan.iter_queries(start, query_cap),
+                    input_mix=plan.input_mix_flags,
+                    input_generic_phrases=plan.input_generic_phrases,
+                    settings=effective_settings,
+                )
             )
+            if previous is not None and start > 0:
+                best, all_candidates, queries_audit, last_qidx = _merge_resumed_match(
+                    previous, start, best, all_candidates, queries_audit, last_qidx
+                )
+        self.logging_service.debug(
+            "[%s] Stopped at q%s (%d queries generated)", idx, last_qidx, len(plan.queries)
         )
 
         dur = (time.perf_counter() - t0) * 1000
@@ -276,7 +393,11 @@ class ProcessorService(IProcessorService):
         if best and best.score >= min_accept_score:
             # Match found
             self.logging_service.info(
-                f"[{idx}] Match found: {best.title} - {best.artists} (score: {best.score:.1f})"
+                "[%s] Match found: %s - %s (score: %.1f)",
+                idx,
+                best.title,
+                best.artists,
+                best.score,
             )
 
             # Fetch full track data if needed (for future use)
@@ -374,9 +495,7 @@ class ProcessorService(IProcessorService):
             )
         else:
             # No match found
-            self.logging_service.warning(
-                f"[{idx}] No match found (duration: {dur:.0f} ms)"
-            )
+            self.logging_service.warning("[%s] No match found (duration: %.0f ms)", idx, dur)
 
             # Build candidates_data list even when no match (for export and UI)
             # This ensures candidates are saved even when no match is found
@@ -448,8 +567,9 @@ class ProcessorService(IProcessorService):
                 file_path=track.file_path,
             )
 
+    @browser_pool_scope()
     def process_playlist(
-        self, tracks: List[Track], settings: Optional[Dict[str, Any]] = None
+        self, tracks: List[Track], settings: Optional[Mapping[str, Any]] = None
     ) -> List[TrackResult]:
         """Process a playlist of tracks.
 
@@ -470,18 +590,20 @@ class ProcessorService(IProcessorService):
         """
         results = []
         total = len(tracks)
+        run_settings = RunSettings.resolve(settings, self.config_service)
 
         for idx, track in enumerate(tracks, 1):
-            self.logging_service.info(f"Processing track {idx}/{total}")
-            result = self.process_track(idx, track, settings)
+            self.logging_service.info("Processing track %s/%s", idx, total)
+            result = self.process_track(idx, track, run_settings)
             results.append(result)
 
         return results
 
+    @browser_pool_scope()
     def process_playlist_from_m3u(
         self,
         m3u_path: str,
-        settings: Optional[Dict[str, Any]] = None,
+        settings: Optional[Mapping[str, Any]] = None,
         progress_callback: Optional[ProgressCallback] = None,
         controller: Optional[ProcessingController] = None,
     ) -> Tuple[List[TrackResult], Optional[str]]:
@@ -506,14 +628,10 @@ class ProcessorService(IProcessorService):
         from cuepoint.ui.gui_interface import ReliabilityState
 
         processing_start_time = time.perf_counter()
-        effective_settings = (
-            settings
-            if settings is not None
-            else {
-                key: self.config_service.get(key, SETTINGS.get(key))
-                for key in SETTINGS.keys()
-            }
-        )
+        # Resolved once; every track of this run sees the same settings
+        effective_settings = RunSettings.resolve(settings, self.config_service)
+        # Size the shared HTTP pool for this run's worker counts
+        http_pool.ensure_capacity(effective_settings)
 
         # Same progress throttle/guardrail config as process_playlist_from_xml
         throttle_ms = 200
@@ -615,11 +733,14 @@ class ProcessorService(IProcessorService):
             try:
                 with ThreadPoolExecutor(max_workers=track_workers) as ex:
                     future_to_args = {
-                        ex.submit(
+                        tracer.submit(
+                            ex,
                             self.process_track,
                             idx,
                             track,
                             effective_settings,
+                            name="process_track",
+                            tags={"track": idx},
                         ): (idx, track)
                         for idx, track in inputs
                     }
@@ -719,7 +840,7 @@ class ProcessorService(IProcessorService):
         xml_path: str,
         playlist_name: str,
         output_dir: Optional[str] = None,
-        settings: Optional[Dict[str, Any]] = None,
+        settings: Optional[Mapping[str, Any]] = None,
         force: bool = False,
     ) -> PreflightResult:
         """Run preflight validation for a run request."""
@@ -1128,11 +1249,12 @@ class ProcessorService(IProcessorService):
             generated_at=datetime.now(),
         )
 
+    @browser_pool_scope()
     def process_playlist_from_xml(
         self,
         xml_path: str,
         playlist_name: str,
-        settings: Optional[Dict[str, Any]] = None,
+        settings: Optional[Mapping[str, Any]] = None,
         progress_callback: Optional[ProgressCallback] = None,
         controller: Optional[ProcessingController] = None,
         auto_research: bool = False,
@@ -1168,15 +1290,23 @@ class ProcessorService(IProcessorService):
         # Track processing start time
         processing_start_time = time.perf_counter()
 
-        # Use provided settings or fall back to config service
-        effective_settings = (
-            settings
-            if settings is not None
-            else {
-                key: self.config_service.get(key, SETTINGS.get(key))
-                for key in SETTINGS.keys()
-            }
+        # Resolved once; every track of this run sees the same settings
+        effective_settings = RunSettings.resolve(settings, self.config_service)
+        # Size the shared HTTP pool for this run's worker counts
+        http_pool.ensure_capacity(effective_settings)
+
+        # Reuse query plans saved by earlier runs into the same output dir
+        query_plan_path = (
+            Path(output_dir) / QUERY_PLAN_FILENAME
+            if output_dir and effective_settings.get("QUERY_PLAN_CACHE", True)
+            else None
         )
+        if query_plan_path is not None:
+            loaded = query_plan_cache.load(query_plan_path)
+            if loaded:
+                self.logging_service.debug(
+                    f"Loaded {loaded} query plans from {query_plan_path}"
+                )
 
         # Design 6.25: Throttle progress updates to avoid UI stutter (default 200ms)
         throttle_ms = 200
@@ -1446,6 +1576,21 @@ class ProcessorService(IProcessorService):
         # Initialize results variable (will be set by parallel or sequential processing)
         results: List[TrackResult] = []
 
+        # Auto-research lane: in parallel mode a track that finishes unmatched
+        # is re-searched on the same executor right away. Every main-pass
+        # track is submitted up front and the executor queue is FIFO, so these
+        # tasks only start once no main-pass track is waiting.
+        enhanced_settings = (
+            _enhanced_research_settings(effective_settings)
+            if auto_research
+            else effective_settings
+        )
+        research_futures: Dict[Future, int] = {}
+        researched: set[int] = set()
+        overlap_research = bool(
+            auto_research and effective_settings.get("AUTO_RESEARCH_OVERLAP", True)
+        )
+
         if track_workers > 1:
             self.logging_service.info(
                 f"Using parallel processing with {track_workers} workers for {len(inputs)} tracks"
@@ -1456,11 +1601,14 @@ class ProcessorService(IProcessorService):
                 with ThreadPoolExecutor(max_workers=track_workers) as ex:
                     # Submit all tasks
                     future_to_args = {
-                        ex.submit(
+                        tracer.submit(
+                            ex,
                             self.process_track,
                             idx,
                             track,
                             effective_settings,
+                            name="process_track",
+                            tags={"track": idx},
                         ): (idx, track)
                         for idx, track in inputs
                     }
@@ -1506,6 +1654,21 @@ class ProcessorService(IProcessorService):
                                 results_dict[result.playlist_index] = result
                                 processed_futures.add(future)
 
+                                if overlap_research and not result.matched:
+                                    idx, track = future_to_args[future]
+                                    research_futures[
+                                        tracer.submit(
+                                            ex,
+                                            self._research_track,
+                                            idx,
+                                            track,
+                                            enhanced_settings,
+                                            result,
+                                            name="process_track",
+                                            tags={"track": idx, "research": True},
+                                        )
+                                    ] = idx
+
                                 # Log completion for debugging (especially important in packaged apps)
                                 self.logging_service.debug(
                                     f"Track {result.playlist_index} completed: "
@@ -1806,6 +1969,50 @@ class ProcessorService(IProcessorService):
                                 with progress_lock:
                                     unmatched_count += 1
 
+                    # Collect the overlapped re-searches (most are already done)
+                    if controller and controller.is_cancelled():
+                        for f in research_futures:
+                            f.cancel()
+                    for future in as_completed(research_futures):
+                        if controller and controller.is_cancelled():
+                            for f in research_futures:
+                                f.cancel()
+                            break
+                        idx = research_futures[future]
+                        researched.add(idx)
+                        try:
+                            new_result = future.result()
+                        except Exception as e:
+                            self.logging_service.warning(
+                                f"Error in auto-research for track {idx}: {e}"
+                            )
+                            continue
+                        if not new_result.matched:
+                            continue
+                        results_dict[idx] = new_result
+                        with progress_lock:
+                            matched_count += 1
+                            unmatched_count -= 1
+                            if progress_callback:
+                                try:
+                                    progress_callback(
+                                        ProgressInfo(
+                                            completed_tracks=len(results_dict),
+                                            total_tracks=total,
+                                            matched_count=matched_count,
+                                            unmatched_count=unmatched_count,
+                                            current_track={
+                                                "title": new_result.title,
+                                                "artists": new_result.artist,
+                                            },
+                                            elapsed_time=time.perf_counter()
+                                            - processing_start_time,
+                                            reliability_state=ReliabilityState.RUNNING,
+                                        )
+                                    )
+                                except Exception:
+                                    pass
+
                     # If cancelled, wait for any remaining futures to complete or be cancelled
                     if controller and controller.is_cancelled():
                         # Wait for all futures to finish (either complete or be cancelled)
@@ -1863,6 +2070,7 @@ class ProcessorService(IProcessorService):
                 # Fall through to sequential processing below
                 track_workers = 1  # Force sequential mode
                 results = None  # Will be set in sequential mode
+                researched.clear()
             else:
                 # Parallel processing completed successfully, results is already set
                 pass
@@ -1982,29 +2190,19 @@ class ProcessorService(IProcessorService):
                         )
 
         # Handle auto-research for unmatched tracks if requested and not cancelled
+        # (tracks already re-searched in the overlapped lane are skipped)
         if auto_research and not (controller and controller.is_cancelled()):
-            unmatched_results = [r for r in results if not r.matched]
+            unmatched_results = [
+                r
+                for r in results
+                if not r.matched and r.playlist_index not in researched
+            ]
             if unmatched_results:
                 self.logging_service.info(
                     f"Auto-research: Found {len(unmatched_results)} unmatched "
                     f"track(s), re-searching with enhanced settings..."
                 )
 
-                # Enhanced settings for re-search
-                enhanced_settings = effective_settings.copy()
-                enhanced_settings["PER_TRACK_TIME_BUDGET_SEC"] = max(
-                    enhanced_settings.get("PER_TRACK_TIME_BUDGET_SEC", 45), 90
-                )
-                enhanced_settings["MAX_SEARCH_RESULTS"] = max(
-                    enhanced_settings.get("MAX_SEARCH_RESULTS", 50), 100
-                )
-                enhanced_settings["MAX_QUERIES_PER_TRACK"] = max(
-                    enhanced_settings.get("MAX_QUERIES_PER_TRACK", 40), 60
-                )
-                enhanced_settings["MIN_ACCEPT_SCORE"] = max(
-                    enhanced_settings.get("MIN_ACCEPT_SCORE", 70), 60
-                )
-
                 # Prepare unmatched inputs for re-search
                 unmatched_inputs = []
                 for result in unmatched_results:
@@ -2013,7 +2211,7 @@ class ProcessorService(IProcessorService):
                         tracks[idx - 1] if idx <= len(tracks) else None
                     )
                     if track:
-                        unmatched_inputs.append((idx, track))
+                        unmatched_inputs.append((idx, track, result))
 
                 # Re-search unmatched tracks in parallel
                 track_workers = enhanced_settings.get(
@@ -2029,13 +2227,17 @@ class ProcessorService(IProcessorService):
                         max_workers=min(track_workers, len(unmatched_inputs))
                     ) as ex:
                         future_to_idx = {
-                            ex.submit(
-                                self.process_track,
+                            tracer.submit(
+                                ex,
+                                self._research_track,
                                 idx,
                                 track,
                                 enhanced_settings,
+                                result,
+                                name="process_track",
+                                tags={"track": idx},
                             ): idx
-                            for idx, track in unmatched_inputs
+                            for idx, track, result in unmatched_inputs
                         }
 
                         for future in as_completed(future_to_idx):
@@ -2093,8 +2295,8 @@ class ProcessorService(IProcessorService):
                             tracks[idx - 1] if idx <= len(tracks) else None
                         )
                         if track:
-                            new_result = self.process_track(
-                                idx, track, enhanced_settings
+                            new_result = self._research_track(
+                                idx, track, enhanced_settings, result
                             )
                             # Update the result if we found a match
                             if new_result.matched:
@@ -2167,6 +2369,12 @@ class ProcessorService(IProcessorService):
                 f"duration={report.duration_sec:.1f}s memory_mb={report.memory_mb_peak:.1f} stages={report.stages}"
             )
 
+        if query_plan_path is not None:
+            try:
+                query_plan_cache.save(query_plan_path)
+            except OSError as e:
+                self.logging_service.warning(f"Could not save query plans: {e}")
+
         # Design 7.50: Log run_completed for observability
         self.logging_service.info(
             "[run] run_completed run_id=%s tracks=%s",
@@ -239,3 +239,7 @@ class DownloadProgressDialog(QDialog):
     def get_downloaded_file(self) -> Optional[str]:
         """Get path to downloaded file."""
         return self.downloaded_file
+
+    def get_downloaded_checksum(self) -> Optional[str]:
+        """SHA-256 computed while downloading, if the download completed."""
+        return self.downloader.last_sha256 if self.downloader else None
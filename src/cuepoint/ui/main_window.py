@@ -27,7 +27,7 @@ import xml.etree.ElementTree as ET
 from datetime import datetime
 
 # For update system (Step 5)
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     pass
@@ -164,6 +164,8 @@ class MainWindow(QMainWindow):
         self.tool_selection_page = None
         self._incrate_page = None
         self.current_page = "tool_selection"  # or "main"
+        # (xml_path, select) run when that XML finishes loading
+        self._pending_playlist_selection: Optional[Tuple[str, Callable[[], None]]] = None
         self.init_ui()
         self.setup_connections()
         self.setup_shortcuts()
@@ -534,6 +536,10 @@ class MainWindow(QMainWindow):
         playlist_layout.setContentsMargins(0, 0, 0, 0)
         self.playlist_selector = PlaylistSelector()
         self.playlist_selector.playlist_selected.connect(self.on_playlist_selected)
+        self.playlist_selector.loading_progress.connect(self._on_xml_load_progress)
+        self.playlist_selector.loading_finished.connect(self._on_xml_loaded)
+        self.playlist_selector.loading_failed.connect(self._on_xml_load_failed)
+        self.playlist_selector.loading_cancelled.connect(self._on_xml_load_cancelled)
         self.playlist_filename_label = QLabel("")
         self.playlist_filename_label.setStyleSheet("font-size: 12px; color: #ccc;")
         self.playlist_filename_label.setObjectName("playlistFilenameLabel")
@@ -1823,9 +1829,10 @@ class MainWindow(QMainWindow):
     def on_file_selected(self, file_path: str) -> None:
         """Handle file selection from FileSelector widget.
 
-        Validates the selected file, loads playlists into the playlist
-        selector, updates the batch processor, and saves to recent files.
-        Shows processing mode selection after valid file is selected (progressive disclosure).
+        Validates the selected file and starts loading its playlists into the
+        playlist selector in the background; _on_xml_loaded then updates the
+        batch processor and saves to recent files. Shows processing mode
+        selection after valid file is selected (progressive disclosure).
 
         Args:
             file_path: Path to the selected XML file.
@@ -1834,76 +1841,119 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage(
                 f"Loading XML file: {os.path.basename(file_path)}..."
             )
-            try:
-                # Load playlists into playlist selector
-                self.playlist_selector.load_xml_file(file_path)
-                playlist_count = len(self.playlist_selector.playlists)
-                self.statusBar().showMessage(
-                    f"File loaded: {playlist_count} playlists found"
-                )
+            self._loading_xml_path = file_path
+            # Parsed on a worker thread; playlists stream into the selector and
+            # _on_xml_loaded finishes the setup once the whole file is read.
+            self.playlist_selector.load_xml_file_async(file_path)
+            # SHOW MODE BOX (progressive disclosure); Batch is available for Collection
+            self.mode_box.setVisible(True)
+            self.batch_mode_radio.setVisible(True)
+            self.batch_mode_radio.setEnabled(True)
+        else:
+            self.statusBar().showMessage(f"Invalid file: {file_path}")
+            # Clear playlist selector if file is invalid
+            self.playlist_selector.clear()
+            self.batch_processor.set_playlists([])
+            # Hide mode/playlist for invalid file
+            self._hide_mode_playlist_boxes()
+            self.start_button_container.setVisible(False)
+            self._set_start_enabled(False)
 
-                # Update batch processor with tree (same hierarchy as single mode)
-                if (
-                    self.playlist_selector.playlists
-                    and self.playlist_selector.get_tree_roots()
-                ):
-                    self.batch_processor.set_playlist_tree(
-                        self.playlist_selector.get_tree_roots(),
-                        self.playlist_selector.playlists,
-                    )
-                else:
-                    self.batch_processor.set_playlists([])
+        self._update_empty_state_hint()
 
-                # SHOW MODE BOX (progressive disclosure); Batch is available for Collection
-                self.mode_box.setVisible(True)
-                self.batch_mode_radio.setVisible(True)
-                self.batch_mode_radio.setEnabled(True)
+    def _on_xml_load_progress(self, percent: int) -> None:
+        """Show background XML loading progress in the status bar."""
+        file_path = getattr(self, "_loading_xml_path", "")
+        self.statusBar().showMessage(
+            f"Loading XML file: {os.path.basename(file_path)}... {percent}%"
+        )
 
-                # Update status bar with file path
-                self._update_status_file_path(file_path)
+    def _on_xml_loaded(self, playlist_count: int) -> None:
+        """Finish XML selection once the playlist tree is fully loaded.
 
-                if self._config_service:
-                    try:
-                        self._config_service.set("product.last_xml_path", file_path)
-                        self._config_service.save()
-                    except Exception:
-                        pass
+        Updates the batch processor, status bar, saved config and recent files.
 
-                # Process events to ensure visibility update is applied
-                from PySide6.QtWidgets import QApplication
+        Args:
+            playlist_count: Number of playlists found in the XML.
+        """
+        file_path = getattr(self, "_loading_xml_path", "")
+        try:
+            self.statusBar().showMessage(
+                f"File loaded: {playlist_count} playlists found"
+            )
 
-                QApplication.processEvents()
+            # Update batch processor with tree (same hierarchy as single mode)
+            if (
+                self.playlist_selector.playlists
+                and self.playlist_selector.get_tree_roots()
+            ):
+                self.batch_processor.set_playlist_tree(
+                    self.playlist_selector.get_tree_roots(),
+                    self.playlist_selector.playlists,
+                )
+            else:
+                self.batch_processor.set_playlists([])
+
+            # Update status bar with file path
+            self._update_status_file_path(file_path)
 
-                # Save to recent files (don't let this fail hide the mode_group)
+            if self._config_service:
                 try:
-                    if hasattr(self, "save_recent_file"):
-                        self.save_recent_file(file_path)
-                except Exception as save_error:
-                    # Log but don't fail - recent files is optional
-                    import traceback
-
-                    print(f"Warning: Could not save to recent files: {save_error}")
-                    traceback.print_exc()
-            except Exception as e:
+                    self._config_service.set("product.last_xml_path", file_path)
+                    self._config_service.save()
+                except Exception:
+                    pass
+
+            # Save to recent files (don't let this fail hide the mode_group)
+            try:
+                if hasattr(self, "save_recent_file"):
+                    self.save_recent_file(file_path)
+            except Exception as save_error:
+                # Log but don't fail - recent files is optional
                 import traceback
 
-                print(f"Error in on_file_selected: {e}")
+                print(f"Warning: Could not save to recent files: {save_error}")
                 traceback.print_exc()
-                self.statusBar().showMessage(f"Error loading XML: {str(e)}")
-                # Hide mode/playlist on error
-                self._hide_mode_playlist_boxes()
-                self.start_button_container.setVisible(False)
-                self._set_start_enabled(False)
-        else:
-            self.statusBar().showMessage(f"Invalid file: {file_path}")
-            # Clear playlist selector if file is invalid
-            self.playlist_selector.clear()
-            self.batch_processor.set_playlists([])
-            # Hide mode/playlist for invalid file
-            self._hide_mode_playlist_boxes()
-            self.start_button_container.setVisible(False)
-            self._set_start_enabled(False)
+        except Exception as e:
+            import traceback
+
+            print(f"Error in _on_xml_loaded: {e}")
+            traceback.print_exc()
+            self._on_xml_load_failed(str(e))
+            return
+        self._update_empty_state_hint()
+
+        pending, self._pending_playlist_selection = self._pending_playlist_selection, None
+        if pending is not None and pending[0] == file_path:
+            pending[1]()
+
+    def _select_playlist_when_loaded(self, xml_path: str, select: Callable[[], None]) -> None:
+        """Run ``select`` once ``xml_path`` has finished loading.
 
+        Call before starting the load. The XML is read on a worker thread, so
+        the playlist can only be selected on loading_finished; a failed or
+        cancelled load (or a later one) drops the pending selection.
+        """
+        self._pending_playlist_selection = (xml_path, select)
+
+    def _on_xml_load_failed(self, message: str) -> None:
+        """Handle a failed XML load: report it and hide mode/playlist."""
+        self._pending_playlist_selection = None
+        self.statusBar().showMessage(f"Error loading XML: {message}")
+        self.batch_processor.set_playlists([])
+        self._hide_mode_playlist_boxes()
+        self.start_button_container.setVisible(False)
+        self._set_start_enabled(False)
+        self._update_empty_state_hint()
+
+    def _on_xml_load_cancelled(self) -> None:
+        """Handle an XML load cancelled from the playlist selector."""
+        self._pending_playlist_selection = None
+        self.statusBar().showMessage("XML loading cancelled")
+        self.batch_processor.set_playlists([])
+        self._hide_mode_playlist_boxes()
+        self.start_button_container.setVisible(False)
+        self._set_start_enabled(False)
         self._update_empty_state_hint()
 
     def _hide_mode_playlist_boxes(self):
@@ -3693,7 +3743,9 @@ class MainWindow(QMainWindow):
                     from cuepoint.update.security import PackageIntegrityVerifier
 
                     ok, err = PackageIntegrityVerifier.verify_checksum(
-                        Path(downloaded_file), expected_checksum
+                        Path(downloaded_file),
+                        expected_checksum,
+                        actual_checksum=download_dialog.get_downloaded_checksum(),
                     )
                     if not ok:
                         logger.error(f"Update checksum verification failed: {err}")
@@ -4974,17 +5026,13 @@ class MainWindow(QMainWindow):
             ):
                 self.show_main_interface()
 
-            # Load XML file
+            # Load XML file; the playlist is selected once it has loaded
             if os.path.exists(xml_path):
+                self._select_playlist_when_loaded(
+                    xml_path, lambda: self._select_playlist_after_load(playlist_name)
+                )
                 self.file_selector.set_file(xml_path)
                 self.on_file_selected(xml_path)
-
-                # Wait a bit for XML to load, then select playlist
-                from PySide6.QtCore import QTimer
-
-                QTimer.singleShot(
-                    500, lambda: self._select_playlist_after_load(playlist_name)
-                )
             else:
                 QMessageBox.warning(
                     self,
@@ -5271,14 +5319,9 @@ class MainWindow(QMainWindow):
                     if last_xml:
                         # Load XML file
                         if hasattr(self, "file_selector"):
-                            self.file_selector.set_file(last_xml)
-                            # This will trigger on_file_selected which loads playlists
-
-                            # Restore last playlist after a short delay (allow XML to load)
+                            # Restore last playlist once the XML has loaded
                             last_playlist = settings.value("last_playlist")
                             if last_playlist and hasattr(self, "playlist_selector"):
-                                # Use QTimer to restore playlist after XML loads
-                                from PySide6.QtCore import QTimer
 
                                 def restore_playlist():
                                     try:
@@ -5288,7 +5331,10 @@ class MainWindow(QMainWindow):
                                     except Exception:
                                         pass  # Playlist may not exist anymore
 
-                                QTimer.singleShot(500, restore_playlist)
+                                self._select_playlist_when_loaded(last_xml, restore_playlist)
+
+                            # This will trigger on_file_selected which loads playlists
+                            self.file_selector.set_file(last_xml)
                 except Exception as e:
                     # Log but don't fail - state restoration is best-effort
                     import logging
@@ -47,6 +47,12 @@ class EmptyState:
     )
     XML_NOT_FOUND = tr("empty_xml_not_found", "XML file not found", "EmptyState")
     ERROR_LOADING_XML = tr("empty_error_loading_xml", "Error loading XML", "EmptyState")
+    LOADING_PLAYLISTS = tr(
+        "empty_loading_playlists", "Loading playlists…", "EmptyState"
+    )
+    LOADING_CANCELLED = tr(
+        "empty_loading_cancelled", "XML loading cancelled", "EmptyState"
+    )
     NO_XML_LOADED = tr("empty_no_xml_loaded", "No XML file loaded", "EmptyState")
 
 
@@ -10,7 +10,7 @@ search filter, and Select All / Deselect All / Expand All / Collapse All.
 """
 
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
@@ -48,7 +48,7 @@ class BatchProcessorWidget(QWidget):
         super().__init__(parent)
         self.playlists: List[str] = []
         self._tree_roots: List[Dict[str, Any]] = []
-        self._playlists_by_path: Dict[str, Any] = {}
+        self._playlists_by_path: Mapping[str, Any] = {}
         self._ignore_item_changed: bool = False  # Block recursive itemChanged
         self._filter_text: str = ""
         self.results: Dict[
@@ -205,7 +205,7 @@ class BatchProcessorWidget(QWidget):
     def set_playlist_tree(
         self,
         tree_roots: List[Dict[str, Any]],
-        playlists_by_path: Dict[str, Any],
+        playlists_by_path: Mapping[str, Any],
     ) -> None:
         """Build hierarchical tree from folder/playlist structure (same as single mode)."""
         self._tree_roots = tree_roots
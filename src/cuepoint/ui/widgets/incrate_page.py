@@ -6,6 +6,7 @@ from typing import Any, Callable, List, Optional
 
 from PySide6.QtCore import QObject, Qt, QSize, QThread, Signal
 from PySide6.QtWidgets import (
+    QApplication,
     QDialog,
     QHBoxLayout,
     QLabel,
@@ -771,6 +772,11 @@ class IncratePage(QWidget):
         api = api_client or (
             self._get_beatport_api() if self._get_beatport_api else self._beatport_api
         )
+
+        def on_progress(processed: int, total: int) -> None:
+            self.playlist_section.set_status(f"Adding tracks {processed}/{total}...")
+            QApplication.processEvents()
+
         return create_playlist_and_add_tracks(
             name,
             tracks,
@@ -778,12 +784,15 @@ class IncratePage(QWidget):
             browser_add_to_playlist=_browser_add_to_playlist,
             beatport_username=username,
             beatport_password=password,
+            progress_callback=on_progress,
         )
 
     def _apply_playlist_result(self, result: PlaylistResult) -> None:
         if result.success:
+            failed = len(result.failed_track_ids)
             self.playlist_section.set_status(
                 f"Added {result.added_count} tracks to playlist."
+                + (f" {failed} could not be added." if failed else "")
                 + (f" {result.playlist_url}" if result.playlist_url else "")
             )
         else:
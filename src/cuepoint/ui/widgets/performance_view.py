@@ -160,7 +160,7 @@ class PerformanceView(QWidget):
             ("Unmatched Tracks", str(stats.unmatched_tracks)),
             ("Total Time", self._format_time(stats.total_time)),
             ("Avg Time per Track", self._format_time(stats.average_time_per_track())),
-            ("Total Queries", str(len(stats.query_metrics))),
+            ("Total Queries", str(stats.query_count())),
             ("Avg Time per Query", self._format_time(stats.average_time_per_query())),
             ("Cache Hit Rate", f"{stats.cache_hit_rate():.1f}%"),
         ]
@@ -215,9 +215,7 @@ class PerformanceView(QWidget):
     def _update_slowest_tracks(self, stats: PerformanceStats):
         """Update slowest tracks table"""
         # Sort tracks by total time
-        slowest = sorted(stats.track_metrics, key=lambda t: t.total_time, reverse=True)[
-            :10
-        ]  # Top 10 slowest
+        slowest = stats.slowest_tracks(10)  # Top 10 slowest
 
         self.slowest_table.setRowCount(len(slowest))
         for row, track in enumerate(slowest):
@@ -249,7 +247,7 @@ class PerformanceView(QWidget):
             tips.append("• Low cache hit rate - consider enabling HTTP caching")
 
         # Check query effectiveness
-        if len(stats.query_metrics) > 0:
+        if stats.query_count() > 0:
             avg_query_time = stats.average_time_per_query()
             if avg_query_time > 3.0:
                 tips.append(
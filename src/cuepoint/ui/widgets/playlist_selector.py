@@ -6,16 +6,23 @@ Playlist Selector Module - Trigger + popup with search and tree
 
 Single-line trigger shows current path; clicking opens a floating popup with
 search bar and hierarchical tree (folders expandable, playlists as leaves).
+
+load_xml_file_async() parses the XML on a worker thread and streams folders
+and playlists into the tree as they are read; Track objects are only built
+for the playlist that is actually selected.
 """
 
-from typing import Any, Dict, List
+import logging
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from PySide6.QtCore import Qt, QPoint, Signal
+from PySide6.QtCore import QObject, QPoint, Qt, QThread, Signal
 from PySide6.QtGui import QKeyEvent
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLineEdit,
+    QProgressBar,
     QPushButton,
     QStyle,
     QTreeWidget,
@@ -24,14 +31,79 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from cuepoint.data.rekordbox import parse_playlist_tree, playlist_path_for_display
+from cuepoint.data.rekordbox import (
+    PlaylistIndex,
+    build_playlist_tree,
+    playlist_path_for_display,
+    stream_playlist_tree,
+)
 from cuepoint.models.playlist import Playlist
 from cuepoint.ui.strings import EmptyState, TooltipCopy
 
+_logger = logging.getLogger(__name__)
 
 # Role for storing playlist path on leaf items
 _PATH_ROLE = Qt.ItemDataRole.UserRole
 
+# Streamed nodes are delivered to the UI in batches at most this often
+_NODE_BATCH_SECONDS = 0.1
+
+NodePair = Tuple[Optional[Dict[str, Any]], Dict[str, Any]]
+
+
+class PlaylistTreeLoadThread(QThread):
+    """Thread that streams the playlist tree of a Rekordbox XML.
+
+    Emits batches of (parent, node) pairs from stream_playlist_tree(); the
+    receiver attaches them on the GUI thread. The PlaylistIndex is filled as
+    parsing goes and is handed over with finished_result.
+    """
+
+    nodes_loaded = Signal(object)  # List[NodePair]; object keeps node identity
+    progress = Signal(int, int)  # bytes read, total bytes
+    finished_result = Signal(object)  # PlaylistIndex
+    cancelled = Signal()
+    error = Signal(str, bool)  # message, file not found
+
+    def __init__(self, xml_path: str, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._path = xml_path
+        self._cancel = False
+        self.index = PlaylistIndex()
+
+    def cancel(self) -> None:
+        """Stop parsing at the next checkpoint."""
+        self._cancel = True
+
+    def run(self) -> None:
+        """Runs in worker thread; guaranteed to execute when thread starts."""
+        batch: List[NodePair] = []
+        last_emit = time.monotonic()
+        try:
+            for pair in stream_playlist_tree(
+                self._path,
+                self.index,
+                progress_callback=self.progress.emit,
+                should_cancel=lambda: self._cancel,
+            ):
+                batch.append(pair)
+                now = time.monotonic()
+                if now - last_emit >= _NODE_BATCH_SECONDS:
+                    self.nodes_loaded.emit(batch)
+                    batch = []
+                    last_emit = now
+            if batch:
+                self.nodes_loaded.emit(batch)
+            if self._cancel:
+                self.cancelled.emit()
+            else:
+                self.finished_result.emit(self.index)
+        except FileNotFoundError as e:
+            self.error.emit(str(e), True)
+        except Exception as e:
+            _logger.warning("Playlist tree load failed for %s: %s", self._path, e)
+            self.error.emit(str(e), False)
+
 
 class _PlaylistPopup(QFrame):
     """Floating popup with search and tree. Closes on focus loss (Popup flag)."""
@@ -66,40 +138,58 @@ class _PlaylistPopup(QFrame):
 
         self._tree_roots = tree_roots
         self._path_to_item: Dict[str, QTreeWidgetItem] = {}
-        self._build_tree()
+        # id(folder node) -> item its children attach to (None for top level)
+        self._folder_items: Dict[int, QTreeWidgetItem | None] = {}
         self._filter_text = ""
+        self._build_tree()
 
     def _build_tree(self) -> None:
         self._tree.clear()
         self._path_to_item.clear()
+        self._folder_items.clear()
         self._add_nodes(self._tree_roots, None)
 
     def _add_nodes(
         self, nodes: List[Dict[str, Any]], parent: QTreeWidgetItem | None
     ) -> None:
         for node in nodes:
-            name = node.get("name", "Unnamed")
-            path = node.get("path", name)
-            node_type = node.get("type", "playlist")
-            if node_type == "playlist":
-                item = QTreeWidgetItem([f"{name} ({node.get('track_count', 0)})"])
-                item.setData(0, _PATH_ROLE, path)
-                self._path_to_item[path] = item
-                if parent:
-                    parent.addChild(item)
-                else:
-                    self._tree.addTopLevelItem(item)
-            else:
-                # Skip ROOT folder: show its children as top-level so we don't display "ROOT"
-                if name.upper() == "ROOT":
-                    self._add_nodes(node.get("children", []), parent)
-                    continue
-                folder_item = QTreeWidgetItem([name])
-                if parent:
-                    parent.addChild(folder_item)
-                else:
-                    self._tree.addTopLevelItem(folder_item)
-                self._add_nodes(node.get("children", []), folder_item)
+            item = self._add_node(node, parent)
+            if node.get("type", "playlist") != "playlist":
+                self._add_nodes(node.get("children", []), item)
+
+    def _add_node(
+        self, node: Dict[str, Any], parent: QTreeWidgetItem | None
+    ) -> QTreeWidgetItem | None:
+        """Add one node (not its children); returns the item children attach to."""
+        name = node.get("name", "Unnamed")
+        path = node.get("path", name)
+        node_type = node.get("type", "playlist")
+        if node_type == "playlist":
+            item = QTreeWidgetItem([f"{name} ({node.get('track_count', 0)})"])
+            item.setData(0, _PATH_ROLE, path)
+            self._path_to_item[path] = item
+        elif name.upper() == "ROOT":
+            # Skip ROOT folder: show its children as top-level so we don't display "ROOT"
+            self._folder_items[id(node)] = parent
+            return parent
+        else:
+            item = QTreeWidgetItem([name])
+            self._folder_items[id(node)] = item
+        if parent:
+            parent.addChild(item)
+        else:
+            self._tree.addTopLevelItem(item)
+        return item
+
+    def append_nodes(self, pairs: List[NodePair]) -> None:
+        """Add nodes streamed in after the popup was opened."""
+        for parent, node in pairs:
+            parent_item = (
+                self._folder_items.get(id(parent)) if parent is not None else None
+            )
+            self._add_node(node, parent_item)
+        if self._filter_text:
+            self._filter_visible()
 
     def _on_search_changed(self, text: str) -> None:
         self._filter_text = (text or "").strip().lower()
@@ -173,13 +263,18 @@ class PlaylistSelector(QWidget):
     """Single-line trigger + popup with search and hierarchical tree."""
 
     playlist_selected = Signal(str)
+    loading_progress = Signal(int)  # percent of the XML read
+    loading_finished = Signal(int)  # number of playlists
+    loading_failed = Signal(str)
+    loading_cancelled = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.playlists: Dict[str, Playlist] = {}
+        self.playlists: Mapping[str, Playlist] = {}
         self._tree_roots: List[Dict[str, Any]] = []
         self._current_path = ""
         self._popup: _PlaylistPopup | None = None
+        self._load_thread: PlaylistTreeLoadThread | None = None
         self.init_ui()
 
     def init_ui(self) -> None:
@@ -203,6 +298,23 @@ class PlaylistSelector(QWidget):
         self._trigger_edit.mousePressEvent = self._on_trigger_clicked
         layout.addWidget(self._trigger_edit, 1)
 
+        # Shown only while an XML is loading in the background
+        self._load_progress = QProgressBar()
+        self._load_progress.setRange(0, 100)
+        self._load_progress.setFixedWidth(80)
+        self._load_progress.setMaximumHeight(12)
+        self._load_progress.setTextVisible(False)
+        self._load_progress.setAccessibleName("XML loading progress")
+        self._load_progress.setVisible(False)
+        layout.addWidget(self._load_progress)
+
+        self._cancel_btn = QPushButton("Cancel")
+        self._cancel_btn.setToolTip("Stop loading the XML file")
+        self._cancel_btn.setStyleSheet("QPushButton { font-size: 11px; }")
+        self._cancel_btn.clicked.connect(self.cancel_loading)
+        self._cancel_btn.setVisible(False)
+        layout.addWidget(self._cancel_btn)
+
         self._arrow_btn = QPushButton()
         self._arrow_btn.setFixedWidth(28)
         self._arrow_btn.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -232,6 +344,7 @@ class PlaylistSelector(QWidget):
             return
         self._popup = _PlaylistPopup(self, self._tree_roots)
         self._popup.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
+        self._popup.destroyed.connect(self._on_popup_destroyed)
         # Match popup width to the playlist box (trigger widget) width
         self._popup.setFixedWidth(self.width())
         pos = self.mapToGlobal(QPoint(0, self.height()))
@@ -239,42 +352,151 @@ class PlaylistSelector(QWidget):
         self._popup.show()
         self._popup._search.setFocus()
 
+    def _on_popup_destroyed(self, *_args: Any) -> None:
+        self._popup = None
+
     def _on_popup_select(self, path: str) -> None:
         self._current_path = path
         self._trigger_edit.setText(playlist_path_for_display(path))
         self._trigger_edit.setPlaceholderText("")
         self.playlist_selected.emit(path)
 
-    def load_xml_file(self, xml_path: str) -> None:
-        try:
-            self._tree_roots, self.playlists = parse_playlist_tree(xml_path)
+    def _set_loaded_state(self, keep_selection: bool = False) -> None:
+        if not (keep_selection and self._current_path):
             self._current_path = ""
             self._trigger_edit.clear()
-            if self._tree_roots or self.playlists:
-                self._trigger_edit.setEnabled(True)
-                self._arrow_btn.setEnabled(True)
-                self._trigger_edit.setPlaceholderText("")
-            else:
-                self._trigger_edit.setEnabled(False)
-                self._arrow_btn.setEnabled(False)
-                self._trigger_edit.setPlaceholderText(EmptyState.NO_PLAYLISTS_IN_XML)
-        except FileNotFoundError:
-            self._tree_roots = []
-            self.playlists = {}
-            self._trigger_edit.clear()
+        if self._tree_roots or self.playlists:
+            self._trigger_edit.setEnabled(True)
+            self._arrow_btn.setEnabled(True)
+            self._trigger_edit.setPlaceholderText("")
+        else:
             self._trigger_edit.setEnabled(False)
             self._arrow_btn.setEnabled(False)
-            self._trigger_edit.setPlaceholderText(EmptyState.XML_NOT_FOUND)
+            self._trigger_edit.setPlaceholderText(EmptyState.NO_PLAYLISTS_IN_XML)
+
+    def _set_empty_state(self, placeholder: str) -> None:
+        self._tree_roots = []
+        self.playlists = {}
+        self._current_path = ""
+        self._trigger_edit.clear()
+        self._trigger_edit.setEnabled(False)
+        self._arrow_btn.setEnabled(False)
+        self._trigger_edit.setPlaceholderText(placeholder)
+
+    def load_xml_file(self, xml_path: str) -> None:
+        """Load the playlist tree synchronously (tracks are built on selection)."""
+        self._stop_loading()
+        try:
+            index = PlaylistIndex()
+            self._tree_roots = build_playlist_tree(
+                stream_playlist_tree(xml_path, index)
+            )
+            self.playlists = index
+            self._set_loaded_state()
+        except FileNotFoundError:
+            self._set_empty_state(EmptyState.XML_NOT_FOUND)
             raise
         except Exception:
-            self._tree_roots = []
-            self.playlists = {}
-            self._trigger_edit.clear()
-            self._trigger_edit.setEnabled(False)
-            self._arrow_btn.setEnabled(False)
-            self._trigger_edit.setPlaceholderText(EmptyState.ERROR_LOADING_XML)
+            self._set_empty_state(EmptyState.ERROR_LOADING_XML)
             raise
 
+    def load_xml_file_async(self, xml_path: str) -> None:
+        """Load the playlist tree on a worker thread.
+
+        Folders and playlists appear in the tree (and an open popup) as they
+        are parsed. Emits loading_progress while reading, then exactly one of
+        loading_finished, loading_failed or loading_cancelled. A load still
+        running is replaced without signalling.
+        """
+        self._stop_loading()
+        self._set_empty_state(EmptyState.LOADING_PLAYLISTS)
+        thread = PlaylistTreeLoadThread(xml_path, parent=self)
+        self.playlists = thread.index
+        thread.nodes_loaded.connect(self._on_nodes_loaded)
+        thread.progress.connect(self._on_load_progress)
+        thread.finished_result.connect(self._on_load_finished)
+        thread.cancelled.connect(self._on_load_cancelled)
+        thread.error.connect(self._on_load_error)
+        self._load_thread = thread
+        self._load_progress.setValue(0)
+        self._load_progress.setVisible(True)
+        self._cancel_btn.setVisible(True)
+        thread.start()
+
+    def is_loading(self) -> bool:
+        return self._load_thread is not None
+
+    def cancel_loading(self) -> None:
+        """Stop a background load and discard what it streamed so far."""
+        if self._stop_loading():
+            self._set_empty_state(EmptyState.LOADING_CANCELLED)
+            self.loading_cancelled.emit()
+
+    def _stop_loading(self) -> bool:
+        """Stop the active load thread, if any; returns True if one was running."""
+        if self._load_thread is None:
+            return False
+        self._load_thread.cancel()
+        self._load_thread.wait()
+        self._detach_thread()
+        if self._popup is not None:
+            self._popup.close()
+            self._popup = None
+        return True
+
+    def _from_current_load(self) -> bool:
+        """True if the running slot was triggered by the active load thread.
+
+        Signals still queued from a cancelled or replaced thread are ignored.
+        """
+        return self._load_thread is not None and self.sender() is self._load_thread
+
+    def _detach_thread(self) -> None:
+        if self._load_thread is not None:
+            # run() has emitted its last signal; wait so deletion never races it
+            self._load_thread.wait()
+            self._load_thread.deleteLater()
+            self._load_thread = None
+        self._load_progress.setVisible(False)
+        self._cancel_btn.setVisible(False)
+
+    def _on_nodes_loaded(self, pairs: List[NodePair]) -> None:
+        if not self._from_current_load():
+            return
+        build_playlist_tree(iter(pairs), self._tree_roots)
+        if self._popup is not None:
+            self._popup.append_nodes(pairs)
+        if self.playlists and not self._arrow_btn.isEnabled():
+            self._trigger_edit.setEnabled(True)
+            self._arrow_btn.setEnabled(True)
+
+    def _on_load_progress(self, done: int, total: int) -> None:
+        if self._from_current_load() and total > 0:
+            percent = min(100, int(done * 100 / total))
+            self._load_progress.setValue(percent)
+            self.loading_progress.emit(percent)
+
+    def _on_load_finished(self, _index: Any) -> None:
+        if not self._from_current_load():
+            return
+        self._detach_thread()
+        # The user may already have picked a playlist that streamed in early
+        self._set_loaded_state(keep_selection=True)
+        self.loading_finished.emit(len(self.playlists))
+
+    def _on_load_cancelled(self) -> None:
+        if self._from_current_load():
+            self.cancel_loading()
+
+    def _on_load_error(self, message: str, not_found: bool) -> None:
+        if not self._from_current_load():
+            return
+        self._detach_thread()
+        self._set_empty_state(
+            EmptyState.XML_NOT_FOUND if not_found else EmptyState.ERROR_LOADING_XML
+        )
+        self.loading_failed.emit(message)
+
     def get_tree_roots(self) -> List[Dict[str, Any]]:
         """Return the tree roots (folder/playlist hierarchy) for use by batch mode."""
         return self._tree_roots
@@ -290,15 +512,13 @@ class PlaylistSelector(QWidget):
         self._trigger_edit.setPlaceholderText("")
 
     def get_playlist_track_count(self, playlist_key: str) -> int:
+        if isinstance(self.playlists, PlaylistIndex):
+            # Counted from the index; no Track objects are built
+            return self.playlists.track_count(playlist_key)
         if playlist_key in self.playlists:
             return self.playlists[playlist_key].get_track_count()
         return 0
 
     def clear(self) -> None:
-        self._tree_roots = []
-        self.playlists = {}
-        self._current_path = ""
-        self._trigger_edit.clear()
-        self._trigger_edit.setEnabled(False)
-        self._arrow_btn.setEnabled(False)
-        self._trigger_edit.setPlaceholderText(EmptyState.NO_XML_LOADED)
+        self._stop_loading()
+        self._set_empty_state(EmptyState.NO_XML_LOADED)
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Resumable, segmented downloads for update packages.
+
+A download is written to ``<target>.part`` next to a JSON state file
+(``<target>.part.json``) recording the URL, total size, validator (ETag or
+Last-Modified) and how far each byte-range segment got. A dropped connection
+retries the segment from the byte where it stopped, and a later download of
+the same URL resumes from the state file instead of starting over. Servers
+that do not advertise ``Accept-Ranges: bytes`` get a single stream that
+restarts from zero on failure, like the old downloader.
+
+Reads start at 64 KB and grow up to 1 MB while the connection keeps up.
+SHA-256 is computed in file order as bytes arrive: the segment at the hash
+cursor is hashed straight from the network, later segments are read back
+from the (recently written) part file once the cursor reaches them. Callers
+compare ``sha256`` with the appcast checksum instead of re-reading the file.
+
+Key classes:
+- ResumableDownload: One download job (run() / cancel())
+- DownloadError / DownloadCancelled: Failure and cancellation
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
+
+import requests
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+logger = logging.getLogger(__name__)
+
+# Bump when the state file layout changes so old state is discarded
+STATE_VERSION = 1
+
+# Parallel segments used when the server supports ranges and the file is big
+DEFAULT_SEGMENTS = 4
+# Files smaller than two of these are fetched as a single segment
+MIN_SEGMENT_SIZE = 4 * 1024 * 1024
+
+# Adaptive read size bounds
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 1024 * 1024
+# Reads faster than this grow the chunk, slower ones shrink it (seconds)
+_FAST_READ = 0.05
+_SLOW_READ = 0.5
+
+# How often the state file is rewritten while downloading (seconds)
+STATE_SAVE_INTERVAL = 1.0
+
+USER_AGENT = "CuePoint-Updater/1.0"
+
+_NETWORK_ERRORS = (requests.RequestException, Urllib3HTTPError, OSError)
+
+
+class DownloadError(Exception):
+    """Raised when a download fails after its retries are exhausted."""
+
+
+class DownloadCancelled(Exception):
+    """Raised by ResumableDownload.run() after cancel()."""
+
+
+class _RestartRequired(Exception):
+    """The server ignored a range request or the remote file changed."""
+
+
+@dataclass
+class _Segment:
+    """Byte range [start, end) of the target; pos is the next byte to fetch."""
+
+    start: int
+    end: Optional[int]
+    pos: int
+
+    @property
+    def done(self) -> bool:
+        return self.end is not None and self.pos >= self.end
+
+
+class _OrderedSha256:
+    """SHA-256 of a file whose segments are written out of order.
+
+    Bytes written at the hash cursor are hashed directly; bytes ahead of it
+    are read back from ``path`` once every byte before them is hashed.
+    Callers serialize access (ResumableDownload holds its lock).
+    """
+
+    def __init__(self, path: Path, segments: List[_Segment]):
+        self._path = path
+        self._segments = segments
+        self._sha = hashlib.sha256()
+        self.position = 0
+
+    def feed(self, offset: int, data: bytes) -> None:
+        if offset == self.position:
+            self._sha.update(data)
+            self.position += len(data)
+        self.catch_up()
+
+    def catch_up(self) -> None:
+        """Hash bytes already on disk that are now contiguous with the cursor."""
+        for seg in self._segments:
+            if seg.start <= self.position < seg.pos:
+                with open(self._path, "rb", buffering=0) as f:
+                    f.seek(self.position)
+                    while self.position < seg.pos:
+                        data = f.read(min(MAX_CHUNK_SIZE, seg.pos - self.position))
+                        if not data:
+                            raise DownloadError(
+                                f"Partial download is shorter than recorded: {self._path}"
+                            )
+                        self._sha.update(data)
+                        self.position += len(data)
+
+    def hexdigest(self) -> str:
+        return self._sha.hexdigest()
+
+
+class ResumableDownload:
+    """Download ``url`` to ``target`` with HTTP Range resume and segments.
+
+    Args:
+        url: Download URL.
+        target: Final file path; ``.part`` and ``.part.json`` sit next to it.
+        segments: Maximum parallel byte ranges (1 disables parallelism).
+        min_segment_size: Smallest range worth its own connection.
+        max_retries: Consecutive failures tolerated per segment without
+            progress before giving up.
+        retry_backoff: Base delay in seconds between retries (doubles).
+        timeout: Connect/read timeout per request in seconds.
+        progress_callback: Called with (bytes_received, bytes_total) after
+            every read; bytes_total is 0 when the size is unknown.
+
+    After run() returns, ``sha256`` holds the digest of the file and
+    ``resumed_from`` the number of bytes reused from an earlier attempt.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        target: Path,
+        segments: int = DEFAULT_SEGMENTS,
+        min_segment_size: int = MIN_SEGMENT_SIZE,
+        max_retries: int = 5,
+        retry_backoff: float = 1.0,
+        timeout: float = 30.0,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ):
+        self.url = url
+        self.target = Path(target)
+        self.part_path = self.target.with_name(self.target.name + ".part")
+        self.state_path = self.target.with_name(self.target.name + ".part.json")
+        self.max_segments = max(1, int(segments))
+        self.min_segment_size = max(1, int(min_segment_size))
+        self.max_retries = max(0, int(max_retries))
+        self.retry_backoff = max(0.0, float(retry_backoff))
+        self.timeout = timeout
+        self.progress_callback = progress_callback
+
+        self.total_size: Optional[int] = None
+        self.supports_ranges = False
+        self.validator: Optional[str] = None
+        self.sha256: Optional[str] = None
+        self.resumed_from = 0
+
+        self._segments: List[_Segment] = []
+        self._hasher: Optional[_OrderedSha256] = None
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._abort = threading.Event()
+        self._last_save = 0.0
+
+    # -- public API ---------------------------------------------------------
+
+    def cancel(self) -> None:
+        """Stop the download; the partial file and state are kept for resume."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def run(self) -> Path:
+        """Download (or resume) the file and return the final path.
+
+        Raises:
+            DownloadCancelled: cancel() was called.
+            DownloadError: The download failed after retries.
+        """
+        self.target.parent.mkdir(parents=True, exist_ok=True)
+        allow_ranges = True
+        for _attempt in range(2):
+            self._prepare(allow_ranges)
+            try:
+                self._fetch_segments()
+                break
+            except _RestartRequired as e:
+                logger.info("Restarting download of %s from zero: %s", self.url, e)
+                self._discard_partial()
+                allow_ranges = False
+        else:
+            raise DownloadError("Server kept rejecting range requests")
+
+        assert self._hasher is not None
+        with self._lock:
+            self._hasher.catch_up()
+            size = self._segments[-1].pos
+            if self._hasher.position != size:
+                raise DownloadError("Downloaded file is incomplete")
+            self.sha256 = self._hasher.hexdigest()
+        if self.total_size is None:
+            self.total_size = size
+        os.replace(self.part_path, self.target)
+        self._remove_state()
+        return self.target
+
+    # -- planning -----------------------------------------------------------
+
+    def _prepare(self, allow_ranges: bool) -> None:
+        """Probe the server, then resume from state or plan fresh segments."""
+        self._abort.clear()
+        info = self._probe()
+        self.total_size = info["size"]
+        self.validator = info["validator"]
+        self.supports_ranges = allow_ranges and info["ranges"] and self.total_size is not None
+
+        segments = self._load_state() if self.supports_ranges else None
+        if segments is None:
+            self._discard_partial()
+            segments = self._plan_segments()
+            with open(self.part_path, "wb") as f:
+                if self.total_size:
+                    f.truncate(self.total_size)
+        self._segments = segments
+        self.resumed_from = sum(seg.pos - seg.start for seg in segments)
+        if self.resumed_from:
+            logger.info(
+                "Resuming download of %s at %d/%d bytes",
+                self.url,
+                self.resumed_from,
+                self.total_size or 0,
+            )
+        self._hasher = _OrderedSha256(self.part_path, segments)
+        with self._lock:
+            self._hasher.catch_up()
+        self._save_state(force=True)
+        self._report()
+
+    def _probe(self) -> Dict[str, Any]:
+        """HEAD the URL for size, range support and a validator."""
+        info: Dict[str, Any] = {"size": None, "ranges": False, "validator": None}
+        try:
+            with requests.Session() as session:
+                resp = session.head(
+                    self.url,
+                    headers=self._headers(),
+                    allow_redirects=True,
+                    timeout=self.timeout,
+                )
+                if resp.status_code >= 400:
+                    return info
+                length = resp.headers.get("Content-Length")
+                if length and length.isdigit():
+                    info["size"] = int(length)
+                info["ranges"] = resp.headers.get("Accept-Ranges", "").lower() == "bytes"
+                # Weak ETags are not valid in If-Range; fall back to the date
+                etag = resp.headers.get("ETag")
+                if etag and not etag.startswith("W/"):
+                    info["validator"] = etag
+                else:
+                    info["validator"] = resp.headers.get("Last-Modified")
+        except _NETWORK_ERRORS as e:
+            logger.debug("HEAD %s failed, downloading without ranges: %s", self.url, e)
+        return info
+
+    def _plan_segments(self) -> List[_Segment]:
+        total = self.total_size
+        if not self.supports_ranges or total is None:
+            return [_Segment(0, total, 0)]
+        count = min(self.max_segments, max(1, total // self.min_segment_size))
+        step = -(-total // count)
+        return [_Segment(start, min(start + step, total), start) for start in range(0, total, step)]
+
+    # -- state file ---------------------------------------------------------
+
+    def _load_state(self) -> Optional[List[_Segment]]:
+        """Segments from a matching state file, or None to start fresh."""
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            part_size = self.part_path.stat().st_size
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(state, dict)
+            or state.get("version") != STATE_VERSION
+            or state.get("url") != self.url
+            or state.get("total_size") != self.total_size
+            or state.get("validator") != self.validator
+            or part_size != self.total_size
+        ):
+            return None
+        try:
+            segments = [
+                _Segment(int(start), int(end), int(pos)) for start, end, pos in state["segments"]
+            ]
+        except (KeyError, TypeError, ValueError):
+            return None
+        expected_start = 0
+        for seg in segments:
+            if seg.start != expected_start or not seg.start <= seg.pos <= seg.end:
+                return None
+            expected_start = seg.end
+        if expected_start != self.total_size:
+            return None
+        return segments
+
+    def _save_state(self, force: bool = False) -> None:
+        if not self.supports_ranges:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_save < STATE_SAVE_INTERVAL:
+                return
+            self._last_save = now
+            payload = {
+                "version": STATE_VERSION,
+                "url": self.url,
+                "total_size": self.total_size,
+                "validator": self.validator,
+                "segments": [[s.start, s.end, s.pos] for s in self._segments],
+            }
+        from cuepoint.utils.file_safety import SafeFileWriter
+
+        SafeFileWriter.write_text_atomic(self.state_path, json.dumps(payload))
+
+    def _remove_state(self) -> None:
+        try:
+            self.state_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _discard_partial(self) -> None:
+        self._remove_state()
+        try:
+            self.part_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    # -- transfer -----------------------------------------------------------
+
+    def _headers(self) -> Dict[str, str]:
+        # identity encoding keeps byte offsets meaningful for Range requests
+        return {
+            "User-Agent": USER_AGENT,
+            "Accept": "*/*",
+            "Accept-Encoding": "identity",
+        }
+
+    def _fetch_segments(self) -> None:
+        pending = [seg for seg in self._segments if not seg.done]
+        try:
+            if len(pending) <= 1:
+                for seg in pending:
+                    self._fetch_segment(seg)
+                return
+            with ThreadPoolExecutor(
+                max_workers=len(pending), thread_name_prefix="update-download"
+            ) as pool:
+                futures = [pool.submit(self._fetch_segment, seg) for seg in pending]
+                errors = []
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self._abort.set()
+                        errors.append(e)
+            # Cancellation and restarts take precedence over follow-on errors
+            for kind in (DownloadCancelled, _RestartRequired):
+                for error in errors:
+                    if isinstance(error, kind):
+                        raise error
+            if errors:
+                raise errors[0]
+        finally:
+            self._save_state(force=True)
+
+    def _fetch_segment(self, seg: _Segment) -> None:
+        failures = 0
+        with requests.Session() as session:
+            while not seg.done:
+                self._check_stop()
+                before = seg.pos
+                try:
+                    self._request_segment(session, seg)
+                    if seg.end is None:
+                        return
+                except _NETWORK_ERRORS as e:
+                    logger.info("Download of %s interrupted at byte %d: %s", self.url, seg.pos, e)
+                if not seg.done and not self.supports_ranges:
+                    self._reset_segment(seg)
+                if seg.pos > before:
+                    failures = 0
+                else:
+                    failures += 1
+                if failures > self.max_retries:
+                    raise DownloadError(
+                        f"Download failed after {self.max_retries} retries " f"at byte {seg.pos}"
+                    )
+                if failures:
+                    delay = self.retry_backoff * (2 ** (failures - 1))
+                    if self._cancel.wait(delay):
+                        raise DownloadCancelled()
+
+    def _request_segment(self, session: requests.Session, seg: _Segment) -> None:
+        headers = self._headers()
+        ranged = self.supports_ranges
+        if ranged:
+            assert seg.end is not None
+            headers["Range"] = f"bytes={seg.pos}-{seg.end - 1}"
+            if self.validator:
+                headers["If-Range"] = self.validator
+        with session.get(self.url, headers=headers, stream=True, timeout=self.timeout) as resp:
+            if ranged and resp.status_code == 200:
+                raise _RestartRequired("server answered a range request with the whole file")
+            if resp.status_code >= 400:
+                if resp.status_code in (408, 429) or resp.status_code >= 500:
+                    raise requests.HTTPError(f"HTTP {resp.status_code}", response=resp)
+                raise DownloadError(f"HTTP {resp.status_code}: {resp.reason}")
+            self._stream(resp, seg)
+
+    def _stream(self, resp: requests.Response, seg: _Segment) -> None:
+        chunk = MIN_CHUNK_SIZE
+        with open(self.part_path, "r+b", buffering=0) as f:
+            f.seek(seg.pos)
+            while not seg.done:
+                want = chunk if seg.end is None else min(chunk, seg.end - seg.pos)
+                started = time.monotonic()
+                data = resp.raw.read(want)
+                elapsed = time.monotonic() - started
+                self._check_stop()
+                if not data:
+                    return
+                self._write(f, seg, data)
+                if elapsed < _FAST_READ and chunk < MAX_CHUNK_SIZE:
+                    chunk *= 2
+                elif elapsed > _SLOW_READ and chunk > MIN_CHUNK_SIZE:
+                    chunk //= 2
+
+    def _write(self, f: BinaryIO, seg: _Segment, data: bytes) -> None:
+        f.write(data)
+        with self._lock:
+            offset = seg.pos
+            seg.pos += len(data)
+            assert self._hasher is not None
+            self._hasher.feed(offset, data)
+        self._save_state()
+        self._report()
+
+    def _reset_segment(self, seg: _Segment) -> None:
+        """Without range support a failed stream starts over."""
+        with self._lock:
+            seg.pos = seg.start
+            self._hasher = _OrderedSha256(self.part_path, self._segments)
+        with open(self.part_path, "wb"):
+            pass
+
+    def _check_stop(self) -> None:
+        if self._cancel.is_set():
+            raise DownloadCancelled()
+        if self._abort.is_set():
+            raise DownloadError("Download aborted after another segment failed")
+
+    def _report(self) -> None:
+        if self.progress_callback is None:
+            return
+        received = sum(seg.pos - seg.start for seg in self._segments)
+        self.progress_callback(received, self.total_size or 0)
@@ -74,13 +74,15 @@ class PackageIntegrityVerifier:
 
     @staticmethod
     def verify_checksum(
-        file_path: Path, expected_checksum: str
+        file_path: Path, expected_checksum: str, actual_checksum: Optional[str] = None
     ) -> Tuple[bool, Optional[str]]:
         """Verify package SHA-256 checksum.
 
         Args:
             file_path: Path to downloaded package.
             expected_checksum: Expected SHA-256 hex string.
+            actual_checksum: Digest computed while downloading; when given the
+                file is not re-read.
         """
         try:
             expected = (expected_checksum or "").strip().lower()
@@ -89,11 +91,16 @@ class PackageIntegrityVerifier:
             if not PackageIntegrityVerifier.is_sha256_hex(expected):
                 return False, "Expected checksum is not a valid SHA-256 hex string"
 
-            sha256 = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(1024 * 1024), b""):
-                    sha256.update(chunk)
-            actual = sha256.hexdigest().lower()
+            if actual_checksum:
+                if not file_path.is_file():
+                    return False, f"File not found: {file_path}"
+                actual = actual_checksum.strip().lower()
+            else:
+                sha256 = hashlib.sha256()
+                with open(file_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        sha256.update(chunk)
+                actual = sha256.hexdigest().lower()
 
             if actual != expected:
                 return False, f"Checksum mismatch: expected {expected}, got {actual}"
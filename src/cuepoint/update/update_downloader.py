@@ -4,30 +4,47 @@
 """
 Update downloader implementation.
 
-Handles downloading update installers/DMGs with progress tracking.
+Handles downloading update installers/DMGs with progress tracking. Transfers
+go through ResumableDownload, so an interrupted download resumes from the
+partial file and the SHA-256 is available without re-reading the package.
 """
 
+import logging
 import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import Callable, Optional
 
+from cuepoint.update.resumable_download import (
+    DEFAULT_SEGMENTS,
+    DownloadCancelled,
+    DownloadError,
+    ResumableDownload,
+)
+
 try:
-    from PySide6.QtCore import QObject, Signal, QUrl
-    from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+    from PySide6.QtCore import QObject, QUrl, Signal
 
     QT_AVAILABLE = True
 except ImportError:
     QT_AVAILABLE = False
     QObject = object
     Signal = None
-    QNetworkRequest = None
+
+logger = logging.getLogger(__name__)
+
+# Minimum interval between progress signals (seconds)
+_PROGRESS_INTERVAL = 0.1
 
 
 class UpdateDownloader(QObject if QT_AVAILABLE else object):
     """
     Downloads update files with progress tracking.
 
-    Uses QNetworkAccessManager for downloads with progress signals.
+    The transfer runs on a worker thread while download() spins a local event
+    loop, so the signals below reach the UI as queued events. After a
+    successful download ``last_sha256`` holds the package digest.
     """
 
     if QT_AVAILABLE:
@@ -38,26 +55,26 @@ class UpdateDownloader(QObject if QT_AVAILABLE else object):
         finished = Signal(str)  # file_path
         error = Signal(str)  # error_message
         cancelled = Signal()
+        _worker_done = Signal()
+
+    def __init__(self, parent=None, segments: int = DEFAULT_SEGMENTS):
+        """Initialize downloader.
 
-    def __init__(self, parent=None):
-        """Initialize downloader."""
+        Args:
+            parent: Optional Qt parent.
+            segments: Maximum parallel byte ranges per download.
+        """
         if QT_AVAILABLE:
             super().__init__(parent)
-            self.network_manager = QNetworkAccessManager(self)
-            self.current_reply: Optional[QNetworkReply] = None
-            self.download_path: Optional[Path] = None
-            self.download_file = None
-            self.cancelled_flag = False
-            self.start_time = None
-            self.last_bytes_received = 0
-            self.last_time = None
-        else:
-            # Fallback for non-Qt environments
-            self.network_manager = None
-            self.current_reply = None
-            self.download_path = None
-            self.download_file = None
-            self.cancelled_flag = False
+        self.segments = segments
+        self.download_path: Optional[Path] = None
+        self.cancelled_flag = False
+        self.last_sha256: Optional[str] = None
+        self.start_time: Optional[float] = None
+        self.last_bytes_received = 0
+        self.last_time: Optional[float] = None
+        self._job: Optional[ResumableDownload] = None
+        self._last_emit = 0.0
 
     def download(
         self,
@@ -81,111 +98,103 @@ class UpdateDownloader(QObject if QT_AVAILABLE else object):
             return self._download_with_requests(url, filename, progress_callback)
 
         try:
-            import logging
-            import time
+            from PySide6.QtCore import QEventLoop
 
-            logger = logging.getLogger(__name__)
             logger.info(f"Starting download from URL: {url}")
 
             # Reset state
             self.cancelled_flag = False
+            self.last_sha256 = None
             self.last_bytes_received = 0
             self.last_time = None
             self.start_time = time.time()
-
-            # Create temporary directory for downloads
-            temp_dir = Path(tempfile.gettempdir()) / "CuePoint_Updates"
-            temp_dir.mkdir(parents=True, exist_ok=True)
-
-            # Determine filename
-            if not filename:
-                filename = Path(QUrl(url).fileName()).name
-                if not filename or "." not in filename:
-                    # Fallback: use extension from URL or default
-                    if url.endswith(".exe"):
-                        filename = "CuePoint-Setup.exe"
-                    elif url.endswith(".dmg"):
-                        filename = "CuePoint.dmg"
-                    else:
-                        filename = "update_file"
-
-            self.download_path = temp_dir / filename
-
-            # Remove existing file if present
-            if self.download_path.exists():
-                self.download_path.unlink()
-
-            # Create request
-            request = QNetworkRequest(QUrl(url))
-            # GitHub Releases requires a proper User-Agent
-            # Some servers block requests without User-Agent or with generic ones
-            request.setRawHeader(b"User-Agent", b"CuePoint-Updater/1.0")
-            # Accept any content type for binary downloads
-            request.setRawHeader(b"Accept", b"*/*")
-
-            # Start download
-            self.current_reply = self.network_manager.get(request)
-
-            # Connect signals
-            self.current_reply.downloadProgress.connect(self._on_download_progress)
-            self.current_reply.finished.connect(self._on_download_finished)
-            self.current_reply.errorOccurred.connect(self._on_download_error)
-            self.current_reply.readyRead.connect(self._on_ready_read)
-
-            # Open file for writing
-            self.download_file = open(self.download_path, "wb")
-
-            # Wait for download to complete (blocking)
-            # In a real implementation, this would be non-blocking with signals
-            # For now, we'll use a simple event loop
-            from PySide6.QtCore import QEventLoop
-
+            self.download_path = self._target_path(url, filename)
+
+            def on_progress(bytes_received: int, bytes_total: int) -> None:
+                if progress_callback:
+                    progress_callback(bytes_received, bytes_total)
+                self._on_download_progress(bytes_received, bytes_total)
+
+            job = self._job = ResumableDownload(
+                url,
+                self.download_path,
+                segments=self.segments,
+                progress_callback=on_progress,
+            )
+            outcome: dict = {}
+
+            def work() -> None:
+                try:
+                    outcome["path"] = job.run()
+                except DownloadCancelled:
+                    pass
+                except Exception as e:
+                    outcome["error"] = e
+                finally:
+                    self._worker_done.emit()
+
+            # The worker emits queued signals; the local loop keeps the UI live
             loop = QEventLoop()
-            self.current_reply.finished.connect(loop.quit)
-            self.error.connect(loop.quit)
+            self._worker_done.connect(loop.quit)
             self.cancelled.connect(loop.quit)
+            threading.Thread(target=work, name="update-download", daemon=True).start()
             loop.exec()
+            self._worker_done.disconnect(loop.quit)
+            self.cancelled.disconnect(loop.quit)
 
             if self.cancelled_flag:
-                if self.download_file:
-                    self.download_file.close()
-                if self.download_path and self.download_path.exists():
-                    self.download_path.unlink()
+                return None
+            if "error" in outcome:
+                raise outcome["error"]
+            if "path" not in outcome:
                 return None
 
-            if self.download_file:
-                self.download_file.close()
-
-            if self.download_path and self.download_path.exists():
-                return str(self.download_path)
-
-            return None
+            self.last_sha256 = job.sha256
+            self.finished.emit(str(self.download_path))
+            return str(self.download_path)
 
         except Exception as e:
             error_msg = f"Download failed: {str(e)}"
+            logger.error(error_msg)
             if hasattr(self, "error"):
                 self.error.emit(error_msg)
             return None
 
-    def _on_ready_read(self):
-        """Handle data ready to read."""
-        if self.current_reply and self.download_file:
-            data = self.current_reply.readAll()
-            self.download_file.write(data.data())
+    def _target_path(self, url: str, filename: Optional[str]) -> Path:
+        """Path under the temp update folder for ``url``."""
+        temp_dir = Path(tempfile.gettempdir()) / "CuePoint_Updates"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+
+        if not filename:
+            if QT_AVAILABLE:
+                filename = Path(QUrl(url).fileName()).name
+            else:
+                filename = Path(url.split("?", 1)[0]).name
+            if not filename or "." not in filename:
+                # Fallback: use extension from URL or default
+                if url.endswith(".exe"):
+                    filename = "CuePoint-Setup.exe"
+                elif url.endswith(".dmg"):
+                    filename = "CuePoint.dmg"
+                else:
+                    filename = "update_file"
+        return temp_dir / filename
 
     def _on_download_progress(self, bytes_received: int, bytes_total: int):
-        """Handle download progress updates."""
+        """Handle download progress updates (called on the worker thread)."""
         if self.cancelled_flag:
             return
 
+        current_time = time.time()
+        if current_time - self._last_emit < _PROGRESS_INTERVAL and bytes_received != bytes_total:
+            return
+        self._last_emit = current_time
+
         # Emit progress signal
         if hasattr(self, "progress"):
             self.progress.emit(bytes_received, bytes_total)
 
         # Calculate download speed
-        import time
-
-        current_time = time.time()
         if self.last_time and self.last_bytes_received:
             elapsed = current_time - self.last_time
             if elapsed > 0:
@@ -204,49 +213,11 @@ class UpdateDownloader(QObject if QT_AVAILABLE else object):
         self.last_bytes_received = bytes_received
         self.last_time = current_time
 
-    def _on_download_finished(self):
-        """Handle download completion."""
-        if self.cancelled_flag:
-            return
-
-        if self.current_reply:
-            error_code = self.current_reply.error()
-            if error_code == QNetworkReply.NetworkError.NoError:
-                # Check HTTP status code
-                status_code = self.current_reply.attribute(
-                    QNetworkRequest.Attribute.HttpStatusCodeAttribute
-                )
-                if status_code and status_code >= 200 and status_code < 300:
-                    if self.download_file:
-                        self.download_file.close()
-                    if self.download_path and self.download_path.exists():
-                        if hasattr(self, "finished"):
-                            self.finished.emit(str(self.download_path))
-                else:
-                    # HTTP error (e.g., 404, 403)
-                    error_msg = f"HTTP {status_code}: {self.current_reply.attribute(QNetworkRequest.Attribute.HttpReasonPhraseAttribute) or 'Download failed'}"
-                    if hasattr(self, "error"):
-                        self.error.emit(error_msg)
-            else:
-                # Network error
-                error_msg = self.current_reply.errorString()
-                if hasattr(self, "error"):
-                    self.error.emit(error_msg)
-
-    def _on_download_error(self, error_code):
-        """Handle download error."""
-        if self.current_reply:
-            error_msg = self.current_reply.errorString()
-            if hasattr(self, "error"):
-                self.error.emit(error_msg)
-
     def cancel(self):
-        """Cancel current download."""
+        """Cancel current download (the partial file is kept for resume)."""
         self.cancelled_flag = True
-        if self.current_reply:
-            self.current_reply.abort()
-        if self.download_file:
-            self.download_file.close()
+        if self._job:
+            self._job.cancel()
         if hasattr(self, "cancelled"):
             self.cancelled.emit()
 
@@ -257,7 +228,7 @@ class UpdateDownloader(QObject if QT_AVAILABLE else object):
         progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> Optional[str]:
         """
-        Fallback download using requests library (for non-Qt environments).
+        Fallback download for non-Qt environments (blocking, no signals).
 
         Args:
             url: Download URL
@@ -267,41 +238,21 @@ class UpdateDownloader(QObject if QT_AVAILABLE else object):
         Returns:
             Path to downloaded file, or None if failed
         """
+        self.cancelled_flag = False
+        self.last_sha256 = None
+        self.download_path = self._target_path(url, filename)
+        self._job = ResumableDownload(
+            url,
+            self.download_path,
+            segments=self.segments,
+            progress_callback=progress_callback,
+        )
         try:
-            import requests
-
-            # Create temporary directory
-            temp_dir = Path(tempfile.gettempdir()) / "CuePoint_Updates"
-            temp_dir.mkdir(parents=True, exist_ok=True)
-
-            # Determine filename
-            if not filename:
-                filename = Path(url).name
-                if not filename or "." not in filename:
-                    filename = "update_file"
-
-            download_path = temp_dir / filename
-
-            # Download with progress
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-
-            total_size = int(response.headers.get("content-length", 0))
-            bytes_received = 0
-
-            with open(download_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if self.cancelled_flag:
-                        download_path.unlink()
-                        return None
-
-                    f.write(chunk)
-                    bytes_received += len(chunk)
-
-                    if progress_callback and total_size > 0:
-                        progress_callback(bytes_received, total_size)
-
-            return str(download_path)
-
-        except Exception:
+            path = self._job.run()
+        except DownloadCancelled:
+            return None
+        except (DownloadError, OSError) as e:
+            logger.error(f"Download failed: {e}")
             return None
+        self.last_sha256 = self._job.sha256
+        return str(path)
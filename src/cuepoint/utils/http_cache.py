@@ -9,24 +9,36 @@ Implements Step 6.5 - Caching Strategy with:
 - Cache invalidation mechanisms
 - Cache pruning strategies
 - Cache statistics and diagnostics
+
+With the SQLite backend, a side table (CacheIndex) records the key, stored
+size, creation time and last access of every cached response. SQLite
+triggers keep it in step with writes and deletes, and cache hits update the
+access time. Statistics and LRU pruning are then plain SQL queries instead of
+a deserialisation of every stored response.
+
+Expired responses that carry an ETag or Last-Modified header are not
+refetched in full: requests-cache revalidates them with If-None-Match /
+If-Modified-Since, and a 304 only renews the stored response's expiry.
+Search pages expire after hours and track pages after weeks (per-URL-class
+TTLs); RevalidationStats counts how often revalidation saved the download.
 """
 
 import fnmatch
 import logging
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from cuepoint.utils.lazy_import import module_available
 from cuepoint.utils.paths import AppPaths
 
-try:
-    import requests_cache
-    from requests_cache import CachedSession
+if TYPE_CHECKING:
+    from requests_cache import CachedSession, ExpirationPatterns
 
-    REQUESTS_CACHE_AVAILABLE = True
-except ImportError:
-    REQUESTS_CACHE_AVAILABLE = False
-    CachedSession = None  # type: ignore
+# requests_cache itself is imported when a session is first created
+REQUESTS_CACHE_AVAILABLE = module_available("requests_cache")
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +54,13 @@ class CacheConfig:
     default_backend = "sqlite"
     default_cache_name = "http_cache"
     default_size_limit = 100 * 1024 * 1024  # 100MB
+    # TTLs by URL class (requests-cache URL globs, matched without the scheme);
+    # other URLs use ``ttl``. Search results change as tracks are released,
+    # track pages hardly ever.
+    default_url_ttls: "ExpirationPatterns" = {
+        "*beatport.com/search": timedelta(hours=6),
+        "*beatport.com/track/": timedelta(days=30),
+    }
 
     def __init__(
         self,
@@ -49,6 +68,7 @@ class CacheConfig:
         ttl: Optional[timedelta] = None,
         backend: str = "sqlite",
         size_limit: Optional[int] = None,
+        url_ttls: Optional["ExpirationPatterns"] = None,
     ):
         """Initialize cache configuration.
 
@@ -57,11 +77,13 @@ class CacheConfig:
             ttl: Time to live (default: 7 days).
             backend: Cache backend (default: "sqlite").
             size_limit: Maximum cache size in bytes (default: 100MB).
+            url_ttls: TTL per URL glob (default: default_url_ttls).
         """
         self.cache_dir = cache_dir or AppPaths.cache_dir() / "http_cache"
         self.ttl = ttl or CacheConfig.default_ttl
         self.backend = backend or CacheConfig.default_backend
         self.size_limit = size_limit or CacheConfig.default_size_limit
+        self.url_ttls = dict(CacheConfig.default_url_ttls if url_ttls is None else url_ttls)
 
     def get_cache_path(self) -> Path:
         """Get cache database path.
@@ -73,6 +95,185 @@ class CacheConfig:
         return self.cache_dir / f"{CacheConfig.default_cache_name}.sqlite"
 
 
+class CacheIndex:
+    """Side index of a requests-cache SQLite response table.
+
+    Rows of ``cache_index`` (key, size, created, last_access) are written by
+    triggers on the ``responses`` table, so every save and delete, including
+    those made by requests-cache itself, is reflected. Cache hits are
+    buffered by touch() and written in batches.
+
+    Args:
+        responses: The backend's ``responses`` SQLiteDict (shares its
+            connection and lock).
+    """
+
+    TABLE = "cache_index"
+    FLUSH_EVERY = 64
+
+    def __init__(self, responses: Any):
+        self._responses = responses
+        self._lock = threading.Lock()
+        self._pending: Dict[str, float] = {}
+        self.install()
+
+    def install(self) -> None:
+        """Create the index table and triggers, and index untracked responses.
+
+        Idempotent; call again after the responses table was dropped (clear).
+        """
+        table = self._responses.table_name
+        now = time.time()
+        with self._responses.connection(commit=True) as con:
+            con.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} ("
+                "    key TEXT PRIMARY KEY,"
+                "    size INTEGER NOT NULL,"
+                "    created REAL NOT NULL,"
+                "    last_access REAL NOT NULL"
+                ")"
+            )
+            con.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.TABLE}_access ON {self.TABLE}(last_access)"
+            )
+            # Unix time with sub-second precision (works on old SQLite versions)
+            unix_now = "(julianday('now') - 2440587.5) * 86400.0"
+            con.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {self.TABLE}_put AFTER INSERT ON {table} BEGIN "
+                f"INSERT OR REPLACE INTO {self.TABLE} (key, size, created, last_access) "
+                f"VALUES (NEW.key, length(NEW.value), {unix_now}, {unix_now}); END"
+            )
+            con.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {self.TABLE}_del AFTER DELETE ON {table} BEGIN "
+                f"DELETE FROM {self.TABLE} WHERE key = OLD.key; END"
+            )
+            # Responses saved before the index existed, and rows left by a dropped table
+            con.execute(
+                f"INSERT OR IGNORE INTO {self.TABLE} (key, size, created, last_access) "
+                f"SELECT key, length(value), ?, ? FROM {table} "
+                f"WHERE key NOT IN (SELECT key FROM {self.TABLE})",
+                (now, now),
+            )
+            con.execute(
+                f"DELETE FROM {self.TABLE} WHERE key NOT IN (SELECT key FROM {table})"
+            )
+
+    def touch(self, key: str) -> None:
+        """Record a cache hit on ``key`` (written on the next flush)."""
+        with self._lock:
+            self._pending[key] = time.time()
+            due = len(self._pending) >= self.FLUSH_EVERY
+        if due:
+            self.flush()
+
+    def on_response(self, response: Any, *args: Any, **kwargs: Any) -> None:
+        """requests ``response`` hook: touch() responses served from the cache."""
+        key = getattr(response, "cache_key", None)
+        if key and getattr(response, "from_cache", False):
+            self.touch(key)
+
+    def flush(self) -> None:
+        """Write buffered access times."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            with self._responses.connection(commit=True) as con:
+                con.executemany(
+                    f"UPDATE {self.TABLE} SET last_access = ? WHERE key = ?",
+                    [(ts, key) for key, ts in pending.items()],
+                )
+        except Exception as e:
+            logger.debug("Cache index flush failed: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, stored bytes and oldest/newest times in one query."""
+        with self._responses.connection() as con:
+            entries, size, oldest, last = con.execute(
+                f"SELECT count(*), coalesce(sum(size), 0), min(created), max(last_access) "
+                f"FROM {self.TABLE}"
+            ).fetchone()
+        return {"entries": entries, "size": size, "oldest": oldest, "last_access": last}
+
+    def total_size(self) -> int:
+        """Stored bytes of all indexed responses."""
+        with self._responses.connection() as con:
+            row = con.execute(f"SELECT coalesce(sum(size), 0) FROM {self.TABLE}").fetchone()
+        return int(row[0])
+
+    def created_before(self, timestamp: float) -> List[str]:
+        """Keys of responses stored before ``timestamp`` (Unix time)."""
+        with self._responses.connection() as con:
+            rows = con.execute(
+                f"SELECT key FROM {self.TABLE} WHERE created < ?", (timestamp,)
+            ).fetchall()
+        return [key for (key,) in rows]
+
+    def lru(self, limit: int) -> List[Tuple[str, int]]:
+        """Up to ``limit`` (key, size) pairs, least recently used first."""
+        self.flush()
+        with self._responses.connection() as con:
+            rows = con.execute(
+                f"SELECT key, size FROM {self.TABLE} ORDER BY last_access, rowid LIMIT ?", (limit,)
+            ).fetchall()
+        return [(key, int(size)) for key, size in rows]
+
+
+class RevalidationStats:
+    """How responses of a cached session were served.
+
+    Counted by a requests ``response`` hook:
+
+    - hits: fresh responses from the cache
+    - revalidated: expired responses renewed by a 304 (no body downloaded)
+    - modified: conditional requests answered with a new page
+    - stale: expired responses served because the refetch failed
+    - misses: plain downloads (nothing cached, or nothing to validate with)
+    """
+
+    _COUNTERS = ("hits", "revalidated", "modified", "stale", "misses")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self._COUNTERS, 0)
+
+    def on_response(self, response: Any, *args: Any, **kwargs: Any) -> None:
+        """requests ``response`` hook of a CachedSession."""
+        from_cache = getattr(response, "from_cache", None)
+        if from_cache is None:
+            # requests dispatches hooks on the raw response too; count the final one
+            return
+        if from_cache:
+            if getattr(response, "revalidated", False):
+                outcome = "revalidated"
+            elif getattr(response, "is_expired", False):
+                outcome = "stale"
+            else:
+                outcome = "hits"
+        else:
+            request = getattr(response, "request", None)
+            headers = getattr(request, "headers", None) or {}
+            conditional = "If-None-Match" in headers or "If-Modified-Since" in headers
+            outcome = "modified" if conditional else "misses"
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters plus ``revalidation_hit_ratio`` (304s / conditional requests, or None)."""
+        with self._lock:
+            counts: Dict[str, Any] = dict(self._counts)
+        conditional = counts["revalidated"] + counts["modified"]
+        counts["revalidation_hit_ratio"] = (
+            counts["revalidated"] / conditional if conditional else None
+        )
+        return counts
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = dict.fromkeys(self._COUNTERS, 0)
+
+
 class HTTPCacheManager:
     """Manage HTTP response caching.
 
@@ -81,6 +282,8 @@ class HTTPCacheManager:
 
     _session: Optional["CachedSession"] = None
     _config: Optional[CacheConfig] = None
+    _index: Optional[CacheIndex] = None
+    _revalidation: Optional[RevalidationStats] = None
 
     @staticmethod
     def initialize(config: Optional[CacheConfig] = None) -> None:
@@ -101,19 +304,37 @@ class HTTPCacheManager:
 
         HTTPCacheManager._config = config
 
+        import requests_cache
+
         # Create cached session
         cache_path = config.get_cache_path()
         HTTPCacheManager._session = requests_cache.CachedSession(
             cache_name=str(cache_path.with_suffix("")),
             backend=config.backend,
             expire_after=config.ttl,
+            urls_expire_after=config.url_ttls,  # Search pages short, track pages long
             allowable_methods=["GET", "POST"],  # Cache GET and POST
             allowable_codes=[200, 203, 300, 301, 308],  # Cache successful responses
             match_headers=False,  # Don't match on headers
             stale_if_error=True,  # Use stale cache on error
         )
+        # Expired responses with an ETag/Last-Modified are revalidated by
+        # requests-cache (conditional request; a 304 renews the stored copy)
+        revalidation = RevalidationStats()
+        HTTPCacheManager._session.hooks["response"].append(revalidation.on_response)
+        HTTPCacheManager._revalidation = revalidation
+
+        if config.backend == "sqlite":
+            try:
+                index = CacheIndex(HTTPCacheManager._session.cache.responses)
+                HTTPCacheManager._session.hooks["response"].append(index.on_response)
+                HTTPCacheManager._index = index
+            except Exception as e:
+                logger.warning(f"HTTP cache index unavailable: {e}")
 
         logger.info(f"HTTP cache initialized at {cache_path}")
+        # Bring an oversized cache back under its limit without delaying startup
+        CachePruner.prune_automatically(background=True)
 
     @staticmethod
     def get_session() -> Optional["CachedSession"]:
@@ -126,6 +347,16 @@ class HTTPCacheManager:
             HTTPCacheManager.initialize()
         return HTTPCacheManager._session
 
+    @staticmethod
+    def get_revalidation_stats() -> Optional[RevalidationStats]:
+        """Serving counters of the cached session, or None if there is none."""
+        return HTTPCacheManager._revalidation
+
+    @staticmethod
+    def get_index() -> Optional[CacheIndex]:
+        """Side index of the SQLite cache, or None (no session or other backend)."""
+        return HTTPCacheManager._index
+
     @staticmethod
     def clear_cache() -> None:
         """Clear all cached responses.
@@ -134,11 +365,18 @@ class HTTPCacheManager:
         """
         if HTTPCacheManager._session is not None:
             HTTPCacheManager._session.cache.clear()
+            if HTTPCacheManager._index is not None:
+                # Dropping the responses table also dropped the index triggers
+                HTTPCacheManager._index.install()
             logger.info("HTTP cache cleared")
 
     @staticmethod
     def close() -> None:
         """Close cache session and release resources."""
+        CachePruner.stop_background()
+        if HTTPCacheManager._index is not None:
+            HTTPCacheManager._index.flush()
+            HTTPCacheManager._index = None
         if HTTPCacheManager._session is not None:
             try:
                 HTTPCacheManager._session.close()
@@ -146,6 +384,7 @@ class HTTPCacheManager:
                 pass
             HTTPCacheManager._session = None
             HTTPCacheManager._config = None
+            HTTPCacheManager._revalidation = None
 
     @staticmethod
     def get_cache_size() -> int:
@@ -185,10 +424,17 @@ class HTTPCacheManager:
             }
 
         cache = HTTPCacheManager._session.cache
-        size = HTTPCacheManager.get_cache_size()
+        file_size = HTTPCacheManager.get_cache_size()
+        size = file_size
 
+        index = HTTPCacheManager._index
         try:
-            entries = len(cache.responses) if hasattr(cache, "responses") else 0
+            if index is not None:
+                indexed = index.stats()
+                entries = indexed["entries"]
+                size = indexed["size"]
+            else:
+                entries = len(cache.responses) if hasattr(cache, "responses") else 0
         except Exception:
             entries = 0
 
@@ -196,9 +442,15 @@ class HTTPCacheManager:
             "enabled": True,
             "size": size,
             "size_mb": size / (1024 * 1024),
+            "file_size": file_size,
             "entries": entries,
             "location": str(HTTPCacheManager._config.get_cache_path()),
             "ttl_days": HTTPCacheManager._config.ttl.days,
+            "revalidation": (
+                HTTPCacheManager._revalidation.snapshot()
+                if HTTPCacheManager._revalidation is not None
+                else None
+            ),
         }
 
 
@@ -314,6 +566,19 @@ class CacheInvalidation:
         cache = HTTPCacheManager._session.cache
         cleared = 0
 
+        index = HTTPCacheManager._index
+        if index is not None:
+            try:
+                keys = index.created_before(time.time() - days * 86400)
+                if keys:
+                    cache.delete(*keys)
+                cleared = len(keys)
+            except Exception as e:
+                logger.warning(f"Error clearing old cache entries: {e}")
+            if cleared > 0:
+                logger.info(f"Cleared {cleared} cache entries older than {days} days")
+            return cleared
+
         try:
             if hasattr(cache, "responses"):
                 for key in list(cache.responses.keys()):
@@ -421,30 +686,79 @@ class CacheSizeMonitor:
 class CachePruner:
     """Prune cache to manage size.
 
-    Implements Step 6.5.3.2 - Automatic Cache Pruning.
+    Implements Step 6.5.3.2 - Automatic Cache Pruning. Entries are evicted
+    least recently used first, in batches, using CacheIndex. Backends without
+    an index fall back to reading every stored response, oldest first.
     """
 
+    BATCH_SIZE = 200
+
+    _thread: Optional[threading.Thread] = None
+    _stop = threading.Event()
+
     @staticmethod
     def prune_to_size(target_size: int) -> int:
         """Prune cache to target size.
 
+        Deletes the least recently used entries, a batch at a time, until the
+        stored bytes fit ``target_size``, then vacuums the database once.
+
         Args:
-            target_size: Target size in bytes.
+            target_size: Target size in bytes (of stored responses).
 
         Returns:
             Number of entries removed.
         """
-        if HTTPCacheManager._session is None:
+        session = HTTPCacheManager._session
+        if session is None:
             return 0
+        index = HTTPCacheManager._index
+        if index is None:
+            removed = CachePruner._prune_unindexed(session.cache, target_size)
+            if removed > 0:
+                logger.info(
+                    f"Pruned cache: removed {removed} entries, "
+                    f"target size: {target_size / (1024 * 1024):.1f} MB"
+                )
+            return removed
+
+        # SQLiteCache: delete(vacuum=...) and responses.vacuum()
+        cache: Any = session.cache
+        removed = 0
 
-        cache = HTTPCacheManager._session.cache
-        current_size = HTTPCacheManager.get_cache_size()
+        try:
+            excess = index.total_size() - target_size
+            while excess > 0 and not CachePruner._stop.is_set():
+                batch = index.lru(CachePruner.BATCH_SIZE)
+                if not batch:
+                    break
+                keys = []
+                for key, size in batch:
+                    keys.append(key)
+                    excess -= size
+                    if excess <= 0:
+                        break
+                cache.delete(*keys, vacuum=False)
+                removed += len(keys)
+            if removed:
+                cache.responses.vacuum()
+        except Exception as e:
+            logger.warning(f"Error pruning cache: {e}")
 
-        if current_size <= target_size:
+        if removed > 0:
+            logger.info(
+                f"Pruned cache: removed {removed} entries, target size: {target_size / (1024 * 1024):.1f} MB"
+            )
+
+        return removed
+
+    @staticmethod
+    def _prune_unindexed(cache: Any, target_size: int) -> int:
+        """Delete the oldest responses until the cache file fits ``target_size``."""
+        if HTTPCacheManager.get_cache_size() <= target_size:
             return 0
 
         removed = 0
-
         try:
             # Get all entries sorted by age (oldest first)
             entries = []
@@ -453,19 +767,17 @@ class CachePruner:
                     try:
                         response = cache.responses[key]
                         created_at = getattr(response, "created_at", datetime.min)
-                        size = getattr(response, "size", 0)
-                        entries.append((key, created_at, size))
+                        entries.append((key, created_at))
                     except Exception:
                         pass
-
-            # Sort by creation time (oldest first)
             entries.sort(key=lambda x: x[1])
 
             # Remove entries until under target size
-            for key, _, _ in entries:
+            for key, _ in entries:
+                if CachePruner._stop.is_set():
+                    break
                 if HTTPCacheManager.get_cache_size() <= target_size:
                     break
-
                 try:
                     cache.delete(key)
                     removed += 1
@@ -473,20 +785,17 @@ class CachePruner:
                     pass
         except Exception as e:
             logger.warning(f"Error pruning cache: {e}")
-
-        if removed > 0:
-            logger.info(
-                f"Pruned cache: removed {removed} entries, target size: {target_size / (1024 * 1024):.1f} MB"
-            )
-
         return removed
 
     @staticmethod
-    def prune_automatically() -> int:
+    def prune_automatically(background: bool = False) -> int:
         """Automatically prune cache if size limit exceeded.
 
+        Args:
+            background: Prune on a daemon thread and return immediately.
+
         Returns:
-            Number of entries removed.
+            Number of entries removed (0 when pruning in the background).
         """
         config = HTTPCacheManager._config
         if config is None:
@@ -497,4 +806,34 @@ class CachePruner:
 
         # Prune to 50% of limit
         target_size = config.size_limit // 2
+        if background:
+            CachePruner.prune_in_background(target_size)
+            return 0
         return CachePruner.prune_to_size(target_size)
+
+    @staticmethod
+    def prune_in_background(target_size: int) -> threading.Thread:
+        """Run prune_to_size() on a daemon thread (one at a time)."""
+        thread = CachePruner._thread
+        if thread is not None and thread.is_alive():
+            return thread
+        CachePruner._stop.clear()
+        thread = threading.Thread(
+            target=CachePruner.prune_to_size,
+            args=(target_size,),
+            name="cuepoint-cache-prune",
+            daemon=True,
+        )
+        CachePruner._thread = thread
+        thread.start()
+        return thread
+
+    @staticmethod
+    def stop_background(timeout: float = 5.0) -> None:
+        """Stop a background prune after its current batch."""
+        thread = CachePruner._thread
+        if thread is None:
+            return
+        CachePruner._stop.set()
+        thread.join(timeout)
+        CachePruner._thread = None
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shared HTTP connection pool for Beatport traffic
+
+Every Beatport caller (the scraping ``SESSION`` in models/config.py, the
+search helpers and BeatportApiClient) mounts one shared transport adapter, so
+connections opened by one worker are reused by the others instead of each
+session keeping its own 10-connection pool. Up to TRACK_WORKERS x
+CANDIDATE_WORKERS threads fetch concurrently; with the requests default pool
+size most of them would open a fresh connection (and TLS handshake) and have
+it discarded again when the pool is full.
+
+Key pieces:
+- PoolConfig: Pool sizes, keep-alive, DNS cache TTL and transport name,
+  derived from settings by PoolConfig.from_settings()
+- PooledHTTPAdapter: urllib3 transport with keep-alive socket options, a
+  DNS cache and utilisation metrics
+- HttpxAdapter: Optional HTTP/2 transport (requires ``httpx[http2]``)
+- register_transport(): Plug in another transport by name
+- POOL_METRICS: Process-wide counters (waits, new connections, reuse ratio)
+  read by the performance report
+"""
+
+import importlib
+import ipaddress
+import logging
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.poolmanager import PoolManager
+
+logger = logging.getLogger(__name__)
+
+# Connections kept per host when no worker counts are known (requests default)
+DEFAULT_POOL_MAXSIZE = 10
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool configuration.
+
+    Attributes:
+        pool_connections: Number of per-host pools kept.
+        pool_maxsize: Connections kept open per host.
+        pool_block: Wait for a free connection instead of opening an extra
+            one that is discarded afterwards.
+        keepalive: Enable TCP keep-alive on pooled sockets.
+        dns_cache_ttl: Seconds a resolved address is reused (0 disables).
+        transport: Registered transport name ("urllib3" or "http2").
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    pool_block: bool = False
+    keepalive: bool = True
+    dns_cache_ttl: float = 300.0
+    transport: str = "urllib3"
+
+    @classmethod
+    def from_settings(cls, settings: Mapping[str, Any]) -> "PoolConfig":
+        """Build from SETTINGS (or a RunSettings snapshot).
+
+        Without an explicit HTTP_POOL_MAXSIZE the per-host pool is sized for
+        TRACK_WORKERS x CANDIDATE_WORKERS concurrent requests, clamped to
+        [10, HTTP_POOL_MAXSIZE_CAP].
+        """
+        maxsize = settings.get("HTTP_POOL_MAXSIZE")
+        if not maxsize:
+            workers = max(int(settings.get("TRACK_WORKERS") or 1), 1) * max(
+                int(settings.get("CANDIDATE_WORKERS") or 1), 1
+            )
+            cap = int(settings.get("HTTP_POOL_MAXSIZE_CAP") or 64)
+            maxsize = min(max(workers, DEFAULT_POOL_MAXSIZE), max(cap, 1))
+        return cls(
+            pool_connections=int(settings.get("HTTP_POOL_HOSTS") or 10),
+            pool_maxsize=int(maxsize),
+            pool_block=bool(settings.get("HTTP_POOL_BLOCK", False)),
+            keepalive=bool(settings.get("HTTP_KEEPALIVE", True)),
+            dns_cache_ttl=float(settings.get("HTTP_DNS_CACHE_TTL") or 0),
+            transport=str(settings.get("HTTP_TRANSPORT") or "urllib3"),
+        )
+
+
+class PoolMetrics:
+    """Thread-safe connection pool counters.
+
+    Counters:
+        requests: Requests sent through a pooled transport.
+        new_connections: Sockets opened (each one a TCP/TLS handshake).
+        reused_connections: Requests served on an already open socket.
+        pool_waits / wait_ms: Times (and total ms) a request waited for a
+            free connection (only with pool_block).
+        discarded: Connections closed because the pool was already full.
+        dns_hits / dns_misses: DNS cache lookups.
+    """
+
+    COUNTERS = (
+        "requests",
+        "new_connections",
+        "reused_connections",
+        "pool_waits",
+        "wait_ms",
+        "discarded",
+        "dns_hits",
+        "dns_misses",
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Dict[str, float] = dict.fromkeys(self.COUNTERS, 0)
+
+    def record(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self._counts[name] += amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = dict.fromkeys(self.COUNTERS, 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current counters plus the derived reuse_ratio (None before any use)."""
+        with self._lock:
+            counts = dict(self._counts)
+        return _with_ratio(counts)
+
+    def delta(self, before: Mapping[str, float]) -> Dict[str, float]:
+        """Counters accumulated since ``before`` (an earlier snapshot)."""
+        now = self.snapshot()
+        counts = {name: now[name] - before.get(name, 0) for name in self.COUNTERS}
+        return _with_ratio(counts)
+
+
+def _with_ratio(counts: Dict[str, Any]) -> Dict[str, Any]:
+    used = counts["new_connections"] + counts["reused_connections"]
+    counts["wait_ms"] = round(counts["wait_ms"], 1)
+    counts["reuse_ratio"] = round(counts["reused_connections"] / used, 3) if used else None
+    return counts
+
+
+# Shared by every pooled transport in the process
+POOL_METRICS = PoolMetrics()
+
+
+class DNSCache:
+    """Small TTL cache of host -> first resolved address.
+
+    A failed connect invalidates the entry, so a stale address costs one
+    retry rather than a whole TTL.
+    """
+
+    def __init__(self, ttl: float, metrics: Optional[PoolMetrics] = None):
+        self.ttl = ttl
+        self._metrics = metrics
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, int], Tuple[float, str]] = {}
+
+    def resolve(self, host: str, port: int) -> Optional[str]:
+        """Cached address for ``host``; None for IP literals or lookup failures."""
+        try:
+            ipaddress.ip_address(host.strip("[]"))
+            return None
+        except ValueError:
+            pass
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            self._record("dns_hits")
+            return entry[1]
+        self._record("dns_misses")
+        try:
+            infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        except OSError:
+            # Let urllib3 resolve (and report) it the normal way
+            return None
+        if not infos:
+            return None
+        address = str(infos[0][4][0])
+        with self._lock:
+            self._entries[key] = (now + self.ttl, address)
+        return address
+
+    def invalidate(self, host: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == host]:
+                del self._entries[key]
+
+    def _record(self, name: str) -> None:
+        if self._metrics is not None:
+            self._metrics.record(name)
+
+
+def keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    """urllib3 defaults (TCP_NODELAY) plus TCP keep-alive where supported."""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 15), ("TCP_KEEPCNT", 4)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class _PooledConnectionMixin:
+    """Counts new sockets and connects to the DNS-cached address."""
+
+    pool_metrics: Optional[PoolMetrics] = None
+    dns_cache: Optional[DNSCache] = None
+
+    def _new_conn(self) -> socket.socket:
+        conn: Any = self  # urllib3 keeps the connect target in _dns_host
+        host = conn._dns_host
+        address = self.dns_cache.resolve(host, conn.port) if self.dns_cache else None
+        if address:
+            # Only the TCP connect uses the address; SNI and certificate
+            # checks still use the host name (restored before TLS starts)
+            conn._dns_host = address
+        try:
+            sock: socket.socket = super()._new_conn()  # type: ignore[misc]
+        except (NewConnectionError, ConnectTimeoutError):
+            if address and self.dns_cache is not None:
+                self.dns_cache.invalidate(host)
+            raise
+        finally:
+            conn._dns_host = host
+        if self.pool_metrics is not None:
+            self.pool_metrics.record("new_connections")
+        return sock
+
+
+class PooledHTTPConnection(_PooledConnectionMixin, HTTPConnection):
+    pass
+
+
+class PooledHTTPSConnection(_PooledConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _MeteredPoolMixin:
+    """Records waits, reuse and discards around urllib3's pool queue."""
+
+    pool_metrics: Optional[PoolMetrics] = None
+    dns_cache: Optional[DNSCache] = None
+
+    def _new_conn(self) -> Any:
+        conn = super()._new_conn()  # type: ignore[misc]
+        conn.pool_metrics = self.pool_metrics
+        conn.dns_cache = self.dns_cache
+        return conn
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        queue = self.pool  # type: ignore[attr-defined]
+        waiting = bool(self.block and queue is not None and queue.empty())  # type: ignore[attr-defined]
+        start = time.perf_counter()
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        if self.pool_metrics is not None:
+            if waiting:
+                self.pool_metrics.record("pool_waits")
+                self.pool_metrics.record("wait_ms", (time.perf_counter() - start) * 1000)
+            if getattr(conn, "sock", None) is not None:
+                self.pool_metrics.record("reused_connections")
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        queue = self.pool  # type: ignore[attr-defined]
+        if conn is not None and queue is not None and queue.full():
+            if self.pool_metrics is not None:
+                self.pool_metrics.record("discarded")
+        super()._put_conn(conn)  # type: ignore[misc]
+
+
+class PooledHTTPConnectionPool(_MeteredPoolMixin, HTTPConnectionPool):
+    ConnectionCls = PooledHTTPConnection
+
+
+class PooledHTTPSConnectionPool(_MeteredPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = PooledHTTPSConnection
+
+
+class _PooledPoolManager(PoolManager):
+    def __init__(
+        self,
+        pool_metrics: PoolMetrics,
+        dns_cache: Optional[DNSCache],
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.pool_metrics = pool_metrics
+        self.dns_cache = dns_cache
+        self.pool_classes_by_scheme = {
+            "http": PooledHTTPConnectionPool,
+            "https": PooledHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme: str, host: str, port: int, request_context: Any = None) -> Any:
+        pool: Any = super()._new_pool(scheme, host, port, request_context)
+        pool.pool_metrics = self.pool_metrics
+        pool.dns_cache = self.dns_cache
+        return pool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """requests adapter over a metered, keep-alive urllib3 pool.
+
+    Args:
+        config: Pool configuration (default: PoolConfig()).
+        metrics: Counters to update (default: POOL_METRICS).
+    """
+
+    def __init__(
+        self,
+        config: Optional[PoolConfig] = None,
+        metrics: Optional[PoolMetrics] = None,
+    ):
+        self.pool_config = config or PoolConfig()
+        self.pool_metrics = metrics or POOL_METRICS
+        self.dns_cache = (
+            DNSCache(self.pool_config.dns_cache_ttl, self.pool_metrics)
+            if self.pool_config.dns_cache_ttl > 0
+            else None
+        )
+        super().__init__(
+            pool_connections=self.pool_config.pool_connections,
+            pool_maxsize=self.pool_config.pool_maxsize,
+            pool_block=self.pool_config.pool_block,
+        )
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        if self.pool_config.keepalive:
+            pool_kwargs.setdefault("socket_options", keepalive_socket_options())
+        self.poolmanager = _PooledPoolManager(
+            self.pool_metrics,
+            self.dns_cache,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+    @property
+    def pool_maxsize(self) -> int:
+        return int(self._pool_maxsize)
+
+    def resize(self, maxsize: int) -> None:
+        """Grow the per-host pools; idle connections of the old pools close."""
+        if maxsize <= self._pool_maxsize:
+            return
+        old = self.poolmanager
+        self.init_poolmanager(self._pool_connections, maxsize, block=self._pool_block)
+        old.clear()
+        logger.debug("HTTP pool resized to %s connections per host", maxsize)
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> requests.Response:
+        self.pool_metrics.record("requests")
+        return super().send(request, *args, **kwargs)
+
+
+class HttpxAdapter(BaseAdapter):
+    """requests adapter that sends through an ``httpx.Client(http2=True)``.
+
+    Responses are read fully before returning (the app never streams Beatport
+    pages). ``client`` is for callers that build their own httpx client.
+    """
+
+    def __init__(
+        self,
+        config: Optional[PoolConfig] = None,
+        metrics: Optional[PoolMetrics] = None,
+        client: Any = None,
+    ):
+        super().__init__()
+        self.pool_config = config or PoolConfig()
+        self.pool_metrics = metrics or POOL_METRICS
+        if client is None:
+            # Raises ImportError when httpx is not installed
+            httpx = importlib.import_module("httpx")
+
+            client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.pool_config.pool_maxsize
+                    * self.pool_config.pool_connections,
+                    max_keepalive_connections=self.pool_config.pool_maxsize,
+                ),
+            )
+        self._client = client
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> requests.Response:
+        self.pool_metrics.record("requests")
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = (connect, read, read, connect)
+        try:
+            raw = self._client.request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+                timeout=timeout,
+            )
+        except Exception as e:
+            httpx = sys.modules.get("httpx")
+            if httpx is not None and isinstance(e, httpx.TimeoutException):
+                raise requests.exceptions.Timeout(e, request=request) from e
+            if httpx is not None and isinstance(e, httpx.TransportError):
+                raise requests.exceptions.ConnectionError(e, request=request) from e
+            raise
+
+        response = requests.Response()
+        response.status_code = raw.status_code
+        response.headers = requests.structures.CaseInsensitiveDict(raw.headers)
+        response._content = raw.content
+        response.url = str(raw.url)
+        response.reason = getattr(raw, "reason_phrase", "")
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.request = request
+        response.connection = self  # type: ignore[assignment]
+        return response
+
+    def close(self) -> None:
+        self._client.close()
+
+
+TransportFactory = Callable[[PoolConfig, PoolMetrics], BaseAdapter]
+
+_TRANSPORTS: Dict[str, TransportFactory] = {
+    "urllib3": PooledHTTPAdapter,
+    "http2": HttpxAdapter,
+}
+
+
+def register_transport(name: str, factory: TransportFactory) -> None:
+    """Make ``factory(config, metrics)`` selectable as HTTP_TRANSPORT=name."""
+    _TRANSPORTS[name] = factory
+
+
+def create_adapter(config: PoolConfig, metrics: Optional[PoolMetrics] = None) -> BaseAdapter:
+    """Adapter for ``config.transport``; falls back to urllib3 if unusable."""
+    metrics = metrics or POOL_METRICS
+    factory = _TRANSPORTS.get(config.transport)
+    if factory is None:
+        logger.warning("Unknown HTTP transport %r, using urllib3", config.transport)
+    else:
+        try:
+            return factory(config, metrics)
+        except ImportError as e:
+            logger.warning("HTTP transport %r unavailable (%s), using urllib3", config.transport, e)
+    return PooledHTTPAdapter(config, metrics)
+
+
+_shared_lock = threading.Lock()
+_shared_adapter: Optional[BaseAdapter] = None
+
+
+def shared_adapter(config: Optional[PoolConfig] = None) -> BaseAdapter:
+    """The process-wide adapter, created from ``config`` on first use."""
+    global _shared_adapter
+    with _shared_lock:
+        if _shared_adapter is None:
+            _shared_adapter = create_adapter(config or PoolConfig())
+        return _shared_adapter
+
+
+def mount_shared_adapter(
+    session: requests.Session, config: Optional[PoolConfig] = None
+) -> requests.Session:
+    """Route ``session``'s http(s) traffic through the shared adapter."""
+    adapter = shared_adapter(config)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def pooled_session(config: Optional[PoolConfig] = None) -> requests.Session:
+    """New session (own headers/cookies) sharing the process-wide pool."""
+    return mount_shared_adapter(requests.Session(), config)
+
+
+def ensure_capacity(settings: Mapping[str, Any]) -> None:
+    """Grow the shared pool for a run's worker counts (never shrinks it)."""
+    config = PoolConfig.from_settings(settings)
+    adapter = shared_adapter(config)
+    if isinstance(adapter, PooledHTTPAdapter):
+        with _shared_lock:
+            adapter.resize(config.pool_maxsize)
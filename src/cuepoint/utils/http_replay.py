@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HTTP record/replay for offline, reproducible benchmarks.
+
+Captures Beatport search and track-page responses into an on-disk fixture
+store and replays them through a local HTTP stand-in, so the real search,
+parsing and scoring code runs without touching the live site.
+
+- ``FixtureStore``: one gzipped JSON file per URL under a root directory.
+- ``RecordingAdapter``: requests transport adapter that forwards to the
+  network and stores every response.
+- ``ReplayServer``: threaded local HTTP server that serves stored
+  responses with configurable latency, jitter and error injection. An
+  optional ``fallback`` responder can synthesize missing fixtures (which
+  are then stored, so later runs replay purely from disk).
+- ``ReplayAdapter``: requests transport adapter that redirects requests
+  for Beatport to the local server.
+- ``recording()`` / ``replaying()``: context managers that mount the
+  adapters on the shared ``SESSION`` and restore it afterwards.
+- ``SyntheticCatalog``: Beatport stand-in for playlists whose tracks do not
+  exist on the live site (the generated benchmark_*.xml playlists). It
+  answers search and track-page URLs with HTML shaped like Beatport's
+  (track links, JSON-LD and __NEXT_DATA__), including look-alike
+  distractors for every track, so the real search, parse and scoring code
+  does real work. Use its ``respond`` as the ReplayServer ``fallback``: the
+  first run synthesizes and stores every response, later runs replay purely
+  from the fixture store. ``golden`` holds the expected match per track.
+
+Example:
+    from cuepoint.utils.http_replay import FixtureStore, replaying
+
+    store = FixtureStore("bench/fixtures")
+    with replaying(store, latency_ms=40, error_rate=0.01) as server:
+        processor.process_playlist_from_xml(...)
+    print(server.stats())
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from cuepoint.models.config import BASE_URL, SESSION
+
+# Header carrying the original URL from ReplayAdapter to ReplayServer
+REPLAY_URL_HEADER = "X-Replay-Url"
+
+# Response headers worth keeping in fixtures (others are transport noise)
+_KEPT_HEADERS = ("Content-Type", "Location")
+
+# Query parameters that only defeat caches and must not affect lookups
+_IGNORED_PARAMS = {"_r"}
+
+# URL prefixes routed through the record/replay adapters
+DEFAULT_PREFIXES = (BASE_URL, "https://beatport.com")
+
+
+@dataclass
+class RecordedResponse:
+    """A stored HTTP response."""
+
+    url: str
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL for fixture lookup (sorted query, no cache-busters)."""
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in _IGNORED_PARAMS
+    )
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), "")
+    )
+
+
+class FixtureStore:
+    """Directory of recorded responses, one gzipped JSON file per URL."""
+
+    def __init__(self, root: Any):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        """Stable file key for a URL."""
+        return hashlib.sha1(canonical_url(url).encode("utf-8")).hexdigest()
+
+    def _path(self, url: str) -> Path:
+        key = self.key_for(url)
+        return self.root / key[:2] / f"{key}.json.gz"
+
+    def get(self, url: str) -> Optional[RecordedResponse]:
+        """Return the stored response for ``url``, or None."""
+        path = self._path(url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return RecordedResponse(
+            url=data["url"],
+            status=int(data["status"]),
+            body=data["body"].encode("utf-8"),
+            headers=dict(data.get("headers") or {}),
+        )
+
+    def put(self, response: RecordedResponse) -> None:
+        """Store a response (atomic replace, last write wins)."""
+        path = self._path(response.url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "url": response.url,
+            "status": response.status,
+            "headers": {
+                k: v for k, v in response.headers.items() if k in _KEPT_HEADERS
+            },
+            "body": response.body.decode("utf-8", errors="replace"),
+        }
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with self._lock:
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                json.dump(payload, f)
+            tmp.replace(path)
+
+    def __contains__(self, url: str) -> bool:
+        return self._path(url).exists()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.root.glob("*/*.json.gz"))
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter that stores every response it receives."""
+
+    def __init__(self, store: FixtureStore, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.store = store
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        response = super().send(request, **kwargs)
+        self.store.put(
+            RecordedResponse(
+                url=str(request.url),
+                status=response.status_code,
+                body=response.content,
+                headers=dict(response.headers),
+            )
+        )
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Transport adapter that sends requests to a local ReplayServer."""
+
+    def __init__(self, server_url: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.server_url = server_url.rstrip("/")
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        original = str(request.url)
+        parts = urlsplit(original)
+        local = request.copy()
+        local.url = f"{self.server_url}{parts.path or '/'}" + (
+            f"?{parts.query}" if parts.query else ""
+        )
+        local.headers[REPLAY_URL_HEADER] = original
+        response = super().send(local, **kwargs)
+        # Callers (cache-hit checks, redirects, logging) see the original URL.
+        response.url = original
+        response.request = request
+        return response
+
+
+Fallback = Callable[[str], Optional[RecordedResponse]]
+
+
+class ReplayServer:
+    """Local HTTP stand-in that serves responses from a FixtureStore.
+
+    Args:
+        store: Fixture store to serve from.
+        latency_ms: Added delay per request.
+        jitter_ms: Uniform random extra delay (0..jitter_ms) per request.
+        error_rate: Probability (0..1) of answering 503 instead of the fixture.
+        seed: Seed for jitter and error injection (reproducible runs).
+        fallback: Optional responder for URLs missing from the store; its
+            responses are stored so later runs replay them from disk.
+    """
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        fallback: Optional[Fallback] = None,
+    ):
+        self.store = store
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.fallback = fallback
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "hits": 0, "misses": 0, "errors": 0, "synthesized": 0}
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if self._httpd is None:
+            raise RuntimeError("ReplayServer is not running")
+        return f"http://127.0.0.1:{self._httpd.server_port}"
+
+    def stats(self) -> Dict[str, int]:
+        """Request counters (requests, hits, misses, errors, synthesized)."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _plan(self) -> Tuple[float, bool]:
+        """Draw (delay_seconds, inject_error) for one request."""
+        with self._lock:
+            jitter = self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+        return (self.latency_ms + jitter) / 1000.0, fail
+
+    def lookup(self, url: str) -> Optional[RecordedResponse]:
+        """Resolve a URL from the store, falling back to the synthesizer."""
+        recorded = self.store.get(url)
+        if recorded is not None:
+            self._count("hits")
+            return recorded
+        if self.fallback is not None:
+            recorded = self.fallback(url)
+            if recorded is not None:
+                self.store.put(recorded)
+                self._count("synthesized")
+                return recorded
+        self._count("misses")
+        return None
+
+    def _handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                server._count("requests")
+                delay, fail = server._plan()
+                if delay:
+                    time.sleep(delay)
+                if fail:
+                    server._count("errors")
+                    self._send(503, b"injected error", {"Content-Type": "text/plain"})
+                    return
+                url = self.headers.get(REPLAY_URL_HEADER) or f"{BASE_URL}{self.path}"
+                recorded = server.lookup(url)
+                if recorded is None:
+                    self._send(404, b"", {"Content-Type": "text/plain"})
+                    return
+                self._send(recorded.status, recorded.body, recorded.headers)
+
+            def _send(self, status: int, body: bytes, headers: Dict[str, str]) -> None:
+                self.send_response(status)
+                for name, value in headers.items():
+                    if name in _KEPT_HEADERS:
+                        self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def start(self) -> str:
+        """Start serving on an ephemeral localhost port; returns the base URL."""
+        if self._httpd is None:
+            self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+            self._httpd.daemon_threads = True
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="ReplayServer", daemon=True
+            )
+            self._thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+            self._thread = None
+
+    def __enter__(self) -> "ReplayServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+@contextmanager
+def _mounted(
+    session: requests.Session, adapter: HTTPAdapter, prefixes: Tuple[str, ...]
+) -> Iterator[None]:
+    previous = dict(session.adapters)
+    for prefix in prefixes:
+        session.mount(prefix, adapter)
+    try:
+        yield
+    finally:
+        session.adapters.clear()
+        for prefix, old in previous.items():
+            session.mount(prefix, old)
+
+
+@contextmanager
+def recording(
+    store: FixtureStore,
+    session: Optional[requests.Session] = None,
+    prefixes: Tuple[str, ...] = DEFAULT_PREFIXES,
+) -> Iterator[FixtureStore]:
+    """Record live responses for ``prefixes`` into ``store``."""
+    with _mounted(session or SESSION, RecordingAdapter(store), prefixes):
+        yield store
+
+
+@contextmanager
+def replaying(
+    store: FixtureStore,
+    session: Optional[requests.Session] = None,
+    prefixes: Tuple[str, ...] = DEFAULT_PREFIXES,
+    **server_options: Any,
+) -> Iterator[ReplayServer]:
+    """Serve ``prefixes`` from ``store`` via a local ReplayServer.
+
+    Keyword arguments are passed to ReplayServer (latency_ms, jitter_ms,
+    error_rate, seed, fallback).
+    """
+    with ReplayServer(store, **server_options) as server:
+        with _mounted(session or SESSION, ReplayAdapter(server.url), prefixes):
+            yield server
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_KEYS = ["A Minor", "C Major", "D Minor", "F Major", "G Major", "E Minor"]
+_GENRES = ["Techno", "House", "Deep House", "Progressive House"]
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _slug(text: str) -> str:
+    return "-".join(_tokens(text)) or "track"
+
+
+@dataclass
+class CatalogEntry:
+    """One synthetic Beatport track."""
+
+    track_id: int
+    title: str
+    artists: str
+    mix: str = "Original Mix"
+
+    @property
+    def url(self) -> str:
+        return f"{BASE_URL}/track/{_slug(self.title)}/{self.track_id}"
+
+
+class SyntheticCatalog:
+    """Beatport stand-in built from (title, artist) pairs.
+
+    Args:
+        tracks: Playlist tracks as (playlist_index, title, artist).
+        distractors: Look-alike entries generated per track.
+        max_results: Track links returned per search page.
+    """
+
+    def __init__(
+        self,
+        tracks: Iterable[Tuple[int, str, str]],
+        distractors: int = 3,
+        max_results: int = 25,
+    ):
+        self.max_results = max_results
+        self.entries: Dict[int, CatalogEntry] = {}
+        self.golden: Dict[int, str] = {}
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        next_id = 10_000_000
+        for playlist_index, title, artist in tracks:
+            variants = [(title, artist, "Original Mix")]
+            if distractors:
+                variants.append((f"{title} (Dub Mix)", artist, "Dub Mix"))
+            variants += [
+                (title, f"Other Artist {k}", "Original Mix")
+                for k in range(max(0, distractors - 1))
+            ]
+            for i, (v_title, v_artist, mix) in enumerate(variants):
+                entry = CatalogEntry(next_id, v_title, v_artist, mix)
+                next_id += 1
+                self.entries[entry.track_id] = entry
+                for tok in set(_tokens(f"{v_title} {v_artist} {mix}")):
+                    self._postings[tok].append(entry.track_id)
+                if i == 0:
+                    self.golden[playlist_index] = entry.url
+        self._idf = {
+            tok: math.log(1 + len(self.entries) / len(ids))
+            for tok, ids in self._postings.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Responses
+    # ------------------------------------------------------------------
+
+    def search(self, query: str) -> List[CatalogEntry]:
+        """Rank entries by summed IDF of matching query tokens."""
+        scores: Dict[int, float] = defaultdict(float)
+        for tok in set(_tokens(query)):
+            weight = self._idf.get(tok)
+            if weight is None:
+                continue
+            for track_id in self._postings[tok]:
+                scores[track_id] += weight
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [self.entries[tid] for tid, _ in ranked[: self.max_results]]
+
+    def respond(self, url: str) -> Optional[RecordedResponse]:
+        """ReplayServer fallback: synthesize a response for ``url``."""
+        parts = urlsplit(url)
+        if parts.path == "/search":
+            query = (parse_qs(parts.query).get("q") or [""])[0]
+            links = "\n".join(
+                f'<a href="/track/{_slug(e.title)}/{e.track_id}">{e.title}</a>'
+                for e in self.search(query)
+            )
+            return self._html(url, f"<main>{links}</main>")
+        match = re.match(r"^/track/[^/]+/(\d+)$", parts.path)
+        if match and int(match.group(1)) in self.entries:
+            return self._html(url, "", self._track_head(self.entries[int(match.group(1))]))
+        return RecordedResponse(url=url, status=404, body=b"", headers={})
+
+    def _track_head(self, entry: CatalogEntry) -> str:
+        ld = {
+            "@context": "https://schema.org",
+            "@type": "MusicRecording",
+            "name": entry.title,
+            "byArtist": {"@type": "MusicGroup", "name": entry.artists},
+            "inAlbum": {"@type": "MusicAlbum", "name": f"{entry.title} EP"},
+            "datePublished": f"20{20 + entry.track_id % 5}-0{1 + entry.track_id % 9}-15",
+        }
+        next_data = {
+            "props": {
+                "pageProps": {
+                    "track": {
+                        "title": entry.title,
+                        "artists": [{"name": entry.artists}],
+                        "key": _KEYS[entry.track_id % len(_KEYS)],
+                        "bpm": 120 + entry.track_id % 10,
+                        "label": {"name": f"Label {entry.track_id % 97}"},
+                        "genres": [{"name": _GENRES[entry.track_id % len(_GENRES)]}],
+                        "mix_name": entry.mix,
+                    }
+                }
+            }
+        }
+        return (
+            f'<script type="application/ld+json">{json.dumps(ld)}</script>'
+            f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data)}</script>'
+        )
+
+    @staticmethod
+    def _html(url: str, body: str, head: str = "") -> RecordedResponse:
+        html = (
+            '<!doctype html><html lang="en"><head><meta charset="utf-8" />'
+            f"{head}</head><body>{body}</body></html>"
+        )
+        return RecordedResponse(
+            url=url,
+            status=200,
+            body=html.encode("utf-8"),
+            headers={"Content-Type": "text/html; charset=utf-8"},
+        )
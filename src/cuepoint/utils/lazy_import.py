@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Deferred imports for heavy optional dependencies
+
+BeautifulSoup, ddgs, dateutil, requests-cache and openpyxl together cost
+several hundred milliseconds at import time, which every entry point
+(``cuepoint --help``, the GUI window) used to pay before doing anything.
+Modules that need them keep a module-level name (so tests can still patch
+it) bound to a stand-in that imports the real object on first use.
+
+Key functions:
+- module_available(): Check an optional dependency without importing it
+- lazy_callable(): Stand-in for a class/function imported on first call
+- lazy_module(): Stand-in for a module imported on first attribute access
+"""
+
+import importlib
+import importlib.util
+import threading
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+
+def module_available(name: str) -> bool:
+    """True if ``name`` can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyCallable:
+    """Callable that resolves its target via ``loader`` on first call.
+
+    Args:
+        loader: Zero-argument function returning the real callable.
+        name: Name shown in repr() (e.g. "bs4.BeautifulSoup").
+    """
+
+    def __init__(self, loader: Callable[[], Any], name: str):
+        self._loader = loader
+        self._name = name
+        self._target: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> Any:
+        """Import (once) and return the real object."""
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    self._target = self._loader()
+        return self._target
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy {self._name} ({state})>"
+
+
+def lazy_callable(module: str, attr: str) -> LazyCallable:
+    """Stand-in for ``from module import attr`` that imports on first call."""
+
+    def _load() -> Any:
+        return getattr(importlib.import_module(module), attr)
+
+    return LazyCallable(_load, f"{module}.{attr}")
+
+
+class LazyModule(ModuleType):
+    """Module proxy that imports ``name`` on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _resolve(self) -> ModuleType:
+        target: Optional[ModuleType] = self.__dict__["_lazy_target"]
+        if target is None:
+            target = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_target"] = target
+        return target
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._resolve(), attr)
+
+
+def lazy_module(name: str) -> Any:
+    """Stand-in for ``import name`` that imports on first attribute access."""
+    return LazyModule(name)
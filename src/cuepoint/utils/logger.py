@@ -11,19 +11,30 @@ Implements Step 6.2 - Logging with:
 - Log level management
 - Sensitive information filtering
 - Timing information logging
+- Queue-based (non-blocking) handlers for worker threads
+- Sampling of per-candidate TRACE/VERBOSE output
+
+With queue logging, a logger's handlers move behind a QueueHandler: the
+calling thread only builds the record and enqueues it, while a listener
+thread runs the sanitising filter, formatting and file I/O. Worker threads
+never wait on the disk or on a handler lock.
 """
 
+import atexit
+import itertools
 import logging
 import logging.handlers
 import os
 import platform
+import queue
 import re
 import sys
+import threading
 import time
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 from cuepoint.utils.paths import AppPaths
@@ -539,6 +550,109 @@ class LogSanitizer:
         return data
 
 
+class SensitiveDataFilter(logging.Filter):
+    """Redact secrets from the formatted message (LogSanitizer.sanitize_message).
+
+    Attach to handlers rather than loggers so that, behind a queue, the
+    regexes run on the listener thread. The formatted message replaces
+    ``msg``/``args`` and the record is marked, so a second handler does not
+    sanitise it again.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sanitized", False):
+            record.msg = LogSanitizer.sanitize_message(record.getMessage())
+            record.args = None
+            record.sanitized = True
+        return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that owns the QueueListener feeding its target handlers.
+
+    close() drains the queue and closes the targets, so code that closes a
+    logger's handlers before reading the log file keeps working.
+    """
+
+    def __init__(self, handlers: List[logging.Handler]):
+        super().__init__(queue.SimpleQueue())
+        self.target_handlers = list(handlers)
+        self.listener = logging.handlers.QueueListener(
+            self.queue, *self.target_handlers, respect_handler_level=True
+        )
+        self.listener.start()
+
+    def close(self) -> None:
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in self.target_handlers:
+                handler.close()
+        super().close()
+
+
+_queue_handlers: Dict[str, Tuple[logging.Logger, NonBlockingQueueHandler]] = {}
+_queue_lock = threading.Lock()
+
+
+def start_queue_logging(
+    logger: logging.Logger, caller_filters: Iterable[logging.Filter] = ()
+) -> NonBlockingQueueHandler:
+    """Move ``logger``'s handlers behind a queue served by a listener thread.
+
+    Args:
+        logger: Logger whose current handlers become the listener's targets.
+        caller_filters: Filters that must see the caller's state (e.g.
+            RunContextFilter); they run on the QueueHandler before enqueueing.
+
+    Returns:
+        The installed handler (its ``target_handlers`` are the moved ones).
+    """
+    stop_queue_logging(logger)
+    handler = NonBlockingQueueHandler(logger.handlers)
+    for flt in caller_filters:
+        handler.addFilter(flt)
+    logger.handlers = [handler]
+    with _queue_lock:
+        _queue_handlers[logger.name] = (logger, handler)
+    return handler
+
+
+def stop_queue_logging(logger: Optional[logging.Logger] = None) -> None:
+    """Flush and close queue logging of ``logger`` (default: every logger)."""
+    with _queue_lock:
+        if logger is None:
+            installed = list(_queue_handlers.values())
+            _queue_handlers.clear()
+        else:
+            found = _queue_handlers.pop(logger.name, None)
+            installed = [found] if found is not None else []
+    for owner, handler in installed:
+        owner.removeHandler(handler)
+        handler.close()
+
+
+atexit.register(stop_queue_logging)
+
+
+class LogSampler:
+    """Let through one call in ``every`` (thread-safe; every <= 1 passes all).
+
+    For per-candidate TRACE/VERBOSE lines, whose volume (candidates x
+    queries x tracks) otherwise dominates console time.
+    """
+
+    def __init__(self, every: int = 1):
+        self.every = max(int(every or 1), 1)
+        self._counter = itertools.count()
+
+    def sample(self, every: Optional[int] = None) -> bool:
+        """True for the calls to log; ``every`` overrides the instance rate."""
+        n = self.every if every is None else max(int(every or 1), 1)
+        # next() on itertools.count is atomic under the GIL
+        return n == 1 or next(self._counter) % n == 0
+
+
 @contextmanager
 def log_timing(operation_name: str, logger: Optional[logging.Logger] = None):
     """Context manager to log operation timing.
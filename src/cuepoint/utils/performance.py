@@ -8,11 +8,13 @@ Provides performance monitoring and optimization utilities.
 Implements performance requirements from Step 1.11.
 """
 
+import bisect
 import logging
+import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -182,6 +184,248 @@ class PerformanceContext:
         self.metadata.update(kwargs)
 
 
+# ============================================================================
+# Lock-cheap Metrics Core (bounded histograms + counters)
+# ============================================================================
+
+# Pipeline stages tracked by the per-stage latency histograms
+STAGE_SEARCH = "search"
+STAGE_FETCH = "fetch"
+STAGE_PARSE = "parse"
+STAGE_SCORE = "score"
+
+# Bucket upper bounds in seconds: geometric from 0.1ms to ~10min (growth 10%).
+# Percentiles are therefore accurate to within one bucket (~10%).
+_BUCKET_GROWTH = 1.1
+_BUCKET_BOUNDS: List[float] = []
+_b = 0.0001
+while _b < 600.0:
+    _BUCKET_BOUNDS.append(_b)
+    _b *= _BUCKET_GROWTH
+del _b
+
+
+class LatencyHistogram:
+    """Fixed-size latency histogram with log-scaled buckets.
+
+    Memory use is constant regardless of how many samples are recorded, so it
+    is safe to keep one per stage for arbitrarily long runs.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record a single duration in seconds."""
+        if seconds < 0:
+            seconds = 0.0
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        if self.count == 0 or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.count += 1
+        self.total += seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the samples of another histogram into this one."""
+        if other.count == 0:
+            return
+        for i, c in enumerate(other.counts):
+            if c:
+                self.counts[i] += c
+        if self.count == 0 or other.min < self.min:
+            self.min = other.min
+        if other.max > self.max:
+            self.max = other.max
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, pct: float) -> float:
+        """Approximate percentile (0-100) in seconds.
+
+        Returns the upper bound of the bucket holding the requested rank,
+        clamped to the observed min/max.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(round(self.count * pct / 100.0)))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                bound = _BUCKET_BOUNDS[i] if i < len(_BUCKET_BOUNDS) else self.max
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        """Average duration in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        """Summary suitable for reports and JSON export."""
+        return {
+            "count": self.count,
+            "avg": self.mean(),
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class _MetricsShard:
+    """Per-thread slice of a MetricsRegistry (only written by its owner).
+
+    The owner takes ``lock`` for each write; it is only contended while a
+    reader merges or resets the shard.
+    """
+
+    __slots__ = ("histograms", "counters", "lock", "owner")
+
+    def __init__(self, owner: Optional[threading.Thread] = None):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.owner = owner
+
+    def merge_into(self, other: "_MetricsShard") -> None:
+        """Add this shard's data to ``other`` (callers hold both locks)."""
+        for stage, hist in self.histograms.items():
+            other.histograms.setdefault(stage, LatencyHistogram()).merge(hist)
+        for name, value in self.counters.items():
+            other.counters[name] = other.counters.get(name, 0) + value
+
+
+class MetricsRegistry:
+    """Stage latency histograms and counters sharded per thread.
+
+    Writers touch only their own thread's shard, so the hot path never waits
+    for another writer. Readers merge all shards on demand. Shards of threads
+    that have exited are folded into one retired shard and dropped, so a
+    long run with short-lived threads keeps a bounded number of shards.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[_MetricsShard] = []
+        # Data recorded by threads that have exited
+        self._retired = _MetricsShard()
+
+    def _shard(self) -> _MetricsShard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _MetricsShard(threading.current_thread())
+            with self._lock:
+                self._retire_dead_locked()
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _retire_dead_locked(self) -> None:
+        """Fold the shards of exited threads into the retired shard (holding _lock)."""
+        live = []
+        for shard in self._shards:
+            if shard.owner is not None and shard.owner.is_alive():
+                live.append(shard)
+                continue
+            with shard.lock, self._retired.lock:
+                shard.merge_into(self._retired)
+        self._shards = live
+
+    def _all_shards(self) -> List[_MetricsShard]:
+        with self._lock:
+            self._retire_dead_locked()
+            return [self._retired] + self._shards
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record a duration for a stage."""
+        shard = self._shard()
+        with shard.lock:
+            hist = shard.histograms.get(stage)
+            if hist is None:
+                hist = shard.histograms[stage] = LatencyHistogram()
+            hist.record(seconds)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Increase a named counter."""
+        shard = self._shard()
+        with shard.lock:
+            shard.counters[name] = shard.counters.get(name, 0) + amount
+
+    def time(self, stage: str) -> "_StageTimer":
+        """Context manager that observes the elapsed time of its block."""
+        return _StageTimer(self, stage)
+
+    def histograms(self) -> Dict[str, LatencyHistogram]:
+        """Merged histograms across all threads."""
+        merged: Dict[str, LatencyHistogram] = {}
+        for shard in self._all_shards():
+            with shard.lock:
+                for stage, hist in shard.histograms.items():
+                    merged.setdefault(stage, LatencyHistogram()).merge(hist)
+        return merged
+
+    def counters(self) -> Dict[str, int]:
+        """Merged counters across all threads."""
+        merged: Dict[str, int] = defaultdict(int)
+        for shard in self._all_shards():
+            with shard.lock:
+                for name, value in shard.counters.items():
+                    merged[name] += value
+        return dict(merged)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Merged view: {"stages": {stage: summary}, "counters": {...}}."""
+        return {
+            "stages": {k: h.to_dict() for k, h in sorted(self.histograms().items())},
+            "counters": self.counters(),
+        }
+
+    def reset(self) -> None:
+        """Drop all recorded data and the shards of exited threads.
+
+        Live shards are cleared in place, under their locks, so threads
+        holding a reference keep writing into the (now empty) registry.
+        """
+        with self._lock:
+            self._shards = [s for s in self._shards if s.owner is not None and s.owner.is_alive()]
+            for shard in [self._retired] + self._shards:
+                with shard.lock:
+                    shard.histograms = {}
+                    shard.counters = {}
+
+
+class _StageTimer:
+    """Context manager returned by MetricsRegistry.time()."""
+
+    __slots__ = ("_registry", "_stage", "_start")
+
+    def __init__(self, registry: MetricsRegistry, stage: str):
+        self._registry = registry
+        self._stage = stage
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._registry.observe(self._stage, time.perf_counter() - self._start)
+
+
+# Process-wide registry for pipeline stage metrics
+stage_metrics = MetricsRegistry()
+
+
 # ============================================================================
 # Performance Collector (Legacy Compatibility)
 # ============================================================================
@@ -211,6 +455,7 @@ class TrackMetrics:
     total_queries: int = 0
     total_candidates: int = 0
     candidates_evaluated: int = 0
+    candidates_skipped: int = 0  # Pages not fetched (slug pre-score)
     early_exit: bool = False
     early_exit_query_index: int = 0
     match_found: bool = False
@@ -227,6 +472,15 @@ class FilterMetrics:
     filters_applied: Dict[str, Any]  # Dictionary of active filters
 
 
+# Bounds for the per-item metric lists kept by PerformanceCollector. Aggregates
+# (counters, histograms, slowest tracks) cover the whole run; the lists only
+# hold the most recent items so memory stays flat on very long runs.
+MAX_RECENT_QUERY_METRICS = 5000
+MAX_RECENT_TRACK_METRICS = 2000
+MAX_RECENT_FILTER_METRICS = 500
+SLOWEST_TRACKS_KEPT = 50
+
+
 @dataclass
 class PerformanceStats:
     """Aggregate performance statistics for a processing session"""
@@ -235,14 +489,33 @@ class PerformanceStats:
     matched_tracks: int = 0
     unmatched_tracks: int = 0
     total_time: float = 0.0
-    query_metrics: List[QueryMetrics] = field(default_factory=list)
-    track_metrics: List[TrackMetrics] = field(default_factory=list)
-    filter_metrics: List[FilterMetrics] = field(default_factory=list)
+    query_metrics: Deque[QueryMetrics] = field(
+        default_factory=lambda: deque(maxlen=MAX_RECENT_QUERY_METRICS)
+    )
+    track_metrics: Deque[TrackMetrics] = field(
+        default_factory=lambda: deque(maxlen=MAX_RECENT_TRACK_METRICS)
+    )
+    filter_metrics: Deque[FilterMetrics] = field(
+        default_factory=lambda: deque(maxlen=MAX_RECENT_FILTER_METRICS)
+    )
     cache_stats: Dict[str, int] = field(
         default_factory=lambda: {"hits": 0, "misses": 0}
     )
     start_time: Optional[float] = None
     end_time: Optional[float] = None
+    total_queries: int = 0  # All queries in the session (not just recent ones)
+    total_query_time: float = 0.0
+    candidates_skipped: int = 0  # Candidate pages not fetched (slug pre-score)
+    slowest: List[TrackMetrics] = field(default_factory=list)
+
+    def query_count(self) -> int:
+        """Number of queries executed in the session"""
+        return max(self.total_queries, len(self.query_metrics))
+
+    def slowest_tracks(self, n: int = 10) -> List[TrackMetrics]:
+        """Slowest completed tracks of the session, slowest first"""
+        pool = self.slowest or list(self.track_metrics)
+        return sorted(pool, key=lambda t: t.total_time, reverse=True)[:n]
 
     def average_time_per_track(self) -> float:
         """Calculate average processing time per track"""
@@ -252,6 +525,8 @@ class PerformanceStats:
 
     def average_time_per_query(self) -> float:
         """Calculate average execution time per query"""
+        if self.total_queries:
+            return self.total_query_time / self.total_queries
         if not self.query_metrics:
             return 0.0
         return sum(q.execution_time for q in self.query_metrics) / len(
@@ -273,36 +548,53 @@ class PerformanceStats:
 
 
 class PerformanceCollector:
-    """Singleton collector for performance metrics"""
+    """Singleton collector for performance metrics.
+
+    Safe to call from multiple track worker threads: session aggregates are
+    updated under a lock, per-stage latencies go to the sharded
+    ``stage_metrics`` registry, and per-item lists are bounded.
+    """
 
     _instance: Optional["PerformanceCollector"] = None
     _stats: Optional[PerformanceStats] = None
+    _lock = threading.RLock()
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Per-stage latency histograms and counters"""
+        return stage_metrics
+
     def start_session(self):
         """Start a new performance monitoring session"""
-        self._stats = PerformanceStats()
-        self._stats.start_time = time.perf_counter()
+        with self._lock:
+            self._stats = PerformanceStats()
+            self._stats.start_time = time.perf_counter()
+            stage_metrics.reset()
 
     def end_session(self):
         """End the current session"""
-        if self._stats:
-            self._stats.end_time = time.perf_counter()
-            if self._stats.start_time:
-                self._stats.total_time = self._stats.end_time - self._stats.start_time
+        with self._lock:
+            if self._stats:
+                self._stats.end_time = time.perf_counter()
+                if self._stats.start_time:
+                    self._stats.total_time = (
+                        self._stats.end_time - self._stats.start_time
+                    )
 
     def record_track_start(self, track_id: str, track_title: str) -> TrackMetrics:
         """Record start of track processing"""
-        if not self._stats:
-            self.start_session()
-        assert self._stats is not None
         track_metrics = TrackMetrics(track_id=track_id, track_title=track_title)
-        self._stats.track_metrics.append(track_metrics)
-        self._stats.total_tracks += 1
+        with self._lock:
+            if not self._stats:
+                self.start_session()
+            assert self._stats is not None
+            self._stats.track_metrics.append(track_metrics)
+            self._stats.total_tracks += 1
         return track_metrics
 
     def record_query(
@@ -326,16 +618,22 @@ class PerformanceCollector:
             network_time=network_time,
             parse_time=parse_time,
         )
+        # TrackMetrics is owned by the calling track worker
         track_metrics.queries.append(query_metric)
         track_metrics.total_queries += 1
-        assert self._stats is not None
-        self._stats.query_metrics.append(query_metric)
+        stage_metrics.increment("cache_hits" if cache_hit else "cache_misses")
 
-        # Update cache stats
-        if cache_hit:
-            self._stats.cache_stats["hits"] += 1
-        else:
-            self._stats.cache_stats["misses"] += 1
+        with self._lock:
+            assert self._stats is not None
+            self._stats.query_metrics.append(query_metric)
+            self._stats.total_queries += 1
+            self._stats.total_query_time += execution_time
+
+            # Update cache stats
+            if cache_hit:
+                self._stats.cache_stats["hits"] += 1
+            else:
+                self._stats.cache_stats["misses"] += 1
 
     def record_track_complete(
         self,
@@ -346,6 +644,7 @@ class PerformanceCollector:
         early_exit: bool = False,
         early_exit_query_index: int = 0,
         candidates_evaluated: int = 0,
+        candidates_skipped: int = 0,
     ):
         """Record completion of track processing"""
         track_metrics.total_time = total_time
@@ -354,12 +653,26 @@ class PerformanceCollector:
         track_metrics.early_exit = early_exit
         track_metrics.early_exit_query_index = early_exit_query_index
         track_metrics.candidates_evaluated = candidates_evaluated
-
-        assert self._stats is not None
-        if match_found:
-            self._stats.matched_tracks += 1
-        else:
-            self._stats.unmatched_tracks += 1
+        track_metrics.candidates_skipped = candidates_skipped
+        # Keep only the recent per-query details on the track itself
+        if len(track_metrics.queries) > 50:
+            del track_metrics.queries[:-50]
+
+        with self._lock:
+            assert self._stats is not None
+            self._stats.candidates_skipped += candidates_skipped
+            if match_found:
+                self._stats.matched_tracks += 1
+            else:
+                self._stats.unmatched_tracks += 1
+
+            slowest = self._stats.slowest
+            if len(slowest) < SLOWEST_TRACKS_KEPT:
+                slowest.append(track_metrics)
+            else:
+                fastest = min(range(len(slowest)), key=lambda i: slowest[i].total_time)
+                if total_time > slowest[fastest].total_time:
+                    slowest[fastest] = track_metrics
 
     def record_filter_operation(
         self,
@@ -369,24 +682,31 @@ class PerformanceCollector:
         filters_applied: Dict[str, Any],
     ):
         """Record a filter operation for performance tracking"""
-        if not self._stats:
-            self.start_session()
-        assert self._stats is not None
         filter_metric = FilterMetrics(
             duration=duration,
             initial_count=initial_count,
             filtered_count=filtered_count,
             filters_applied=filters_applied,
         )
-        self._stats.filter_metrics.append(filter_metric)
+        with self._lock:
+            if not self._stats:
+                self.start_session()
+            assert self._stats is not None
+            self._stats.filter_metrics.append(filter_metric)
 
     def get_stats(self) -> Optional[PerformanceStats]:
         """Get current performance statistics"""
         return self._stats
 
+    def get_stage_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage latency summary (count/avg/min/max/p50/p95/p99 in seconds)"""
+        return {k: h.to_dict() for k, h in sorted(stage_metrics.histograms().items())}
+
     def reset(self):
         """Reset all statistics"""
-        self._stats = None
+        with self._lock:
+            self._stats = None
+            stage_metrics.reset()
 
 
 # Global instance for backward compatibility
@@ -17,6 +17,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from cuepoint.utils.http_pool import POOL_METRICS
+from cuepoint.utils.single_flight import single_flight_delta, single_flight_stats
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +63,8 @@ class RunPerformanceReport:
     memory_mb_peak: float = 0.0
     stages: Dict[str, float] = field(default_factory=dict)
     cache_hit_rate: Optional[float] = None
+    http_pool: Optional[Dict[str, Any]] = None
+    single_flight: Optional[Dict[str, Dict[str, int]]] = None
     tracks_processed: int = 0
     matched_count: int = 0
     created_at: str = ""
@@ -76,6 +81,8 @@ class RunPerformanceReport:
             "cache_hit_rate": round(self.cache_hit_rate, 2)
             if self.cache_hit_rate is not None
             else None,
+            "http_pool": self.http_pool,
+            "single_flight": self.single_flight,
             "tracks_processed": self.tracks_processed,
             "matched_count": self.matched_count,
             "created_at": self.created_at,
@@ -97,15 +104,27 @@ class RunPerformanceCollector:
         self._matched_count = 0
         self._cache_hits = 0
         self._cache_misses = 0
+        self._pool_start: Optional[Dict[str, Any]] = None
+        self._http_pool: Optional[Dict[str, Any]] = None
+        self._flight_start: Optional[Dict[str, Dict[str, int]]] = None
+        self._single_flight: Optional[Dict[str, Dict[str, int]]] = None
 
     def start_run(self, dataset_size: int = 0) -> None:
         """Start timing the run."""
         self._start_time = time.perf_counter()
         self._dataset_size = dataset_size
+        self._pool_start = POOL_METRICS.snapshot()
+        self._flight_start = single_flight_stats()
 
     def end_run(self) -> None:
         """End timing the run."""
         self._end_time = time.perf_counter()
+        if self._pool_start is not None:
+            # Connection pool use during this run (waits, new connections, reuse)
+            self._http_pool = POOL_METRICS.delta(self._pool_start)
+        if self._flight_start is not None:
+            # Searches/fetches shared between track workers during this run
+            self._single_flight = single_flight_delta(self._flight_start)
 
     def start_stage(self, stage: str) -> None:
         """Start timing a stage (Design 6.49)."""
@@ -174,6 +193,8 @@ class RunPerformanceCollector:
             memory_mb_peak=self.memory_mb_peak,
             stages=dict(self._stage_durations),
             cache_hit_rate=self.cache_hit_rate,
+            http_pool=self._http_pool,
+            single_flight=self._single_flight,
             tracks_processed=self._tracks_processed,
             matched_count=self._matched_count,
             created_at=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
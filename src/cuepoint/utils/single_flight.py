@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+In-flight request coalescing (single-flight)
+
+With several track workers, neighbouring tracks by the same artist or from
+the same release issue identical searches and fetch the same candidate pages
+at the same moment. best_beatport_match() only dedupes within one track and
+the HTTP cache only helps once the first response has landed. A SingleFlight
+group lets the first caller for a key (the leader) do the work while callers
+that arrive before it finishes wait for, and share, its result or exception.
+Nothing is cached: once the leader returns, the next call runs again.
+
+Key functions:
+- SingleFlight: One coalescing group with calls/executions/coalesced counters
+- flight_group(): Process-wide named group (html, track_page, search, ...)
+- single_flight_stats(): Counters of every named group
+- single_flight_delta(): Counters since an earlier snapshot (per run)
+- coalesce(): flight_group().do() with an on/off switch (SINGLE_FLIGHT)
+- normalize_url(): Key for URL-based groups
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit, urlunsplit
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share it.
+
+    Args:
+        name: Group name used in stats and reports.
+    """
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._lock = threading.Lock()
+        # key -> (future shared with waiters, ident of the leader thread)
+        self._inflight: Dict[Hashable, Tuple["Future[Any]", int]] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T], timeout: Optional[float] = None) -> T:
+        """Return ``fn()``, sharing one execution among concurrent callers of ``key``.
+
+        Waiters receive the leader's return value, or its exception re-raised.
+        A waiter whose leader is this thread (re-entrant call) runs ``fn``
+        itself rather than deadlocking.
+
+        Raises:
+            concurrent.futures.TimeoutError: If ``timeout`` passes while waiting.
+        """
+        me = threading.get_ident()
+        with self._lock:
+            self.calls += 1
+            entry = self._inflight.get(key)
+            if entry is not None and entry[1] != me:
+                self.coalesced += 1
+                shared = entry[0]
+            else:
+                self.executions += 1
+                shared = None
+                future: "Future[Any]" = Future()
+                if entry is None:
+                    self._inflight[key] = (future, me)
+        if shared is not None:
+            return shared.result(timeout)  # type: ignore[no-any-return]
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                entry = self._inflight.get(key)
+                if entry is not None and entry[0] is future:
+                    del self._inflight[key]
+
+    def in_flight(self) -> int:
+        """Number of keys currently being executed."""
+        with self._lock:
+            return len(self._inflight)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+            }
+
+    def reset(self) -> None:
+        """Zero the counters (in-flight calls are not affected)."""
+        with self._lock:
+            self.calls = self.executions = self.coalesced = 0
+
+
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def flight_group(name: str) -> SingleFlight:
+    """Process-wide group ``name``, created on first use."""
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = _groups[name] = SingleFlight(name)
+        return group
+
+
+def single_flight_stats() -> Dict[str, Dict[str, int]]:
+    """Counters of every named group, keyed by group name."""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {g.name: g.stats() for g in groups}
+
+
+def normalize_url(url: str) -> str:
+    """Coalescing key for a URL: lower-case scheme/host, no fragment or trailing slash."""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+def single_flight_delta(before: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    """Counters accumulated since ``before`` (a single_flight_stats() snapshot)."""
+    delta = {}
+    for name, now in single_flight_stats().items():
+        prev = before.get(name, {})
+        delta[name] = {k: v - prev.get(k, 0) for k, v in now.items()}
+    return delta
+
+
+def coalesce(name: str, key: Hashable, fn: Callable[[], T], enabled: bool = True) -> T:
+    """``flight_group(name).do(key, fn)``, or just ``fn()`` when disabled."""
+    if not enabled:
+        return fn()
+    return flight_group(name).do(key, fn)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Startup import-cost profiler
+
+Backs ``cuepoint --profile-startup``. Imports an entry module (the CLI's
+``main`` or the GUI's ``cuepoint.ui.main_window``) in a fresh interpreter
+with ``python -X importtime`` and reports which modules dominate the cost,
+so regressions from a new top-level import are easy to spot.
+
+Key functions:
+- parse_importtime(): Parse ``-X importtime`` stderr into ImportTiming rows
+- profile_imports(): Profile one entry module in a subprocess
+- format_report(): Human-readable top-N report
+- run_profile_cli(): Argument handling for ``--profile-startup``
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+CLI_ENTRY = "main"
+GUI_ENTRY = "cuepoint.ui.main_window"
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportTiming:
+    """One module from ``-X importtime`` (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    """Import timings for one entry module."""
+
+    entry: str
+    timings: List[ImportTiming] = field(default_factory=list)
+    wall_ms: float = 0.0
+
+    @property
+    def entry_ms(self) -> float:
+        """Cumulative import time of the entry module itself."""
+        for timing in self.timings:
+            if timing.module == self.entry and timing.depth == 0:
+                return timing.cumulative_us / 1000.0
+        return 0.0
+
+    @property
+    def total_ms(self) -> float:
+        """All top-level imports, including interpreter startup (site)."""
+        return sum(t.cumulative_us for t in self.timings if t.depth == 0) / 1000.0
+
+    def top(self, n: int = 20, by: str = "cumulative") -> List[ImportTiming]:
+        key = "self_us" if by == "self" else "cumulative_us"
+        return sorted(self.timings, key=lambda t: getattr(t, key), reverse=True)[:n]
+
+
+def parse_importtime(text: str) -> List[ImportTiming]:
+    """Parse ``-X importtime`` output; lines that are not timings are skipped."""
+    timings = []
+    for line in text.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=max(len(indent) - 1, 0) // 2,
+            )
+        )
+    return timings
+
+
+def profile_imports(
+    entry: str = CLI_ENTRY,
+    src_dir: Optional[Path] = None,
+    timeout: float = 120.0,
+) -> StartupProfile:
+    """Import ``entry`` in a fresh interpreter and collect import timings.
+
+    Args:
+        entry: Module to import (``main`` or ``cuepoint.ui.main_window``).
+        src_dir: Directory put on PYTHONPATH (defaults to this source tree).
+        timeout: Seconds to wait for the subprocess.
+
+    Raises:
+        RuntimeError: If the import fails in the subprocess.
+    """
+    src = src_dir or Path(__file__).resolve().parents[2]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(src), env.get("PYTHONPATH", "")) if p)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    cmd = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        f"import time; t = time.perf_counter(); import {entry}; "
+        "print((time.perf_counter() - t) * 1000.0)",
+    ]
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True, timeout=timeout)
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"Importing {entry} failed: {tail[0]}")
+    try:
+        wall_ms = float(proc.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        wall_ms = 0.0
+    return StartupProfile(entry=entry, timings=parse_importtime(proc.stderr), wall_ms=wall_ms)
+
+
+def format_report(profile: StartupProfile, top: int = 20) -> str:
+    """Top modules by cumulative and by self time."""
+    lines = [
+        f"Startup import profile: {profile.entry}",
+        f"  import {profile.entry}: {profile.entry_ms:.1f} ms "
+        f"(wall {profile.wall_ms:.1f} ms, all imports {profile.total_ms:.1f} ms)",
+        "",
+        f"  Top {top} by cumulative time:",
+    ]
+    for t in profile.top(top, by="cumulative"):
+        lines.append(f"    {t.cumulative_us / 1000.0:9.1f} ms  {t.module}")
+    lines += ["", f"  Top {top} by self time:"]
+    for t in profile.top(top, by="self"):
+        lines.append(f"    {t.self_us / 1000.0:9.1f} ms  {t.module}")
+    return "\n".join(lines)
+
+
+def run_profile_cli(argv: Sequence[str]) -> int:
+    """Entry point for ``main.py --profile-startup [--gui] [--top N] [--json]``."""
+    parser = argparse.ArgumentParser(prog="cuepoint --profile-startup")
+    parser.add_argument("--gui", action="store_true", help="Also profile the GUI main window")
+    parser.add_argument("--top", type=int, default=20, metavar="N")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args(list(argv))
+
+    if getattr(sys, "frozen", False):
+        print("--profile-startup needs a source checkout (not a packaged build)")
+        return 2
+
+    entries = [CLI_ENTRY] + ([GUI_ENTRY] if args.gui else [])
+    try:
+        profiles = [profile_imports(entry) for entry in entries]
+    except (RuntimeError, subprocess.TimeoutExpired) as e:
+        print(f"Error: {e}")
+        return 1
+
+    if args.json:
+        payload = [
+            {
+                "entry": p.entry,
+                "entry_ms": p.entry_ms,
+                "wall_ms": p.wall_ms,
+                "total_ms": p.total_ms,
+                "top": [asdict(t) for t in p.top(args.top)],
+            }
+            for p in profiles
+        ]
+        print(json.dumps(payload, indent=2))
+    else:
+        print("\n\n".join(format_report(p, args.top) for p in profiles))
+    return 0
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in span tracing with Chrome trace-event export.
+
+Records a per-track timeline of pipeline stages (query generation, search,
+fetch, parse, score, output writing) tagged with track index, query index
+and thread. The result is written as Chrome trace-event JSON and can be
+opened in Perfetto (ui.perfetto.dev) or chrome://tracing to see where a
+slow track spent its time, including time spent queued for a worker.
+
+Tracing is off by default. When disabled, ``span()`` returns a shared
+no-op context manager and ``traced`` functions call straight through, so
+the hot path pays a single attribute check.
+
+Example:
+    from cuepoint.utils.tracing import tracer, traced
+
+    tracer.enable()
+
+    @traced("parse")
+    def parse(html): ...
+
+    with tracer.context(track=3):
+        with tracer.span("search", query="artist title"):
+            ...
+
+    tracer.export_chrome_trace("output/trace.json")
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, TypeVar, cast
+
+DEFAULT_MAX_EVENTS = 200_000
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _NullSpan:
+    """No-op span returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Active span; records one complete ("X") event on exit."""
+
+    __slots__ = ("_tracer", "name", "args", "_start_ns")
+
+    def __init__(self, tracer: "Tracer", name: str, args: Dict[str, Any]):
+        self._tracer = tracer
+        self.name = name
+        self.args = args
+        self._start_ns = 0
+
+    def __enter__(self) -> "_Span":
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self._tracer._record(self.name, self._start_ns, time.perf_counter_ns(), self.args)
+
+    def set(self, **args: Any) -> None:
+        """Attach extra arguments (e.g. result counts) before the span ends."""
+        self.args.update(args)
+
+
+class Tracer:
+    """Collects spans from all threads into a bounded event buffer.
+
+    Tags set with ``context()``/``tag()`` are thread-local and are attached
+    to every span recorded on that thread. Use ``submit()`` (or
+    ``wrap()``) to carry the caller's tags into executor worker threads.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=DEFAULT_MAX_EVENTS)
+        self._threads: Dict[int, str] = {}
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._origin_ns = time.perf_counter_ns()
+        self.dropped = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def enable(self, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        """Start recording spans, discarding any previous events."""
+        with self._lock:
+            self._events = deque(maxlen=max_events)
+            self._threads = {}
+            self._origin_ns = time.perf_counter_ns()
+            self.dropped = 0
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording spans; already recorded events are kept."""
+        self.enabled = False
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Return a copy of the recorded complete events."""
+        with self._lock:
+            return list(self._events)
+
+    # ------------------------------------------------------------------
+    # Context tags
+    # ------------------------------------------------------------------
+
+    def current_context(self) -> Dict[str, Any]:
+        """Return the tags active on the calling thread."""
+        return dict(getattr(self._local, "tags", None) or {})
+
+    def tag(self, **tags: Any) -> None:
+        """Update tags on the calling thread (e.g. the current query index)."""
+        if not self.enabled:
+            return
+        current = getattr(self._local, "tags", None)
+        self._local.tags = {**(current or {}), **tags}
+
+    @contextmanager
+    def context(self, **tags: Any) -> Iterator[None]:
+        """Apply tags for the duration of a block, restoring previous tags."""
+        if not self.enabled:
+            yield
+            return
+        previous = getattr(self._local, "tags", None)
+        self._local.tags = {**(previous or {}), **tags}
+        try:
+            yield
+        finally:
+            self._local.tags = previous
+
+    # ------------------------------------------------------------------
+    # Spans
+    # ------------------------------------------------------------------
+
+    def span(self, name: str, **args: Any) -> Any:
+        """Return a context manager timing ``name`` (no-op when disabled)."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def wrap(
+        self,
+        fn: Callable[..., Any],
+        name: Optional[str] = None,
+        tags: Optional[Dict[str, Any]] = None,
+    ) -> Callable[..., Any]:
+        """Bind the caller's tags to ``fn`` so they apply in a worker thread.
+
+        When ``name`` is given, the delay between wrapping and the worker
+        starting is recorded as a ``queue_wait`` span. ``tags`` are merged
+        over the caller's tags (e.g. the track index of a submitted task).
+        """
+        if not self.enabled:
+            return fn
+        tags = {**self.current_context(), **(tags or {})}
+        queued_ns = time.perf_counter_ns()
+
+        @functools.wraps(fn)
+        def run(*args: Any, **kwargs: Any) -> Any:
+            with self.context(**tags):
+                if name is not None:
+                    self._record(
+                        "queue_wait", queued_ns, time.perf_counter_ns(), {"task": name}
+                    )
+                return fn(*args, **kwargs)
+
+        return run
+
+    def submit(
+        self,
+        executor: Executor,
+        fn: Callable[..., Any],
+        *args: Any,
+        name: Optional[str] = None,
+        tags: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """``executor.submit`` that propagates tags and records queue wait."""
+        if not self.enabled:
+            return executor.submit(fn, *args, **kwargs)
+        task = name or getattr(fn, "__name__", "task")
+        return executor.submit(self.wrap(fn, task, tags), *args, **kwargs)
+
+    def _record(self, name: str, start_ns: int, end_ns: int, args: Dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        tid = threading.get_ident()
+        tags = getattr(self._local, "tags", None)
+        if tags:
+            args = {**tags, **args}
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": (start_ns - self._origin_ns) / 1000.0,
+            "dur": (end_ns - start_ns) / 1000.0,
+            "pid": self._pid,
+            "tid": tid,
+            "args": args,
+        }
+        with self._lock:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+            if tid not in self._threads:
+                self._threads[tid] = thread.name
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Build the Chrome trace-event document for recorded spans."""
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+            dropped = self.dropped
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": tid,
+                "args": {"name": thread_name},
+            }
+            for tid, thread_name in threads.items()
+        ]
+        return {
+            "traceEvents": metadata + events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": dropped},
+        }
+
+    def export_chrome_trace(self, path: str) -> str:
+        """Write recorded spans as Chrome trace-event JSON and return the path."""
+        target = Path(path)
+        if target.parent and not target.parent.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+        return str(target)
+
+
+tracer = Tracer()
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator recording a span around each call when tracing is enabled.
+
+    Args:
+        name: Span name. Defaults to the function's ``__name__``.
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(tracer, span_name, {}):
+                return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
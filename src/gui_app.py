@@ -8,9 +8,15 @@ This is the main entry point for the CuePoint GUI application.
 Run this file to launch the graphical user interface.
 """
 
+import multiprocessing
 import os
 import sys
 
+if __name__ == "__main__":
+    # Frozen builds: let PARSE_PROCESSES worker processes start (a spawned
+    # worker runs its task and exits here instead of launching the GUI)
+    multiprocessing.freeze_support()
+
 # If a project-local virtualenv exists, re-exec into it so `python3 gui_app.py`
 # works without manual activation and uses a consistent, ship-ready runtime.
 if __name__ == "__main__":
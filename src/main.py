@@ -28,15 +28,6 @@ if __name__ == "__main__":
     if src_path not in sys.path:
         sys.path.insert(0, src_path)
 
-from cuepoint.cli.cli_processor import CLIProcessor
-from cuepoint.services.bootstrap import bootstrap_services
-from cuepoint.services.interfaces import (
-    IConfigService,
-    IExportService,
-    ILoggingService,
-    IProcessorService,
-)
-from cuepoint.utils.di_container import get_container
 from cuepoint.utils.errors import (
     error_config_invalid,
     error_file_not_found,
@@ -83,8 +74,8 @@ def main():
     Main CLI entry point
 
     This function:
-    1. Bootstraps services (dependency injection setup)
-    2. Sets up argument parser with all available options
+    1. Sets up argument parser with all available options
+    2. Bootstraps services (dependency injection setup) once arguments parse
     3. Applies configuration presets based on flags (--fast, --turbo, --myargs, etc.)
     4. Shows startup banner with configuration fingerprint
     5. Uses CLIProcessor (Phase 5 architecture) to execute the main processing logic
@@ -104,6 +95,12 @@ def main():
         )
         sys.exit(result.returncode)
 
+    # Import cost report - handle before full bootstrap (measures a fresh process)
+    if len(sys.argv) > 1 and sys.argv[1] == "--profile-startup":
+        from cuepoint.utils.startup_profile import run_profile_cli
+
+        sys.exit(run_profile_cli(sys.argv[2:]))
+
     # Step 12: Migrate subcommand - handle before full bootstrap
     if len(sys.argv) > 1 and sys.argv[1] == "migrate":
         migrate_parser = argparse.ArgumentParser(prog="cuepoint migrate")
@@ -124,24 +121,6 @@ def main():
         migrate_args = migrate_parser.parse_args(sys.argv[2:])
         sys.exit(_run_migrate(migrate_args))
 
-    # Bootstrap services (dependency injection setup)
-    bootstrap_services()
-
-    # Get services from DI container
-    container = get_container()
-    processor_service = container.resolve(IProcessorService)
-    export_service = container.resolve(IExportService)
-    config_service = container.resolve(IConfigService)
-    logging_service = container.resolve(ILoggingService)
-
-    # Create CLI processor
-    cli_processor = CLIProcessor(
-        processor_service=processor_service,
-        export_service=export_service,
-        config_service=config_service,
-        logging_service=logging_service,
-    )
-
     # Set up command-line argument parser with all available options
     ap = argparse.ArgumentParser(
         description="Enrich Rekordbox playlist with Beatport metadata (Accuracy + Logs + Candidates)"
@@ -260,6 +239,12 @@ def main():
         action="store_true",
         help="Benchmark mode: collect and save performance metrics to output dir",
     )
+    ap.add_argument(
+        "--trace-spans",
+        default=None,
+        metavar="PATH",
+        help="Record per-track stage spans and write a Chrome trace (open in Perfetto) to PATH",
+    )
     # Design 9: Data integrity - verify outputs
     ap.add_argument(
         "--verify-outputs",
@@ -334,6 +319,11 @@ def main():
         action="store_true",
         help="Generate maintenance report (dependencies, audit status) and exit",
     )
+    ap.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report per-module import cost of CLI/GUI startup and exit",
+    )
     ap.add_argument(
         "--checkpoint-every",
         type=int,
@@ -353,6 +343,36 @@ def main():
     if args.dry_run:
         args.preflight_only = True
 
+    # Services are bootstrapped only after argument parsing so that --help and
+    # argument errors do not pay for importing the processing stack.
+    from cuepoint.cli.cli_processor import CLIProcessor
+    from cuepoint.services.bootstrap import bootstrap_services
+    from cuepoint.services.interfaces import (
+        IConfigService,
+        IExportService,
+        ILoggingService,
+        IProcessorService,
+    )
+    from cuepoint.utils.di_container import get_container
+
+    # Bootstrap services (dependency injection setup)
+    bootstrap_services()
+
+    # Get services from DI container
+    container = get_container()
+    processor_service = container.resolve(IProcessorService)
+    export_service = container.resolve(IExportService)
+    config_service = container.resolve(IConfigService)
+    logging_service = container.resolve(ILoggingService)
+
+    # Create CLI processor
+    cli_processor = CLIProcessor(
+        processor_service=processor_service,
+        export_service=export_service,
+        config_service=config_service,
+        logging_service=logging_service,
+    )
+
     # Design 13.182: --export-support-bundle - generate support bundle and exit
     if getattr(args, "export_support_bundle", False):
         from cuepoint.utils.paths import AppPaths
@@ -686,6 +706,10 @@ def main():
     # 5. Optionally re-search unmatched tracks if --auto-research is enabled
     # Design 5.47: --resume wins over --no-resume when both given
     resume = args.resume and not args.no_resume
+    if args.trace_spans:
+        from cuepoint.utils.tracing import tracer
+
+        tracer.enable()
     try:
         cli_processor.process_playlist(
             xml_path=args.xml,
@@ -702,10 +726,18 @@ def main():
             benchmark_mode=args.benchmark,
         )
     finally:
+        if args.trace_spans:
+            trace_path = tracer.export_chrome_trace(args.trace_spans)
+            tracer.disable()
+            print(f"Trace: {trace_path}")
         # Design 7.53, 7.54: Print log path at end
         if log_path:
             print(f"Logs: {log_path}")
 
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    # Frozen builds: let PARSE_PROCESSES worker processes start
+    multiprocessing.freeze_support()
     main()
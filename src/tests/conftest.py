@@ -16,7 +16,7 @@ if _src_dir not in sys.path:
     sys.path.insert(0, _src_dir)
 
 from typing import Generator  # noqa: E402
-from unittest.mock import Mock  # noqa: E402
+from unittest.mock import Mock, patch  # noqa: E402
 
 import pytest  # noqa: E402
 
@@ -45,6 +45,15 @@ def pytest_sessionfinish(session, exitstatus):
         pass
 
 
+@pytest.fixture(autouse=True)
+def _no_persistent_caches():
+    """Keep the on-disk payload and negative caches out of tests (they reuse URLs and queries)."""
+    from cuepoint.models.config import SETTINGS
+
+    with patch.dict(SETTINGS, {"PAYLOAD_CACHE": False, "NEGATIVE_CACHE": False}):
+        yield
+
+
 @pytest.fixture(scope="function")
 def di_container() -> Generator[DIContainer, None, None]:
     """Create a fresh DI container for each test."""
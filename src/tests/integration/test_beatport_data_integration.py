@@ -9,10 +9,10 @@ from cuepoint.data.beatport import (
     _parse_next_data,
     _parse_structured_json_ld,
     ddg_track_urls,
-    get_last_cache_hit,
     is_track_url,
     parse_track_page,
     request_html,
+    request_html_ex,
     track_urls,
 )
 
@@ -41,10 +41,9 @@ class TestBeatportDataIntegration:
         assert is_track_url("not-a-url") is False
         assert is_track_url("") is False
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_with_json_ld(self, mock_request):
         """Test parsing track page with JSON-LD structured data."""
-        from bs4 import BeautifulSoup
 
         # Mock HTML with JSON-LD
         html_content = """
@@ -67,7 +66,7 @@ class TestBeatportDataIntegration:
         <body></body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -76,10 +75,9 @@ class TestBeatportDataIntegration:
         assert title == "Test Track"
         assert "Test Artist" in artists
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_with_next_data(self, mock_request):
         """Test parsing track page with Next.js __NEXT_DATA__."""
-        from bs4 import BeautifulSoup
 
         # Mock HTML with __NEXT_DATA__
         html_content = """
@@ -111,7 +109,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -121,42 +119,28 @@ class TestBeatportDataIntegration:
         assert isinstance(title, str)
         assert isinstance(artists, str)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_empty_html(self, mock_request):
         """Test parsing with empty HTML."""
-        from bs4 import BeautifulSoup
 
-        mock_request.return_value = BeautifulSoup("", "html.parser")
+        mock_request.return_value = ("", False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
         # Should return None or empty values
         assert result is None or all(v is None or v == "" for v in result)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_malformed_html(self, mock_request):
         """Test parsing with malformed HTML."""
-        from bs4 import BeautifulSoup
 
-        mock_request.return_value = BeautifulSoup(
-            "<html><body>Invalid content</body></html>", "html.parser"
-        )
+        mock_request.return_value = ("<html><body>Invalid content</body></html>", False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
         # Should handle gracefully
         assert result is None or isinstance(result, tuple)
 
-    def test_get_last_cache_hit(self):
-        """Test getting last cache hit status."""
-        # Reset cache hit
-        get_last_cache_hit()
-
-        # Should return False initially (no cache hit yet)
-        # Note: This depends on implementation
-        result = get_last_cache_hit()
-        assert isinstance(result, bool)
-
     def test_beatport_candidate_creation(self):
         """Test creating BeatportCandidate with all fields."""
         candidate = BeatportCandidate(
@@ -299,11 +283,11 @@ class TestBeatportDataIntegration:
 
         mock_get.return_value = mock_resp
 
-        result = request_html("https://www.beatport.com/track/test/123")
+        result, from_cache = request_html_ex("https://www.beatport.com/track/test/123")
 
         # Should detect cache hit
         assert result is not None
-        assert get_last_cache_hit() is True
+        assert from_cache is True
 
     @patch("requests.Session.get")
     def test_request_html_retry_on_failure(self, mock_get):
@@ -491,10 +475,9 @@ class TestBeatportDataIntegration:
         # Should extract from nested structure
         assert "title" in result or "artists" in result
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_combines_sources(self, mock_request):
         """Test parse_track_page combining JSON-LD and Next.js data."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -525,7 +508,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -535,10 +518,9 @@ class TestBeatportDataIntegration:
         assert isinstance(title, str)
         assert isinstance(artists, str)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_html_fallback_title(self, mock_request):
         """Test parse_track_page falling back to HTML for title."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -547,7 +529,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -556,10 +538,9 @@ class TestBeatportDataIntegration:
         # Should extract title from HTML
         assert "HTML Title Track" in title or len(title) > 0
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_html_fallback_artists(self, mock_request):
         """Test parse_track_page falling back to HTML for artists."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -572,7 +553,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -714,10 +695,9 @@ class TestBeatportDataIntegration:
         assert isinstance(result, dict)
         assert len(result) == 0
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_artists_byline(self, mock_request):
         """Test parse_track_page extracting artists from byline."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -728,7 +708,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -737,10 +717,9 @@ class TestBeatportDataIntegration:
         # Should extract artists from byline
         assert isinstance(artists, str)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_remixers_val_after_label(self, mock_request):
         """Test parse_track_page extracting remixers using val_after_label."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -752,7 +731,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -761,10 +740,9 @@ class TestBeatportDataIntegration:
         # Should extract remixers
         assert isinstance(result, tuple)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_key_bpm_val_after_label(self, mock_request):
         """Test parse_track_page extracting key and BPM using val_after_label."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -778,7 +756,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -787,10 +765,9 @@ class TestBeatportDataIntegration:
         # Should extract key and BPM
         assert isinstance(result, tuple)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_label_from_link(self, mock_request):
         """Test parse_track_page extracting label from link."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -799,7 +776,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -808,10 +785,9 @@ class TestBeatportDataIntegration:
         # Should extract label from link
         assert isinstance(result, tuple)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_label_val_after_label(self, mock_request):
         """Test parse_track_page extracting label using val_after_label."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -823,7 +799,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -832,10 +808,9 @@ class TestBeatportDataIntegration:
         # Should extract label
         assert isinstance(result, tuple)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_genres_from_links(self, mock_request):
         """Test parse_track_page extracting genres from links."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -845,7 +820,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -854,10 +829,9 @@ class TestBeatportDataIntegration:
         # Should extract genres from links
         assert isinstance(result, tuple)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_genres_val_after_label(self, mock_request):
         """Test parse_track_page extracting genres using val_after_label."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -869,7 +843,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -878,10 +852,9 @@ class TestBeatportDataIntegration:
         # Should extract genres
         assert isinstance(result, tuple)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_release_name_from_link(self, mock_request):
         """Test parse_track_page extracting release name from link."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -890,7 +863,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -899,10 +872,9 @@ class TestBeatportDataIntegration:
         # Should extract release name from link
         assert isinstance(result, tuple)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_release_name_val_after_label(self, mock_request):
         """Test parse_track_page extracting release name using val_after_label."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -914,7 +886,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -923,10 +895,9 @@ class TestBeatportDataIntegration:
         # Should extract release name
         assert isinstance(result, tuple)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_release_date_meta(self, mock_request):
         """Test parse_track_page extracting release date from meta tag."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -936,7 +907,7 @@ class TestBeatportDataIntegration:
         <body></body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -945,10 +916,9 @@ class TestBeatportDataIntegration:
         # Should extract release date from meta
         assert isinstance(result, tuple)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_remixers_merge_with_title(self, mock_request):
         """Test parse_track_page merging remixers from title."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -963,7 +933,7 @@ class TestBeatportDataIntegration:
         <body></body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -1019,11 +989,11 @@ class TestBeatportDataIntegration:
 
         mock_get.return_value = mock_resp
 
-        result = request_html("https://www.beatport.com/track/test/123")
+        result, from_cache = request_html_ex("https://www.beatport.com/track/test/123")
 
         # Should detect cache via _from_cache
         assert result is not None
-        assert get_last_cache_hit() is True
+        assert from_cache is True
 
     @patch("requests.Session.get")
     def test_request_html_compressed_encoding(self, mock_get):
@@ -1043,10 +1013,9 @@ class TestBeatportDataIntegration:
         # Should detect compressed encoding as empty body
         assert result is None
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_date_parsing_exception(self, mock_request):
         """Test parse_track_page handling date parsing exceptions."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -1058,7 +1027,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -1067,10 +1036,9 @@ class TestBeatportDataIntegration:
         # Should handle date parsing exception gracefully
         assert isinstance(result, tuple)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_meta_date_parsing_exception(self, mock_request):
         """Test parse_track_page handling meta date parsing exceptions."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -1080,7 +1048,7 @@ class TestBeatportDataIntegration:
         <body></body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -1693,10 +1661,9 @@ class TestBeatportDataIntegration:
         # Should detect deflate encoding as empty body
         assert result is None
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_val_after_label_exception(self, mock_request):
         """Test parse_track_page handling exceptions in val_after_label."""
-        from bs4 import BeautifulSoup
 
         html_content = """
         <html>
@@ -1707,7 +1674,7 @@ class TestBeatportDataIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (html_content, False)
 
         result = parse_track_page("https://www.beatport.com/track/test/123")
 
@@ -201,7 +201,7 @@ class TestBeatportSearchIntegration:
         assert isinstance(urls, list)
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_api_success(self, mock_request, mock_api):
         """Test direct search with API success."""
         # Mock API returning URLs
@@ -214,7 +214,7 @@ class TestBeatportSearchIntegration:
         assert len(urls) > 0
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_api_fallback(self, mock_request, mock_api):
         """Test direct search falling back to HTML when API fails."""
         from bs4 import BeautifulSoup
@@ -231,7 +231,7 @@ class TestBeatportSearchIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (BeautifulSoup(html_content, "html.parser"), False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=10)
 
@@ -413,14 +413,14 @@ class TestBeatportSearchIntegration:
         assert isinstance(urls, list)
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_html_none(self, mock_request, mock_api):
         """Test direct search when HTML request returns None."""
         # Mock API returning empty list
         mock_api.return_value = []
 
         # Mock HTML request returning None
-        mock_request.return_value = None
+        mock_request.return_value = (None, False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=10)
 
@@ -429,7 +429,7 @@ class TestBeatportSearchIntegration:
         assert len(urls) == 0
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_empty_href(self, mock_request, mock_api):
         """Test direct search with empty href attributes."""
         from bs4 import BeautifulSoup
@@ -446,7 +446,7 @@ class TestBeatportSearchIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (BeautifulSoup(html_content, "html.parser"), False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=10)
 
@@ -454,7 +454,7 @@ class TestBeatportSearchIntegration:
         assert isinstance(urls, list)
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_max_results_break(self, mock_request, mock_api):
         """Test direct search breaking at max_results."""
         from bs4 import BeautifulSoup
@@ -476,7 +476,7 @@ class TestBeatportSearchIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (BeautifulSoup(html_content, "html.parser"), False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=5)
 
@@ -484,7 +484,7 @@ class TestBeatportSearchIntegration:
         assert len(urls) <= 5
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_next_data_parsing(self, mock_request, mock_api):
         """Test direct search parsing __NEXT_DATA__."""
         from bs4 import BeautifulSoup
@@ -502,7 +502,7 @@ class TestBeatportSearchIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (BeautifulSoup(html_content, "html.parser"), False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=10)
 
@@ -510,7 +510,7 @@ class TestBeatportSearchIntegration:
         assert isinstance(urls, list)
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_next_data_exception(self, mock_request, mock_api):
         """Test direct search handling __NEXT_DATA__ parsing exception."""
         from bs4 import BeautifulSoup
@@ -528,7 +528,7 @@ class TestBeatportSearchIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (BeautifulSoup(html_content, "html.parser"), False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=10)
 
@@ -536,7 +536,7 @@ class TestBeatportSearchIntegration:
         assert isinstance(urls, list)
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_script_regex(self, mock_request, mock_api):
         """Test direct search extracting URLs from script tags via regex."""
         from bs4 import BeautifulSoup
@@ -555,7 +555,7 @@ class TestBeatportSearchIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (BeautifulSoup(html_content, "html.parser"), False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=10)
 
@@ -563,7 +563,7 @@ class TestBeatportSearchIntegration:
         assert isinstance(urls, list)
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_data_attributes(self, mock_request, mock_api):
         """Test direct search extracting from data attributes."""
         from bs4 import BeautifulSoup
@@ -580,7 +580,7 @@ class TestBeatportSearchIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (BeautifulSoup(html_content, "html.parser"), False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=10)
 
@@ -588,7 +588,7 @@ class TestBeatportSearchIntegration:
         assert isinstance(urls, list)
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_exception_handling(self, mock_request, mock_api):
         """Test direct search exception handling."""
         # Mock API raising exception
@@ -639,7 +639,8 @@ class TestBeatportSearchIntegration:
 
     def test_beatport_search_browser_playwright_success(self):
         """Test browser search with Playwright success."""
-        # Build mock structure: sync_playwright() -> context manager -> p.chromium.launch() -> browser
+        # Build mock structure: sync_playwright().start() -> p.chromium.launch() -> browser
+        # -> browser.new_context() -> context.new_page() -> page
         mock_page = Mock()
         mock_link1 = Mock()
         mock_link1.get_attribute.return_value = "/track/test-track/123456"
@@ -648,14 +649,13 @@ class TestBeatportSearchIntegration:
         mock_page.query_selector_all.return_value = [mock_link1, mock_link2]
 
         mock_browser = Mock()
-        mock_browser.new_page.return_value = mock_page
+        mock_browser.new_context.return_value.new_page.return_value = mock_page
 
         mock_p = Mock()
         mock_p.chromium.launch.return_value = mock_browser
 
         mock_sync_playwright = MagicMock()
-        mock_sync_playwright.return_value.__enter__.return_value = mock_p
-        mock_sync_playwright.return_value.__exit__.return_value = None
+        mock_sync_playwright.return_value.start.return_value = mock_p
 
         # Inject fake playwright.sync_api so "from playwright.sync_api import sync_playwright" works
         fake_playwright = MagicMock()
@@ -669,9 +669,13 @@ class TestBeatportSearchIntegration:
             with patch("cuepoint.data.beatport_search._PLAYWRIGHT_USABLE", True):
                 urls = beatport_search_browser(1, "Test Track", max_results=10)
 
-        # Should return URLs from Playwright
-        assert isinstance(urls, list)
+        # Should return URLs from Playwright; one-shot browser is closed (no pool active)
+        assert urls == [
+            "https://www.beatport.com/track/test-track/123456",
+            "https://www.beatport.com/track/another-track/123457",
+        ]
         mock_browser.close.assert_called_once()
+        mock_p.stop.assert_called_once()
 
     def test_beatport_search_browser_no_browser_libs(self):
         """Test browser search when neither Playwright nor Selenium are available."""
@@ -1000,7 +1004,7 @@ class TestBeatportSearchIntegration:
         assert isinstance(urls, list)
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_empty_href_line_310(self, mock_request, mock_api):
         """Test direct search skipping empty href - line 310."""
         from bs4 import BeautifulSoup
@@ -1017,7 +1021,7 @@ class TestBeatportSearchIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (BeautifulSoup(html_content, "html.parser"), False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=10)
 
@@ -1025,7 +1029,7 @@ class TestBeatportSearchIntegration:
         assert isinstance(urls, list)
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_script_regex_max_results_345(
         self, mock_request, mock_api
     ):
@@ -1048,7 +1052,7 @@ class TestBeatportSearchIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (BeautifulSoup(html_content, "html.parser"), False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=5)
 
@@ -1056,7 +1060,7 @@ class TestBeatportSearchIntegration:
         assert len(urls) <= 5
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_relative_path_max_results_357(
         self, mock_request, mock_api
     ):
@@ -1079,7 +1083,7 @@ class TestBeatportSearchIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (BeautifulSoup(html_content, "html.parser"), False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=5)
 
@@ -1087,7 +1091,7 @@ class TestBeatportSearchIntegration:
         assert len(urls) <= 5
 
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_data_attributes_max_results_372(
         self, mock_request, mock_api
     ):
@@ -1111,7 +1115,7 @@ class TestBeatportSearchIntegration:
         </body>
         </html>
         """
-        mock_request.return_value = BeautifulSoup(html_content, "html.parser")
+        mock_request.return_value = (BeautifulSoup(html_content, "html.parser"), False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=5)
 
@@ -62,7 +62,7 @@ class TestImportIdempotent:
         assert second_stats["total"] == 10
 
 
-def _mock_parse_track_page_integration(url: str):
+def _mock_parse_track_page_integration(url: str, settings=None):
     """Return (title, artists, key, year, bpm, label, genres, rel_name, rel_date)."""
     return ("Track 1", "Artist 1", None, None, None, "Test Label", None, None, None)
 
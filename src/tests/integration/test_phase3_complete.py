@@ -44,9 +44,9 @@ def test_imports():
         pytest.fail(f"output_writer.py write_performance_report import failed: {e}")
 
     try:
-        print("[OK] beatport.py get_last_cache_hit import successful")
+        print("[OK] beatport.py request_html_ex import successful")
     except Exception as e:
-        pytest.fail(f"beatport.py get_last_cache_hit import failed: {e}")
+        pytest.fail(f"beatport.py request_html_ex import failed: {e}")
 
     try:
         print("[OK] matcher.py imports successful")
@@ -218,17 +218,17 @@ def test_cache_tracking():
     print("Test 5: Cache Hit Tracking")
     print("=" * 80)
 
-    from cuepoint.data.beatport import get_last_cache_hit
+    from cuepoint.data.negative_cache import SearchOutcome
 
-    # Test that function exists and returns a boolean
+    # Test that a search outcome reports whether its answers came from cache
     try:
-        cache_hit = get_last_cache_hit()
-        assert isinstance(cache_hit, bool), (
-            f"get_last_cache_hit() returned {type(cache_hit)}, expected bool"
-        )
-        print(f"[OK] get_last_cache_hit() returns boolean: {cache_hit}")
+        outcome = SearchOutcome()
+        outcome.note_answered(from_cache=True)
+        cache_hit = outcome.from_cache
+        assert cache_hit is True, f"SearchOutcome.from_cache returned {cache_hit!r}"
+        print(f"[OK] SearchOutcome.from_cache returns boolean: {cache_hit}")
     except Exception as e:
-        pytest.fail(f"get_last_cache_hit() failed: {e}")
+        pytest.fail(f"SearchOutcome.from_cache failed: {e}")
 
 
 def test_query_classification():
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Per-track logging overhead benchmark.
+
+Eight worker threads each log what process_track() logs for a track (two INFO
+lines, three DEBUG lines below the level, a structured extra) to the rotating
+log file: first with the handlers called on the worker threads, then with
+them behind the queue listener. Reported is the time the workers spend in
+logging calls per track; with the queue, sanitising, formatting and file
+writes leave the workers.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cuepoint.services.logging_service import LoggingService
+from cuepoint.utils.logger import stop_queue_logging
+
+TRACKS = 2000
+WORKERS = 8
+
+
+def _log_track(service, idx):
+    start = time.perf_counter()
+    service.info("[%s] Processing: %s - %s", idx, "Never Sleep Again", "Solomun")
+    service.debug("[%s] Artists inferred from title for scoring; search is title-only", idx)
+    service.debug("[%s] Stopped at q%s (%d queries generated)", idx, 3, 12)
+    service.debug("[%s] fetched %s", idx, "https://www.beatport.com/track/nsa/1")
+    service.info(
+        "[%s] Match found: %s - %s (score: %.1f)",
+        idx,
+        "Never Sleep Again",
+        "Solomun",
+        97.25,
+        extra={"track_id": idx, "token": "secret"},
+    )
+    return time.perf_counter() - start
+
+
+def _per_track_us(tmp_path, queue_logging):
+    service = LoggingService(
+        log_dir=tmp_path,
+        enable_console_logging=False,
+        logger_name=f"cuepoint.bench_logging.{queue_logging}",
+        queue_logging=queue_logging,
+    )
+    try:
+        with ThreadPoolExecutor(max_workers=WORKERS) as workers:
+            spent = sum(workers.map(lambda i: _log_track(service, i), range(TRACKS)))
+    finally:
+        stop_queue_logging(service.logger)
+        for handler in list(service.logger.handlers):
+            handler.close()
+            service.logger.removeHandler(handler)
+    text = (tmp_path / "cuepoint.log").read_text(encoding="utf-8")
+    assert text.count("Match found") == TRACKS
+    assert "secret" not in text
+    return spent / TRACKS * 1e6
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+class TestLoggingOverheadBenchmark:
+    """Benchmark worker-side logging cost per track, direct vs queued handlers."""
+
+    def test_logging_overhead_per_track(self, tmp_path):
+        """Queued logging costs the workers less than writing the file themselves."""
+        direct_us = _per_track_us(tmp_path / "direct", queue_logging=False)
+        queued_us = _per_track_us(tmp_path / "queued", queue_logging=True)
+        print(
+            f"\n[Benchmark] logging per track ({TRACKS} tracks, {WORKERS} threads, "
+            f"level {logging.getLevelName(logging.INFO)}):\n"
+            f"  direct handlers: {direct_us:7.1f} us\n"
+            f"  queue listener:  {queued_us:7.1f} us ({direct_us / queued_us:.1f}x)"
+        )
+        assert queued_us < direct_us
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Track page parsing benchmark: JSON fast path vs BeautifulSoup.
+
+The saved track page fixture is padded with repeated markup and scripts to
+the ~500 KB of a live Beatport page, then parsed both by slicing out the JSON
+payloads (parse_track_json) and by building a BeautifulSoup tree first
+(parse_track_soup), which is what every candidate page used to cost.
+"""
+
+import time
+
+import pytest
+from bs4 import BeautifulSoup
+
+from cuepoint.data.beatport import parse_track_json, parse_track_soup
+from tests.fixtures import load_fixture
+
+ROUNDS = 5
+PAGE_BYTES = 500_000
+
+FILLER = (
+    '<div class="track-row"><a href="/artist/someone/1">Someone</a>'
+    '<span class="meta">Label &amp; Genre</span><img src="/img/1.jpg" alt="" /></div>\n'
+    '<script>self.__next_f.push([1,"chunk of serialised component state"])</script>\n'
+)
+
+
+def _saved_page() -> str:
+    html = load_fixture("beatport/track_page_next_data.html")
+    pad = FILLER * (PAGE_BYTES // len(FILLER))
+    return html.replace("</main>", "</main>\n" + pad, 1)
+
+
+def _time(fn, html: str) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn(html)
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+class TestPageParseBenchmark:
+    """Benchmark the JSON fast path against soup parsing of a track page."""
+
+    def test_json_fast_path_vs_soup(self):
+        """Slicing the payloads out is much cheaper than building the tree."""
+        html = _saved_page()
+        assert parse_track_json(html) == parse_track_soup(BeautifulSoup(html, "lxml"))
+
+        soup_ms = _time(lambda h: parse_track_soup(BeautifulSoup(h, "lxml")), html)
+        json_ms = _time(parse_track_json, html)
+
+        print(
+            f"\n[Benchmark] track page parsing, {len(html) // 1024} KB page:\n"
+            f"  BeautifulSoup + parse_track_soup: {soup_ms:.2f} ms/page\n"
+            f"  JSON fast path (parse_track_json): {json_ms:.2f} ms/page "
+            f"({soup_ms / max(json_ms, 1e-6):.0f}x)"
+        )
+        assert json_ms * 5 < soup_ms
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Parse process pool scaling benchmark.
+
+Sixteen ~100 KB track pages are parsed with BeautifulSoup (the JSON fast path
+off, i.e. the expensive fallback) by eight concurrent fetcher threads: first
+in-process, where the GIL serialises them, then on ParsePool with 1, 2, 4
+and 8 worker processes. The speed-up is only asserted when the machine has
+the cores for it.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cuepoint.data.beatport import parse_track_html
+from cuepoint.data.parse_pool import ParsePool
+from tests.fixtures import load_fixture
+
+PAGES = 16
+FETCH_THREADS = 8
+PAGE_BYTES = 100_000
+
+FILLER = (
+    '<div class="track-row"><a href="/artist/someone/1">Someone</a>'
+    '<span class="meta">Label &amp; Genre</span><img src="/img/1.jpg" alt="" /></div>\n'
+)
+
+
+def _pages():
+    html = load_fixture("beatport/track_page_next_data.html")
+    pad = FILLER * (PAGE_BYTES // len(FILLER))
+    return [html.replace("</main>", f"</main>\n<!-- {n} -->\n{pad}", 1) for n in range(PAGES)]
+
+
+def _run(parse, pages):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=FETCH_THREADS) as fetchers:
+        results = list(fetchers.map(parse, pages))
+    return time.perf_counter() - start, results
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+class TestParsePoolBenchmark:
+    """Benchmark soup parsing in-process vs on 1/2/4/8 worker processes."""
+
+    def test_parse_pool_scaling(self):
+        """Parsing throughput grows with worker processes (given the cores)."""
+        pages = _pages()
+        inline_sec, expected = _run(lambda h: parse_track_html(h, json_fast_path=False), pages)
+
+        timings = {}
+        for processes in (1, 2, 4, 8):
+            pool = ParsePool(processes)
+            try:
+                pool.warm_up()
+                timings[processes], results = _run(lambda h: pool.parse(h, False), pages)
+            finally:
+                pool.close()
+            assert results == expected
+
+        lines = "\n".join(
+            f"  {n} process(es): {PAGES / sec:6.1f} pages/s ({inline_sec / sec:.1f}x)"
+            for n, sec in timings.items()
+        )
+        print(
+            f"\n[Benchmark] soup parsing of {PAGES} x {PAGE_BYTES // 1000} KB pages from "
+            f"{FETCH_THREADS} threads, {os.cpu_count()} CPU(s):\n"
+            f"  in-process (GIL): {PAGES / inline_sec:6.1f} pages/s\n{lines}"
+        )
+        if (os.cpu_count() or 1) >= 4:
+            assert timings[4] * 1.5 < timings[1]
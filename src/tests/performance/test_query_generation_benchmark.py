@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Query generation benchmark for tracks with many credited artists.
+
+Compares exhausting the query stream without a stage budget (what eager
+generation used to cost on every track) with pulling only the queries a
+matcher typically executes before an early exit, and with the default
+MAX_QUERIES_PER_TRACK cap.
+"""
+
+import time
+from itertools import islice
+
+import pytest
+
+from cuepoint.core.query_generator import iter_search_queries, make_search_queries
+
+MULTI_ARTIST_TRACKS = [
+    ("Batonga (Extended Mix)", "Bontan, AMEME, Don Bello, Ni"),
+    ("Tighter (CamelPhat Remix)", "HOSH, CamelPhat, 1979, Jalja, Kyle Walker"),
+    (
+        "Sun Goes Down (Original Mix)",
+        "Fred again.., Obongjayar, Anna Lunoe, Kettama, Joy Anonymous, Skrillex",
+    ),
+    ("Higher Love (Keinemusik Remix)", "&ME, Rampa, Adam Port, Kerala Dust, Sofie"),
+]
+
+ROUNDS = 50
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for title, artists in MULTI_ARTIST_TRACKS:
+            fn(title, artists)
+    return (time.perf_counter() - start) / (ROUNDS * len(MULTI_ARTIST_TRACKS)) * 1000
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+class TestQueryGenerationBenchmark:
+    """Benchmark lazy query generation on 4-6 artist tracks."""
+
+    def test_lazy_stream_vs_eager_generation(self):
+        """Early-exit consumers pay a fraction of full generation."""
+        full_ms = _time(
+            lambda t, a: list(iter_search_queries(t, a, original_title=t, stage_budget=0))
+        )
+        budgeted_ms = _time(lambda t, a: list(iter_search_queries(t, a, original_title=t)))
+        capped_ms = _time(lambda t, a: make_search_queries(t, a, original_title=t))
+        early_exit_ms = _time(
+            lambda t, a: list(islice(iter_search_queries(t, a, original_title=t), 5))
+        )
+        sizes = [
+            len(list(iter_search_queries(t, a, original_title=t, stage_budget=0)))
+            for t, a in MULTI_ARTIST_TRACKS
+        ]
+
+        print(
+            f"\n[Benchmark] query generation, {len(MULTI_ARTIST_TRACKS)} tracks with 4-6 "
+            f"artists ({min(sizes)}-{max(sizes)} queries unbudgeted):\n"
+            f"  full stream, no budget: {full_ms:.2f} ms/track\n"
+            f"  full stream, budgeted:  {budgeted_ms:.2f} ms/track\n"
+            f"  capped (make_search_queries): {capped_ms:.2f} ms/track\n"
+            f"  first 5 queries (early exit): {early_exit_ms:.2f} ms/track"
+        )
+        assert early_exit_ms < full_ms
+        assert capped_ms < full_ms
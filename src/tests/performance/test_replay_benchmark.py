@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Offline replay benchmark smoke test.
+
+Runs the real pipeline (search, parse, scoring) for a small synthetic
+playlist through scripts/bench.py's replay harness and checks the reported
+metrics and accuracy against the synthetic golden file.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "scripts"))
+
+from bench import load_golden, run_replay_benchmark  # noqa: E402
+from cuepoint.models.config import SETTINGS  # noqa: E402
+
+
+@pytest.fixture
+def playlist_xml(tmp_path):
+    """Five-track playlist shaped like the benchmark_*.xml fixtures."""
+    tracks = "".join(
+        f'<TRACK TrackID="{i}" Name="Track {i}" Artist="Artist {i}"/>' for i in range(1, 6)
+    )
+    refs = "".join(f'<TRACK Key="{i}"/>' for i in range(1, 6))
+    xml = tmp_path / "replay.xml"
+    xml.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?><DJ_PLAYLISTS Version="1.0.0">'
+        f"<COLLECTION>{tracks}</COLLECTION><PLAYLISTS><NODE Name=\"ROOT\">"
+        f'<NODE Name="Replay" Type="1">{refs}</NODE></NODE></PLAYLISTS></DJ_PLAYLISTS>',
+        encoding="utf-8",
+    )
+    return xml
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestReplayBenchmark:
+    """Test the offline replay benchmark harness."""
+
+    def test_synthesize_then_replay(self, playlist_xml, tmp_path):
+        """First run fills the store; second run replays it with full accuracy."""
+        store = tmp_path / "store"
+        first = run_replay_benchmark(
+            playlist_xml, store, synthesize=True, output_dir=tmp_path / "out1"
+        )
+        assert first["tracks"] == 5
+        assert first["accuracy"] == 1.0
+        assert len(load_golden(store / "golden.json")) == 5
+
+        ddg_enabled = SETTINGS["DDG_ENABLED"]
+        second = run_replay_benchmark(playlist_xml, store, output_dir=tmp_path / "out2")
+        # Replay settings go to the run's snapshot, not the global SETTINGS
+        assert SETTINGS["DDG_ENABLED"] == ddg_enabled
+        assert second["accuracy"] == 1.0
+        assert second["http"]["misses"] == 0
+        assert second["http"]["synthesized"] == 0
+        assert second["p95_track_sec"] >= second["p50_track_sec"] > 0
+        assert second["rss_mb_peak"] > 0
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Startup performance regression tests.
+
+Imports the CLI entry point in a fresh interpreter and checks it against the
+"startup" budget, and that heavy optional dependencies stay deferred.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cuepoint.utils.startup_profile import CLI_ENTRY, profile_imports
+from tests.performance.performance_budgets import PERFORMANCE_BUDGETS
+
+SRC_DIR = Path(__file__).resolve().parents[2]
+
+DEFERRED_MODULES = ("bs4", "ddgs", "openpyxl", "requests_cache", "dateutil")
+
+
+@pytest.mark.performance
+def test_cli_import_within_startup_budget():
+    """Importing main (what ``--help`` pays) stays inside the startup budget."""
+    budget = PERFORMANCE_BUDGETS["startup"]
+    profile = profile_imports(CLI_ENTRY, src_dir=SRC_DIR)
+    assert profile.entry_ms > 0
+    assert profile.wall_ms < budget.target_ms, (
+        f"import main took {profile.wall_ms:.0f} ms "
+        f"(budget {budget.target_ms:.0f} ms); "
+        f"slowest: {[t.module for t in profile.top(5)]}"
+    )
+
+
+@pytest.mark.performance
+def test_heavy_dependencies_not_imported_at_startup():
+    """bs4, ddgs, openpyxl, requests-cache and dateutil load on first use only."""
+    code = (
+        "import sys, main, cuepoint.data.beatport, cuepoint.services.output_writer, "
+        "cuepoint.utils.http_cache; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(SRC_DIR),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == ""
@@ -0,0 +1,96 @@
+"""Tests for background XML loading in PlaylistSelector."""
+
+from pathlib import Path
+
+import pytest
+
+from cuepoint.ui.widgets.playlist_selector import PlaylistSelector
+
+_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<DJ_PLAYLISTS Version="1.0.0">
+  <COLLECTION Entries="2">
+    <TRACK TrackID="1" Name="Track 1" Artist="Artist 1"/>
+    <TRACK TrackID="2" Name="Track 2" Artist="Artist 2"/>
+  </COLLECTION>
+  <PLAYLISTS>
+    <NODE Type="0" Name="ROOT" Count="2">
+      <NODE Type="0" Name="House" Count="1">
+        <NODE Type="1" Name="Deep" KeyType="0" Entries="2">
+          <TRACK Key="1"/><TRACK Key="2"/>
+        </NODE>
+      </NODE>
+      <NODE Type="1" Name="Warmup" KeyType="0" Entries="1">
+        <TRACK Key="2"/>
+      </NODE>
+    </NODE>
+  </PLAYLISTS>
+</DJ_PLAYLISTS>
+"""
+
+
+@pytest.fixture
+def xml_path(tmp_path: Path) -> str:
+    path = tmp_path / "collection.xml"
+    path.write_text(_XML, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def selector(qapp):
+    widget = PlaylistSelector()
+    yield widget
+    widget.clear()
+
+
+def test_async_load_streams_tree_and_finishes(selector, xml_path, qtbot):
+    """Background load fills the tree, enables the trigger and reports the count."""
+    with qtbot.waitSignal(selector.loading_finished, timeout=5000) as blocker:
+        selector.load_xml_file_async(xml_path)
+        assert selector.is_loading()
+    assert blocker.args == [2]
+    assert not selector.is_loading()
+    assert selector._arrow_btn.isEnabled()
+    root = selector.get_tree_roots()[0]
+    assert [c["name"] for c in root["children"]] == ["House", "Warmup"]
+    assert selector.get_playlist_track_count("ROOT/House/Deep") == 2
+
+
+def test_async_load_matches_sync_load(selector, xml_path, qtbot):
+    """Both load paths produce the same tree and playlists."""
+    selector.load_xml_file(xml_path)
+    sync_roots = selector.get_tree_roots()
+    sync_keys = list(selector.playlists)
+    with qtbot.waitSignal(selector.loading_finished, timeout=5000):
+        selector.load_xml_file_async(xml_path)
+    assert selector.get_tree_roots() == sync_roots
+    assert list(selector.playlists) == sync_keys
+
+
+def test_async_load_missing_file_fails(selector, tmp_path, qtbot):
+    """A missing file is reported through loading_failed."""
+    with qtbot.waitSignal(selector.loading_failed, timeout=5000):
+        selector.load_xml_file_async(str(tmp_path / "missing.xml"))
+    assert not selector.is_loading()
+    assert not selector._arrow_btn.isEnabled()
+
+
+def test_cancel_discards_partial_load(selector, xml_path, qtbot):
+    """Cancelling stops the worker and leaves an empty selector."""
+    with qtbot.waitSignal(selector.loading_cancelled, timeout=5000):
+        selector.load_xml_file_async(xml_path)
+        selector.cancel_loading()
+    assert not selector.is_loading()
+    assert selector.get_tree_roots() == []
+    assert len(selector.playlists) == 0
+    # Signals queued by the cancelled thread are ignored
+    qtbot.wait(50)
+    assert selector.get_tree_roots() == []
+
+
+def test_track_count_comes_from_the_index(selector, xml_path, qtbot):
+    """Counting tracks does not build the playlist's Track objects."""
+    with qtbot.waitSignal(selector.loading_finished, timeout=5000):
+        selector.load_xml_file_async(xml_path)
+    assert selector.get_playlist_track_count("ROOT/Warmup") == 1
+    assert selector.get_playlist_track_count("ROOT/Missing") == 0
+    assert selector.playlists._built == {}
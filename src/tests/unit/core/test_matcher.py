@@ -298,6 +298,111 @@ class TestMatcherHelpers:
 class TestBestBeatportMatch:
     """Test best_beatport_match function."""
 
+    @patch("cuepoint.core.matcher.track_urls")
+    def test_settings_snapshot_reaches_track_urls(self, mock_track_urls):
+        """A settings snapshot replaces global SETTINGS for the whole search."""
+        from cuepoint.models.run_settings import RunSettings
+
+        mock_track_urls.return_value = []
+        settings = RunSettings.resolve().replace(
+            ADAPTIVE_MAX_RESULTS=False, MAX_SEARCH_RESULTS=7, RUN_ALL_QUERIES=True
+        )
+
+        best_beatport_match(
+            idx=1,
+            track_title="Test Track",
+            track_artists_for_scoring="Test Artist",
+            title_only_mode=False,
+            queries=["Test Track Test Artist", "Test Track"],
+            settings=settings,
+        )
+
+        assert mock_track_urls.call_count == 2
+        for call in mock_track_urls.call_args_list:
+            assert call.kwargs["max_results"] == 7
+            assert call.kwargs["settings"] is settings
+
+    @patch("cuepoint.core.matcher.track_urls")
+    @patch("cuepoint.core.matcher.parse_track_page")
+    @patch("cuepoint.core.matcher.get_fetch_engine")
+    def test_asyncio_engine_fetches_candidates(
+        self, mock_get_engine, mock_parse, mock_track_urls
+    ):
+        """With FETCH_ENGINE=asyncio candidate pages go through the engine."""
+        from concurrent.futures import Future
+
+        from cuepoint.models.run_settings import RunSettings
+
+        html = (
+            '<script type="application/ld+json">{"@type": "MusicRecording", '
+            '"name": "Test Track", "byArtist": {"name": "Test Artist"}}</script>'
+        )
+        submitted = []
+
+        def submit(url, parse):
+            submitted.append(url)
+            fut = Future()
+            fut.set_result(parse(html))
+            return fut
+
+        mock_get_engine.return_value.submit.side_effect = submit
+        mock_track_urls.return_value = [
+            "https://www.beatport.com/track/test-track/123456"
+        ]
+        settings = RunSettings.resolve().replace(FETCH_ENGINE="asyncio")
+
+        best, candidates, _, _ = best_beatport_match(
+            idx=1,
+            track_title="Test Track",
+            track_artists_for_scoring="Test Artist",
+            title_only_mode=False,
+            queries=["Test Track Test Artist"],
+            settings=settings,
+        )
+
+        mock_get_engine.assert_called_with(settings)
+        assert submitted == ["https://www.beatport.com/track/test-track/123456"]
+        mock_parse.assert_not_called()
+        assert best is not None and best.title == "Test Track"
+
+    @patch("cuepoint.core.matcher.track_urls")
+    @patch("cuepoint.core.matcher.parse_track_page")
+    def test_slug_prescore_fetches_promising_pages_only(
+        self, mock_parse, mock_track_urls
+    ):
+        """Pages are fetched best slug first; hopeless slugs are not fetched."""
+        from cuepoint.models.run_settings import RunSettings
+
+        good = "https://www.beatport.com/track/test-track/2"
+        mock_track_urls.return_value = [
+            "https://www.beatport.com/track/something-else-entirely/1",
+            good,
+        ]
+        mock_parse.return_value = (
+            "Test Track",
+            "Test Artist",
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+        )
+        settings = RunSettings.resolve().replace(CANDIDATE_WORKERS=1)
+
+        best, _, _, _ = best_beatport_match(
+            idx=1,
+            track_title="Test Track",
+            track_artists_for_scoring="Test Artist",
+            title_only_mode=False,
+            queries=["Test Track Test Artist"],
+            settings=settings,
+        )
+
+        assert [c.args[0] for c in mock_parse.call_args_list] == [good]
+        assert best is not None and best.url == good
+
     @patch("cuepoint.core.matcher.track_urls")
     @patch("cuepoint.core.matcher.parse_track_page")
     def test_best_beatport_match_finds_match(
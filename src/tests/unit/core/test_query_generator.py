@@ -9,6 +9,7 @@ from cuepoint.core.query_generator import (
     _ordered_unique,
     _subset_join,
     _title_prefixes,
+    iter_search_queries,
     make_search_queries,
 )
 
@@ -634,3 +635,66 @@ class TestMakeSearchQueriesSettings:
         )
         # Should use first 3 artists for extended mix
         assert len(queries) > 0
+
+
+class TestIterSearchQueries:
+    """Test the lazy, budgeted query generator."""
+
+    def test_prefix_matches_make_search_queries(self):
+        """The lazy stream yields make_search_queries' queries in order."""
+        from itertools import islice
+
+        title, artists = "Tighter (CamelPhat Remix)", "HOSH, CamelPhat, 1979, A, B"
+        eager = make_search_queries(title, artists, original_title=title, max_queries=0)
+        lazy = list(
+            islice(iter_search_queries(title, artists, original_title=title, stage_budget=0), 60)
+        )
+        assert lazy == eager[:60]
+
+    def test_stage_budget_trims_combinatorial_tail(self):
+        """A stage budget keeps the head of the stream and drops only queries."""
+        title, artists = "Batonga (Extended Mix)", "Bontan, AMEME, Don Bello, Ni, Foo, Bar"
+        full = list(iter_search_queries(title, artists, original_title=title, stage_budget=0))
+        budgeted = list(
+            iter_search_queries(title, artists, original_title=title, stage_budget=50)
+        )
+        assert len(budgeted) < len(full)
+        assert budgeted[:40] == full[:40]
+        assert set(budgeted) <= set(full)
+
+
+class TestQuerySettings:
+    """Queries follow the settings snapshot passed in, not global SETTINGS."""
+
+    TITLE = "Sun Goes Down Tonight (Extended Mix)"
+    ARTISTS = "Fred again.., Obongjayar"
+
+    def _queries(self, settings):
+        return make_search_queries(
+            self.TITLE, self.ARTISTS, original_title=self.TITLE, settings=settings
+        )
+
+    def test_snapshot_overrides_global_settings(self):
+        from cuepoint.models.run_settings import RunSettings
+
+        base = RunSettings.resolve().replace(
+            MAX_QUERIES_PER_TRACK=0, REVERSE_ORDER_QUERIES=False
+        )
+        plain = self._queries(base)
+        reversed_too = self._queries(base.replace(REVERSE_ORDER_QUERIES=True))
+        assert len(reversed_too) > len(plain)
+        assert self._queries(base.replace(MAX_QUERIES_PER_TRACK=5)) == plain[:5]
+
+    def test_concurrent_runs_do_not_interfere(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from cuepoint.models.run_settings import RunSettings
+
+        base = RunSettings.resolve().replace(MAX_QUERIES_PER_TRACK=0)
+        variants = [base, base.replace(QUOTED_TITLE_VARIANT=True, TITLE_GRAM_MAX=1)]
+        expected = [self._queries(s) for s in variants]
+        assert expected[0] != expected[1]
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            results = list(ex.map(lambda i: (i, self._queries(variants[i])), [0, 1] * 20))
+        assert all(queries == expected[i] for i, queries in results)
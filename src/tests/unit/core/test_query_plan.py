@@ -0,0 +1,113 @@
+"""Unit tests for cached per-track query plans."""
+
+from unittest.mock import patch
+
+from cuepoint.core.query_generator import make_search_queries
+from cuepoint.core.query_plan import (
+    QueryPlanCache,
+    build_query_plan,
+    settings_fingerprint,
+)
+from cuepoint.models.config import SETTINGS
+
+
+class TestBuildQueryPlan:
+    """Test build_query_plan."""
+
+    def test_matches_inline_generation(self):
+        """Capped plan queries equal make_search_queries' output."""
+        plan = build_query_plan("Never Sleep Again (Extended Mix)", "Tim Green")
+        expected = make_search_queries(
+            plan.title_for_search, "Tim Green", original_title=plan.title
+        )
+        assert plan.queries_for(SETTINGS["MAX_QUERIES_PER_TRACK"]) == expected
+        assert plan.input_mix_flags["is_extended"] is True
+        assert not plan.title_only_search
+
+    def test_uncapped_plan_extends_capped(self):
+        """A larger cap only appends queries to the smaller cap's list."""
+        plan = build_query_plan("Never Sleep Again (Tim Green Remix)", "Artist A, Artist B")
+        first_five = plan.queries_for(5)
+        everything = plan.queries_for(0)
+        assert everything[:5] == first_five
+        assert plan.complete
+
+    def test_queries_are_generated_on_demand(self):
+        """Building a plan generates nothing; iteration pulls one query at a time."""
+        plan = build_query_plan("Never Sleep Again", "A, B, C, D, E")
+        assert plan.queries == []
+        it = plan.iter_queries(0, 40)
+        first = next(it)
+        assert plan.queries == [first]
+        assert list(plan.iter_queries(3, 5)) == plan.queries_for(5)[3:]
+        assert len(plan.queries) == 5
+        assert not plan.complete
+
+    def test_artists_inferred_from_title(self):
+        """Empty artist field means title-only search with inferred artists."""
+        plan = build_query_plan("Tim Green - Never Sleep Again", "")
+        assert plan.title_only_search
+        assert plan.extracted
+        assert plan.artists_for_scoring == "Tim Green"
+
+
+class TestQueryPlanCache:
+    """Test QueryPlanCache."""
+
+    def test_hit_on_normalized_input(self):
+        """Whitespace differences hit the same plan."""
+        cache = QueryPlanCache()
+        first = cache.get_or_build("Never Sleep  Again", "Tim Green")
+        second = cache.get_or_build(" Never Sleep Again", "Tim  Green ")
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_settings_change_misses(self):
+        """Changing a query-generation setting builds a new plan."""
+        cache = QueryPlanCache()
+        first = cache.get_or_build("Never Sleep Again", "Tim Green")
+        with patch.dict(SETTINGS, {"TITLE_GRAM_MAX": 3}):
+            assert settings_fingerprint() != settings_fingerprint(
+                {**SETTINGS, "TITLE_GRAM_MAX": 2}
+            )
+            second = cache.get_or_build("Never Sleep Again", "Tim Green")
+        assert second is not first
+        assert cache.misses == 2
+
+    def test_cap_does_not_change_fingerprint(self):
+        """MAX_QUERIES_PER_TRACK is applied per call, not baked into plans."""
+        assert settings_fingerprint({**SETTINGS, "MAX_QUERIES_PER_TRACK": 5}) == (
+            settings_fingerprint({**SETTINGS, "MAX_QUERIES_PER_TRACK": 60})
+        )
+
+    def test_lru_eviction(self):
+        """Least recently used plans are evicted past max_entries."""
+        cache = QueryPlanCache(max_entries=2)
+        for title in ("A", "B", "C"):
+            cache.get_or_build(title, "X")
+        assert len(cache) == 2
+
+    def test_save_and_load(self, tmp_path):
+        """Saved plans load into a fresh cache and are served as hits."""
+        path = tmp_path / "query_plans.json"
+        cache = QueryPlanCache()
+        plan = cache.get_or_build("Strobe (Extended Mix)", "deadmau5")
+        plan.queries_for(3)
+        cache.save(path)
+
+        fresh = QueryPlanCache()
+        assert fresh.load(path) == 1
+        loaded = fresh.get_or_build("Strobe (Extended Mix)", "deadmau5")
+        assert fresh.misses == 0
+        assert loaded.queries == plan.queries
+        assert loaded.input_mix_flags == plan.input_mix_flags
+        # A loaded prefix resumes generation where it stopped
+        assert loaded.queries_for(0) == plan.queries_for(0)
+
+    def test_load_ignores_missing_and_corrupt(self, tmp_path):
+        """Missing or corrupt files load nothing."""
+        cache = QueryPlanCache()
+        assert cache.load(tmp_path / "missing.json") == 0
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json", encoding="utf-8")
+        assert cache.load(bad) == 0
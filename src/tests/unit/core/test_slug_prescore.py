@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for URL-slug pre-scoring."""
+
+from cuepoint.core.mix_parser import _parse_mix_flags
+from cuepoint.core.slug_prescore import SlugPrescorer, slug_text
+from cuepoint.models.run_settings import RunSettings
+
+BASE = "https://www.beatport.com/track"
+
+
+def test_slug_text():
+    assert slug_text(f"{BASE}/never-sleep-again-extended-mix/123") == (
+        "never sleep again extended mix"
+    )
+    assert slug_text("https://www.beatport.com/release/x/1") == ""
+
+
+def test_order_prefers_title_and_mix_intent():
+    prescorer = SlugPrescorer(
+        "Never Sleep Again (Keinemusik Remix)",
+        _parse_mix_flags("Never Sleep Again (Keinemusik Remix)"),
+    )
+    urls = [
+        f"{BASE}/other-song/1",
+        f"{BASE}/never-sleep-again-original-mix/2",
+        f"{BASE}/never-sleep-again-keinemusik-remix/3",
+    ]
+    assert prescorer.order(urls) == [urls[2], urls[1], urls[0]]
+
+
+def test_cannot_win_against_best_score():
+    prescorer = SlugPrescorer("Test Track", settings=RunSettings.resolve())
+    close = f"{BASE}/test-track-extended-mix/1"
+    assert not prescorer.cannot_win(close, None)
+    assert not prescorer.cannot_win(close, 100.0)
+    assert prescorer.cannot_win(close, 1000.0)
+    assert prescorer.skipped == 1
+
+
+def test_title_below_guard_floor_is_skipped_without_best():
+    prescorer = SlugPrescorer("Test Track")
+    assert prescorer.cannot_win(f"{BASE}/completely-unrelated-words/1", None)
+
+
+def test_unjudgeable_slugs_are_never_skipped():
+    prescorer = SlugPrescorer("東京")
+    assert prescorer.upper_bound(f"{BASE}/tokyo/1") is None
+    assert not prescorer.cannot_win(f"{BASE}/tokyo/1", 1000.0)
+    assert not SlugPrescorer("Test").cannot_win("https://example.com/x", 1000.0)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for the asyncio candidate fetch engine."""
+
+import threading
+import time
+from concurrent.futures import as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cuepoint.data.async_fetch import AsyncFetchEngine
+from cuepoint.data.beatport import parse_track_html
+
+TRACK_HTML = """
+<html><head>
+<script type="application/ld+json">
+{"@type": "MusicRecording", "name": "Test Track",
+ "byArtist": {"@type": "MusicGroup", "name": "Test Artist"}}
+</script>
+</head><body></body></html>
+"""
+
+
+class _PageServer:
+    """Serves TRACK_HTML slowly and records peak request concurrency."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.hits = {}
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.active += 1
+                    server.peak = max(server.peak, server.active)
+                    server.hits[self.path] = server.hits.get(self.path, 0) + 1
+                    hits = server.hits[self.path]
+                time.sleep(server.delay)
+                with server._lock:
+                    server.active -= 1
+                if self.path.startswith("/missing"):
+                    status, body = 404, b"gone"
+                elif self.path.startswith("/empty") and hits == 1:
+                    status, body = 200, b""
+                else:
+                    status, body = 200, TRACK_HTML.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.httpd.server_port}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    srv = _PageServer()
+    yield srv
+    srv.close()
+
+
+@pytest.fixture
+def engine():
+    eng = AsyncFetchEngine(max_in_flight=4, parse_workers=2, dns_cache_ttl=0)
+    yield eng
+    eng.close()
+
+
+def test_fetches_concurrently_within_cap(server, engine):
+    """Twenty pages share one loop thread; never more than the cap in flight."""
+    futures = [engine.submit(f"{server.base}/track/t/{n}", parse_track_html) for n in range(20)]
+    results = [f.result(timeout=30) for f in as_completed(futures)]
+    assert {r[:2] for r in results} == {("Test Track", "Test Artist")}
+    assert server.peak <= 4
+    assert engine.peak_in_flight == 4
+    # one loop thread and the parse workers, not one thread per request
+    names = [t.name for t in threading.enumerate() if t.name.startswith("cuepoint-")]
+    assert names.count("cuepoint-fetch-loop") == 1
+    assert len(names) <= 3
+
+
+def test_parse_runs_off_the_loop_thread(server, engine):
+    threads = []
+
+    def parse(html):
+        threads.append(threading.current_thread().name)
+        return html
+
+    assert "Test Track" in engine.submit(f"{server.base}/track/a/1", parse).result(30)
+    assert threads[0].startswith("cuepoint-parse")
+
+
+def test_failed_fetch_passes_none_to_parse(server, engine):
+    """A 404 is retried once, then parse() gets None."""
+    result = engine.submit(f"{server.base}/missing/1", parse_track_html).result(30)
+    assert result == ("", "", None, None, None, None, None, None, None)
+    assert server.hits["/missing/1"] == 2
+
+
+def test_empty_body_is_retried(server, engine):
+    result = engine.submit(f"{server.base}/empty/1", parse_track_html).result(30)
+    assert result[0] == "Test Track"
+    assert server.hits["/empty/1"] == 2
+
+
+def test_close_stops_loop_thread(server):
+    eng = AsyncFetchEngine(max_in_flight=2, dns_cache_ttl=0)
+    eng.submit(f"{server.base}/track/a/1", parse_track_html).result(30)
+    assert eng.running
+    eng.close()
+    assert not eng.running
+    assert not any(t.name == "cuepoint-fetch-loop" for t in threading.enumerate())
@@ -9,7 +9,7 @@ from unittest.mock import Mock, patch
 import pytest
 from bs4 import BeautifulSoup
 
-from cuepoint.data.beatport import BeatportCandidate, get_last_cache_hit, is_track_url
+from cuepoint.data.beatport import BeatportCandidate, is_track_url
 
 
 @pytest.mark.unit
@@ -108,18 +108,6 @@ class TestIsTrackUrl:
         assert is_track_url("https://www.beatport.com/track/title/123#section") is True
 
 
-@pytest.mark.unit
-class TestGetLastCacheHit:
-    """Test get_last_cache_hit function."""
-
-    def test_get_last_cache_hit_default(self):
-        """Test default cache hit status."""
-        # Reset to default
-        result = get_last_cache_hit()
-        # Should return a boolean
-        assert isinstance(result, bool)
-
-
 @pytest.mark.unit
 class TestRequestHtml:
     """Test request_html function."""
@@ -160,7 +148,7 @@ class TestRequestHtml:
 class TestParseTrackPage:
     """Test parse_track_page function."""
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_success(self, mock_request):
         """Test successful track page parsing."""
         # Create mock HTML with structured data
@@ -179,8 +167,7 @@ class TestParseTrackPage:
             <body>Test</body>
         </html>
         """
-        mock_soup = BeautifulSoup(html_content, "html.parser")
-        mock_request.return_value = mock_soup
+        mock_request.return_value = (html_content, False)
 
         from cuepoint.data.beatport import parse_track_page
 
@@ -193,10 +180,10 @@ class TestParseTrackPage:
             len(result) == 9
         )  # (title, artists, key, year, bpm, label, genres, release_name, release_date)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_no_html(self, mock_request):
         """Test parsing when HTML request fails."""
-        mock_request.return_value = None
+        mock_request.return_value = (None, False)
 
         from cuepoint.data.beatport import parse_track_page
 
@@ -208,11 +195,10 @@ class TestParseTrackPage:
         assert result[0] == ""  # Empty title
         assert result[1] == ""  # Empty artists
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_empty_html(self, mock_request):
         """Test parsing empty HTML."""
-        mock_soup = BeautifulSoup("<html></html>", "html.parser")
-        mock_request.return_value = mock_soup
+        mock_request.return_value = ("<html></html>", False)
 
         from cuepoint.data.beatport import parse_track_page
 
@@ -261,12 +247,11 @@ class TestParseTrackPage:
         mock_response.from_cache = True
         mock_retry.return_value = mock_response
 
-        from cuepoint.data.beatport import get_last_cache_hit, request_html
+        from cuepoint.data.beatport import request_html_ex
 
-        request_html("https://www.beatport.com/track/test/123")
+        _soup, cache_hit = request_html_ex("https://www.beatport.com/track/test/123")
 
         # Check cache hit status
-        cache_hit = get_last_cache_hit()
         assert isinstance(cache_hit, bool)
 
     @patch("cuepoint.data.beatport.retry_with_backoff")
@@ -286,7 +271,7 @@ class TestParseTrackPage:
         # Should handle empty response gracefully
         assert result is None or isinstance(result, BeautifulSoup)
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_with_json_ld(self, mock_request):
         """Test parsing track page with JSON-LD structured data."""
         html_content = """
@@ -311,8 +296,7 @@ class TestParseTrackPage:
             <body>Test</body>
         </html>
         """
-        mock_soup = BeautifulSoup(html_content, "html.parser")
-        mock_request.return_value = mock_soup
+        mock_request.return_value = (html_content, False)
 
         from cuepoint.data.beatport import parse_track_page
 
@@ -322,7 +306,7 @@ class TestParseTrackPage:
         assert isinstance(result, tuple)
         assert len(result) == 9
 
-    @patch("cuepoint.data.beatport.request_html")
+    @patch("cuepoint.data.beatport.request_text_ex")
     def test_parse_track_page_with_next_data(self, mock_request):
         """Test parsing track page with Next.js __NEXT_DATA__."""
         html_content = """
@@ -346,8 +330,7 @@ class TestParseTrackPage:
             <body>Test</body>
         </html>
         """
-        mock_soup = BeautifulSoup(html_content, "html.parser")
-        mock_request.return_value = mock_soup
+        mock_request.return_value = (html_content, False)
 
         from cuepoint.data.beatport import parse_track_page
 
@@ -159,7 +159,7 @@ class TestBeatportSearchViaApi:
     @pytest.mark.skipif(
         sys.platform == "win32", reason="Qt event loop can raise on Windows"
     )
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_via_api_success(self, mock_request):
         """Test successful API search."""
         # Mock HTML response with Next.js data
@@ -194,7 +194,7 @@ class TestBeatportSearchViaApi:
         from bs4 import BeautifulSoup
 
         mock_soup = BeautifulSoup(html_content, "html.parser")
-        mock_request.return_value = mock_soup
+        mock_request.return_value = (mock_soup, False)
 
         urls = beatport_search_via_api(1, "Test Track", max_results=10)
 
@@ -204,10 +204,10 @@ class TestBeatportSearchViaApi:
     @pytest.mark.skipif(
         sys.platform == "win32", reason="Qt event loop can raise on Windows"
     )
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_via_api_no_html(self, mock_request):
         """Test API search when HTML request fails."""
-        mock_request.return_value = None
+        mock_request.return_value = (None, False)
 
         urls = beatport_search_via_api(1, "Test Track", max_results=10)
 
@@ -217,13 +217,13 @@ class TestBeatportSearchViaApi:
     @pytest.mark.skipif(
         sys.platform == "win32", reason="Qt event loop can raise on Windows"
     )
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_via_api_empty_html(self, mock_request):
         """Test API search with empty HTML."""
         from bs4 import BeautifulSoup
 
         mock_soup = BeautifulSoup("<html></html>", "html.parser")
-        mock_request.return_value = mock_soup
+        mock_request.return_value = (mock_soup, False)
 
         urls = beatport_search_via_api(1, "Test Track", max_results=10)
 
@@ -248,7 +248,7 @@ class TestBeatportSearchDirect:
         sys.platform == "win32", reason="Qt event loop can raise on Windows"
     )
     @patch("cuepoint.data.beatport_search.beatport_search_via_api")
-    @patch("cuepoint.data.beatport_search.request_html")
+    @patch("cuepoint.data.beatport_search.request_html_ex")
     def test_beatport_search_direct_api_fallback(self, mock_request, mock_api):
         """Test direct search falls back to HTML when API fails."""
         mock_api.return_value = []
@@ -263,7 +263,7 @@ class TestBeatportSearchDirect:
         </html>
         """
         mock_soup = BeautifulSoup(html_content, "html.parser")
-        mock_request.return_value = mock_soup
+        mock_request.return_value = (mock_soup, False)
 
         urls = beatport_search_direct(1, "Test Track", max_results=10)
 
@@ -0,0 +1,175 @@
+"""Unit tests for the run-scoped headless browser pool."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from cuepoint.data import browser_pool
+from cuepoint.data.browser_pool import (
+    BrowserPool,
+    browser_pool_scope,
+    collect_track_links,
+    get_active_pool,
+    is_blocked_url,
+)
+
+
+class FakeBrowser:
+    """Stand-in backend recording lifecycle calls and owning threads."""
+
+    instances = []
+
+    def __init__(self, timeout_sec, block_resources):
+        self.started = self.closed = False
+        self.pages = 0
+        self.threads = set()
+        self.fail_next = False
+        FakeBrowser.instances.append(self)
+
+    def start(self):
+        self.started = True
+        self.threads.add(threading.get_ident())
+
+    def collect_links(self, url):
+        self.threads.add(threading.get_ident())
+        if "crash" in url:
+            raise RuntimeError("browser crashed")
+        self.pages += 1
+        return [f"/track/x/{self.pages}"]
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_backend():
+    FakeBrowser.instances = []
+    with patch.dict(browser_pool._BACKENDS, {"fake": FakeBrowser}):
+        yield
+
+
+class TestBrowserPool:
+    """Test BrowserPool."""
+
+    def test_browser_is_reused_across_queries(self):
+        """One launch serves many page loads; shutdown closes it."""
+        pool = BrowserPool(size=1, max_pages=100)
+        for _ in range(5):
+            assert pool.collect_links("fake", "u")
+        pool.shutdown()
+        assert len(FakeBrowser.instances) == 1
+        assert FakeBrowser.instances[0].pages == 5
+        assert FakeBrowser.instances[0].closed
+        assert pool.stats()["launches"] == 1
+
+    def test_recycles_after_max_pages(self):
+        """Browsers are replaced after max_pages loads."""
+        pool = BrowserPool(size=1, max_pages=2)
+        for _ in range(5):
+            pool.collect_links("fake", "u")
+        pool.shutdown()
+        assert pool.stats()["launches"] == 3
+        assert pool.stats()["recycles"] == 2
+        assert all(b.closed for b in FakeBrowser.instances)
+
+    def test_crash_recycles_and_raises(self):
+        """A failing page load closes that browser and re-raises to the caller."""
+        pool = BrowserPool(size=1, max_pages=100)
+        pool.collect_links("fake", "u")
+        with pytest.raises(RuntimeError, match="crashed"):
+            pool.collect_links("fake", "crash")
+        pool.collect_links("fake", "u")
+        pool.shutdown()
+        assert pool.stats()["crashes"] == 1
+        assert pool.stats()["launches"] == 2
+
+    def test_browsers_stay_on_their_worker_thread(self):
+        """Callers on many threads never drive a browser from their own thread."""
+        pool = BrowserPool(size=2, max_pages=100)
+        callers = set()
+
+        def call(_):
+            callers.add(threading.get_ident())
+            return pool.collect_links("fake", "u")
+
+        with ThreadPoolExecutor(max_workers=6) as ex:
+            list(ex.map(call, range(30)))
+        pool.shutdown()
+        assert 1 <= len(FakeBrowser.instances) <= 2
+        for browser in FakeBrowser.instances:
+            assert len(browser.threads) == 1
+            assert not browser.threads & callers
+
+    def test_shutdown_rejects_new_work(self):
+        """Pool cannot be used after shutdown."""
+        pool = BrowserPool(size=1)
+        pool.shutdown()
+        with pytest.raises(RuntimeError):
+            pool.collect_links("fake", "u")
+
+    def test_shutdown_fails_queued_jobs(self):
+        """Callers waiting behind a busy browser are released by shutdown."""
+        pool = BrowserPool(size=1)
+        release = threading.Event()
+        original = FakeBrowser.collect_links
+
+        def slow(browser, url):
+            if url == "slow":
+                release.wait(5)
+            return original(browser, url)
+
+        with patch.object(FakeBrowser, "collect_links", slow), ThreadPoolExecutor(3) as ex:
+            running = ex.submit(pool.collect_links, "fake", "slow")
+            for _ in range(500):
+                if FakeBrowser.instances:
+                    break
+                threading.Event().wait(0.01)
+            queued = ex.submit(pool.collect_links, "fake", "u")
+            for _ in range(500):
+                if pool._jobs.qsize() == 1:
+                    break
+                threading.Event().wait(0.01)
+            stopping = ex.submit(pool.shutdown)
+            with pytest.raises(RuntimeError, match="shut down"):
+                queued.result(timeout=5)
+            release.set()
+            stopping.result(timeout=5)
+            assert running.result(timeout=5)
+
+
+class TestBrowserPoolScope:
+    """Test browser_pool_scope and collect_track_links."""
+
+    def test_scope_is_reentrant_and_shuts_down(self):
+        """Nested scopes share one pool, closed when the outer scope exits."""
+        with browser_pool_scope() as outer:
+            with browser_pool_scope() as inner:
+                assert inner is outer
+                collect_track_links("fake", "u")
+                collect_track_links("fake", "u")
+            assert get_active_pool() is outer
+        assert get_active_pool() is None
+        assert len(FakeBrowser.instances) == 1
+        assert FakeBrowser.instances[0].closed
+
+    def test_one_shot_outside_scope(self):
+        """Without a scope each call launches and closes its own browser."""
+        collect_track_links("fake", "u")
+        collect_track_links("fake", "u")
+        assert len(FakeBrowser.instances) == 2
+        assert all(b.closed for b in FakeBrowser.instances)
+
+    def test_pool_disabled_by_setting(self):
+        """BROWSER_POOL_SIZE=0 keeps the one-shot behavior inside a scope."""
+        with patch.dict(browser_pool.SETTINGS, {"BROWSER_POOL_SIZE": 0}):
+            with browser_pool_scope() as pool:
+                assert pool is None
+
+
+def test_is_blocked_url():
+    """Analytics hosts are blocked; Beatport is not."""
+    assert is_blocked_url("https://www.google-analytics.com/collect")
+    assert is_blocked_url("https://stats.g.doubleclick.net/x")
+    assert not is_blocked_url("https://www.beatport.com/search?q=x")
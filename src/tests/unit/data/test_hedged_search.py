@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for hedged search and backend health."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cuepoint.data.hedged_search import BACKEND_HEALTH, BackendHealth, hedged_search
+from cuepoint.models.config import SETTINGS
+from cuepoint.models.run_settings import RunSettings
+
+
+@pytest.fixture(autouse=True)
+def _fresh_health():
+    BACKEND_HEALTH.reset()
+    yield
+    BACKEND_HEALTH.reset()
+
+
+def _settings(**overrides):
+    return RunSettings.resolve().replace(**overrides)
+
+
+def test_returns_as_soon_as_primary_is_sufficient():
+    slow = Mock(return_value=["c"])
+    settings = _settings(HEDGED_STAGGER_SEC=5)
+    urls = hedged_search(1, [("fast", lambda: ["a", "b"]), ("slow", slow)], 2, settings=settings)
+    assert urls == ["a", "b"]
+    slow.assert_not_called()
+
+
+def test_short_primary_starts_next_backend_and_merges_in_priority_order():
+    settings = _settings(HEDGED_STAGGER_SEC=5)
+    urls = hedged_search(
+        1,
+        [("first", lambda: ["a"]), ("second", lambda: ["a", "b", "c"])],
+        10,
+        sufficient=3,
+        settings=settings,
+    )
+    assert urls == ["a", "b", "c"]
+
+
+def test_slow_backend_is_hedged_and_abandoned():
+    release = threading.Event()
+
+    def hung():
+        release.wait(5)
+        return ["late"]
+
+    settings = _settings(HEDGED_STAGGER_SEC=0.05)
+    t0 = time.perf_counter()
+    urls = hedged_search(1, [("hung", hung), ("backup", lambda: ["x", "y"])], 2, settings=settings)
+    assert urls == ["x", "y"]
+    assert time.perf_counter() - t0 < 2
+    release.set()
+
+
+def test_queued_backends_are_cancelled_when_the_search_ends():
+    from cuepoint.data import hedged_search as hedged
+
+    release = threading.Event()
+    queued = Mock(return_value=["late"])
+    pool = ThreadPoolExecutor(max_workers=1)
+    pool.submit(release.wait, 5)
+    try:
+        with patch.object(hedged, "_search_pool", return_value=pool):
+            settings = _settings(HEDGED_TIMEOUT_SEC=0.1)
+            urls = hedged_search(1, [("queued", queued)], 1, settings=settings)
+    finally:
+        release.set()
+        pool.shutdown(wait=True)
+    assert urls == []
+    queued.assert_not_called()
+
+
+def test_failing_backend_is_marked_dead_and_skipped():
+    health = BackendHealth()
+    with patch.dict(SETTINGS, {"SEARCH_BACKEND_DEAD_AFTER": 2}):
+        health.record("api:x", False, 0.1)
+        assert not health.is_dead("api:x")
+        health.record("api:x", False, 0.1)
+        assert health.is_dead("api:x")
+    assert health.stats()["api:x"]["failures"] == 2
+
+    broken = Mock(side_effect=RuntimeError("down"))
+    with patch.dict(SETTINGS, {"SEARCH_BACKEND_DEAD_AFTER": 1}):
+        hedged_search(1, [("broken", broken), ("ok", lambda: ["u"])], 1)
+        hedged_search(1, [("broken", broken), ("ok", lambda: ["u"])], 1)
+    assert broken.call_count == 1
+
+
+def test_api_search_skips_dead_endpoints():
+    from cuepoint.data import beatport_search
+
+    resp = Mock(status_code=404)
+    with patch.dict(SETTINGS, {"SEARCH_BACKEND_DEAD_AFTER": 1}), patch.object(
+        beatport_search.SESSION, "get", return_value=resp
+    ) as get:
+        assert beatport_search.beatport_search_via_api(1, "query") == []
+        assert get.call_count == 4
+        assert beatport_search.beatport_search_via_api(1, "other") == []
+        assert get.call_count == 4
+
+
+def test_track_urls_hedged_mode_runs_backends():
+    from cuepoint.data import beatport
+
+    settings = _settings(SEARCH_MODE="hedged", HEDGED_STAGGER_SEC=0)
+    with patch(
+        "cuepoint.data.beatport_search.beatport_search_via_api", return_value=[]
+    ), patch.object(
+        beatport, "beatport_search_direct", return_value=["https://b/track/x/1"]
+    ) as direct, patch.object(
+        beatport, "ddg_track_urls", return_value=["https://b/track/y/2"]
+    ):
+        urls = beatport.track_urls(1, "Title (Someone Remix)", 2, settings=settings)
+    assert urls == ["https://b/track/x/1", "https://b/track/y/2"]
+    assert direct.call_args.kwargs == {"use_api": False}
+
+
+def test_hybrid_search_uses_the_run_settings():
+    from cuepoint.data.beatport_search import beatport_search_hybrid
+
+    settings = _settings(SEARCH_MODE="hedged")
+    with patch.dict(SETTINGS, {"SEARCH_MODE": "sequential"}), patch(
+        "cuepoint.data.hedged_search.hedged_search", return_value=["u"]
+    ) as hedged:
+        assert beatport_search_hybrid(1, "query", 10, settings=settings) == ["u"]
+    assert hedged.call_args.kwargs["settings"] is settings
+
+
+def test_hybrid_hedged_search_honours_ddg_enabled_and_reports_outcome():
+    from cuepoint.data import beatport
+    from cuepoint.data.beatport_search import beatport_search_hybrid
+    from cuepoint.data.negative_cache import note_search_failed, search_outcome
+
+    def offline(*args, **kwargs):
+        note_search_failed()
+        return []
+
+    settings = _settings(SEARCH_MODE="hedged", HEDGED_STAGGER_SEC=0, DDG_ENABLED=False)
+    with patch(
+        "cuepoint.data.beatport_search.beatport_search_via_api", side_effect=offline
+    ), patch.object(beatport, "beatport_search_direct", return_value=[]), patch.object(
+        beatport, "ddg_track_urls", return_value=["https://b/track/y/2"]
+    ) as ddg, search_outcome() as outcome:
+        assert beatport_search_hybrid(1, "query", 10, settings=settings) == []
+    ddg.assert_not_called()
+    assert outcome.failed
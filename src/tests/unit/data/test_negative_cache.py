@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for the negative-result cache and its use by fetching and search."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from bs4 import BeautifulSoup
+
+from cuepoint.data import beatport
+from cuepoint.data.beatport import is_known_bad_page, parse_track_page, request_text, track_urls
+from cuepoint.data.beatport_search import beatport_search_direct
+from cuepoint.data.negative_cache import (
+    BASE_TTL_SEC,
+    KIND_DEAD,
+    KIND_EMPTY_SEARCH,
+    KIND_UNPARSEABLE,
+    NegativeCache,
+    SearchOutcome,
+    note_search_answered,
+    note_search_failed,
+    search_outcome,
+)
+
+TRACK_URL = "https://www.beatport.com/track/removed/123"
+
+
+@pytest.fixture
+def negative(tmp_path):
+    cache = NegativeCache(tmp_path / "negative.sqlite", max_ttl_sec=4 * 3600)
+    with patch.object(beatport, "get_negative_cache", return_value=cache), patch(
+        "cuepoint.data.beatport_search.get_negative_cache", return_value=cache
+    ):
+        yield cache
+    cache.close()
+
+
+def test_ttl_doubles_per_failure_up_to_the_cap_and_resets_on_success(tmp_path):
+    cache = NegativeCache(tmp_path / "n.sqlite", max_ttl_sec=4 * 3600)
+    base = BASE_TTL_SEC[KIND_UNPARSEABLE]
+    ttls = [cache.record(KIND_UNPARSEABLE, "k") for _ in range(4)]
+    assert ttls == [base, 2 * base, 4 * base, 4 * 3600]
+    assert cache.is_negative(KIND_UNPARSEABLE, "k")
+    assert not cache.is_negative(KIND_DEAD, "k")
+
+    cache.forget(KIND_UNPARSEABLE, "k")
+    assert not cache.is_negative(KIND_UNPARSEABLE, "k")
+    assert cache.record(KIND_UNPARSEABLE, "k") == base
+    cache.close()
+
+
+def test_entries_persist_until_long_expired(tmp_path):
+    path = tmp_path / "n.sqlite"
+    cache = NegativeCache(path, max_ttl_sec=3600)
+    cache.record(KIND_DEAD, "live")
+    cache.record(KIND_DEAD, "old")
+    # Expired for longer than the cap: dropped on the next open
+    cache._conn.execute("UPDATE negative SET expires = ? WHERE key = 'old'", (time.time() - 7200,))
+    cache._conn.commit()
+    cache.close()
+
+    reopened = NegativeCache(path, max_ttl_sec=3600)
+    assert reopened.is_negative(KIND_DEAD, "live")
+    assert ("dead", "old") not in reopened._entries
+    assert reopened.stats() == {"active": {KIND_DEAD: 1}, "hits": 1}
+    reopened.close()
+
+
+def test_dead_pages_are_not_requested_again(negative):
+    gone = Mock(status_code=404, headers={}, content=b"")
+    with patch.object(beatport.SESSION, "get", return_value=gone) as get:
+        assert request_text(TRACK_URL) is None
+        assert request_text(TRACK_URL) is None
+        assert parse_track_page(TRACK_URL)[0] == ""
+    # The 404 is retried once, then nothing more is requested
+    assert get.call_count == 2
+    assert is_known_bad_page(TRACK_URL.replace("removed", "other-slug"))
+
+
+def test_unparseable_pages_are_remembered(negative):
+    with patch.object(beatport, "request_text_ex", return_value=("<html></html>", False)) as fetch:
+        assert parse_track_page(TRACK_URL)[0] == ""
+        assert parse_track_page(TRACK_URL)[0] == ""
+    assert fetch.call_count == 1
+    assert negative.is_negative(KIND_UNPARSEABLE, "track/123")
+
+
+def _answered(urls):
+    """Stand-in for _track_urls() whose backend answered with ``urls``."""
+
+    def search(*args):
+        note_search_answered()
+        return list(urls)
+
+    return Mock(side_effect=search)
+
+
+def test_empty_searches_are_skipped_until_they_expire(negative):
+    with patch.object(beatport, "_track_urls", _answered([])) as search:
+        assert track_urls(1, "Nobody  Nothing", 10) == []
+        assert track_urls(1, "nobody nothing", 10) == []
+        assert search.call_count == 1
+
+        # Expired: searched again, and a result clears the entry
+        key = next(k for kind, k in negative._entries if kind == KIND_EMPTY_SEARCH)
+        negative._entries[(KIND_EMPTY_SEARCH, key)] = (1, time.time() - 1)
+        search.side_effect = _answered([TRACK_URL]).side_effect
+        assert track_urls(1, "nobody nothing", 10) == [TRACK_URL]
+    assert negative.stats()["active"] == {}
+
+
+def test_direct_search_pages_without_results_are_not_refetched(negative):
+    empty = BeautifulSoup("<html><body>No results</body></html>", "lxml")
+    with patch(
+        "cuepoint.data.beatport_search.request_html_ex", return_value=(empty, False)
+    ) as fetch, patch("cuepoint.data.beatport_search.time.sleep"):
+        assert beatport_search_direct(1, "nobody nothing", 10, use_api=False) == []
+        assert beatport_search_direct(1, "nobody nothing", 10, use_api=False) == []
+    assert fetch.call_count == 1
+
+
+def test_failed_searches_are_not_recorded_as_empty(negative):
+    empty = BeautifulSoup("<html><body>No results</body></html>", "lxml")
+    with patch(
+        "cuepoint.data.beatport_search.request_html_ex", return_value=(None, False)
+    ) as fetch, patch(
+        "cuepoint.data.beatport_search.beatport_search_via_api", return_value=[]
+    ), patch.object(beatport, "ddg_track_urls", return_value=[]), patch.object(
+        beatport, "beatport_search_browser", return_value=[]
+    ), patch(
+        "cuepoint.data.beatport_search.time.sleep"
+    ):
+        # Search page fetch failed (rate limit, timeout, offline): retried next time
+        assert track_urls(1, "nobody nothing", 10, use_direct_search=True) == []
+        assert track_urls(1, "nobody nothing", 10, use_direct_search=True) == []
+        assert fetch.call_count == 2
+        assert negative.stats()["active"] == {}
+
+        # The page answered without results: remembered
+        fetch.return_value = (empty, False)
+        assert track_urls(1, "nobody nothing", 10, use_direct_search=True) == []
+        assert track_urls(1, "nobody nothing", 10, use_direct_search=True) == []
+    assert fetch.call_count == 3
+    assert negative.stats()["active"] == {KIND_EMPTY_SEARCH: 2}
+
+
+def test_track_urls_reports_into_the_callers_outcome(negative):
+    def failing(*args):
+        note_search_failed()
+        return []
+
+    with patch.object(beatport, "_track_urls", Mock(side_effect=failing)):
+        with search_outcome() as outcome:
+            assert track_urls(1, "offline query", 10) == []
+    assert outcome.failed and not outcome.confirmed_empty
+    assert negative.stats()["active"] == {}
+
+
+def test_track_urls_reports_whether_answers_came_from_cache(negative):
+    def cached(*args):
+        note_search_answered(from_cache=True)
+        return []
+
+    with patch.object(beatport, "_track_urls", Mock(side_effect=cached)):
+        outcome = SearchOutcome()
+        assert track_urls(1, "cached query", 10, outcome=outcome) == []
+    assert outcome.from_cache and outcome.confirmed_empty
+
+    # Skipped by the negative cache: also a cache hit
+    skipped = SearchOutcome()
+    assert track_urls(1, "cached query", 10, outcome=skipped) == []
+    assert skipped.from_cache
+
+    with patch.object(beatport, "_track_urls", _answered([TRACK_URL])):
+        network = SearchOutcome()
+        assert track_urls(1, "fresh query", 10, outcome=network) == [TRACK_URL]
+    assert network.answered and not network.from_cache
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for the JSON fast path of track page parsing."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from bs4 import BeautifulSoup
+
+from cuepoint.data import beatport
+from cuepoint.data.beatport import parse_track_html, parse_track_json, parse_track_soup
+from cuepoint.data.page_json import extract_json_ld, extract_next_data
+from cuepoint.utils.lazy_import import lazy_module
+from tests.fixtures import load_fixture
+
+
+def test_extract_next_data_ignores_attribute_order_and_quotes():
+    html = (
+        "<script src='/app.js'></script>"
+        "<script type='application/json' id='__NEXT_DATA__'>{\"a\": 1}</script>"
+    )
+    assert json.loads(extract_next_data(html)) == {"a": 1}
+    assert extract_next_data("<script id=\"__NEXT_DATA__\"></script>") is None
+    assert extract_next_data("<html><body>no data</body></html>") is None
+
+
+def test_extract_json_ld_returns_every_payload_in_order():
+    html = (
+        '<script type="application/ld+json">{"n": 1}</script>'
+        "<script>var x = 1;</script>"
+        '<SCRIPT TYPE="application/ld+json">{"n": 2}</SCRIPT>'
+    )
+    assert [json.loads(t)["n"] for t in extract_json_ld(html)] == [1, 2]
+
+
+def test_parse_track_json_matches_soup_parsing():
+    html = load_fixture("beatport/track_page_next_data.html")
+    fields = parse_track_json(html)
+    assert fields == parse_track_soup(BeautifulSoup(html, "lxml"))
+    assert fields[:5] == (
+        "Never Sleep Again (Keinemusik Remix)",
+        "Solomun, Keinemusik",
+        "A Minor",
+        2023,
+        "122",
+    )
+
+
+def test_complete_payloads_skip_the_soup():
+    html = load_fixture("beatport/track_page_next_data.html")
+    with patch.object(beatport, "BeautifulSoup", side_effect=AssertionError("soup built")):
+        assert parse_track_html(html)[0] == "Never Sleep Again (Keinemusik Remix)"
+
+
+def test_incomplete_payloads_fall_back_to_html_scraping():
+    # JSON-LD only: no key, BPM, label or genres in the payloads
+    html = load_fixture("beatport/track_page_standard.html")
+    assert parse_track_json(html) is None
+    title, artists, *_rest = parse_track_html(html)
+    assert (title, artists) == ("Test Track", "Test Artist")
+
+
+def test_broken_date_parser_install_is_not_an_unparseable_date():
+    with patch.object(beatport, "dateparser", lazy_module("cuepoint_missing_dateutil.parser")):
+        with pytest.raises(ImportError):
+            beatport._parse_release_date("2024-05-17")
+    assert beatport._parse_release_date("not a date at all") == (None, None)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for the track page parse process pool."""
+
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+import pytest
+
+from cuepoint.data import beatport, parse_pool
+from cuepoint.data.beatport import parse_track_html, parse_track_page
+from cuepoint.data.parse_pool import ParsePool, get_parse_pool, parse_page, shutdown_parse_pool
+from cuepoint.models.run_settings import RunSettings
+from tests.fixtures import load_fixture
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_pool():
+    shutdown_parse_pool()
+    yield
+    shutdown_parse_pool()
+
+
+def _settings(**overrides):
+    return RunSettings.resolve().replace(**overrides)
+
+
+def test_parse_page_inline_by_default():
+    html = load_fixture("beatport/track_page_next_data.html")
+    with patch.object(parse_pool, "get_parse_pool", side_effect=AssertionError("pool used")):
+        assert parse_page(html, _settings(PARSE_PROCESSES=0)) == parse_track_html(html)
+
+
+def test_worker_processes_return_the_inline_result():
+    pages = [
+        load_fixture("beatport/track_page_next_data.html"),
+        load_fixture("beatport/track_page_standard.html"),
+    ]
+    pool = ParsePool(2)
+    try:
+        pool.warm_up()
+        for html in pages:
+            # Soup fallback too: the standard page's payloads lack key/BPM/label
+            for fast in (True, False):
+                assert pool.parse(html, fast) == parse_track_html(html, json_fast_path=fast)
+        assert pool.stats() == {"processes": 2, "tasks": 4, "failures": 0}
+    finally:
+        pool.close()
+
+
+def test_parse_page_uses_shared_pool_when_enabled():
+    html = load_fixture("beatport/track_page_next_data.html")
+    settings = _settings(PARSE_PROCESSES=1)
+    assert parse_page(html, settings) == parse_track_html(html)
+    assert get_parse_pool(1).stats()["tasks"] == 1
+
+
+def test_broken_pool_falls_back_to_inline_parsing():
+    html = load_fixture("beatport/track_page_next_data.html")
+    settings = _settings(PARSE_PROCESSES=1)
+    broken = get_parse_pool(1)
+    with patch.object(broken, "parse", side_effect=BrokenProcessPool("worker died")):
+        assert parse_page(html, settings) == parse_track_html(html)
+    assert get_parse_pool(1) is not broken
+
+
+def test_track_pages_are_parsed_with_the_run_settings():
+    html = load_fixture("beatport/track_page_next_data.html")
+    settings = _settings(PARSE_PROCESSES=1)
+    with patch.object(beatport, "request_text_ex", return_value=(html, False)):
+        fields = parse_track_page("https://www.beatport.com/track/nsa/17000000", settings)
+    assert fields == parse_track_html(html)
+    assert get_parse_pool(1).stats()["tasks"] == 1
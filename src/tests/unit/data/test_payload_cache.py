@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for the payload cache tier in front of page fetching and parsing."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+from bs4 import BeautifulSoup
+
+from cuepoint.data import beatport
+from cuepoint.data.beatport import parse_track_html, parse_track_page
+from cuepoint.data.beatport_search import beatport_search_direct
+from cuepoint.data.parse_pool import get_parse_pool, shutdown_parse_pool
+from cuepoint.data.payload_cache import KIND_TRACK, PayloadCache, canonical_key
+from cuepoint.models.run_settings import RunSettings
+from tests.fixtures import load_fixture
+
+TRACK_URL = "https://www.beatport.com/track/never-sleep-again/17000000"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = PayloadCache(tmp_path / "payload_cache.sqlite")
+    yield c
+    c.close()
+
+
+def test_round_trip_expiry_and_canonical_keys(cache):
+    assert canonical_key(TRACK_URL) == canonical_key(
+        "https://www.beatport.com/track/never-sleep-again-keinemusik-remix/17000000/"
+    )
+    assert canonical_key("https://WWW.beatport.com/search?q=a#x") == (
+        "https://www.beatport.com/search?q=a"
+    )
+
+    cache.put(KIND_TRACK, "track/1", {"json_ld": ["{}"], "next_data": None}, ttl_sec=60)
+    cache.put(KIND_TRACK, "track/2", {"json_ld": [], "next_data": None}, ttl_sec=0)
+    assert cache.get(KIND_TRACK, "track/1") == {"json_ld": ["{}"], "next_data": None}
+    assert cache.get(KIND_TRACK, "track/2") is None
+    assert cache.get("search", "track/1") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+
+def test_least_recently_used_entries_are_pruned_over_budget(tmp_path):
+    cache = PayloadCache(tmp_path / "p.sqlite", max_bytes=3000)
+    try:
+        # Random hex strings: ~1 KB each once compressed
+        blobs = [random.Random(n).randbytes(1000).hex() for n in range(5)]
+        for n, blob in enumerate(blobs[:2]):
+            cache.put(KIND_TRACK, f"track/{n}", blob, ttl_sec=60)
+        cache.get(KIND_TRACK, "track/0")  # track/1 is now least recently used
+        for n, blob in enumerate(blobs[2:], start=2):
+            cache.put(KIND_TRACK, f"track/{n}", blob, ttl_sec=60)
+
+        assert cache.stats()["bytes"] <= 3000
+        assert cache.get(KIND_TRACK, "track/1") is None
+        assert cache.get(KIND_TRACK, "track/4") == blobs[4]
+    finally:
+        cache.close()
+
+
+def test_hits_buffer_access_times_until_flushed(cache):
+    cache.put(KIND_TRACK, "track/1", [1], ttl_sec=60)
+
+    def last_access():
+        return cache._conn.execute("SELECT last_access FROM payloads").fetchone()[0]
+
+    stored = last_access()
+    for _ in range(cache.FLUSH_EVERY - 1):
+        assert cache.get(KIND_TRACK, "track/1") == [1]
+    assert last_access() == stored
+    cache.flush()
+    assert last_access() > stored
+
+
+def test_track_page_hit_skips_fetch_and_html(cache):
+    html = load_fixture("beatport/track_page_next_data.html")
+    with patch.object(beatport, "get_payload_cache", return_value=cache), patch.object(
+        beatport, "request_text_ex", return_value=(html, False)
+    ) as fetch:
+        first = parse_track_page(TRACK_URL)
+        with patch.object(beatport, "extract_payloads", side_effect=AssertionError("sliced")):
+            # Same track ID under another slug
+            second = parse_track_page(TRACK_URL.replace("never-sleep-again", "nsa"))
+
+    assert fetch.call_count == 1
+    assert second == first
+    assert first[0] == "Never Sleep Again (Keinemusik Remix)"
+    assert cache.stats()["entries"] == {KIND_TRACK: 1}
+
+
+def test_incomplete_payloads_are_not_cached(cache):
+    html = load_fixture("beatport/track_page_standard.html")
+    with patch.object(beatport, "get_payload_cache", return_value=cache), patch.object(
+        beatport, "request_text_ex", return_value=(html, False)
+    ):
+        assert parse_track_page(TRACK_URL)[0] == "Test Track"
+    assert cache.stats()["entries"] == {}
+
+
+def test_search_results_are_served_from_cache(cache):
+    soup = BeautifulSoup('<a href="/track/one/1">One</a><a href="/track/two/2">Two</a>', "lxml")
+    with patch("cuepoint.data.beatport_search.get_payload_cache", return_value=cache), patch(
+        "cuepoint.data.beatport_search.request_html_ex", return_value=(soup, False)
+    ) as fetch, patch("cuepoint.data.beatport_search.time.sleep"):
+        first = beatport_search_direct(1, "one two", 10, use_api=False)
+        second = beatport_search_direct(1, "one two", 10, use_api=False)
+        beatport_search_direct(1, "one two", 1, use_api=False)
+
+    assert (
+        first
+        == second
+        == [
+            "https://www.beatport.com/track/one/1",
+            "https://www.beatport.com/track/two/2",
+        ]
+    )
+    # A different max_results is a different entry
+    assert fetch.call_count == 2
+
+
+def test_pages_parsed_on_the_pool_fill_the_cache(cache):
+    html = load_fixture("beatport/track_page_next_data.html")
+    settings = RunSettings.resolve().replace(PARSE_PROCESSES=1)
+    try:
+        with patch.object(beatport, "get_payload_cache", return_value=cache), patch.object(
+            beatport, "request_text_ex", return_value=(html, False)
+        ):
+            fields = parse_track_page(TRACK_URL, settings)
+        assert get_parse_pool(1).stats()["tasks"] == 1
+    finally:
+        shutdown_parse_pool()
+    assert fields == parse_track_html(html)
+    assert cache.get(KIND_TRACK, canonical_key(TRACK_URL)) is not None
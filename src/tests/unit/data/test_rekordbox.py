@@ -10,13 +10,17 @@ import pytest
 
 from cuepoint.data.rekordbox import (
     MAX_XML_SIZE_BYTES,
+    PlaylistIndex,
     RBTrack,
+    build_playlist_tree,
     extract_artists_from_title,
     is_readable,
     is_writable,
     parse_collection,
+    parse_playlist_tree,
     parse_rekordbox,
     read_playlist_index,
+    stream_playlist_tree,
 )
 
 
@@ -729,3 +733,108 @@ class TestParseCollection:
             )
         finally:
             os.unlink(xml_path)
+
+
+_TREE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<DJ_PLAYLISTS Version="1.0.0">
+  <COLLECTION Entries="3">
+    <TRACK TrackID="1" Name="Track 1" Artist="Artist 1"/>
+    <TRACK TrackID="2" Name="Track 2" Artist="Artist 2"/>
+    <TRACK TrackID="3" Name="" Artist="No Title"/>
+  </COLLECTION>
+  <PLAYLISTS>
+    <NODE Type="0" Name="ROOT" Count="2">
+      <NODE Type="0" Name="House" Count="2">
+        <NODE Type="1" Name="Deep" KeyType="0" Entries="3">
+          <TRACK Key="2"/><TRACK Key="3"/><TRACK Key="1"/>
+        </NODE>
+        <NODE Type="0" Name="Empty Folder" Count="0"/>
+      </NODE>
+      <NODE Type="1" Name="Warmup" KeyType="0" Entries="1">
+        <TRACK Key="1"/>
+      </NODE>
+    </NODE>
+  </PLAYLISTS>
+</DJ_PLAYLISTS>
+"""
+
+
+class TestStreamPlaylistTree:
+    """Test stream_playlist_tree, PlaylistIndex and parse_playlist_tree."""
+
+    @pytest.fixture
+    def xml_path(self, tmp_path: Path) -> str:
+        path = tmp_path / "tree.xml"
+        path.write_text(_TREE_XML, encoding="utf-8")
+        return str(path)
+
+    def test_nodes_stream_in_document_order(self, xml_path: str):
+        """Folders arrive when opened, playlists when closed, with their parent."""
+        index = PlaylistIndex()
+        pairs = list(stream_playlist_tree(xml_path, index))
+        assert [(p["path"] if p else None, n["path"]) for p, n in pairs] == [
+            (None, "ROOT"),
+            ("ROOT", "ROOT/House"),
+            ("ROOT/House", "ROOT/House/Deep"),
+            ("ROOT/House", "ROOT/House/Empty Folder"),
+            ("ROOT", "ROOT/Warmup"),
+        ]
+        assert pairs[2][1]["track_count"] == 3
+
+    def test_index_builds_tracks_on_access(self, xml_path: str):
+        """Track objects are only built for playlists that are looked up."""
+        index = PlaylistIndex()
+        list(stream_playlist_tree(xml_path, index))
+        assert len(index) == 2
+        assert "ROOT/Warmup" in index
+        assert index.track_count("ROOT/House/Deep") == 3
+        assert index._built == {}
+        deep = index["ROOT/House/Deep"]
+        # Track 3 has no title and is skipped; positions keep playlist order
+        assert [(t.title, t.position) for t in deep.tracks] == [
+            ("Track 2", 1),
+            ("Track 1", 3),
+        ]
+        assert list(index._built) == ["ROOT/House/Deep"]
+        assert index["ROOT/House/Deep"] is deep
+
+    def test_parse_playlist_tree_matches_streamed_tree(self, xml_path: str):
+        """parse_playlist_tree returns the assembled tree and eager playlists."""
+        roots, playlists = parse_playlist_tree(xml_path)
+        streamed = build_playlist_tree(stream_playlist_tree(xml_path, PlaylistIndex()))
+        assert roots == streamed
+        house = roots[0]["children"][0]
+        assert [c["name"] for c in house["children"]] == ["Deep", "Empty Folder"]
+        assert isinstance(playlists, dict)
+        assert playlists["ROOT/Warmup"].get_track_count() == 1
+
+    def test_cancel_stops_parsing(self, xml_path: str):
+        """should_cancel ends the stream quietly at the next checkpoint."""
+        with patch("cuepoint.data.rekordbox._TREE_PROGRESS_INTERVAL", 1):
+            pairs = list(
+                stream_playlist_tree(
+                    xml_path, PlaylistIndex(), should_cancel=lambda: True
+                )
+            )
+        assert pairs == []
+
+    def test_progress_reports_bytes(self, xml_path: str):
+        """Progress is reported as (bytes_read, total_bytes), ending at 100%."""
+        calls = []
+        with patch("cuepoint.data.rekordbox._TREE_PROGRESS_INTERVAL", 5):
+            list(
+                stream_playlist_tree(
+                    xml_path,
+                    PlaylistIndex(),
+                    progress_callback=lambda done, total: calls.append((done, total)),
+                )
+            )
+        size = os.path.getsize(xml_path)
+        assert len(calls) > 1
+        assert all(total == size for _, total in calls)
+        assert calls[-1] == (size, size)
+
+    def test_missing_file(self, tmp_path: Path):
+        """Missing files raise before any node is yielded."""
+        with pytest.raises(FileNotFoundError):
+            next(stream_playlist_tree(str(tmp_path / "nope.xml"), PlaylistIndex()))
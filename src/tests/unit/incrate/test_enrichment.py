@@ -42,11 +42,11 @@ def _insert_row(
 
 
 # parse_track_page returns (title, artists, key, year, bpm, label, genres, rel_name, rel_date)
-def _mock_parse_track_page_defected(url: str):
+def _mock_parse_track_page_defected(url: str, settings=None):
     return ("Track One", "Artist A", None, None, None, "Defected", None, None, None)
 
 
-def _mock_parse_track_page_label_two(url: str):
+def _mock_parse_track_page_label_two(url: str, settings=None):
     return ("T2", "B", None, None, None, "LabelTwo", None, None, None)
 
 
@@ -239,3 +239,89 @@ class TestEnrichLabelsForEmpty:
             assert row[1] == url
         finally:
             conn.close()
+
+
+class TestEnrichmentResume:
+    """Enrichment skips rows an earlier run already attempted."""
+
+    @staticmethod
+    def _config(workers: int) -> Mock:
+        config = Mock()
+        config.get.side_effect = lambda k, d=None: (
+            workers if k == "processing.track_workers" else d
+        )
+        return config
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_second_run_resumes_after_attempted_rows(
+        self, initialized_db: str, workers: int
+    ):
+        """Unmatched rows are not retried; rows that raised are."""
+        from cuepoint.models.result import TrackResult
+
+        _insert_row(initialized_db, 1, "1", "A", "No Match", label=None)
+        _insert_row(initialized_db, 2, "2", "B", "Boom", label=None)
+        _insert_row(initialized_db, 3, "3", "C", "Also No Match", label=None)
+
+        def process_track(idx, track):
+            if track.title == "Boom":
+                raise RuntimeError("network down")
+            return TrackResult(
+                playlist_index=idx,
+                title=track.title,
+                artist=track.artist,
+                matched=False,
+            )
+
+        processor = Mock()
+        processor.process_track.side_effect = process_track
+        kwargs = dict(
+            beatport_service=Mock(),
+            processor_service=processor,
+            config_service=self._config(workers),
+        )
+
+        assert enrichment.enrich_labels_for_empty(initialized_db, **kwargs) == 0
+        assert processor.process_track.call_count == 3
+
+        processor.process_track.reset_mock()
+        enrichment.enrich_labels_for_empty(initialized_db, **kwargs)
+        titles = [c.args[1].title for c in processor.process_track.call_args_list]
+        assert titles == ["Boom"]
+
+        processor.process_track.reset_mock()
+        enrichment.enrich_labels_for_empty(
+            initialized_db, retry_attempted=True, **kwargs
+        )
+        assert processor.process_track.call_count == 3
+
+    def test_rows_whose_search_failed_are_retried(self, initialized_db: str):
+        """An unmatched result from a failed search does not hide the row."""
+        from cuepoint.data.negative_cache import note_search_answered, note_search_failed
+        from cuepoint.models.result import TrackResult
+
+        _insert_row(initialized_db, 1, "1", "A", "Offline", label=None)
+        _insert_row(initialized_db, 2, "2", "B", "Nothing Found", label=None)
+
+        def process_track(idx, track):
+            if track.title == "Offline":
+                note_search_failed()
+            else:
+                note_search_answered()
+            return TrackResult(
+                playlist_index=idx, title=track.title, artist=track.artist, matched=False
+            )
+
+        processor = Mock()
+        processor.process_track.side_effect = process_track
+        kwargs = dict(
+            beatport_service=Mock(),
+            processor_service=processor,
+            config_service=self._config(1),
+        )
+        enrichment.enrich_labels_for_empty(initialized_db, **kwargs)
+
+        processor.process_track.reset_mock()
+        enrichment.enrich_labels_for_empty(initialized_db, **kwargs)
+        titles = [c.args[1].title for c in processor.process_track.call_args_list]
+        assert titles == ["Offline"]
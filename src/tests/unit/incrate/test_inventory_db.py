@@ -1,15 +1,18 @@
 """Unit tests for incrate inventory_db."""
 
+import time
 from pathlib import Path
 
 import pytest
 
 from cuepoint.incrate.inventory_db import (
+    EnrichmentWriter,
     get_all_inventory,
     get_connection,
     get_inventory_stats,
     get_library_artists,
     get_library_labels,
+    get_unlabeled_rows,
     has_artist,
     init_db,
     reset_db,
@@ -371,3 +374,118 @@ class TestGetAllInventory:
             assert rows[0]["label"] == "Label Y"
         finally:
             conn.close()
+
+
+def _seed_unlabeled(db_path: str, count: int) -> None:
+    now = "2025-02-26T12:00:00Z"
+    conn = get_connection(db_path)
+    try:
+        upsert_batch(
+            conn.cursor(),
+            [
+                InventoryRecord(
+                    str(i), str(i), f"A{i}", f"T{i}", "", None, None, None, now, now
+                )
+                for i in range(1, count + 1)
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class TestEnrichmentWriter:
+    """Test EnrichmentWriter and get_unlabeled_rows."""
+
+    def test_batches_updates_and_marks_attempts(self, initialized_db: str):
+        """Rows recorded from many calls commit in batch_size transactions."""
+        _seed_unlabeled(initialized_db, 5)
+        with EnrichmentWriter(
+            initialized_db, batch_size=2, flush_interval=60
+        ) as writer:
+            writer.record(1, "Label 1", "11", "https://www.beatport.com/track/t/11")
+            writer.record(2)
+            writer.record(3, "Label 3", None, "https://www.beatport.com/track/t/3")
+        assert writer.updated == 2
+        assert writer.attempted == 3
+        assert writer.batches == 2
+        conn = get_connection(initialized_db)
+        try:
+            cur = conn.cursor()
+            assert get_library_labels(cur) == ["Label 1", "Label 3"]
+            assert [r[0] for r in get_unlabeled_rows(cur)] == [4, 5]
+            assert [r[0] for r in get_unlabeled_rows(cur, include_attempted=True)] == [
+                2,
+                4,
+                5,
+            ]
+            cur.execute("PRAGMA journal_mode")
+            assert cur.fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    def test_failed_batch_is_written_row_by_row(self, initialized_db: str):
+        """A row that breaks the batch transaction does not drop the others."""
+        _seed_unlabeled(initialized_db, 3)
+        conn = get_connection(initialized_db)
+        try:
+            conn.execute(
+                "CREATE TRIGGER reject_bad BEFORE UPDATE ON inventory "
+                "WHEN NEW.label = 'Bad' BEGIN SELECT RAISE(ABORT, 'bad row'); END"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        with EnrichmentWriter(initialized_db, batch_size=3, flush_interval=60) as writer:
+            writer.record(1, "Label 1")
+            writer.record(2, "Bad")
+            writer.record(3, "Label 3")
+        assert (writer.updated, writer.attempted, writer.batches) == (2, 2, 1)
+        conn = get_connection(initialized_db)
+        try:
+            cur = conn.cursor()
+            assert get_library_labels(cur) == ["Label 1", "Label 3"]
+            assert [r[0] for r in get_unlabeled_rows(cur)] == [2]
+        finally:
+            conn.close()
+
+    def test_flush_interval_commits_partial_batch(self, initialized_db: str):
+        """A partial batch is committed once flush_interval elapses."""
+        _seed_unlabeled(initialized_db, 1)
+        with EnrichmentWriter(
+            initialized_db, batch_size=100, flush_interval=0.05
+        ) as writer:
+            writer.record(1, "Label 1")
+            deadline = time.monotonic() + 5
+            while writer.batches == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert writer.batches == 1
+
+    def test_changed_artist_or_title_is_eligible_again(self, initialized_db: str):
+        """An attempt only covers the artist/title the row had when tried."""
+        _seed_unlabeled(initialized_db, 1)
+        with EnrichmentWriter(initialized_db) as writer:
+            writer.record(1)
+        conn = get_connection(initialized_db)
+        try:
+            cur = conn.cursor()
+            assert get_unlabeled_rows(cur) == []
+            cur.execute("UPDATE inventory SET title = 'T1 (Extended Mix)' WHERE id = 1")
+            conn.commit()
+            assert [r[0] for r in get_unlabeled_rows(cur)] == [1]
+        finally:
+            conn.close()
+
+    def test_reset_db_clears_attempts(self, initialized_db: str):
+        """reset_db forgets attempted rows along with the inventory."""
+        _seed_unlabeled(initialized_db, 1)
+        with EnrichmentWriter(initialized_db) as writer:
+            writer.record(1)
+        reset_db(initialized_db)
+        conn = get_connection(initialized_db)
+        try:
+            cur = conn.cursor()
+            cur.execute("SELECT COUNT(*) FROM enrichment_attempts")
+            assert cur.fetchone()[0] == 0
+        finally:
+            conn.close()
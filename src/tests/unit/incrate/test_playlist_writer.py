@@ -2,11 +2,14 @@
 
 from unittest.mock import Mock
 
+from cuepoint.exceptions.cuepoint_exceptions import BeatportAPIError
 from cuepoint.incrate.beatport_api_models import DiscoveredTrack
 from cuepoint.incrate.playlist_writer import (
     PlaylistResult,
+    add_tracks_with_retry,
     create_playlist_and_add_tracks,
 )
+from cuepoint.services.beatport_api import BeatportApi
 
 
 def _track(track_id: int = 100, title: str = "Track", artists: str = "Artist"):
@@ -110,3 +113,106 @@ class TestPlaylistResultOnApiError:
             or "401" in result.error.lower()
             or "unauthorized" in result.error.lower()
         )
+
+
+class FakeBeatportClient:
+    """In-memory stand-in for BeatportApiClient's playlist endpoints.
+
+    ``fail_posts`` holds (status, applied) pairs consumed by the next POSTs
+    to the tracks endpoint: applied=True stores the track before failing,
+    like a request that timed out after the server handled it.
+    """
+
+    def __init__(self):
+        self.playlists = {}
+        self.posts = []
+        self.fail_posts = []
+
+    def post(self, path, json=None):
+        parts = path.strip("/").split("/")
+        self.posts.append(path)
+        if parts == ["my", "playlists"]:
+            pid = str(len(self.playlists) + 1)
+            self.playlists[pid] = []
+            return {"id": pid}
+        pid = parts[2]
+        status, applied = self.fail_posts.pop(0) if self.fail_posts else (0, True)
+        if applied:
+            self.playlists[pid].append(json["track_id"])
+        if status:
+            raise BeatportAPIError(f"HTTP {status}", status_code=status)
+        return {}
+
+    def get(self, path, params=None):
+        pid = path.strip("/").split("/")[2]
+        page, per_page = params["page"], params["per_page"]
+        all_ids = self.playlists[pid]
+        ids = all_ids[(page - 1) * per_page : page * per_page]
+        more = page * per_page < len(all_ids)
+        return {
+            "results": [{"track": {"id": tid}} for tid in ids],
+            "next": f"{path}?page={page + 1}" if more else None,
+        }
+
+
+class TestAddTracksWithRetry:
+    """Test add_tracks_with_retry against FakeBeatportClient."""
+
+    def test_adds_in_order_and_reports_progress(self):
+        client = FakeBeatportClient()
+        progress = []
+        result = create_playlist_and_add_tracks(
+            "feb26",
+            [_track(i) for i in range(30)],
+            api_client=BeatportApi(client),
+            progress_callback=lambda *a: progress.append(a),
+        )
+        assert result.success and result.added_count == 30
+        assert client.playlists["1"] == list(range(30))
+        assert progress == [(n, 30) for n in range(1, 31)]
+
+    def test_retry_of_applied_add_does_not_duplicate(self):
+        client = FakeBeatportClient()
+        client.fail_posts = [(0, True), (500, True)]
+        api = BeatportApi(client)
+        pid = api.create_playlist("feb26")
+        added = add_tracks_with_retry(api, pid, range(5), retry_delay=0)
+        assert added.added == 5 and not added.failed_track_ids
+        assert client.playlists[pid] == list(range(5))
+
+    def test_retry_of_unapplied_add_resends(self):
+        client = FakeBeatportClient()
+        client.fail_posts = [(503, False)]
+        api = BeatportApi(client)
+        pid = api.create_playlist("feb26")
+        added = add_tracks_with_retry(api, pid, range(3), retry_delay=0)
+        assert added.added == 3
+        assert client.playlists[pid] == list(range(3))
+
+    def test_persistent_failure_reports_failed_ids(self):
+        client = FakeBeatportClient()
+        client.fail_posts = [(500, False)] * 3
+        api = BeatportApi(client)
+        pid = api.create_playlist("feb26")
+        added = add_tracks_with_retry(api, pid, range(4), retry_delay=0)
+        assert added.failed_track_ids == [0]
+        assert added.added == 3
+        assert client.playlists[pid] == [1, 2, 3]
+
+    def test_auth_failure_before_any_add_fails_api_path(self):
+        client = FakeBeatportClient()
+        client.fail_posts = [(401, False)]
+        result = create_playlist_and_add_tracks(
+            "feb26", [_track(1), _track(2)], api_client=BeatportApi(client)
+        )
+        assert result.success is False
+
+    def test_auth_failure_later_stops_and_reports_the_rest(self):
+        client = FakeBeatportClient()
+        client.fail_posts = [(0, True), (403, False)]
+        api = BeatportApi(client)
+        pid = api.create_playlist("feb26")
+        added = add_tracks_with_retry(api, pid, range(4), retry_delay=0)
+        assert added.added == 1
+        assert added.failed_track_ids == [1, 2, 3]
+        assert len(client.posts) == 3
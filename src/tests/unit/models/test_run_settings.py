@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for RunSettings."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cuepoint.models.config import SETTINGS
+from cuepoint.models.run_settings import RunSettings, settings_or_global
+
+
+def test_resolve_snapshots_settings():
+    """Later changes to SETTINGS do not reach an existing snapshot."""
+    with patch.dict(SETTINGS, {"MIN_ACCEPT_SCORE": 70}):
+        snapshot = RunSettings.resolve()
+        SETTINGS["MIN_ACCEPT_SCORE"] = 10
+        assert snapshot["MIN_ACCEPT_SCORE"] == 70
+    assert set(snapshot) == set(SETTINGS)
+
+
+def test_resolve_applies_overrides_on_top_of_settings():
+    config = Mock()
+    snapshot = RunSettings.resolve({"TRACK_WORKERS": 3}, config)
+    assert snapshot["TRACK_WORKERS"] == 3
+    assert snapshot["TITLE_WEIGHT"] == SETTINGS["TITLE_WEIGHT"]
+    config.get.assert_not_called()
+
+
+def test_resolve_uses_config_service_without_overrides():
+    config = Mock()
+    config.get.side_effect = lambda key, default=None: (
+        5 if key == "TRACK_WORKERS" else default
+    )
+    snapshot = RunSettings.resolve(None, config)
+    assert snapshot["TRACK_WORKERS"] == 5
+    assert snapshot["MIN_ACCEPT_SCORE"] == SETTINGS["MIN_ACCEPT_SCORE"]
+
+
+def test_resolve_returns_existing_snapshot():
+    snapshot = RunSettings.resolve()
+    assert RunSettings.resolve(snapshot, Mock()) is snapshot
+
+
+def test_snapshot_is_read_only_and_replace_copies():
+    snapshot = RunSettings({"MAX_SEARCH_RESULTS": 50})
+    with pytest.raises(TypeError):
+        snapshot["MAX_SEARCH_RESULTS"] = 100  # type: ignore[index]
+    enhanced = snapshot.replace(MAX_SEARCH_RESULTS=100)
+    assert enhanced["MAX_SEARCH_RESULTS"] == 100
+    assert snapshot["MAX_SEARCH_RESULTS"] == 50
+    assert enhanced.get("MISSING", "default") == "default"
+
+
+def test_settings_or_global():
+    assert settings_or_global(None) is SETTINGS
+    snapshot = RunSettings()
+    assert settings_or_global(snapshot) is snapshot
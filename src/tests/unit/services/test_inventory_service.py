@@ -4,6 +4,7 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from cuepoint.incrate import inventory_db
 from cuepoint.services.inventory_service import (
     InventoryService,
     default_inventory_db_path,
@@ -64,6 +65,35 @@ class TestInventoryServiceImport:
         assert result["imported"] == 1
         assert "enriched" in result
 
+    def test_import_can_retry_attempted_rows(self, tmp_path: Path):
+        """retry_attempted reaches enrichment; clear_enrichment_attempts forgets attempts."""
+        xml_path = tmp_path / "test.xml"
+        xml_path.write_text(
+            _minimal_collection_xml([{"TrackID": "1", "Name": "T", "Artist": "A"}]),
+            encoding="utf-8",
+        )
+        service = InventoryService(
+            db_path=str(tmp_path / "inventory.sqlite"), beatport_service=Mock()
+        )
+        with patch(
+            "cuepoint.services.inventory_service.enrichment.enrich_labels_for_empty",
+            return_value=0,
+        ) as enrich:
+            service.import_from_xml(str(xml_path), retry_attempted=True)
+        assert enrich.call_args.kwargs["retry_attempted"] is True
+
+        conn = inventory_db.get_connection(service.db_path)
+        try:
+            conn.execute(
+                "INSERT INTO enrichment_attempts (inventory_id, artist, title, attempted_at) "
+                "SELECT id, artist, title, 'now' FROM inventory"
+            )
+            conn.commit()
+            service.clear_enrichment_attempts()
+            assert conn.execute("SELECT COUNT(*) FROM enrichment_attempts").fetchone()[0] == 0
+        finally:
+            conn.close()
+
 
 class TestInventoryServiceGetters:
     """Test get_library_artists, get_inventory_stats after import."""
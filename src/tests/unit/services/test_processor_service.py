@@ -1051,6 +1051,37 @@ class TestProcessorService:
         call_kwargs = mock_matcher.find_best_match.call_args[1]
         assert "input_mix" in call_kwargs
 
+    def test_process_track_passes_settings_snapshot_to_matcher(
+        self,
+        mock_beatport_service,
+        mock_logging_service,
+        mock_config_service,
+        sample_track,
+    ):
+        """Run overrides reach the matcher as one read-only snapshot."""
+        from cuepoint.models.run_settings import RunSettings
+
+        mock_matcher = Mock()
+        mock_matcher.find_best_match.return_value = (None, [], [], 1)
+        service = ProcessorService(
+            beatport_service=mock_beatport_service,
+            matcher_service=mock_matcher,
+            logging_service=mock_logging_service,
+            config_service=mock_config_service,
+        )
+
+        service.process_playlist(
+            [sample_track, sample_track], settings={"MAX_SEARCH_RESULTS": 9}
+        )
+
+        snapshots = [
+            c.kwargs["settings"] for c in mock_matcher.find_best_match.call_args_list
+        ]
+        assert len(snapshots) == 2 and snapshots[0] is snapshots[1]
+        assert isinstance(snapshots[0], RunSettings)
+        assert snapshots[0]["MAX_SEARCH_RESULTS"] == 9
+        mock_config_service.get.assert_not_called()
+
     def test_process_track_score_below_threshold(
         self,
         mock_beatport_service,
@@ -1269,6 +1300,181 @@ class TestProcessorService:
         finally:
             Path(xml_path).unlink(missing_ok=True)
 
+    def test_auto_research_resumes_after_executed_queries(
+        self,
+        mock_beatport_service,
+        mock_logging_service,
+        mock_config_service,
+    ):
+        """Re-search runs only the plan queries past the ones already executed."""
+        from cuepoint.core.query_plan import query_plan_cache
+        from cuepoint.models.config import SETTINGS
+
+        def config_get(key, default=None):
+            return SETTINGS.get(key, default)
+
+        mock_config_service.get.side_effect = config_get
+
+        def candidate(url, score, query_index, is_winner=False):
+            return BeatportCandidate(
+                url=url,
+                title="Strobe",
+                artists="deadmau5",
+                key=None,
+                release_year=None,
+                bpm=None,
+                label=None,
+                genre=None,
+                release_name=None,
+                release_date=None,
+                score=score,
+                title_sim=int(score),
+                artist_sim=int(score),
+                query_index=query_index,
+                query_text="q",
+                candidate_index=1,
+                base_score=score,
+                bonus_year=0,
+                bonus_key=0,
+                guard_ok=True,
+                reject_reason="",
+                elapsed_ms=10,
+                is_winner=is_winner,
+            )
+
+        weak = candidate("https://www.beatport.com/track/strobe/1", 50.0, 1, True)
+        strong = candidate("https://www.beatport.com/track/strobe/2", 90.0, 1, True)
+        mock_matcher = Mock()
+        mock_matcher.find_best_match.side_effect = [
+            (weak, [weak], [(1, "q1", 1, 10), (2, "q2", 0, 10)], 2),
+            (strong, [strong], [(1, "q3", 1, 10)], 1),
+        ]
+        service = ProcessorService(
+            beatport_service=mock_beatport_service,
+            matcher_service=mock_matcher,
+            logging_service=mock_logging_service,
+            config_service=mock_config_service,
+        )
+        track = Track(title="Strobe (Extended Mix)", artist="deadmau5")
+        first = service.process_track(1, track, dict(SETTINGS))
+        assert first.matched is False
+
+        enhanced = {**SETTINGS, "MAX_QUERIES_PER_TRACK": 60}
+        second = service._research_track(1, track, enhanced, first)
+
+        plan = query_plan_cache.get_or_build(track.title, track.artist)
+        resumed_queries = mock_matcher.find_best_match.call_args.kwargs["queries"]
+        assert list(resumed_queries) == plan.queries_for(60)[2:]
+        assert second.matched is True
+        assert second.best_match.query_index == 3
+        assert [q["index"] for q in second.queries_data] == [1, 2, 3]
+        assert [c.is_winner for c in second.candidates] == [False, True]
+
+    def test_auto_research_overlaps_main_pass(
+        self,
+        mock_beatport_service,
+        mock_logging_service,
+        mock_config_service,
+    ):
+        """An unmatched track is re-searched while the main pass is still running."""
+        import threading
+
+        from cuepoint.models.config import SETTINGS
+
+        mock_config_service.get.side_effect = lambda key, default=None: SETTINGS.get(
+            key, default
+        )
+        match = BeatportCandidate(
+            url="https://www.beatport.com/track/track-1/1",
+            title="Track 1",
+            artists="Artist 1",
+            key=None,
+            release_year=None,
+            bpm=None,
+            label=None,
+            genre=None,
+            release_name=None,
+            release_date=None,
+            score=95.0,
+            title_sim=95,
+            artist_sim=95,
+            query_index=1,
+            query_text="Track 1 Artist 1",
+            candidate_index=1,
+            base_score=95.0,
+            bonus_year=0,
+            bonus_key=0,
+            guard_ok=True,
+            reject_reason="",
+            elapsed_ms=10,
+            is_winner=True,
+        )
+        calls = {"Track 1": 0}
+        researched = threading.Event()
+        overlapped = []
+
+        def find_best_match(**kwargs):
+            title = kwargs["track_title"]
+            if title == "Track 1":
+                calls[title] += 1
+                if calls[title] == 2:
+                    researched.set()
+                    return (match, [match], [(1, "Track 1 Artist 1", 1, 10)], 1)
+            elif title == "Track 2":
+                # Still in the main pass: wait for track 1's re-search to start
+                overlapped.append(researched.wait(timeout=5))
+                return (match, [match], [(1, "Track 2 Artist 2", 1, 10)], 1)
+            return (None, [], [], 1)
+
+        mock_matcher = Mock()
+        mock_matcher.find_best_match.side_effect = find_best_match
+        service = ProcessorService(
+            beatport_service=mock_beatport_service,
+            matcher_service=mock_matcher,
+            logging_service=mock_logging_service,
+            config_service=mock_config_service,
+        )
+
+        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+<DJ_PLAYLISTS>
+    <COLLECTION>
+        <TRACK TrackID="1" Name="Track 1" Artist="Artist 1"/>
+        <TRACK TrackID="2" Name="Track 2" Artist="Artist 2"/>
+        <TRACK TrackID="3" Name="Track 3" Artist="Artist 3"/>
+    </COLLECTION>
+    <PLAYLISTS>
+        <NODE Name="ROOT">
+            <NODE Name="Test Playlist" Type="1">
+                <TRACK Key="1"/>
+                <TRACK Key="2"/>
+                <TRACK Key="3"/>
+            </NODE>
+        </NODE>
+    </PLAYLISTS>
+</DJ_PLAYLISTS>"""
+
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".xml", delete=False, encoding="utf-8"
+        ) as f:
+            f.write(xml_content)
+            xml_path = f.name
+
+        try:
+            results = service.process_playlist_from_xml(
+                xml_path,
+                "ROOT/Test Playlist",
+                settings={"TRACK_WORKERS": 2},
+                auto_research=True,
+            )
+        finally:
+            Path(xml_path).unlink(missing_ok=True)
+
+        assert overlapped == [True]
+        assert [r.matched for r in results] == [True, True, False]
+        # Each unmatched track is re-searched exactly once
+        assert calls["Track 1"] == 2
+        assert mock_matcher.find_best_match.call_count == 5
+
     def test_process_playlist_from_xml_progress_callback_exception(
         self,
         mock_beatport_service,
@@ -0,0 +1,183 @@
+"""Unit tests for resumable, segmented update downloads."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cuepoint.update.resumable_download import (
+    DownloadCancelled,
+    DownloadError,
+    ResumableDownload,
+)
+from cuepoint.update.security import PackageIntegrityVerifier
+
+PAYLOAD = os.urandom(300_000)
+
+
+class RangeServer:
+    """Local HTTP server serving one file with optional Range support.
+
+    ``drop_after`` makes the next GET close the connection after that many
+    body bytes (once per entry in the list).
+    """
+
+    def __init__(self, payload=PAYLOAD, ranges=True, etag='"v1"'):
+        self.payload = payload
+        self.ranges = ranges
+        self.etag = etag
+        self.drop_after = []
+        self.requests = []
+        self.bytes_sent = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _headers(self, status, length, extra=()):
+                self.send_response(status)
+                self.send_header("Content-Length", str(length))
+                self.send_header("ETag", server.etag)
+                if server.ranges:
+                    self.send_header("Accept-Ranges", "bytes")
+                for key, value in extra:
+                    self.send_header(key, value)
+                self.end_headers()
+
+            def do_HEAD(self):
+                self._headers(200, len(server.payload))
+
+            def do_GET(self):
+                body = server.payload
+                status, extra = 200, []
+                requested = self.headers.get("Range")
+                if_range = self.headers.get("If-Range")
+                server.requests.append(requested)
+                match = re.match(r"bytes=(\d+)-(\d+)", requested or "")
+                if server.ranges and match and if_range in (None, server.etag):
+                    start, end = int(match.group(1)), int(match.group(2))
+                    body = body[start : end + 1]
+                    status = 206
+                    extra = [("Content-Range", f"bytes {start}-{end}/{len(server.payload)}")]
+                self._headers(status, len(body), extra)
+                if server.drop_after:
+                    body = body[: server.drop_after.pop(0)]
+                self.wfile.write(body)
+                server.bytes_sent += len(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/CuePoint-Setup.exe"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    srv = RangeServer()
+    yield srv
+    srv.close()
+
+
+def _job(url, tmp_path, **kwargs):
+    kwargs.setdefault("retry_backoff", 0)
+    kwargs.setdefault("segments", 1)
+    return ResumableDownload(url, tmp_path / "CuePoint-Setup.exe", **kwargs)
+
+
+class TestResumableDownload:
+    """Test ResumableDownload against a local range-capable server."""
+
+    def test_single_stream_hashes_while_downloading(self, server, tmp_path):
+        """The file and its digest match; no partial or state file remains."""
+        job = _job(server.url, tmp_path)
+        path = job.run()
+        assert path.read_bytes() == PAYLOAD
+        assert job.sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+        assert not job.part_path.exists()
+        assert not job.state_path.exists()
+
+    def test_parallel_segments(self, server, tmp_path):
+        """Large files are split into ranges fetched concurrently."""
+        job = _job(server.url, tmp_path, segments=4, min_segment_size=50_000)
+        path = job.run()
+        assert path.read_bytes() == PAYLOAD
+        assert job.sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+        assert len(server.requests) == 4
+        assert all(r and r.startswith("bytes=") for r in server.requests)
+
+    def test_dropped_connection_resumes(self, server, tmp_path):
+        """A drop at 90% continues from the last byte instead of restarting."""
+        server.drop_after = [270_000]
+        job = _job(server.url, tmp_path)
+        path = job.run()
+        assert path.read_bytes() == PAYLOAD
+        assert job.sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+        resume_start = int(server.requests[-1].split("=")[1].split("-")[0])
+        assert resume_start >= 200_000
+        assert server.bytes_sent == len(PAYLOAD)
+
+    def test_resumes_from_state_file_across_runs(self, server, tmp_path):
+        """A run that stops making progress leaves state the next run resumes."""
+        server.drop_after = [200_000, 0]
+        first = _job(server.url, tmp_path, max_retries=0)
+        with pytest.raises(DownloadError):
+            first.run()
+        state = json.loads(first.state_path.read_text(encoding="utf-8"))
+        assert state["segments"][0][2] > 0
+
+        second = _job(server.url, tmp_path)
+        second.run()
+        assert second.resumed_from == state["segments"][0][2]
+        assert second.sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+        assert server.bytes_sent == len(PAYLOAD)
+
+    def test_changed_file_discards_partial(self, server, tmp_path):
+        """A new ETag invalidates the partial download."""
+        server.drop_after = [100_000, 0]
+        with pytest.raises(DownloadError):
+            _job(server.url, tmp_path, max_retries=0).run()
+        server.payload = PAYLOAD[::-1]
+        server.etag = '"v2"'
+        job = _job(server.url, tmp_path)
+        assert job.run().read_bytes() == PAYLOAD[::-1]
+        assert job.resumed_from == 0
+
+    def test_server_without_ranges_restarts(self, tmp_path):
+        """Without range support a drop restarts the stream from zero."""
+        srv = RangeServer(ranges=False)
+        try:
+            srv.drop_after = [150_000]
+            job = _job(srv.url, tmp_path, segments=4, min_segment_size=50_000)
+            assert job.run().read_bytes() == PAYLOAD
+            assert job.sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+            assert srv.requests == [None, None]
+        finally:
+            srv.close()
+
+    def test_cancel_keeps_partial_for_resume(self, server, tmp_path):
+        """Cancelling stops the download but keeps the state file."""
+        job = _job(server.url, tmp_path)
+        job.progress_callback = lambda received, total: job.cancel()
+        with pytest.raises(DownloadCancelled):
+            job.run()
+        assert job.state_path.exists()
+        assert not job.target.exists()
+
+
+def test_verify_checksum_uses_precomputed_digest(tmp_path):
+    """A digest computed during download is compared without re-reading."""
+    path = tmp_path / "pkg.bin"
+    path.write_bytes(b"not the hashed content")
+    digest = hashlib.sha256(PAYLOAD).hexdigest()
+    ok, err = PackageIntegrityVerifier.verify_checksum(path, digest, actual_checksum=digest.upper())
+    assert ok and err is None
+    ok, err = PackageIntegrityVerifier.verify_checksum(path, "0" * 64, actual_checksum=digest)
+    assert not ok and "mismatch" in err
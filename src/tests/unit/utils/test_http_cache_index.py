@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for the HTTP cache side index and LRU pruning."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cuepoint.utils.http_cache import CacheConfig, CacheIndex, CachePruner, HTTPCacheManager
+
+BODY_BYTES = 10_000
+
+
+@pytest.fixture
+def base_url():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            body = b"x" * BODY_BYTES
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    HTTPCacheManager.close()
+    HTTPCacheManager.initialize(CacheConfig(cache_dir=tmp_path, size_limit=1024 * 1024))
+    if HTTPCacheManager.get_index() is None:
+        pytest.skip("requests-cache not available")
+    yield HTTPCacheManager.get_session()
+    HTTPCacheManager.close()
+
+
+def _keys(index):
+    return [key for key, _size in index.lru(1000)]
+
+
+def test_index_tracks_saved_responses(cache, base_url):
+    for n in range(5):
+        cache.get(f"{base_url}/track/{n}")
+    stats = HTTPCacheManager.get_cache_stats()
+    assert stats["entries"] == 5
+    assert 5 * BODY_BYTES <= stats["size"] < 6 * BODY_BYTES
+
+
+def test_prune_evicts_least_recently_used_first(cache, base_url):
+    urls = [f"{base_url}/track/{n}" for n in range(5)]
+    for url in urls:
+        cache.get(url)
+    keys = _keys(HTTPCacheManager.get_index())
+    assert cache.get(urls[0]).from_cache
+
+    removed = CachePruner.prune_to_size(3 * BODY_BYTES + BODY_BYTES // 2)
+
+    assert removed == 2
+    assert _keys(HTTPCacheManager.get_index()) == [keys[3], keys[4], keys[0]]
+
+
+def test_prune_without_index_removes_oldest_responses(cache, base_url, monkeypatch):
+    urls = [f"{base_url}/track/{n}" for n in range(5)]
+    for url in urls:
+        cache.get(url)
+    responses = cache.cache.responses
+    keys = _keys(HTTPCacheManager.get_index())
+    monkeypatch.setattr(HTTPCacheManager, "_index", None)
+    monkeypatch.setattr(
+        HTTPCacheManager, "get_cache_size", lambda: len(list(responses.keys())) * BODY_BYTES
+    )
+
+    assert CachePruner.prune_to_size(2 * BODY_BYTES) == 3
+    assert sorted(responses.keys()) == sorted(keys[3:])
+
+
+def test_clear_keeps_indexing_new_responses(cache, base_url):
+    cache.get(f"{base_url}/track/1")
+    HTTPCacheManager.clear_cache()
+    assert HTTPCacheManager.get_cache_stats()["entries"] == 0
+    cache.get(f"{base_url}/track/2")
+    assert HTTPCacheManager.get_cache_stats()["entries"] == 1
+
+
+def test_existing_responses_are_indexed_on_install(cache, base_url):
+    cache.get(f"{base_url}/track/1")
+    responses = cache.cache.responses
+    with responses.connection(commit=True) as con:
+        con.execute(f"DROP TABLE {CacheIndex.TABLE}")
+    index = CacheIndex(responses)
+    assert index.stats()["entries"] == 1
+    assert index.total_size() >= BODY_BYTES
+
+
+def test_oversized_cache_is_pruned_in_background_on_startup(tmp_path, base_url):
+    HTTPCacheManager.close()
+    HTTPCacheManager.initialize(CacheConfig(cache_dir=tmp_path))
+    if HTTPCacheManager.get_index() is None:
+        pytest.skip("requests-cache not available")
+    session = HTTPCacheManager.get_session()
+    for n in range(10):
+        session.get(f"{base_url}/track/{n}")
+    HTTPCacheManager.close()
+
+    try:
+        HTTPCacheManager.initialize(CacheConfig(cache_dir=tmp_path, size_limit=8 * BODY_BYTES))
+        thread = CachePruner._thread
+        assert thread is not None
+        thread.join(10)
+        assert HTTPCacheManager.get_cache_stats()["size"] <= 4 * BODY_BYTES
+    finally:
+        HTTPCacheManager.close()
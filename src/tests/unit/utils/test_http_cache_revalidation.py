@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for conditional revalidation and per-URL-class TTLs of the HTTP cache."""
+
+import threading
+from datetime import timedelta
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cuepoint.utils.http_cache import CacheConfig, HTTPCacheManager
+
+
+@pytest.fixture
+def server():
+    """Stand-in for Beatport: ETag pages under /track/, Last-Modified pages under /search."""
+    state = {"version": 1, "full": 0, "not_modified": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            version = state["version"]
+            if self.path.startswith("/track/"):
+                validator = ("ETag", f'"v{version}"')
+                current = self.headers.get("If-None-Match") == validator[1]
+            else:
+                validator = ("Last-Modified", formatdate(1_700_000_000 + version, usegmt=True))
+                current = self.headers.get("If-Modified-Since") == validator[1]
+            if current:
+                state["not_modified"] += 1
+                self.send_response(304)
+                self.send_header(*validator)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            state["full"] += 1
+            body = f"page {self.path} v{version}".encode()
+            self.send_response(200)
+            self.send_header(*validator)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    state["base"] = f"http://127.0.0.1:{httpd.server_port}"
+    yield state
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _session(tmp_path, url_ttls):
+    HTTPCacheManager.close()
+    HTTPCacheManager.initialize(CacheConfig(cache_dir=tmp_path, url_ttls=url_ttls))
+    session = HTTPCacheManager.get_session()
+    if session is None:
+        pytest.skip("requests-cache not available")
+    return session
+
+
+@pytest.fixture(autouse=True)
+def _close_cache():
+    yield
+    HTTPCacheManager.close()
+
+
+def test_expired_entries_are_revalidated_with_304(tmp_path, server):
+    session = _session(tmp_path, {"127.0.0.1*/track/": timedelta(0)})
+    url = f"{server['base']}/track/1"
+
+    assert session.get(url).text == "page /track/1 v1"
+    second = session.get(url)
+    third = session.get(url)
+
+    assert second.from_cache and second.text == "page /track/1 v1"
+    assert third.from_cache
+    assert (server["full"], server["not_modified"]) == (1, 2)
+
+    server["version"] = 2
+    assert session.get(url).text == "page /track/1 v2"
+    assert server["full"] == 2
+
+    stats = HTTPCacheManager.get_cache_stats()["revalidation"]
+    assert stats["misses"] == 1
+    assert (stats["revalidated"], stats["modified"]) == (2, 1)
+    assert stats["revalidation_hit_ratio"] == pytest.approx(2 / 3)
+
+
+def test_last_modified_is_used_when_there_is_no_etag(tmp_path, server):
+    session = _session(tmp_path, {"127.0.0.1*/search": timedelta(0)})
+    url = f"{server['base']}/search?q=solomun"
+
+    session.get(url)
+    assert session.get(url).from_cache
+    assert (server["full"], server["not_modified"]) == (1, 1)
+
+
+def test_url_classes_get_their_own_ttl(tmp_path, server):
+    session = _session(
+        tmp_path,
+        {"127.0.0.1*/search": timedelta(hours=6), "127.0.0.1*/track/": timedelta(days=30)},
+    )
+    search = session.get(f"{server['base']}/search?q=a")
+    track = session.get(f"{server['base']}/track/2")
+    search_ttl = search.expires - search.created_at
+    track_ttl = track.expires - track.created_at
+
+    assert timedelta(hours=5) < search_ttl <= timedelta(hours=6)
+    assert timedelta(days=29) < track_ttl <= timedelta(days=30)
+    # Fresh entries are served without contacting the server
+    assert session.get(f"{server['base']}/track/2").from_cache
+    assert server["not_modified"] == 0
+    assert HTTPCacheManager.get_cache_stats()["revalidation"]["hits"] == 1
+
+
+def test_default_url_ttls_cover_beatport_search_and_track_pages():
+    ttls = CacheConfig(cache_dir=None).url_ttls
+    assert ttls["*beatport.com/search"] < CacheConfig.default_ttl < ttls["*beatport.com/track/"]
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for the shared HTTP connection pool."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from cuepoint.utils import http_pool
+from cuepoint.utils.http_pool import (
+    DNSCache,
+    HttpxAdapter,
+    PoolConfig,
+    PooledHTTPAdapter,
+    PoolMetrics,
+    create_adapter,
+    register_transport,
+)
+from cuepoint.utils.run_performance_collector import RunPerformanceCollector
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+
+@pytest.fixture
+def server_url():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://localhost:{httpd.server_port}/"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _session(config, metrics):
+    session = requests.Session()
+    session.mount("http://", PooledHTTPAdapter(config, metrics))
+    return session
+
+
+def test_pool_size_derived_from_workers():
+    assert PoolConfig.from_settings({"TRACK_WORKERS": 4, "CANDIDATE_WORKERS": 8}).pool_maxsize == 32
+    assert PoolConfig.from_settings({"TRACK_WORKERS": 1, "CANDIDATE_WORKERS": 2}).pool_maxsize == 10
+    capped = PoolConfig.from_settings(
+        {"TRACK_WORKERS": 12, "CANDIDATE_WORKERS": 15, "HTTP_POOL_MAXSIZE_CAP": 64}
+    )
+    assert capped.pool_maxsize == 64
+    assert PoolConfig.from_settings({"HTTP_POOL_MAXSIZE": 7}).pool_maxsize == 7
+
+
+def test_sequential_requests_reuse_one_connection(server_url):
+    metrics = PoolMetrics()
+    session = _session(PoolConfig(), metrics)
+    for _ in range(5):
+        assert session.get(server_url).text == "ok"
+    stats = metrics.snapshot()
+    assert stats["requests"] == 5
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 4
+    assert stats["reuse_ratio"] == 0.8
+    assert stats["dns_misses"] == 1
+
+
+def test_undersized_pool_discards_connections(server_url):
+    """Concurrency above pool_maxsize shows up as discards; a sized pool has none."""
+    small, sized = PoolMetrics(), PoolMetrics()
+    for config, metrics in (
+        (PoolConfig(pool_maxsize=1), small),
+        (PoolConfig(pool_maxsize=8), sized),
+    ):
+        session = _session(config, metrics)
+        barrier = threading.Barrier(8)
+
+        def fetch(_):
+            barrier.wait()
+            return session.get(server_url).status_code
+
+        with ThreadPoolExecutor(8) as ex:
+            assert set(ex.map(fetch, range(8))) == {200}
+    assert small.snapshot()["discarded"] > 0
+    assert sized.snapshot()["discarded"] == 0
+
+
+def test_blocking_pool_counts_waits(server_url):
+    metrics = PoolMetrics()
+    session = _session(PoolConfig(pool_maxsize=1, pool_block=True), metrics)
+    with ThreadPoolExecutor(4) as ex:
+        list(ex.map(lambda _: session.get(server_url), range(8)))
+    stats = metrics.snapshot()
+    assert stats["new_connections"] == 1
+    assert stats["discarded"] == 0
+    assert stats["pool_waits"] > 0
+
+
+def test_dns_cache_hits_and_invalidation():
+    metrics = PoolMetrics()
+    cache = DNSCache(ttl=60, metrics=metrics)
+    assert cache.resolve("127.0.0.1", 80) is None
+    with patch("socket.getaddrinfo", return_value=[(2, 1, 6, "", ("10.0.0.5", 443))]) as lookup:
+        assert cache.resolve("beatport.test", 443) == "10.0.0.5"
+        assert cache.resolve("beatport.test", 443) == "10.0.0.5"
+        cache.invalidate("beatport.test")
+        cache.resolve("beatport.test", 443)
+    assert lookup.call_count == 2
+    assert metrics.snapshot()["dns_hits"] == 1
+
+
+def test_unavailable_transport_falls_back_to_urllib3():
+    def missing(config, metrics):
+        raise ImportError("no h2")
+
+    register_transport("test-missing", missing)
+    assert isinstance(create_adapter(PoolConfig(transport="test-missing")), PooledHTTPAdapter)
+    assert isinstance(create_adapter(PoolConfig(transport="nope")), PooledHTTPAdapter)
+
+
+def test_httpx_adapter_builds_requests_response():
+    calls = []
+
+    class FakeClient:
+        def request(self, method, url, **kwargs):
+            calls.append((method, url, kwargs))
+            return SimpleNamespace(
+                status_code=200,
+                headers={"Content-Type": "text/html; charset=utf-8"},
+                content=b"<html>ok</html>",
+                url=url,
+                reason_phrase="OK",
+            )
+
+        def close(self):
+            pass
+
+    metrics = PoolMetrics()
+    session = requests.Session()
+    session.mount("https://", HttpxAdapter(PoolConfig(), metrics, client=FakeClient()))
+    resp = session.get("https://www.beatport.com/track/x/1", timeout=(3, 8))
+    assert resp.status_code == 200
+    assert resp.text == "<html>ok</html>"
+    assert calls[0][2]["timeout"] == (3, 8, 8, 3)
+    assert metrics.snapshot()["requests"] == 1
+
+
+def test_ensure_capacity_grows_shared_pool(monkeypatch):
+    adapter = PooledHTTPAdapter(PoolConfig(pool_maxsize=10), PoolMetrics())
+    monkeypatch.setattr(http_pool, "_shared_adapter", adapter)
+    http_pool.ensure_capacity({"TRACK_WORKERS": 4, "CANDIDATE_WORKERS": 6})
+    assert adapter.pool_maxsize == 24
+    http_pool.ensure_capacity({"TRACK_WORKERS": 1, "CANDIDATE_WORKERS": 1})
+    assert adapter.pool_maxsize == 24
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 24
+
+
+def test_run_report_includes_pool_usage():
+    collector = RunPerformanceCollector()
+    collector.start_run()
+    http_pool.POOL_METRICS.record("requests", 3)
+    http_pool.POOL_METRICS.record("new_connections")
+    http_pool.POOL_METRICS.record("reused_connections", 2)
+    collector.end_run()
+    pool = collector.get_report().to_dict()["http_pool"]
+    assert pool["requests"] == 3
+    assert pool["reuse_ratio"] == pytest.approx(0.667)
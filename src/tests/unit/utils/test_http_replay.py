@@ -0,0 +1,142 @@
+"""Unit tests for HTTP record/replay (fixture store, stand-in server, adapters)."""
+
+import time
+
+import requests
+
+from cuepoint.utils.http_replay import (
+    FixtureStore,
+    RecordedResponse,
+    ReplayServer,
+    SyntheticCatalog,
+    canonical_url,
+    percentile,
+    recording,
+    replaying,
+)
+
+URL = "https://www.beatport.com/track/test-track/123456"
+
+
+def _html(url, text="<h1>Test Track</h1>", status=200):
+    return RecordedResponse(
+        url=url, status=status, body=text.encode("utf-8"), headers={"Content-Type": "text/html"}
+    )
+
+
+class TestFixtureStore:
+    """Test FixtureStore."""
+
+    def test_roundtrip(self, tmp_path):
+        """Stored responses come back byte-for-byte with kept headers."""
+        store = FixtureStore(tmp_path)
+        store.put(_html(URL))
+        got = store.get(URL)
+        assert got.status == 200
+        assert got.body == b"<h1>Test Track</h1>"
+        assert got.headers == {"Content-Type": "text/html"}
+        assert URL in store
+        assert len(store) == 1
+
+    def test_missing(self, tmp_path):
+        """Unknown URLs return None."""
+        assert FixtureStore(tmp_path).get(URL) is None
+
+    def test_canonical_url_ignores_cache_buster_and_order(self):
+        """Query order and the _r cache-buster do not change the key."""
+        a = "https://www.beatport.com/search?q=x&page=2&_r=123"
+        b = "https://www.beatport.com/search?page=2&q=x"
+        assert canonical_url(a) == canonical_url(b)
+        assert FixtureStore.key_for(a) == FixtureStore.key_for(b)
+
+
+class TestReplay:
+    """Test ReplayServer with the replaying() session adapter."""
+
+    def test_replays_stored_response(self, tmp_path):
+        """Requests to Beatport are answered from the store."""
+        store = FixtureStore(tmp_path)
+        store.put(_html(URL))
+        session = requests.Session()
+        with replaying(store, session=session) as server:
+            resp = session.get(URL, timeout=5)
+            missing = session.get("https://www.beatport.com/track/x/1", timeout=5)
+        assert resp.status_code == 200
+        assert resp.text == "<h1>Test Track</h1>"
+        assert resp.url == URL
+        assert missing.status_code == 404
+        assert server.stats()["hits"] == 1
+        assert server.stats()["misses"] == 1
+
+    def test_adapters_restored(self, tmp_path):
+        """The session's adapters are restored after replay."""
+        session = requests.Session()
+        before = dict(session.adapters)
+        with replaying(FixtureStore(tmp_path), session=session):
+            assert session.adapters != before
+        assert session.adapters == before
+
+    def test_error_injection_and_latency(self, tmp_path):
+        """error_rate=1 answers 503; latency is applied per request."""
+        store = FixtureStore(tmp_path)
+        store.put(_html(URL))
+        session = requests.Session()
+        with replaying(store, session=session, latency_ms=50, error_rate=1.0) as server:
+            start = time.perf_counter()
+            resp = session.get(URL, timeout=5)
+            elapsed = time.perf_counter() - start
+        assert resp.status_code == 503
+        assert elapsed >= 0.05
+        assert server.stats()["errors"] == 1
+
+    def test_fallback_is_stored(self, tmp_path):
+        """Synthesized responses are written to the store for later replays."""
+        store = FixtureStore(tmp_path)
+        session = requests.Session()
+        with replaying(store, session=session, fallback=_html) as server:
+            assert session.get(URL, timeout=5).status_code == 200
+        assert server.stats()["synthesized"] == 1
+        assert store.get(URL).body == b"<h1>Test Track</h1>"
+
+
+class TestRecording:
+    """Test recording() against a local origin."""
+
+    def test_records_responses(self, tmp_path):
+        """Responses passing through the recording adapter are stored."""
+        origin_store = FixtureStore(tmp_path / "origin")
+        with ReplayServer(origin_store, fallback=_html) as origin:
+            url = f"{origin.url}/track/test-track/123456"
+            store = FixtureStore(tmp_path / "recorded")
+            session = requests.Session()
+            with recording(store, session=session, prefixes=(origin.url,)):
+                resp = session.get(url, timeout=5)
+        assert resp.status_code == 200
+        assert store.get(url).body == resp.content
+
+
+class TestSyntheticCatalog:
+    """Test SyntheticCatalog."""
+
+    def test_search_ranks_the_golden_track_first(self):
+        """Search pages link the playlist track ahead of its distractors."""
+        catalog = SyntheticCatalog([(1, "Track 12", "Artist 12"), (2, "Track 7", "Artist 7")])
+        resp = catalog.respond("https://www.beatport.com/search?q=Track+12+Artist+12")
+        assert resp.status == 200
+        first_link = resp.body.decode("utf-8").split('href="', 1)[1].split('"', 1)[0]
+        assert catalog.golden[1].endswith(first_link)
+
+    def test_track_pages_and_unknown_urls(self):
+        """Known track pages carry JSON payloads; anything else is a 404."""
+        catalog = SyntheticCatalog([(1, "Track 12", "Artist 12")], distractors=0)
+        page = catalog.respond(catalog.golden[1])
+        assert b"__NEXT_DATA__" in page.body and b"Artist 12" in page.body
+        assert catalog.respond("https://www.beatport.com/track/x/1").status == 404
+
+
+def test_percentile():
+    """Nearest-rank percentile."""
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 50) == 50.0
+    assert percentile([], 95) == 0.0
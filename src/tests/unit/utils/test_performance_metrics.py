@@ -0,0 +1,157 @@
+"""Unit tests for the sharded metrics core and bounded PerformanceCollector."""
+
+import threading
+
+import pytest
+
+from cuepoint.utils.performance import (
+    MAX_RECENT_QUERY_METRICS,
+    STAGE_FETCH,
+    LatencyHistogram,
+    MetricsRegistry,
+    PerformanceCollector,
+)
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram."""
+
+    def test_percentiles_within_bucket_error(self):
+        """p50/p95/p99 are accurate to roughly one bucket (10%)."""
+        h = LatencyHistogram()
+        for ms in range(1, 1001):
+            h.record(ms / 1000.0)
+        assert h.count == 1000
+        assert h.percentile(50) == pytest.approx(0.5, rel=0.11)
+        assert h.percentile(95) == pytest.approx(0.95, rel=0.11)
+        assert h.percentile(99) == pytest.approx(0.99, rel=0.11)
+        assert h.min == pytest.approx(0.001)
+        assert h.max == pytest.approx(1.0)
+
+    def test_memory_is_fixed(self):
+        """Bucket array does not grow with samples."""
+        h = LatencyHistogram()
+        size = len(h.counts)
+        for _ in range(10000):
+            h.record(0.05)
+        assert len(h.counts) == size
+
+    def test_merge(self):
+        """Merging combines counts and extremes."""
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.record(0.01)
+        b.record(2.0)
+        a.merge(b)
+        assert a.count == 2
+        assert a.min == pytest.approx(0.01)
+        assert a.max == pytest.approx(2.0)
+
+    def test_empty(self):
+        """Empty histogram reports zeros."""
+        assert LatencyHistogram().percentile(95) == 0.0
+
+
+class TestMetricsRegistry:
+    """Test MetricsRegistry."""
+
+    def test_concurrent_writers_merge_on_read(self):
+        """Per-thread shards are merged without losing samples."""
+        reg = MetricsRegistry()
+
+        def work():
+            for _ in range(500):
+                reg.observe(STAGE_FETCH, 0.01)
+                reg.increment("requests")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        snap = reg.snapshot()
+        assert snap["stages"][STAGE_FETCH]["count"] == 4000
+        assert snap["counters"]["requests"] == 4000
+
+    def test_reset(self):
+        """Reset clears all shards."""
+        reg = MetricsRegistry()
+        reg.observe(STAGE_FETCH, 0.1)
+        reg.reset()
+        assert reg.snapshot() == {"stages": {}, "counters": {}}
+
+    def test_shards_of_exited_threads_are_folded_and_dropped(self):
+        """Samples of finished threads survive; their shards do not pile up."""
+        reg = MetricsRegistry()
+        for _ in range(20):
+            t = threading.Thread(target=reg.observe, args=(STAGE_FETCH, 0.01))
+            t.start()
+            t.join()
+        reg.increment("requests")
+        assert len(reg._shards) == 1
+        assert reg.histograms()[STAGE_FETCH].count == 20
+        assert reg.counters() == {"requests": 1}
+
+    def test_reset_drops_exited_thread_shards(self):
+        """Reset clears live shards and forgets those of finished threads."""
+        reg = MetricsRegistry()
+        reg.increment("requests")
+        t = threading.Thread(target=reg.increment, args=("requests",))
+        t.start()
+        t.join()
+        reg.reset()
+        assert len(reg._shards) == 1
+        reg.increment("requests")
+        assert reg.counters() == {"requests": 1}
+
+    def test_time_context_manager(self):
+        """time() records one observation."""
+        reg = MetricsRegistry()
+        with reg.time("score"):
+            pass
+        assert reg.histograms()["score"].count == 1
+
+
+class TestPerformanceCollectorBounded:
+    """Test PerformanceCollector memory bounds and thread safety."""
+
+    def setup_method(self):
+        self.collector = PerformanceCollector()
+        self.collector.reset()
+        self.collector.start_session()
+
+    def teardown_method(self):
+        self.collector.reset()
+
+    def test_query_list_is_bounded(self):
+        """Recent query list is capped but totals cover the session."""
+        tm = self.collector.record_track_start("t1", "Title")
+        n = MAX_RECENT_QUERY_METRICS + 100
+        for i in range(n):
+            self.collector.record_query(tm, f"q{i}", 0.01, 1, i % 2 == 0, "n_gram")
+        stats = self.collector.get_stats()
+        assert len(stats.query_metrics) == MAX_RECENT_QUERY_METRICS
+        assert stats.query_count() == n
+        assert stats.cache_stats["hits"] + stats.cache_stats["misses"] == n
+        assert stats.average_time_per_query() == pytest.approx(0.01)
+
+    def test_concurrent_tracks(self):
+        """Counters stay consistent with many worker threads."""
+
+        def work(k):
+            for j in range(50):
+                tm = self.collector.record_track_start(f"{k}-{j}", "T")
+                self.collector.record_query(tm, "q", 0.001, 1, False, "priority")
+                self.collector.record_track_complete(tm, 0.01 * j, match_found=True)
+
+        threads = [threading.Thread(target=work, args=(k,)) for k in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = self.collector.get_stats()
+        assert stats.total_tracks == 400
+        assert stats.matched_tracks == 400
+        assert stats.query_count() == 400
+        assert stats.slowest_tracks(1)[0].total_time == pytest.approx(0.49)
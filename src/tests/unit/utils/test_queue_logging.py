@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for queue-based logging, lazy sanitising and candidate log sampling."""
+
+import logging
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from cuepoint.services.logging_service import LoggingService
+from cuepoint.utils.logger import (
+    LogSampler,
+    NonBlockingQueueHandler,
+    SensitiveDataFilter,
+    start_queue_logging,
+    stop_queue_logging,
+)
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = LoggingService(
+        log_dir=tmp_path,
+        log_level="DEBUG",
+        enable_console_logging=False,
+        logger_name="cuepoint.test_queue",
+        queue_logging=True,
+    )
+    yield svc
+    stop_queue_logging(svc.logger)
+
+
+def test_records_reach_the_file_through_the_listener(service, tmp_path):
+    (handler,) = service.logger.handlers
+    assert isinstance(handler, NonBlockingQueueHandler)
+    assert service.get_log_path() == tmp_path / "cuepoint.log"
+
+    with patch("cuepoint.utils.run_context.get_current_run_id", return_value="run-42"):
+        service.info("[%s] Match found: %s (url %s)", 7, "Title", "https://x/?token=abc123")
+    stop_queue_logging(service.logger)
+
+    assert service.logger.handlers == []
+    text = (tmp_path / "cuepoint.log").read_text(encoding="utf-8")
+    # Formatted with its args, sanitized after formatting, run_id from the caller
+    assert "[7] Match found: Title" in text
+    assert "abc123" not in text
+    assert "run_id=run-42" in text
+
+
+def test_callers_do_not_wait_for_a_slow_handler():
+    logger = logging.getLogger("cuepoint.test_queue.slow")
+    release = threading.Event()
+    emitted = []
+
+    class SlowHandler(logging.Handler):
+        def emit(self, record):
+            release.wait(5)
+            emitted.append(record.getMessage())
+
+    logger.handlers = [SlowHandler()]
+    logger.propagate = False
+    start_queue_logging(logger)
+    try:
+        start = time.perf_counter()
+        for n in range(20):
+            logger.warning("record %d", n)
+        assert time.perf_counter() - start < 1.0
+        assert emitted == []
+    finally:
+        release.set()
+        stop_queue_logging(logger)
+    assert emitted == [f"record {n}" for n in range(20)]
+
+
+def test_records_below_the_level_cost_no_sanitising(service):
+    service.logger.setLevel(logging.INFO)
+    with patch("cuepoint.services.logging_service.LogSanitizer.sanitize_dict") as sanitize:
+        service.debug("skipped %s", object(), extra={"token": "abc"})
+        sanitize.assert_not_called()
+        service.info("kept", extra={"token": "abc"})
+        sanitize.assert_called_once()
+
+
+def test_sanitizer_runs_once_per_record():
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, "password=%s", ("hunter2",), None)
+    flt = SensitiveDataFilter()
+    with patch(
+        "cuepoint.utils.logger.LogSanitizer.sanitize_message", return_value="redacted"
+    ) as sanitize:
+        assert flt.filter(record) and flt.filter(record)
+    sanitize.assert_called_once_with("password=hunter2")
+    assert (record.getMessage(), record.args) == ("redacted", None)
+
+
+def test_log_sampler_passes_one_call_in_n():
+    sampler = LogSampler(3)
+    assert [sampler.sample() for _ in range(7)] == [True, False, False] * 2 + [True]
+    assert all(LogSampler().sample() for _ in range(5))
+    assert all(sampler.sample(every=1) for _ in range(5))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for in-flight request coalescing."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cuepoint.utils.run_performance_collector import RunPerformanceCollector
+from cuepoint.utils.single_flight import (
+    SingleFlight,
+    coalesce,
+    flight_group,
+    normalize_url,
+    single_flight_stats,
+)
+
+
+def _run_concurrently(n, fn, group, release):
+    """Run ``fn`` on ``n`` threads; release the leader once the rest are waiting."""
+    start = group.stats()["coalesced"]
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(fn) for _ in range(n)]
+        for _ in range(500):
+            if group.stats()["coalesced"] - start >= n - 1:
+                break
+            threading.Event().wait(0.01)
+        release.set()
+        return [f.result(timeout=5) for f in futures]
+
+
+def test_concurrent_callers_share_one_execution():
+    group = SingleFlight("test")
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return len(calls)
+
+    results = _run_concurrently(6, lambda: group.do("key", fn), group, release)
+
+    assert results == [1] * 6
+    assert len(calls) == 1
+    assert group.stats() == {"calls": 6, "executions": 1, "coalesced": 5}
+    assert group.in_flight() == 0
+
+
+def test_waiters_receive_leader_exception():
+    group = SingleFlight("test")
+    started = threading.Event()
+    release = threading.Event()
+
+    def boom():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(group.do, "key", boom)
+        started.wait(5)
+        waiter = pool.submit(group.do, "key", lambda: "not called")
+        while group.stats()["coalesced"] < 1:
+            threading.Event().wait(0.01)
+        release.set()
+        for future in (leader, waiter):
+            with pytest.raises(ValueError, match="boom"):
+                future.result(timeout=5)
+
+
+def test_sequential_calls_and_distinct_keys_are_not_coalesced():
+    group = SingleFlight("test")
+    fn = Mock(return_value="x")
+    group.do("a", fn)
+    group.do("a", fn)
+    group.do("b", fn)
+    assert fn.call_count == 3
+    assert group.stats()["coalesced"] == 0
+
+
+def test_reentrant_call_runs_instead_of_deadlocking():
+    group = SingleFlight("test")
+    assert group.do("key", lambda: group.do("key", lambda: 7) + 1) == 8
+
+
+def test_coalesce_disabled_skips_group():
+    fn = Mock(return_value=3)
+    before = single_flight_stats().get("disabled-test")
+    assert coalesce("disabled-test", "k", fn, enabled=False) == 3
+    assert single_flight_stats().get("disabled-test") == before
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://WWW.Beatport.com/track/x/1/#top") == (
+        "https://www.beatport.com/track/x/1"
+    )
+    assert normalize_url("https://www.beatport.com/search?q=A") == (
+        "https://www.beatport.com/search?q=A"
+    )
+
+
+def test_run_report_includes_coalescing_delta():
+    flight_group("report-test").do("k", lambda: None)
+    collector = RunPerformanceCollector()
+    collector.start_run()
+    flight_group("report-test").do("k", lambda: None)
+    collector.end_run()
+    report = collector.get_report().to_dict()
+    assert report["single_flight"]["report-test"] == {
+        "calls": 1,
+        "executions": 1,
+        "coalesced": 0,
+    }
+
+
+def test_request_html_coalesces_concurrent_fetches():
+    from cuepoint.data import beatport
+
+    release = threading.Event()
+    gets = []
+
+    def fake_get(url, **kwargs):
+        gets.append(url)
+        release.wait(5)
+        resp = Mock(status_code=200, headers={}, content=b"<html>x</html>")
+        resp.text = "<html><body>x</body></html>"
+        return resp
+
+    url = "https://www.beatport.com/track/x/1"
+    with patch.object(beatport.SESSION, "get", side_effect=fake_get):
+        results = _run_concurrently(
+            4, lambda: beatport.request_html_ex(url), flight_group("html"), release
+        )
+
+    assert len(gets) == 1
+    soups = {id(soup) for soup, _from_cache in results}
+    assert len(soups) == 1 and None not in [soup for soup, _ in results]
+
+
+def test_track_urls_waiters_get_the_leaders_cache_flag():
+    from cuepoint.data import beatport
+    from cuepoint.data.negative_cache import SearchOutcome, note_search_answered
+
+    release = threading.Event()
+
+    def cached_search(*args):
+        release.wait(5)
+        note_search_answered(from_cache=True)
+        return ["https://www.beatport.com/track/x/1"]
+
+    def search():
+        outcome = SearchOutcome()
+        urls = beatport.track_urls(1, "artist title", 10, outcome=outcome)
+        return urls, outcome.from_cache
+
+    with patch.object(beatport, "_track_urls", Mock(side_effect=cached_search)) as inner:
+        results = _run_concurrently(4, search, flight_group("search"), release)
+
+    assert inner.call_count == 1
+    assert results == [(["https://www.beatport.com/track/x/1"], True)] * 4
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for lazy imports and the startup import profiler."""
+
+import sys
+
+from cuepoint.utils.lazy_import import (
+    lazy_callable,
+    lazy_module,
+    module_available,
+)
+from cuepoint.utils.startup_profile import StartupProfile, format_report, parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      4809 |      52234 | site
+import time:       300 |        300 |     requests.compat
+import time:       700 |       1000 |   requests
+import time:      5000 |       6000 | main
+Traceback lines and other noise are ignored
+"""
+
+
+def test_parse_importtime():
+    timings = parse_importtime(SAMPLE)
+    assert [t.module for t in timings] == ["_io", "site", "requests.compat", "requests", "main"]
+    assert [t.depth for t in timings] == [1, 0, 2, 1, 0]
+    main = timings[-1]
+    assert (main.self_us, main.cumulative_us) == (5000, 6000)
+
+
+def test_profile_summary_and_report():
+    profile = StartupProfile(entry="main", timings=parse_importtime(SAMPLE), wall_ms=7.0)
+    assert profile.entry_ms == 6.0
+    assert profile.total_ms == 58.234
+    assert [t.module for t in profile.top(2)] == ["site", "main"]
+    assert profile.top(1, by="self")[0].module == "main"
+    report = format_report(profile, top=3)
+    assert "import main: 6.0 ms" in report
+    assert "requests" in report
+
+
+def test_lazy_callable_imports_on_first_call():
+    sys.modules.pop("colorsys", None)
+    rgb_to_hsv = lazy_callable("colorsys", "rgb_to_hsv")
+    assert "colorsys" not in sys.modules
+    assert not rgb_to_hsv.loaded
+    assert rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert rgb_to_hsv.loaded
+
+
+def test_lazy_module_and_availability():
+    sys.modules.pop("colorsys", None)
+    colorsys = lazy_module("colorsys")
+    assert "colorsys" not in sys.modules
+    assert colorsys.hsv_to_rgb(0.0, 0.0, 1.0) == (1.0, 1.0, 1.0)
+    assert module_available("json")
+    assert not module_available("cuepoint_no_such_module")
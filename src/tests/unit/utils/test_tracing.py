@@ -0,0 +1,105 @@
+"""Unit tests for opt-in span tracing and Chrome trace export."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cuepoint.utils.tracing import Tracer, traced, tracer
+
+
+@pytest.fixture
+def local_tracer():
+    t = Tracer()
+    t.enable()
+    yield t
+    t.disable()
+
+
+class TestTracer:
+    """Test Tracer."""
+
+    def test_disabled_records_nothing(self):
+        """Spans are no-ops while tracing is off."""
+        t = Tracer()
+        with t.span("search") as s:
+            s.set(results=3)
+        with t.context(track=1):
+            assert t.current_context() == {}
+        assert t.events() == []
+
+    def test_span_carries_context_tags(self, local_tracer):
+        """Spans pick up thread-local track/query tags."""
+        with local_tracer.context(track=7):
+            local_tracer.tag(query=2)
+            with local_tracer.span("fetch", url="u") as s:
+                s.set(status=200)
+        (event,) = local_tracer.events()
+        assert event["name"] == "fetch"
+        assert event["ph"] == "X"
+        assert event["dur"] >= 0
+        assert event["args"] == {"track": 7, "query": 2, "url": "u", "status": 200}
+        assert local_tracer.current_context() == {}
+
+    def test_exception_marks_span(self, local_tracer):
+        """A failing block still records its span with the error type."""
+        with pytest.raises(ValueError):
+            with local_tracer.span("parse"):
+                raise ValueError("bad")
+        assert local_tracer.events()[0]["args"]["error"] == "ValueError"
+
+    def test_submit_propagates_tags_and_queue_wait(self, local_tracer):
+        """Executor tasks inherit tags and record time spent queued."""
+
+        def work():
+            with local_tracer.span("work"):
+                return local_tracer.current_context()
+
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            with local_tracer.context(track=3):
+                fut = local_tracer.submit(ex, work, name="task", tags={"query": 1})
+            assert fut.result() == {"track": 3, "query": 1}
+
+        names = [e["name"] for e in local_tracer.events()]
+        assert names == ["queue_wait", "work"]
+        assert local_tracer.events()[0]["args"]["task"] == "task"
+
+    def test_bounded_buffer(self):
+        """Oldest events are dropped past max_events."""
+        t = Tracer()
+        t.enable(max_events=5)
+        for _ in range(8):
+            with t.span("s"):
+                pass
+        assert len(t.events()) == 5
+        assert t.dropped == 3
+
+    def test_export_chrome_trace(self, local_tracer, tmp_path):
+        """Export writes trace-event JSON with thread name metadata."""
+        with local_tracer.span("write_csv_files"):
+            pass
+        path = local_tracer.export_chrome_trace(str(tmp_path / "sub" / "trace.json"))
+        with open(path, encoding="utf-8") as f:
+            doc = json.load(f)
+        phases = {e["ph"] for e in doc["traceEvents"]}
+        assert phases == {"M", "X"}
+        assert doc["displayTimeUnit"] == "ms"
+
+
+class TestTracedDecorator:
+    """Test traced decorator on the global tracer."""
+
+    def teardown_method(self):
+        tracer.disable()
+
+    def test_traced_records_when_enabled(self):
+        """Decorated calls produce a span only while enabled."""
+
+        @traced("stage")
+        def fn(x):
+            return x * 2
+
+        assert fn(2) == 4
+        tracer.enable()
+        assert fn(3) == 6
+        assert [e["name"] for e in tracer.events()] == ["stage"]